@@ -0,0 +1,298 @@
+"""Benchmark suite: trainer throughput, data pipeline, message encoding and stream fan-out.
+
+Results are written as JSON and can be compared with a stored baseline:
+
+    uv run python -m scripts.benchmark --out data/benchmarks/after.json --baseline data/benchmarks/before.json
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Any, Callable, Iterator
+import grpc
+import numpy as np
+import torch
+
+from src.generated import metrics_pb2 as pb
+from src.generated import metrics_pb2_grpc as pbg
+from src.services.encoding import WireFormat, to_proto
+from src.services.hub import MetricsHub
+from src.services.scheduler import JobScheduler
+from src.services.servicer import Servicer
+from src.training.config import TrainConfig, build_trainer
+from src.training.data_module import DataModule, set_epoch
+from src.training.runner import ThreadRunner
+
+SUITES = ('trainer', 'loader', 'encode', 'fanout')
+
+
+class Results:
+    """Named measurements plus the environment they were taken in."""
+
+    meta: dict[str, Any]
+    results: dict[str, dict[str, Any]]
+
+    def __init__(self) -> None:
+        self.meta = environment()
+        self.results = {}
+
+    def add(self, name: str, value: float, unit: str, higher_is_better: bool = True,
+            runs: list[float] | None = None, **params: Any) -> None:
+        self.results[name] = {'value': value, 'unit': unit, 'higher_is_better': higher_is_better, 'params': params}
+        if runs is not None:
+            self.results[name]['runs'] = runs
+        print(f'   {name:<44} {value:>12.2f} {unit}')
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'meta': self.meta, 'results': self.results}, indent=2))
+        print(f'💾 Saved {len(self.results)} results to {path}')
+
+
+def environment() -> dict[str, Any]:
+    """What a number depends on besides the code: host, interpreter, torch and commit."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ''
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'torch': torch.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'torch_threads': torch.get_num_threads(),
+    }
+
+
+class Take:
+    """The first `n` batches of a loader, so an "epoch" fits in a benchmark."""
+
+    def __init__(self, loader: Any, n: int) -> None:
+        self.loader = loader
+        self.n = min(n, len(loader))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def set_epoch(self, epoch: int) -> None:
+        set_epoch(self.loader, epoch)
+
+    def __iter__(self) -> Iterator[Any]:
+        return islice(iter(self.loader), self.n)
+
+
+def bench_trainer(results: Results, root: str, batches: int, models: list[str], batch_sizes: list[int]) -> None:
+    """Samples/sec of Trainer.train_epoch (lazy metrics, tensor-resident data) per model and batch size."""
+    print('🏋️  Trainer throughput')
+    for model in models:
+        for batch_size in batch_sizes:
+            config = TrainConfig(root=root, batch_size=batch_size, model=model, checkpoint_dir=None, update_interval=50,
+                                 patience=0)                     # Full epochs: no early stop
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                trainer = build_trainer(config)
+                trainer.dataloader = Take(trainer.dataloader, batches)
+                trainer.train_epoch(0)                      # Warm-up: allocator, kernels, prefetch thread
+                start = perf_counter()
+                trainer.train_epoch(1)
+                elapsed = perf_counter() - start
+            results.add(f'trainer.{model}.bs{batch_size}', len(trainer.dataloader) * batch_size / elapsed,
+                        'samples/s', model=model, batch_size=batch_size, batches=len(trainer.dataloader))
+
+
+def bench_loader(results: Results, root: str, batches: int, repeats: int) -> None:
+    """Samples/sec of the DataModule train loader alone, per pipeline configuration (median of passes)."""
+    print('📦 Loader throughput')
+    variants = {
+        'pil': dict(tensor_resident=False, prefetch=0),
+        'pil.prefetch4': dict(tensor_resident=False, prefetch=4),
+        'tensor': dict(tensor_resident=True, prefetch=0),
+        'tensor.prefetch4': dict(tensor_resident=True, prefetch=4),
+    }
+    for name, options in variants.items():
+        loader, _ = DataModule(root=root, batch_size=64, **options).get_loaders()
+        loader = Take(loader, batches)
+        rates = []
+        for _ in range(repeats):
+            samples = 0
+            start = perf_counter()
+            for _, inputs, _ in loader:
+                samples += inputs.shape[0]
+            rates.append(samples / (perf_counter() - start))
+        results.add(f'loader.{name}', float(np.median(rates)), 'samples/s', runs=rates,
+                    batch_size=64, batches=len(loader), **options)
+
+
+def synthetic_metric(seq: int, batch_size: int) -> dict[str, Any]:
+    rng = np.random.default_rng(seq)
+    return {
+        'seq': seq,
+        'epoch': 0,
+        'batch': seq,
+        'batch_size': batch_size,
+        'batch_loss': float(rng.random()),
+        'preds': rng.integers(0, 10, batch_size, dtype=np.int64),
+        'truths': rng.integers(0, 10, batch_size, dtype=np.int64),
+        'scores': rng.random(batch_size, dtype=np.float32),
+        'image_ids': rng.permutation(60_000)[:batch_size].astype(np.int64),
+    }
+
+
+def per_call(fn: Callable[[], Any], rounds: int = 5, min_time: float = 0.1) -> float:
+    """Seconds per call: the best of several timed rounds, each repeating until `min_time` has elapsed."""
+    best = float('inf')
+    for _ in range(rounds):
+        calls, start = 0, perf_counter()
+        while (elapsed := perf_counter() - start) < min_time or calls < 10:
+            fn()
+            calls += 1
+        best = min(best, elapsed / calls)
+    return best
+
+
+def bench_encode(results: Results) -> None:
+    """Cost of turning one metric into wire bytes (cache miss path of Subscribe), per wire format."""
+    print('🧬 Encode cost per message')
+    formats = {
+        'repeated': WireFormat(False, pb.SCORES_FLOAT32),
+        'packed.f32': WireFormat(True, pb.SCORES_FLOAT32),
+        'packed.f16': WireFormat(True, pb.SCORES_FLOAT16),
+        'packed.u8': WireFormat(True, pb.SCORES_UINT8),
+    }
+    for batch_size in (16, 256):
+        metric = synthetic_metric(1, batch_size)
+        for name, fmt in formats.items():
+            seconds = per_call(lambda: to_proto(metric, fmt).SerializeToString())
+            size = len(to_proto(metric, fmt).SerializeToString())
+            results.add(f'encode.{name}.bs{batch_size}', seconds * 1e6, 'us/msg', higher_is_better=False,
+                        batch_size=batch_size, bytes=size)
+
+
+def bench_fanout(results: Results, subscribers: list[int], messages: int, repeats: int) -> None:
+    """Delivered msgs/sec from an in-process thread-pool server to N concurrent Subscribe streams (median of runs)."""
+    print('📡 Stream fan-out')
+    for n in subscribers:
+        rates = [fanout_rate(n, messages) for _ in range(repeats)]
+        results.add(f'fanout.subscribers{n}', float(np.median(rates)), 'msgs/s',
+                    subscribers=n, messages=messages, runs=rates)
+
+
+def fanout_rate(n: int, messages: int) -> float:
+    """Open n streams, publish `messages` metrics, and time until every stream has received all of them."""
+    hub = MetricsHub(capacity=messages, subscriber_capacity=messages)          # Nothing dropped: measure delivery
+    # One job that never gets a slot: its hub is fed directly below, so only delivery is measured
+    scheduler = JobScheduler(make_hub=lambda *_: hub,
+                             make_runner=lambda job: ThreadRunner(TrainConfig(checkpoint_dir=None), job.hub), max_jobs=0)
+    scheduler.submit(1)
+    servicer = Servicer(scheduler)
+    server = grpc.server(ThreadPoolExecutor(max_workers=n + 4))                # One pool thread per open stream
+    pbg.add_TrainingServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    channel = grpc.insecure_channel(f'127.0.0.1:{port}')
+    stub = pbg.TrainingStub(channel)
+    finished: list[float] = []
+
+    def receive() -> None:
+        call = stub.Subscribe(pb.SubscribeReq(packed=True))
+        for _ in range(messages):
+            next(call)
+        finished.append(perf_counter())
+        call.cancel()
+
+    batch = [synthetic_metric(seq, 16) for seq in range(messages)]
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            receivers = [Thread(target=receive, daemon=True) for _ in range(n)]
+            for receiver in receivers:
+                receiver.start()
+            while len(hub.subscribers) < n:                                     # Every stream attached first
+                sleep(0.01)
+
+            start = perf_counter()
+            for metric in batch:
+                hub.put(metric)
+            for receiver in receivers:
+                receiver.join()
+    finally:
+        channel.close()
+        server.stop(grace=None)
+
+    if len(finished) < n:
+        raise RuntimeError(f'Only {len(finished)} of {n} subscribers received every message')
+    return n * messages / (max(finished) - start)
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print current vs baseline and return the names that regressed by more than `threshold`."""
+    print(f'\n📊 Compared with baseline from {baseline["meta"].get("timestamp")} ({baseline["meta"].get("commit")})')
+    regressions = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None or not before['value']:
+            print(f'   {name:<44} {"new":>12}')
+            continue
+
+        change = (result['value'] - before['value']) / before['value']
+        better = change if result['higher_is_better'] else -change
+        mark = '✅' if better >= -threshold else '❌'
+        if better < -threshold:
+            regressions.append(name)
+        note = '  (different parameters)' if before.get('params') != result['params'] else ''
+        print(f'   {name:<44} {before["value"]:>12.2f} → {result["value"]:>12.2f} {result["unit"]:<10} {change:+7.1%} {mark}{note}')
+    return regressions
+
+
+def main() -> None:
+    """Run the selected suites, save JSON results, and optionally compare with a baseline."""
+
+    parser = ArgumentParser(description='Benchmark trainer, data pipeline, encoding and stream fan-out')
+    parser.add_argument('--suites', default=','.join(SUITES), help=f'comma-separated subset of {",".join(SUITES)}')
+    parser.add_argument('--root', default='./data', help='MNIST root directory')
+    parser.add_argument('--out', type=Path, default=Path('./data/benchmarks/latest.json'))
+    parser.add_argument('--baseline', type=Path, help='earlier results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative change counted as a regression')
+    parser.add_argument('--batches', type=int, default=200, help='batches per trainer/loader measurement')
+    parser.add_argument('--models', default='mlp,cnn')
+    parser.add_argument('--batch-sizes', default='16,64,256')
+    parser.add_argument('--subscribers', default='1,10,50,100')
+    parser.add_argument('--messages', type=int, default=200, help='messages published per fan-out run')
+    parser.add_argument('--repeats', type=int, default=3, help='loader passes / fan-out runs per measurement (median reported)')
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    results = Results()
+    suites = args.suites.split(',')
+    if 'trainer' in suites:
+        bench_trainer(results, args.root, args.batches, args.models.split(','),
+                      [int(b) for b in args.batch_sizes.split(',')])
+    if 'loader' in suites:
+        bench_loader(results, args.root, args.batches, args.repeats)
+    if 'encode' in suites:
+        bench_encode(results)
+    if 'fanout' in suites:
+        bench_fanout(results, [int(n) for n in args.subscribers.split(',')], args.messages, args.repeats)
+    results.save(args.out)
+
+    if args.baseline:
+        regressions = compare({'results': results.results}, json.loads(args.baseline.read_text()), args.threshold)
+        if regressions:
+            print(f'\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}: {", ".join(regressions)}')
+            sys.exit(1)
+        print('\n✅ No regressions')
+
+
+if __name__ == '__main__':
+    main()
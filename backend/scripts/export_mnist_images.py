@@ -1,9 +1,22 @@
-"""Export MNIST train images as PNG files."""
+"""Export MNIST train images as PNG files, or as sprite atlases with an index.
 
+    uv run python -m scripts.export_mnist_images                  # one PNG per image (images/train/{id}.png)
+    uv run python -m scripts.export_mnist_images --atlas          # 1024-digit sheets + index.json (images/atlas/)
+"""
+
+import hashlib
+import json
+import math
 import os
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from time import perf_counter
 from torchvision import datasets
-from PIL import Image
+
+from src.services.images import IDX_FILES, TILE, open_idx, sprite
+
+INDEX_VERSION = 1
 
 
 def export_mnist_images():
@@ -49,5 +62,91 @@ def export_mnist_images():
     print(f"   Average size per image: {avg_size / 1024:.2f} KB")
 
 
+def sheet_digest(source: Path, first: int, count: int) -> str:
+    """Hash of the source pixels a sheet is rendered from."""
+    return hashlib.sha1(open_idx(source)[first:first + count].tobytes()).hexdigest()
+
+
+def render_sheet(source: Path, path: Path, first: int, count: int, columns: int) -> int:
+    """Worker: render images [first, first + count) of the idx file into one sprite PNG, returning its size."""
+    data = sprite(open_idx(source)[first:first + count], columns, compress_level=9)
+    tmp = path.with_suffix('.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+def export_atlas(out_dir: Path, data_dir: Path, per_sheet: int = 1024, workers: int | None = None,
+                 force: bool = False) -> None:
+    """Write fixed-grid sprite sheets plus index.json, re-rendering only sheets whose source pixels changed.
+
+    Image `id` lives on sheet `id // per_sheet`, at pixel x = (id % per_sheet) % columns * tile,
+    y = (id % per_sheet) // columns * tile; index.json records those parameters and the sheet files.
+    """
+    datasets.MNIST(root=str(data_dir), train=True, download=True)          # Make sure the raw idx file exists
+    source = data_dir / 'MNIST' / 'raw' / IDX_FILES['train']
+    count = len(open_idx(source))
+    columns = math.isqrt(per_sheet - 1) + 1                                 # Square-ish sheets
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    index_path = out_dir / 'index.json'
+    previous = json.loads(index_path.read_text()) if index_path.exists() and not force else {}
+    layout = {'version': INDEX_VERSION, 'tile': TILE, 'per_sheet': per_sheet, 'columns': columns}
+    old_sheets = previous.get('sheets', []) if all(previous.get(k) == v for k, v in layout.items()) else []
+    stat = source.stat()
+    origin = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    # Fast path: same source file and layout, every sheet still on disk
+    if old_sheets and previous.get('source') == origin and all((out_dir / s['file']).exists() for s in old_sheets):
+        print(f'✅ Atlas already up to date: {len(old_sheets)} sheets in {out_dir}')
+        return
+
+    print(f'📂 Checking {count} images from {source} against {len(old_sheets)} existing sheets...')
+    start = perf_counter()
+    sheets, jobs = [], []
+    for n, first in enumerate(range(0, count, per_sheet)):
+        size = min(per_sheet, count - first)
+        sheet = {'file': f'sheet-{n:03d}.png', 'first': first, 'count': size,
+                 'sha1': sheet_digest(source, first, size)}
+        sheets.append(sheet)
+        unchanged = n < len(old_sheets) and old_sheets[n]['sha1'] == sheet['sha1'] and old_sheets[n]['count'] == size
+        if not unchanged or not (out_dir / sheet['file']).exists():
+            jobs.append(sheet)
+
+    if jobs:
+        print(f'💾 Rendering {len(jobs)} of {len(sheets)} sheets ({columns}x{columns} digits each) '
+              f'on {workers or os.cpu_count()} processes...')
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            sizes = pool.map(render_sheet, *zip(*[(source, out_dir / s['file'], s['first'], s['count'], columns)
+                                                  for s in jobs]))
+            for sheet, size in zip(jobs, sizes):
+                sheet['bytes'] = size
+    for n, sheet in enumerate(sheets):
+        if 'bytes' not in sheet:
+            sheet['bytes'] = old_sheets[n]['bytes']
+
+    index_path.write_text(json.dumps({**layout, 'count': count, 'source': origin, 'sheets': sheets}, separators=(',', ':')))
+    current = {sheet['file'] for sheet in sheets}
+    for stale in out_dir.glob('sheet-*.png'):                               # Left over from a different layout
+        if stale.name not in current:
+            stale.unlink()
+
+    total = sum(s['bytes'] for s in sheets)
+    print(f'✅ Atlas up to date in {perf_counter() - start:.2f}s: {len(sheets)} sheets, {total / 1024 / 1024:.2f} MB')
+    print(f'   Location: {out_dir}')
+
+
 if __name__ == '__main__':
-    export_mnist_images()
+    parser = ArgumentParser(description='Export MNIST train images as PNGs or sprite atlases')
+    parser.add_argument('--atlas', action='store_true', help='write sprite sheets + index.json instead of 60k PNGs')
+    parser.add_argument('--out', type=Path, default=Path(__file__).parent.parent / 'images' / 'atlas')
+    parser.add_argument('--root', type=Path, default=Path(__file__).parent.parent / 'data', help='MNIST root directory')
+    parser.add_argument('--per-sheet', type=int, default=1024, help='digits per sheet')
+    parser.add_argument('--workers', type=int, help='rendering processes (default: all cores)')
+    parser.add_argument('--force', action='store_true', help='re-render every sheet')
+    args = parser.parse_args()
+
+    if args.atlas:
+        export_atlas(args.out, args.root, per_sheet=args.per_sheet, workers=args.workers, force=args.force)
+    else:
+        export_mnist_images()
@@ -5,6 +5,7 @@ import grpc
 
 from src.generated import metrics_pb2 as pb
 from src.generated import metrics_pb2_grpc as pbg
+from src.services.encoding import unpack_samples
 
 
 class Client:
@@ -33,10 +34,10 @@ class Client:
             print(f'❌ Failed to get status: {e.code()} - {e.details()}')
             raise
 
-    def start(self, num_epochs: int, confirmed: bool = True) -> pb.StartRes:
-        """Start training on the server."""
-        print(f'🎬 Starting training ({num_epochs} epochs, confirmed={confirmed})...')
-        req = pb.StartReq(num_epochs=num_epochs, confirmed=confirmed)
+    def start(self, num_epochs: int, confirmed: bool = True, resume: bool = False) -> pb.StartRes:
+        """Start training on the server (optionally resuming from its latest checkpoint)."""
+        print(f'🎬 Starting training ({num_epochs} epochs, confirmed={confirmed}, resume={resume})...')
+        req = pb.StartReq(num_epochs=num_epochs, confirmed=confirmed, resume=resume)
 
         try:
             res = self.stub.Start(req, timeout=self.timeout)
@@ -47,10 +48,11 @@ class Client:
             print(f'❌ Failed to start training: {e.code()} - {e.details()}')
             raise
 
-    def subscribe(self) -> Iterator[pb.TrainingMetric]:
-        """Subscribe to streaming training metrics from the server."""
+    def subscribe(self, from_seq: int | None = None, packed: bool = False,
+                  score_encoding: int = pb.SCORES_FLOAT32, compress: bool = False) -> Iterator[pb.TrainingMetric]:
+        """Subscribe to streaming training metrics, optionally replaying history from a seq."""
         print('📡 Subscribing to metrics stream...')
-        req = pb.SubscribeReq()
+        req = pb.SubscribeReq(from_seq=from_seq, packed=packed, score_encoding=score_encoding, compress=compress)  # type: ignore[arg-type]
 
         try:
             for metric in self.stub.Subscribe(req):
@@ -107,13 +109,17 @@ def main() -> None:
         # Step 4: Subscribe to metrics stream
         print()
         for metric in client.subscribe():
-            print(f'📊 Received Metric:')
+            print(f'📊 Received Metric #{metric.seq}:')
             print(f'   Epoch: {metric.epoch}')
             print(f'   Batch: {metric.batch}')
             print(f'   Batch Size: {metric.batch_size}')
             print(f'   Batch Loss: {metric.batch_loss:.4f}')
-            print(f'   Predictions: {list(metric.preds)[:10]}...')
-            print(f'   Truths: {list(metric.truths)[:10]}...')
+            preds, truths = metric.preds, metric.truths
+            if metric.HasField('packed'):
+                samples = unpack_samples(metric.packed)
+                preds, truths = samples['preds'], samples['truths']
+            print(f'   Predictions: {list(preds)[:10]}...')
+            print(f'   Truths: {list(truths)[:10]}...')
             print()
 
     except KeyboardInterrupt:
@@ -24,25 +24,89 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rmetrics.proto\x12\x08services\"\x98\x01\n\x0eTrainingMetric\x12\r\n\x05\x65poch\x18\x01 \x01(\x05\x12\r\n\x05\x62\x61tch\x18\x02 \x01(\x05\x12\x12\n\nbatch_size\x18\x03 \x01(\x05\x12\x12\n\nbatch_loss\x18\x04 \x01(\x02\x12\r\n\x05preds\x18\x05 \x03(\x05\x12\x0e\n\x06truths\x18\x06 \x03(\x05\x12\x0e\n\x06scores\x18\x07 \x03(\x02\x12\x11\n\timage_ids\x18\x08 \x03(\x05\"\x0e\n\x0cSubscribeReq\"\x0b\n\tStatusReq\";\n\tStatusRes\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\r\n\x05\x65poch\x18\x03 \x01(\x05\"1\n\x08StartReq\x12\x12\n\nnum_epochs\x18\x01 \x01(\x05\x12\x11\n\tconfirmed\x18\x02 \x01(\x08\"+\n\x08StartRes\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t2\xb0\x01\n\x08Training\x12\x32\n\x06Status\x12\x13.services.StatusReq\x1a\x13.services.StatusRes\x12/\n\x05Start\x12\x12.services.StartReq\x1a\x12.services.StartRes\x12?\n\tSubscribe\x12\x16.services.SubscribeReq\x1a\x18.services.TrainingMetric0\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rmetrics.proto\x12\x08services\"\x9a\x01\n\rPackedSamples\x12\r\n\x05preds\x18\x01 \x01(\x0c\x12\x0e\n\x06truths\x18\x02 \x01(\x0c\x12\x0e\n\x06scores\x18\x03 \x01(\x0c\x12/\n\x0escore_encoding\x18\x04 \x01(\x0e\x32\x17.services.ScoreEncoding\x12\x11\n\timage_ids\x18\x05 \x01(\x0c\x12\x16\n\x0eimage_id_width\x18\x06 \x01(\r\"\xfa\x01\n\x0eTrainingMetric\x12\r\n\x05\x65poch\x18\x01 \x01(\x05\x12\r\n\x05\x62\x61tch\x18\x02 \x01(\x05\x12\x12\n\nbatch_size\x18\x03 \x01(\x05\x12\x12\n\nbatch_loss\x18\x04 \x01(\x02\x12\r\n\x05preds\x18\x05 \x03(\x05\x12\x0e\n\x06truths\x18\x06 \x03(\x05\x12\x0e\n\x06scores\x18\x07 \x03(\x02\x12\x11\n\timage_ids\x18\x08 \x03(\x05\x12\x0b\n\x03seq\x18\t \x01(\x03\x12\'\n\x06packed\x18\n \x01(\x0b\x32\x17.services.PackedSamples\x12\x13\n\x0bstop_reason\x18\x0b \x01(\t\x12\x15\n\rbatches_saved\x18\x0c \x01(\x03\"\xf9\x02\n\x0cSubscribeReq\x12\x15\n\x08\x66rom_seq\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x0e\n\x06packed\x18\x02 \x01(\x08\x12/\n\x0escore_encoding\x18\x03 \x01(\x0e\x32\x17.services.ScoreEncoding\x12\x10\n\x08\x63ompress\x18\x04 \x01(\x08\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t\x12\x11\n\tevery_nth\x18\x06 \x01(\x05\x12\x16\n\tmin_epoch\x18\x07 \x01(\x05H\x01\x88\x01\x01\x12\x16\n\tmax_epoch\x18\x08 \x01(\x05H\x02\x88\x01\x01\x12\x16\n\tmin_batch\x18\t \x01(\x05H\x03\x88\x01\x01\x12\x16\n\tmax_batch\x18\n \x01(\x05H\x04\x88\x01\x01\x12\x1a\n\x12misclassified_only\x18\x0b \x01(\x08\x12\x0e\n\x06job_id\x18\x0c \x01(\t\x12\x0b\n\x03run\x18\r \x01(\tB\x0b\n\t_from_seqB\x0c\n\n_min_epochB\x0c\n\n_max_epochB\x0c\n\n_min_batchB\x0c\n\n_max_batch\"\x94\x01\n\x11SubscribeBatchReq\x12)\n\tsubscribe\x18\x01 \x01(\x0b\x32\x16.services.SubscribeReq\x12\x11\n\tmax_count\x18\x02 \x01(\x05\x12\x11\n\tmax_bytes\x18\x03 \x01(\x05\x12\x1b\n\x0emax_latency_ms\x18\x04 \x01(\x05H\x00\x88\x01\x01\x42\x11\n\x0f_max_latency_ms\"@\n\x13TrainingMetricBatch\x12)\n\x07metrics\x18\x01 \x03(\x0b\x32\x18.services.TrainingMetric\"6\n\x10SubscribeEvalReq\x12\x15\n\x08\x66rom_seq\x18\x01 \x01(\x03H\x00\x88\x01\x01\x42\x0b\n\t_from_seq\"\xb6\x01\n\nEvalMetric\x12\x0b\n\x03seq\x18\x01 \x01(\x03\x12\r\n\x05\x65poch\x18\x02 \x01(\x05\x12\r\n\x05\x62\x61tch\x18\x03 \x01(\x05\x12\x0f\n\x07version\x18\x04 \x01(\x03\x12\x0c\n\x04loss\x18\x05 \x01(\x02\x12\x10\n\x08\x61\x63\x63uracy\x18\x06 \x01(\x02\x12\x16\n\x0e\x63lass_accuracy\x18\x07 \x03(\x02\x12\x0f\n\x07samples\x18\x08 \x01(\x05\x12\x13\n\x0b\x64uration_ms\x18\t \x01(\x02\x12\x0e\n\x06job_id\x18\n \x01(\t\"\x1b\n\tStatusReq\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"R\n\nTrainModes\x12\r\n\x05model\x18\x01 \x01(\t\x12\x0c\n\x04\x62\x66\x31\x36\x18\x02 \x01(\x08\x12\x10\n\x08\x63ompiled\x18\x03 \x01(\x08\x12\x15\n\rchannels_last\x18\x04 \x01(\x08\"\xfc\x01\n\tStatusRes\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\r\n\x05\x65poch\x18\x03 \x01(\x05\x12#\n\x05modes\x18\x04 \x01(\x0b\x32\x14.services.TrainModes\x12\x10\n\x08progress\x18\x05 \x01(\x02\x12\x0e\n\x06job_id\x18\x06 \x01(\t\x12\x0e\n\x06queued\x18\x07 \x01(\x05\x12\x0f\n\x07running\x18\x08 \x01(\x05\x12\x13\n\x0bstop_reason\x18\t \x01(\t\x12\x15\n\rbatches_saved\x18\n \x01(\x03\x12+\n\tresources\x18\x0b \x01(\x0b\x32\x18.services.ResourceLayout\"\xa9\x01\n\x0eResourceLayout\x12\x13\n\x0btrain_cores\x18\x01 \x03(\x05\x12\x13\n\x0bserve_cores\x18\x02 \x03(\x05\x12\x18\n\x10intra_op_threads\x18\x03 \x01(\x05\x12\x18\n\x10inter_op_threads\x18\x04 \x01(\x05\x12\x13\n\x0bjob_threads\x18\x05 \x01(\x05\x12\x14\n\x0cgrpc_workers\x18\x06 \x01(\x05\x12\x0e\n\x06pinned\x18\x07 \x01(\x08\"\xe1\x02\n\x08StartReq\x12\x12\n\nnum_epochs\x18\x01 \x01(\x05\x12\x11\n\tconfirmed\x18\x02 \x01(\x08\x12\x0e\n\x06resume\x18\x03 \x01(\x08\x12\x12\n\x05model\x18\x04 \x01(\tH\x00\x88\x01\x01\x12\x11\n\x04\x62\x66\x31\x36\x18\x05 \x01(\x08H\x01\x88\x01\x01\x12\x14\n\x07\x63ompile\x18\x06 \x01(\x08H\x02\x88\x01\x01\x12\x1a\n\rchannels_last\x18\x07 \x01(\x08H\x03\x88\x01\x01\x12\x0f\n\x02lr\x18\x08 \x01(\x01H\x04\x88\x01\x01\x12\x17\n\nbatch_size\x18\t \x01(\x05H\x05\x88\x01\x01\x12\x15\n\x08patience\x18\x0c \x01(\x05H\x06\x88\x01\x01\x12\x10\n\x08priority\x18\n \x01(\x05\x12\x13\n\x06job_id\x18\x0b \x01(\tH\x07\x88\x01\x01\x42\x08\n\x06_modelB\x07\n\x05_bf16B\n\n\x08_compileB\x10\n\x0e_channels_lastB\x05\n\x03_lrB\r\n\x0b_batch_sizeB\x0b\n\t_patienceB\t\n\x07_job_id\"Z\n\x08StartRes\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06job_id\x18\x03 \x01(\t\x12\x10\n\x08position\x18\x04 \x01(\x05\x12\x0b\n\x03run\x18\x05 \x01(\t\"\r\n\x0bListJobsReq\"\xa3\x02\n\x07JobInfo\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\r\n\x05\x65poch\x18\x03 \x01(\x05\x12\x12\n\nnum_epochs\x18\x04 \x01(\x05\x12\x10\n\x08priority\x18\x05 \x01(\x05\x12\x33\n\toverrides\x18\x06 \x03(\x0b\x32 .services.JobInfo.OverridesEntry\x12#\n\x05modes\x18\x07 \x01(\x0b\x32\x14.services.TrainModes\x12\x13\n\x0bstop_reason\x18\x08 \x01(\t\x12\x15\n\rbatches_saved\x18\t \x01(\x03\x12\x0b\n\x03run\x18\n \x01(\t\x1a\x30\n\x0eOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\".\n\x0bListJobsRes\x12\x1f\n\x04jobs\x18\x01 \x03(\x0b\x32\x11.services.JobInfo\"\x1c\n\nPredictReq\x12\x0e\n\x06images\x18\x01 \x01(\x0c\"9\n\nPrediction\x12\r\n\x05label\x18\x01 \x01(\x05\x12\r\n\x05score\x18\x02 \x01(\x02\x12\r\n\x05probs\x18\x03 \x03(\x02\"v\n\nPredictRes\x12)\n\x0bpredictions\x18\x01 \x03(\x0b\x32\x14.services.Prediction\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12\r\n\x05\x65poch\x18\x03 \x01(\x05\x12\r\n\x05\x62\x61tch\x18\x04 \x01(\x05\x12\x0e\n\x06job_id\x18\x05 \x01(\t\"d\n\tImagesReq\x12\x11\n\timage_ids\x18\x01 \x03(\x05\x12\x0c\n\x04test\x18\x02 \x01(\x08\x12%\n\x06\x66ormat\x18\x03 \x01(\x0e\x32\x15.services.ImageFormat\x12\x0f\n\x07\x63olumns\x18\x04 \x01(\x05\"s\n\tImagesRes\x12%\n\x06\x66ormat\x18\x01 \x01(\x0e\x32\x15.services.ImageFormat\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\x12\r\n\x05\x63ount\x18\x03 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x04 \x01(\x05\x12\x11\n\ttile_size\x18\x05 \x01(\x05\"\x1a\n\x08StatsReq\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x96\x01\n\tHistogram\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x03\x12\x0b\n\x03sum\x18\x03 \x01(\x01\x12\x0b\n\x03min\x18\x04 \x01(\x01\x12\x0b\n\x03max\x18\x05 \x01(\x01\x12\x0b\n\x03p50\x18\x06 \x01(\x01\x12\x0b\n\x03p90\x18\x07 \x01(\x01\x12\x0b\n\x03p99\x18\x08 \x01(\x01\x12\x0e\n\x06\x62ounds\x18\t \x03(\x01\x12\x0e\n\x06\x63ounts\x18\n \x03(\x03\"\xd6\x02\n\x08StatsRes\x12\'\n\nhistograms\x18\x01 \x03(\x0b\x32\x13.services.Histogram\x12\x32\n\x08\x63ounters\x18\x02 \x03(\x0b\x32 .services.StatsRes.CountersEntry\x12.\n\x06gauges\x18\x03 \x03(\x0b\x32\x1e.services.StatsRes.GaugesEntry\x12.\n\x06labels\x18\x04 \x03(\x0b\x32\x1e.services.StatsRes.LabelsEntry\x1a/\n\rCountersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\x1a-\n\x0bGaugesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"+\n\nProfileReq\x12\r\n\x05steps\x18\x01 \x01(\x05\x12\x0e\n\x06job_id\x18\x02 \x01(\t\"-\n\nProfileRes\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\xd2\x01\n\x0fHardExamplesReq\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\t\n\x01k\x18\x02 \x01(\x05\x12\x12\n\x05label\x18\x03 \x01(\x05H\x00\x88\x01\x01\x12\x11\n\x04pred\x18\x04 \x01(\x05H\x01\x88\x01\x01\x12\x1a\n\x12misclassified_only\x18\x05 \x01(\x08\x12\x16\n\tmin_epoch\x18\x06 \x01(\x05H\x02\x88\x01\x01\x12\x18\n\x0bmax_correct\x18\x07 \x01(\x05H\x03\x88\x01\x01\x42\x08\n\x06_labelB\x07\n\x05_predB\x0c\n\n_min_epochB\x0e\n\x0c_max_correct\"\xa4\x01\n\x0fHardExamplesRes\x12\x11\n\timage_ids\x18\x01 \x03(\x05\x12\x0e\n\x06losses\x18\x02 \x03(\x02\x12\r\n\x05preds\x18\x03 \x03(\x05\x12\x0e\n\x06truths\x18\x04 \x03(\x05\x12\x0f\n\x07\x63orrect\x18\x05 \x03(\x05\x12\x0c\n\x04seen\x18\x06 \x03(\x05\x12\x0e\n\x06\x65pochs\x18\x07 \x03(\x05\x12\x0f\n\x07matched\x18\x08 \x01(\x05\x12\x0f\n\x07indexed\x18\t \x01(\x05*I\n\rScoreEncoding\x12\x12\n\x0eSCORES_FLOAT32\x10\x00\x12\x12\n\x0eSCORES_FLOAT16\x10\x01\x12\x10\n\x0cSCORES_UINT8\x10\x02*6\n\x0bImageFormat\x12\x10\n\x0cIMAGES_TILES\x10\x00\x12\x15\n\x11IMAGES_SPRITE_PNG\x10\x01\x32\xe6\x05\n\x08Training\x12\x32\n\x06Status\x12\x13.services.StatusReq\x1a\x13.services.StatusRes\x12/\n\x05Start\x12\x12.services.StartReq\x1a\x12.services.StartRes\x12\x38\n\x08ListJobs\x12\x15.services.ListJobsReq\x1a\x15.services.ListJobsRes\x12?\n\tSubscribe\x12\x16.services.SubscribeReq\x1a\x18.services.TrainingMetric0\x01\x12P\n\x10SubscribeBatched\x12\x1b.services.SubscribeBatchReq\x1a\x1d.services.TrainingMetricBatch0\x01\x12\x43\n\rSubscribeEval\x12\x1a.services.SubscribeEvalReq\x1a\x14.services.EvalMetric0\x01\x12\x35\n\tGetImages\x12\x13.services.ImagesReq\x1a\x13.services.ImagesRes\x12\x35\n\x07Predict\x12\x14.services.PredictReq\x1a\x14.services.PredictRes\x12?\n\rPredictStream\x12\x14.services.PredictReq\x1a\x14.services.PredictRes(\x01\x30\x01\x12\x32\n\x08GetStats\x12\x12.services.StatsReq\x1a\x12.services.StatsRes\x12\x35\n\x07Profile\x12\x14.services.ProfileReq\x1a\x14.services.ProfileRes\x12I\n\x11QueryHardExamples\x12\x19.services.HardExamplesReq\x1a\x19.services.HardExamplesResb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'metrics_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_TRAININGMETRIC']._serialized_start=28
-  _globals['_TRAININGMETRIC']._serialized_end=180
-  _globals['_SUBSCRIBEREQ']._serialized_start=182
-  _globals['_SUBSCRIBEREQ']._serialized_end=196
-  _globals['_STATUSREQ']._serialized_start=198
-  _globals['_STATUSREQ']._serialized_end=209
-  _globals['_STATUSRES']._serialized_start=211
-  _globals['_STATUSRES']._serialized_end=270
-  _globals['_STARTREQ']._serialized_start=272
-  _globals['_STARTREQ']._serialized_end=321
-  _globals['_STARTRES']._serialized_start=323
-  _globals['_STARTRES']._serialized_end=366
-  _globals['_TRAINING']._serialized_start=369
-  _globals['_TRAINING']._serialized_end=545
+  _globals['_JOBINFO_OVERRIDESENTRY']._loaded_options = None
+  _globals['_JOBINFO_OVERRIDESENTRY']._serialized_options = b'8\001'
+  _globals['_STATSRES_COUNTERSENTRY']._loaded_options = None
+  _globals['_STATSRES_COUNTERSENTRY']._serialized_options = b'8\001'
+  _globals['_STATSRES_GAUGESENTRY']._loaded_options = None
+  _globals['_STATSRES_GAUGESENTRY']._serialized_options = b'8\001'
+  _globals['_STATSRES_LABELSENTRY']._loaded_options = None
+  _globals['_STATSRES_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_SCOREENCODING']._serialized_start=4046
+  _globals['_SCOREENCODING']._serialized_end=4119
+  _globals['_IMAGEFORMAT']._serialized_start=4121
+  _globals['_IMAGEFORMAT']._serialized_end=4175
+  _globals['_PACKEDSAMPLES']._serialized_start=28
+  _globals['_PACKEDSAMPLES']._serialized_end=182
+  _globals['_TRAININGMETRIC']._serialized_start=185
+  _globals['_TRAININGMETRIC']._serialized_end=435
+  _globals['_SUBSCRIBEREQ']._serialized_start=438
+  _globals['_SUBSCRIBEREQ']._serialized_end=815
+  _globals['_SUBSCRIBEBATCHREQ']._serialized_start=818
+  _globals['_SUBSCRIBEBATCHREQ']._serialized_end=966
+  _globals['_TRAININGMETRICBATCH']._serialized_start=968
+  _globals['_TRAININGMETRICBATCH']._serialized_end=1032
+  _globals['_SUBSCRIBEEVALREQ']._serialized_start=1034
+  _globals['_SUBSCRIBEEVALREQ']._serialized_end=1088
+  _globals['_EVALMETRIC']._serialized_start=1091
+  _globals['_EVALMETRIC']._serialized_end=1273
+  _globals['_STATUSREQ']._serialized_start=1275
+  _globals['_STATUSREQ']._serialized_end=1302
+  _globals['_TRAINMODES']._serialized_start=1304
+  _globals['_TRAINMODES']._serialized_end=1386
+  _globals['_STATUSRES']._serialized_start=1389
+  _globals['_STATUSRES']._serialized_end=1641
+  _globals['_RESOURCELAYOUT']._serialized_start=1644
+  _globals['_RESOURCELAYOUT']._serialized_end=1813
+  _globals['_STARTREQ']._serialized_start=1816
+  _globals['_STARTREQ']._serialized_end=2169
+  _globals['_STARTRES']._serialized_start=2171
+  _globals['_STARTRES']._serialized_end=2261
+  _globals['_LISTJOBSREQ']._serialized_start=2263
+  _globals['_LISTJOBSREQ']._serialized_end=2276
+  _globals['_JOBINFO']._serialized_start=2279
+  _globals['_JOBINFO']._serialized_end=2570
+  _globals['_JOBINFO_OVERRIDESENTRY']._serialized_start=2522
+  _globals['_JOBINFO_OVERRIDESENTRY']._serialized_end=2570
+  _globals['_LISTJOBSRES']._serialized_start=2572
+  _globals['_LISTJOBSRES']._serialized_end=2618
+  _globals['_PREDICTREQ']._serialized_start=2620
+  _globals['_PREDICTREQ']._serialized_end=2648
+  _globals['_PREDICTION']._serialized_start=2650
+  _globals['_PREDICTION']._serialized_end=2707
+  _globals['_PREDICTRES']._serialized_start=2709
+  _globals['_PREDICTRES']._serialized_end=2827
+  _globals['_IMAGESREQ']._serialized_start=2829
+  _globals['_IMAGESREQ']._serialized_end=2929
+  _globals['_IMAGESRES']._serialized_start=2931
+  _globals['_IMAGESRES']._serialized_end=3046
+  _globals['_STATSREQ']._serialized_start=3048
+  _globals['_STATSREQ']._serialized_end=3074
+  _globals['_HISTOGRAM']._serialized_start=3077
+  _globals['_HISTOGRAM']._serialized_end=3227
+  _globals['_STATSRES']._serialized_start=3230
+  _globals['_STATSRES']._serialized_end=3572
+  _globals['_STATSRES_COUNTERSENTRY']._serialized_start=3431
+  _globals['_STATSRES_COUNTERSENTRY']._serialized_end=3478
+  _globals['_STATSRES_GAUGESENTRY']._serialized_start=3480
+  _globals['_STATSRES_GAUGESENTRY']._serialized_end=3525
+  _globals['_STATSRES_LABELSENTRY']._serialized_start=3527
+  _globals['_STATSRES_LABELSENTRY']._serialized_end=3572
+  _globals['_PROFILEREQ']._serialized_start=3574
+  _globals['_PROFILEREQ']._serialized_end=3617
+  _globals['_PROFILERES']._serialized_start=3619
+  _globals['_PROFILERES']._serialized_end=3664
+  _globals['_HARDEXAMPLESREQ']._serialized_start=3667
+  _globals['_HARDEXAMPLESREQ']._serialized_end=3877
+  _globals['_HARDEXAMPLESRES']._serialized_start=3880
+  _globals['_HARDEXAMPLESRES']._serialized_end=4044
+  _globals['_TRAINING']._serialized_start=4178
+  _globals['_TRAINING']._serialized_end=4920
 # @@protoc_insertion_point(module_scope)
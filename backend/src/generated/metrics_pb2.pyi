@@ -1,13 +1,46 @@
 from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from collections.abc import Iterable as _Iterable
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class ScoreEncoding(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SCORES_FLOAT32: _ClassVar[ScoreEncoding]
+    SCORES_FLOAT16: _ClassVar[ScoreEncoding]
+    SCORES_UINT8: _ClassVar[ScoreEncoding]
+
+class ImageFormat(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    IMAGES_TILES: _ClassVar[ImageFormat]
+    IMAGES_SPRITE_PNG: _ClassVar[ImageFormat]
+SCORES_FLOAT32: ScoreEncoding
+SCORES_FLOAT16: ScoreEncoding
+SCORES_UINT8: ScoreEncoding
+IMAGES_TILES: ImageFormat
+IMAGES_SPRITE_PNG: ImageFormat
+
+class PackedSamples(_message.Message):
+    __slots__ = ("preds", "truths", "scores", "score_encoding", "image_ids", "image_id_width")
+    PREDS_FIELD_NUMBER: _ClassVar[int]
+    TRUTHS_FIELD_NUMBER: _ClassVar[int]
+    SCORES_FIELD_NUMBER: _ClassVar[int]
+    SCORE_ENCODING_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_IDS_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_ID_WIDTH_FIELD_NUMBER: _ClassVar[int]
+    preds: bytes
+    truths: bytes
+    scores: bytes
+    score_encoding: ScoreEncoding
+    image_ids: bytes
+    image_id_width: int
+    def __init__(self, preds: _Optional[bytes] = ..., truths: _Optional[bytes] = ..., scores: _Optional[bytes] = ..., score_encoding: _Optional[_Union[ScoreEncoding, str]] = ..., image_ids: _Optional[bytes] = ..., image_id_width: _Optional[int] = ...) -> None: ...
+
 class TrainingMetric(_message.Message):
-    __slots__ = ("epoch", "batch", "batch_size", "batch_loss", "preds", "truths", "scores", "image_ids")
+    __slots__ = ("epoch", "batch", "batch_size", "batch_loss", "preds", "truths", "scores", "image_ids", "seq", "packed", "stop_reason", "batches_saved")
     EPOCH_FIELD_NUMBER: _ClassVar[int]
     BATCH_FIELD_NUMBER: _ClassVar[int]
     BATCH_SIZE_FIELD_NUMBER: _ClassVar[int]
@@ -16,6 +49,10 @@ class TrainingMetric(_message.Message):
     TRUTHS_FIELD_NUMBER: _ClassVar[int]
     SCORES_FIELD_NUMBER: _ClassVar[int]
     IMAGE_IDS_FIELD_NUMBER: _ClassVar[int]
+    SEQ_FIELD_NUMBER: _ClassVar[int]
+    PACKED_FIELD_NUMBER: _ClassVar[int]
+    STOP_REASON_FIELD_NUMBER: _ClassVar[int]
+    BATCHES_SAVED_FIELD_NUMBER: _ClassVar[int]
     epoch: int
     batch: int
     batch_size: int
@@ -24,38 +61,406 @@ class TrainingMetric(_message.Message):
     truths: _containers.RepeatedScalarFieldContainer[int]
     scores: _containers.RepeatedScalarFieldContainer[float]
     image_ids: _containers.RepeatedScalarFieldContainer[int]
-    def __init__(self, epoch: _Optional[int] = ..., batch: _Optional[int] = ..., batch_size: _Optional[int] = ..., batch_loss: _Optional[float] = ..., preds: _Optional[_Iterable[int]] = ..., truths: _Optional[_Iterable[int]] = ..., scores: _Optional[_Iterable[float]] = ..., image_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+    seq: int
+    packed: PackedSamples
+    stop_reason: str
+    batches_saved: int
+    def __init__(self, epoch: _Optional[int] = ..., batch: _Optional[int] = ..., batch_size: _Optional[int] = ..., batch_loss: _Optional[float] = ..., preds: _Optional[_Iterable[int]] = ..., truths: _Optional[_Iterable[int]] = ..., scores: _Optional[_Iterable[float]] = ..., image_ids: _Optional[_Iterable[int]] = ..., seq: _Optional[int] = ..., packed: _Optional[_Union[PackedSamples, _Mapping]] = ..., stop_reason: _Optional[str] = ..., batches_saved: _Optional[int] = ...) -> None: ...
 
 class SubscribeReq(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("from_seq", "packed", "score_encoding", "compress", "fields", "every_nth", "min_epoch", "max_epoch", "min_batch", "max_batch", "misclassified_only", "job_id", "run")
+    FROM_SEQ_FIELD_NUMBER: _ClassVar[int]
+    PACKED_FIELD_NUMBER: _ClassVar[int]
+    SCORE_ENCODING_FIELD_NUMBER: _ClassVar[int]
+    COMPRESS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    EVERY_NTH_FIELD_NUMBER: _ClassVar[int]
+    MIN_EPOCH_FIELD_NUMBER: _ClassVar[int]
+    MAX_EPOCH_FIELD_NUMBER: _ClassVar[int]
+    MIN_BATCH_FIELD_NUMBER: _ClassVar[int]
+    MAX_BATCH_FIELD_NUMBER: _ClassVar[int]
+    MISCLASSIFIED_ONLY_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    RUN_FIELD_NUMBER: _ClassVar[int]
+    from_seq: int
+    packed: bool
+    score_encoding: ScoreEncoding
+    compress: bool
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    every_nth: int
+    min_epoch: int
+    max_epoch: int
+    min_batch: int
+    max_batch: int
+    misclassified_only: bool
+    job_id: str
+    run: str
+    def __init__(self, from_seq: _Optional[int] = ..., packed: bool = ..., score_encoding: _Optional[_Union[ScoreEncoding, str]] = ..., compress: bool = ..., fields: _Optional[_Iterable[str]] = ..., every_nth: _Optional[int] = ..., min_epoch: _Optional[int] = ..., max_epoch: _Optional[int] = ..., min_batch: _Optional[int] = ..., max_batch: _Optional[int] = ..., misclassified_only: bool = ..., job_id: _Optional[str] = ..., run: _Optional[str] = ...) -> None: ...
+
+class SubscribeBatchReq(_message.Message):
+    __slots__ = ("subscribe", "max_count", "max_bytes", "max_latency_ms")
+    SUBSCRIBE_FIELD_NUMBER: _ClassVar[int]
+    MAX_COUNT_FIELD_NUMBER: _ClassVar[int]
+    MAX_BYTES_FIELD_NUMBER: _ClassVar[int]
+    MAX_LATENCY_MS_FIELD_NUMBER: _ClassVar[int]
+    subscribe: SubscribeReq
+    max_count: int
+    max_bytes: int
+    max_latency_ms: int
+    def __init__(self, subscribe: _Optional[_Union[SubscribeReq, _Mapping]] = ..., max_count: _Optional[int] = ..., max_bytes: _Optional[int] = ..., max_latency_ms: _Optional[int] = ...) -> None: ...
+
+class TrainingMetricBatch(_message.Message):
+    __slots__ = ("metrics",)
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    metrics: _containers.RepeatedCompositeFieldContainer[TrainingMetric]
+    def __init__(self, metrics: _Optional[_Iterable[_Union[TrainingMetric, _Mapping]]] = ...) -> None: ...
+
+class SubscribeEvalReq(_message.Message):
+    __slots__ = ("from_seq",)
+    FROM_SEQ_FIELD_NUMBER: _ClassVar[int]
+    from_seq: int
+    def __init__(self, from_seq: _Optional[int] = ...) -> None: ...
+
+class EvalMetric(_message.Message):
+    __slots__ = ("seq", "epoch", "batch", "version", "loss", "accuracy", "class_accuracy", "samples", "duration_ms", "job_id")
+    SEQ_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    LOSS_FIELD_NUMBER: _ClassVar[int]
+    ACCURACY_FIELD_NUMBER: _ClassVar[int]
+    CLASS_ACCURACY_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    DURATION_MS_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    seq: int
+    epoch: int
+    batch: int
+    version: int
+    loss: float
+    accuracy: float
+    class_accuracy: _containers.RepeatedScalarFieldContainer[float]
+    samples: int
+    duration_ms: float
+    job_id: str
+    def __init__(self, seq: _Optional[int] = ..., epoch: _Optional[int] = ..., batch: _Optional[int] = ..., version: _Optional[int] = ..., loss: _Optional[float] = ..., accuracy: _Optional[float] = ..., class_accuracy: _Optional[_Iterable[float]] = ..., samples: _Optional[int] = ..., duration_ms: _Optional[float] = ..., job_id: _Optional[str] = ...) -> None: ...
 
 class StatusReq(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class TrainModes(_message.Message):
+    __slots__ = ("model", "bf16", "compiled", "channels_last")
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    BF16_FIELD_NUMBER: _ClassVar[int]
+    COMPILED_FIELD_NUMBER: _ClassVar[int]
+    CHANNELS_LAST_FIELD_NUMBER: _ClassVar[int]
+    model: str
+    bf16: bool
+    compiled: bool
+    channels_last: bool
+    def __init__(self, model: _Optional[str] = ..., bf16: bool = ..., compiled: bool = ..., channels_last: bool = ...) -> None: ...
 
 class StatusRes(_message.Message):
-    __slots__ = ("status", "message", "epoch")
+    __slots__ = ("status", "message", "epoch", "modes", "progress", "job_id", "queued", "running", "stop_reason", "batches_saved", "resources")
     STATUS_FIELD_NUMBER: _ClassVar[int]
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
     EPOCH_FIELD_NUMBER: _ClassVar[int]
+    MODES_FIELD_NUMBER: _ClassVar[int]
+    PROGRESS_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    QUEUED_FIELD_NUMBER: _ClassVar[int]
+    RUNNING_FIELD_NUMBER: _ClassVar[int]
+    STOP_REASON_FIELD_NUMBER: _ClassVar[int]
+    BATCHES_SAVED_FIELD_NUMBER: _ClassVar[int]
+    RESOURCES_FIELD_NUMBER: _ClassVar[int]
     status: str
     message: str
     epoch: int
-    def __init__(self, status: _Optional[str] = ..., message: _Optional[str] = ..., epoch: _Optional[int] = ...) -> None: ...
+    modes: TrainModes
+    progress: float
+    job_id: str
+    queued: int
+    running: int
+    stop_reason: str
+    batches_saved: int
+    resources: ResourceLayout
+    def __init__(self, status: _Optional[str] = ..., message: _Optional[str] = ..., epoch: _Optional[int] = ..., modes: _Optional[_Union[TrainModes, _Mapping]] = ..., progress: _Optional[float] = ..., job_id: _Optional[str] = ..., queued: _Optional[int] = ..., running: _Optional[int] = ..., stop_reason: _Optional[str] = ..., batches_saved: _Optional[int] = ..., resources: _Optional[_Union[ResourceLayout, _Mapping]] = ...) -> None: ...
+
+class ResourceLayout(_message.Message):
+    __slots__ = ("train_cores", "serve_cores", "intra_op_threads", "inter_op_threads", "job_threads", "grpc_workers", "pinned")
+    TRAIN_CORES_FIELD_NUMBER: _ClassVar[int]
+    SERVE_CORES_FIELD_NUMBER: _ClassVar[int]
+    INTRA_OP_THREADS_FIELD_NUMBER: _ClassVar[int]
+    INTER_OP_THREADS_FIELD_NUMBER: _ClassVar[int]
+    JOB_THREADS_FIELD_NUMBER: _ClassVar[int]
+    GRPC_WORKERS_FIELD_NUMBER: _ClassVar[int]
+    PINNED_FIELD_NUMBER: _ClassVar[int]
+    train_cores: _containers.RepeatedScalarFieldContainer[int]
+    serve_cores: _containers.RepeatedScalarFieldContainer[int]
+    intra_op_threads: int
+    inter_op_threads: int
+    job_threads: int
+    grpc_workers: int
+    pinned: bool
+    def __init__(self, train_cores: _Optional[_Iterable[int]] = ..., serve_cores: _Optional[_Iterable[int]] = ..., intra_op_threads: _Optional[int] = ..., inter_op_threads: _Optional[int] = ..., job_threads: _Optional[int] = ..., grpc_workers: _Optional[int] = ..., pinned: bool = ...) -> None: ...
 
 class StartReq(_message.Message):
-    __slots__ = ("num_epochs", "confirmed")
+    __slots__ = ("num_epochs", "confirmed", "resume", "model", "bf16", "compile", "channels_last", "lr", "batch_size", "patience", "priority", "job_id")
     NUM_EPOCHS_FIELD_NUMBER: _ClassVar[int]
     CONFIRMED_FIELD_NUMBER: _ClassVar[int]
+    RESUME_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    BF16_FIELD_NUMBER: _ClassVar[int]
+    COMPILE_FIELD_NUMBER: _ClassVar[int]
+    CHANNELS_LAST_FIELD_NUMBER: _ClassVar[int]
+    LR_FIELD_NUMBER: _ClassVar[int]
+    BATCH_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PATIENCE_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
     num_epochs: int
     confirmed: bool
-    def __init__(self, num_epochs: _Optional[int] = ..., confirmed: bool = ...) -> None: ...
+    resume: bool
+    model: str
+    bf16: bool
+    compile: bool
+    channels_last: bool
+    lr: float
+    batch_size: int
+    patience: int
+    priority: int
+    job_id: str
+    def __init__(self, num_epochs: _Optional[int] = ..., confirmed: bool = ..., resume: bool = ..., model: _Optional[str] = ..., bf16: bool = ..., compile: bool = ..., channels_last: bool = ..., lr: _Optional[float] = ..., batch_size: _Optional[int] = ..., patience: _Optional[int] = ..., priority: _Optional[int] = ..., job_id: _Optional[str] = ...) -> None: ...
 
 class StartRes(_message.Message):
+    __slots__ = ("status", "message", "job_id", "position", "run")
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    RUN_FIELD_NUMBER: _ClassVar[int]
+    status: str
+    message: str
+    job_id: str
+    position: int
+    run: str
+    def __init__(self, status: _Optional[str] = ..., message: _Optional[str] = ..., job_id: _Optional[str] = ..., position: _Optional[int] = ..., run: _Optional[str] = ...) -> None: ...
+
+class ListJobsReq(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class JobInfo(_message.Message):
+    __slots__ = ("job_id", "status", "epoch", "num_epochs", "priority", "overrides", "modes", "stop_reason", "batches_saved", "run")
+    class OverridesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    NUM_EPOCHS_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    MODES_FIELD_NUMBER: _ClassVar[int]
+    STOP_REASON_FIELD_NUMBER: _ClassVar[int]
+    BATCHES_SAVED_FIELD_NUMBER: _ClassVar[int]
+    RUN_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    status: str
+    epoch: int
+    num_epochs: int
+    priority: int
+    overrides: _containers.ScalarMap[str, str]
+    modes: TrainModes
+    stop_reason: str
+    batches_saved: int
+    run: str
+    def __init__(self, job_id: _Optional[str] = ..., status: _Optional[str] = ..., epoch: _Optional[int] = ..., num_epochs: _Optional[int] = ..., priority: _Optional[int] = ..., overrides: _Optional[_Mapping[str, str]] = ..., modes: _Optional[_Union[TrainModes, _Mapping]] = ..., stop_reason: _Optional[str] = ..., batches_saved: _Optional[int] = ..., run: _Optional[str] = ...) -> None: ...
+
+class ListJobsRes(_message.Message):
+    __slots__ = ("jobs",)
+    JOBS_FIELD_NUMBER: _ClassVar[int]
+    jobs: _containers.RepeatedCompositeFieldContainer[JobInfo]
+    def __init__(self, jobs: _Optional[_Iterable[_Union[JobInfo, _Mapping]]] = ...) -> None: ...
+
+class PredictReq(_message.Message):
+    __slots__ = ("images",)
+    IMAGES_FIELD_NUMBER: _ClassVar[int]
+    images: bytes
+    def __init__(self, images: _Optional[bytes] = ...) -> None: ...
+
+class Prediction(_message.Message):
+    __slots__ = ("label", "score", "probs")
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    SCORE_FIELD_NUMBER: _ClassVar[int]
+    PROBS_FIELD_NUMBER: _ClassVar[int]
+    label: int
+    score: float
+    probs: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, label: _Optional[int] = ..., score: _Optional[float] = ..., probs: _Optional[_Iterable[float]] = ...) -> None: ...
+
+class PredictRes(_message.Message):
+    __slots__ = ("predictions", "version", "epoch", "batch", "job_id")
+    PREDICTIONS_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    EPOCH_FIELD_NUMBER: _ClassVar[int]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    predictions: _containers.RepeatedCompositeFieldContainer[Prediction]
+    version: int
+    epoch: int
+    batch: int
+    job_id: str
+    def __init__(self, predictions: _Optional[_Iterable[_Union[Prediction, _Mapping]]] = ..., version: _Optional[int] = ..., epoch: _Optional[int] = ..., batch: _Optional[int] = ..., job_id: _Optional[str] = ...) -> None: ...
+
+class ImagesReq(_message.Message):
+    __slots__ = ("image_ids", "test", "format", "columns")
+    IMAGE_IDS_FIELD_NUMBER: _ClassVar[int]
+    TEST_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    COLUMNS_FIELD_NUMBER: _ClassVar[int]
+    image_ids: _containers.RepeatedScalarFieldContainer[int]
+    test: bool
+    format: ImageFormat
+    columns: int
+    def __init__(self, image_ids: _Optional[_Iterable[int]] = ..., test: bool = ..., format: _Optional[_Union[ImageFormat, str]] = ..., columns: _Optional[int] = ...) -> None: ...
+
+class ImagesRes(_message.Message):
+    __slots__ = ("format", "data", "count", "columns", "tile_size")
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    COLUMNS_FIELD_NUMBER: _ClassVar[int]
+    TILE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    format: ImageFormat
+    data: bytes
+    count: int
+    columns: int
+    tile_size: int
+    def __init__(self, format: _Optional[_Union[ImageFormat, str]] = ..., data: _Optional[bytes] = ..., count: _Optional[int] = ..., columns: _Optional[int] = ..., tile_size: _Optional[int] = ...) -> None: ...
+
+class StatsReq(_message.Message):
+    __slots__ = ("job_id",)
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    def __init__(self, job_id: _Optional[str] = ...) -> None: ...
+
+class Histogram(_message.Message):
+    __slots__ = ("name", "count", "sum", "min", "max", "p50", "p90", "p99", "bounds", "counts")
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    SUM_FIELD_NUMBER: _ClassVar[int]
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    P50_FIELD_NUMBER: _ClassVar[int]
+    P90_FIELD_NUMBER: _ClassVar[int]
+    P99_FIELD_NUMBER: _ClassVar[int]
+    BOUNDS_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    count: int
+    sum: float
+    min: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+    bounds: _containers.RepeatedScalarFieldContainer[float]
+    counts: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, name: _Optional[str] = ..., count: _Optional[int] = ..., sum: _Optional[float] = ..., min: _Optional[float] = ..., max: _Optional[float] = ..., p50: _Optional[float] = ..., p90: _Optional[float] = ..., p99: _Optional[float] = ..., bounds: _Optional[_Iterable[float]] = ..., counts: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class StatsRes(_message.Message):
+    __slots__ = ("histograms", "counters", "gauges", "labels")
+    class CountersEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    class GaugesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: float
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[float] = ...) -> None: ...
+    class LabelsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    HISTOGRAMS_FIELD_NUMBER: _ClassVar[int]
+    COUNTERS_FIELD_NUMBER: _ClassVar[int]
+    GAUGES_FIELD_NUMBER: _ClassVar[int]
+    LABELS_FIELD_NUMBER: _ClassVar[int]
+    histograms: _containers.RepeatedCompositeFieldContainer[Histogram]
+    counters: _containers.ScalarMap[str, int]
+    gauges: _containers.ScalarMap[str, float]
+    labels: _containers.ScalarMap[str, str]
+    def __init__(self, histograms: _Optional[_Iterable[_Union[Histogram, _Mapping]]] = ..., counters: _Optional[_Mapping[str, int]] = ..., gauges: _Optional[_Mapping[str, float]] = ..., labels: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class ProfileReq(_message.Message):
+    __slots__ = ("steps", "job_id")
+    STEPS_FIELD_NUMBER: _ClassVar[int]
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    steps: int
+    job_id: str
+    def __init__(self, steps: _Optional[int] = ..., job_id: _Optional[str] = ...) -> None: ...
+
+class ProfileRes(_message.Message):
     __slots__ = ("status", "message")
     STATUS_FIELD_NUMBER: _ClassVar[int]
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
     status: str
     message: str
     def __init__(self, status: _Optional[str] = ..., message: _Optional[str] = ...) -> None: ...
+
+class HardExamplesReq(_message.Message):
+    __slots__ = ("job_id", "k", "label", "pred", "misclassified_only", "min_epoch", "max_correct")
+    JOB_ID_FIELD_NUMBER: _ClassVar[int]
+    K_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    PRED_FIELD_NUMBER: _ClassVar[int]
+    MISCLASSIFIED_ONLY_FIELD_NUMBER: _ClassVar[int]
+    MIN_EPOCH_FIELD_NUMBER: _ClassVar[int]
+    MAX_CORRECT_FIELD_NUMBER: _ClassVar[int]
+    job_id: str
+    k: int
+    label: int
+    pred: int
+    misclassified_only: bool
+    min_epoch: int
+    max_correct: int
+    def __init__(self, job_id: _Optional[str] = ..., k: _Optional[int] = ..., label: _Optional[int] = ..., pred: _Optional[int] = ..., misclassified_only: bool = ..., min_epoch: _Optional[int] = ..., max_correct: _Optional[int] = ...) -> None: ...
+
+class HardExamplesRes(_message.Message):
+    __slots__ = ("image_ids", "losses", "preds", "truths", "correct", "seen", "epochs", "matched", "indexed")
+    IMAGE_IDS_FIELD_NUMBER: _ClassVar[int]
+    LOSSES_FIELD_NUMBER: _ClassVar[int]
+    PREDS_FIELD_NUMBER: _ClassVar[int]
+    TRUTHS_FIELD_NUMBER: _ClassVar[int]
+    CORRECT_FIELD_NUMBER: _ClassVar[int]
+    SEEN_FIELD_NUMBER: _ClassVar[int]
+    EPOCHS_FIELD_NUMBER: _ClassVar[int]
+    MATCHED_FIELD_NUMBER: _ClassVar[int]
+    INDEXED_FIELD_NUMBER: _ClassVar[int]
+    image_ids: _containers.RepeatedScalarFieldContainer[int]
+    losses: _containers.RepeatedScalarFieldContainer[float]
+    preds: _containers.RepeatedScalarFieldContainer[int]
+    truths: _containers.RepeatedScalarFieldContainer[int]
+    correct: _containers.RepeatedScalarFieldContainer[int]
+    seen: _containers.RepeatedScalarFieldContainer[int]
+    epochs: _containers.RepeatedScalarFieldContainer[int]
+    matched: int
+    indexed: int
+    def __init__(self, image_ids: _Optional[_Iterable[int]] = ..., losses: _Optional[_Iterable[float]] = ..., preds: _Optional[_Iterable[int]] = ..., truths: _Optional[_Iterable[int]] = ..., correct: _Optional[_Iterable[int]] = ..., seen: _Optional[_Iterable[int]] = ..., epochs: _Optional[_Iterable[int]] = ..., matched: _Optional[int] = ..., indexed: _Optional[int] = ...) -> None: ...
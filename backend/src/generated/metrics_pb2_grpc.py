@@ -48,11 +48,56 @@ class TrainingStub(object):
                 request_serializer=metrics__pb2.StartReq.SerializeToString,
                 response_deserializer=metrics__pb2.StartRes.FromString,
                 _registered_method=True)
+        self.ListJobs = channel.unary_unary(
+                '/services.Training/ListJobs',
+                request_serializer=metrics__pb2.ListJobsReq.SerializeToString,
+                response_deserializer=metrics__pb2.ListJobsRes.FromString,
+                _registered_method=True)
         self.Subscribe = channel.unary_stream(
                 '/services.Training/Subscribe',
                 request_serializer=metrics__pb2.SubscribeReq.SerializeToString,
                 response_deserializer=metrics__pb2.TrainingMetric.FromString,
                 _registered_method=True)
+        self.SubscribeBatched = channel.unary_stream(
+                '/services.Training/SubscribeBatched',
+                request_serializer=metrics__pb2.SubscribeBatchReq.SerializeToString,
+                response_deserializer=metrics__pb2.TrainingMetricBatch.FromString,
+                _registered_method=True)
+        self.SubscribeEval = channel.unary_stream(
+                '/services.Training/SubscribeEval',
+                request_serializer=metrics__pb2.SubscribeEvalReq.SerializeToString,
+                response_deserializer=metrics__pb2.EvalMetric.FromString,
+                _registered_method=True)
+        self.GetImages = channel.unary_unary(
+                '/services.Training/GetImages',
+                request_serializer=metrics__pb2.ImagesReq.SerializeToString,
+                response_deserializer=metrics__pb2.ImagesRes.FromString,
+                _registered_method=True)
+        self.Predict = channel.unary_unary(
+                '/services.Training/Predict',
+                request_serializer=metrics__pb2.PredictReq.SerializeToString,
+                response_deserializer=metrics__pb2.PredictRes.FromString,
+                _registered_method=True)
+        self.PredictStream = channel.stream_stream(
+                '/services.Training/PredictStream',
+                request_serializer=metrics__pb2.PredictReq.SerializeToString,
+                response_deserializer=metrics__pb2.PredictRes.FromString,
+                _registered_method=True)
+        self.GetStats = channel.unary_unary(
+                '/services.Training/GetStats',
+                request_serializer=metrics__pb2.StatsReq.SerializeToString,
+                response_deserializer=metrics__pb2.StatsRes.FromString,
+                _registered_method=True)
+        self.Profile = channel.unary_unary(
+                '/services.Training/Profile',
+                request_serializer=metrics__pb2.ProfileReq.SerializeToString,
+                response_deserializer=metrics__pb2.ProfileRes.FromString,
+                _registered_method=True)
+        self.QueryHardExamples = channel.unary_unary(
+                '/services.Training/QueryHardExamples',
+                request_serializer=metrics__pb2.HardExamplesReq.SerializeToString,
+                response_deserializer=metrics__pb2.HardExamplesRes.FromString,
+                _registered_method=True)
 
 
 class TrainingServicer(object):
@@ -70,7 +115,14 @@ class TrainingServicer(object):
         raise NotImplementedError('Method not implemented!')
 
     def Start(self, request, context):
-        """Start training with epochs and confirmation (stateless)
+        """Submit a training job (run config, epochs, priority); it starts once a slot is free
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListJobs(self, request, context):
+        """Every job on the server (queued, training, or retained after finishing)
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -83,6 +135,62 @@ class TrainingServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SubscribeBatched(self, request, context):
+        """Same stream, coalesced into frames under a client-chosen flush policy
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubscribeEval(self, request, context):
+        """Held-out test set results, evaluated in the background on periodic weight snapshots
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetImages(self, request, context):
+        """Many thumbnails in one response, read from the memory-mapped idx image files
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Predict(self, request, context):
+        """Classify images with the latest weight snapshot of the model being trained
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PredictStream(self, request_iterator, context):
+        """Same, one response per request, for clients sending a steady stream of images
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetStats(self, request, context):
+        """Per-stage latency histograms, counters and gauges of the trainer and the server
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Profile(self, request, context):
+        """Capture a torch.profiler trace of the next N training steps
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def QueryHardExamples(self, request, context):
+        """Top-k hardest train samples of a job by last loss, from its server-side per-sample index
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TrainingServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -96,11 +204,56 @@ def add_TrainingServicer_to_server(servicer, server):
                     request_deserializer=metrics__pb2.StartReq.FromString,
                     response_serializer=metrics__pb2.StartRes.SerializeToString,
             ),
+            'ListJobs': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListJobs,
+                    request_deserializer=metrics__pb2.ListJobsReq.FromString,
+                    response_serializer=metrics__pb2.ListJobsRes.SerializeToString,
+            ),
             'Subscribe': grpc.unary_stream_rpc_method_handler(
                     servicer.Subscribe,
                     request_deserializer=metrics__pb2.SubscribeReq.FromString,
                     response_serializer=metrics__pb2.TrainingMetric.SerializeToString,
             ),
+            'SubscribeBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribeBatched,
+                    request_deserializer=metrics__pb2.SubscribeBatchReq.FromString,
+                    response_serializer=metrics__pb2.TrainingMetricBatch.SerializeToString,
+            ),
+            'SubscribeEval': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribeEval,
+                    request_deserializer=metrics__pb2.SubscribeEvalReq.FromString,
+                    response_serializer=metrics__pb2.EvalMetric.SerializeToString,
+            ),
+            'GetImages': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetImages,
+                    request_deserializer=metrics__pb2.ImagesReq.FromString,
+                    response_serializer=metrics__pb2.ImagesRes.SerializeToString,
+            ),
+            'Predict': grpc.unary_unary_rpc_method_handler(
+                    servicer.Predict,
+                    request_deserializer=metrics__pb2.PredictReq.FromString,
+                    response_serializer=metrics__pb2.PredictRes.SerializeToString,
+            ),
+            'PredictStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.PredictStream,
+                    request_deserializer=metrics__pb2.PredictReq.FromString,
+                    response_serializer=metrics__pb2.PredictRes.SerializeToString,
+            ),
+            'GetStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetStats,
+                    request_deserializer=metrics__pb2.StatsReq.FromString,
+                    response_serializer=metrics__pb2.StatsRes.SerializeToString,
+            ),
+            'Profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.Profile,
+                    request_deserializer=metrics__pb2.ProfileReq.FromString,
+                    response_serializer=metrics__pb2.ProfileRes.SerializeToString,
+            ),
+            'QueryHardExamples': grpc.unary_unary_rpc_method_handler(
+                    servicer.QueryHardExamples,
+                    request_deserializer=metrics__pb2.HardExamplesReq.FromString,
+                    response_serializer=metrics__pb2.HardExamplesRes.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'services.Training', rpc_method_handlers)
@@ -170,6 +323,33 @@ class Training(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ListJobs(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/services.Training/ListJobs',
+            metrics__pb2.ListJobsReq.SerializeToString,
+            metrics__pb2.ListJobsRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Subscribe(request,
             target,
@@ -196,3 +376,219 @@ class Training(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SubscribeBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/services.Training/SubscribeBatched',
+            metrics__pb2.SubscribeBatchReq.SerializeToString,
+            metrics__pb2.TrainingMetricBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubscribeEval(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/services.Training/SubscribeEval',
+            metrics__pb2.SubscribeEvalReq.SerializeToString,
+            metrics__pb2.EvalMetric.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetImages(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/services.Training/GetImages',
+            metrics__pb2.ImagesReq.SerializeToString,
+            metrics__pb2.ImagesRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Predict(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/services.Training/Predict',
+            metrics__pb2.PredictReq.SerializeToString,
+            metrics__pb2.PredictRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PredictStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/services.Training/PredictStream',
+            metrics__pb2.PredictReq.SerializeToString,
+            metrics__pb2.PredictRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/services.Training/GetStats',
+            metrics__pb2.StatsReq.SerializeToString,
+            metrics__pb2.StatsRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/services.Training/Profile',
+            metrics__pb2.ProfileReq.SerializeToString,
+            metrics__pb2.ProfileRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def QueryHardExamples(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/services.Training/QueryHardExamples',
+            metrics__pb2.HardExamplesReq.SerializeToString,
+            metrics__pb2.HardExamplesRes.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,70 +1,197 @@
-import os
+import asyncio
+from argparse import ArgumentParser, Namespace
+from typing import Callable
 from concurrent.futures import ThreadPoolExecutor
-from threading import Thread
-import torch
-from torch.nn import CrossEntropyLoss
-from torch.optim import SGD
 from grpc import server as Server
+from grpc import aio
 
 from src.generated import metrics_pb2_grpc as pbg
-from src.services.servicer import Servicer
-from src.training.data_module import DataModule
-from src.training.model import Model
-from src.training.trainer import Trainer
+from src.services.aio_servicer import AsyncServicer
+from src.services.hub import MetricsHub
+from src.services.metrics_log import MetricsLog
+from src.services.resources import ResourceLayout, pin_thread
+from src.services.scheduler import Followed, Job, JobScheduler, Runner
+from src.services.servicer import Classifier, Servicer
+from src.services.stats import Stats
+from src.services.warmup import Warmup
 
+# Nothing above imports torch: the port is bound first, and the training stack is built by the warm-up
+WARMUP_STAGES = ('Importing torch', 'Loading MNIST', 'Building model', 'Starting evaluator and predictor')
 
-def main() -> None:
-    """Entry point for training with gRPC metric streaming server."""
 
-    # Set seed for reproducibility
-    torch.manual_seed(0)
-
-    # 1. Load data
-    data = DataModule(root='./data', batch_size=16, download=True)
-    train_loader, _ = data.get_loaders()
-
-    # 2. Build model + optimizer + loss
-    model = Model()
-    criterion = CrossEntropyLoss()
-    optimizer = SGD(model.parameters(), lr=0.01)
-
-    # 3. Create trainer (producer of metrics)
-    trainer = Trainer(
-        model=model,
-        criterion=criterion,
-        optimizer=optimizer,
-        dataloader=train_loader,
-        tolerance=0.005,
-        update_interval=160,
-    )
+def build_stack(warmup: Warmup, args: Namespace, scheduler: JobScheduler, evals: MetricsHub | None,
+                layout: ResourceLayout) -> tuple[Callable[[Job], Runner], Classifier | None]:
+    """Import torch, load the data and build everything training needs (runs on the warm-up thread)."""
+    # Threads started from here on (torch's pools, evaluator, predictor) inherit the training cores
+    if layout.pinned:
+        layout.train_cores = pin_thread(layout.train_cores)
+    warmup.stage('Importing torch')
+    import torch
+    torch.set_num_threads(layout.intra_op_threads)
+    torch.set_num_interop_threads(layout.inter_op_threads)     # Only possible before the pool first runs
+    layout.intra_op_threads = torch.get_num_threads()
+    from dataclasses import replace
+    from src.training.config import TrainConfig
+    from src.training.dataset_cache import load_mnist
+    from src.training.evaluator import Evaluator
+    from src.training.model import MODELS
+    from src.training.predictor import Predictor
+    from src.training.runner import ProcessRunner, ThreadRunner
+    from src.training.snapshots import WeightSnapshots
 
-    # 4. Define training callback
-    def worker(num_epochs: int) -> None:
-        """Callback that runs training in a background thread."""
-        thread = Thread(target=trainer.train, args=(num_epochs,), daemon=True)
-        thread.start()
-
-    # 5. Start gRPC server that streams metrics
-    port = 50051
-    queue = trainer.metrics
-    
-    os.system('cls')
-    print("🚀 Starting gRPC Training Server...")
-    servicer = Servicer(queue, on_start=worker)             # Equivalent of router with set routes
-    server = Server(ThreadPoolExecutor(max_workers=10))     # Equivalent of app = express()
+    # Data, model + optimizer + loss, and the trainer (producer of metrics) are built for every job
+    # from this config, so a StartReq can override the run config and acceleration modes;
+    # in isolated and data-parallel modes each training process builds its own
+    config = TrainConfig(root='./data', checkpoint_every=args.checkpoint_every, checkpoint_keep=args.checkpoint_keep,
+                         model=args.model, bf16=args.bf16, compile=args.compile, channels_last=args.channels_last,
+                         patience=args.patience, snapshot_every=args.snapshot_every, cores=layout.train_cores,
+                         threads=layout.job_threads, interop_threads=layout.inter_op_threads)
+
+    # Download MNIST and build the array cache now, so Start (and every training process) maps it instantly
+    warmup.stage('Loading MNIST')
+    load_mnist(config.root)
+
+    # One forward pass initializes torch's thread pool and CPU kernels ahead of the first request
+    warmup.stage('Building model')
+    with torch.inference_mode():
+        MODELS[config.model]()(torch.zeros(1, 1, 28, 28))
+
+    # Periodic weight snapshots feed held-out evaluation (with its own result hub) and Predict,
+    # each on a background thread of its own
+    warmup.stage('Starting evaluator and predictor')
+    snapshots, predictor = None, None
+    if evals is not None:
+        snapshots = WeightSnapshots()
+        Evaluator(snapshots, evals, root=config.root).start()
+        predictor = Predictor(snapshots, max_batch=args.predict_max_batch, max_wait=args.predict_max_wait_ms / 1000,
+                              stats=scheduler.stats)
+        predictor.start()
+
+    def make_runner(job: Job) -> Runner:
+        """Runner for one job: its own config (raising ValueError if invalid) and checkpoint directory."""
+        checkpoint_dir = f'{config.checkpoint_dir}/{job.id}' if config.checkpoint_dir else None
+        job_config = replace(config, **job.overrides, checkpoint_dir=checkpoint_dir)
+        sink = Followed(snapshots, scheduler, job.id) if snapshots else None
+        # Concurrent jobs each get a process: threads would fight over the GIL
+        if args.isolated or args.max_jobs > 1:
+            return ProcessRunner(job_config, job.hub, world_size=args.workers, snapshots=sink)
+        return ThreadRunner(job_config, job.hub, world_size=args.workers, snapshots=sink)
+
+    return make_runner, predictor
+
+
+def serve(scheduler: JobScheduler, warmup: Warmup, layout: ResourceLayout, port: int,
+          evals: MetricsHub | None = None) -> None:
+    """Run the thread-pool gRPC server (one pool thread per open stream), warming up once it listens."""
+    servicer = Servicer(scheduler, evals, warmup=warmup, layout=layout)     # Equivalent of router with set routes
+    server = Server(ThreadPoolExecutor(max_workers=layout.grpc_workers))    # Equivalent of app = express()
     pbg.add_TrainingServicer_to_server(servicer, server)    # Equivalent of app.use(router)
     server.add_insecure_port(f'0.0.0.0:{port}')             # |
     server.start()                                          # Equivalent of app.listen(port, ...)
 
     print(f"✅ Server listening on port {port}")
     print("📡 Awaiting client connection...\n")
+    warmup.start(servicer.attach)
 
-    # 6. Keep server running until interrupted
+    # Keep server running until interrupted
     try:
         server.wait_for_termination()
     except KeyboardInterrupt:
         server.stop(grace=2)
 
 
+async def serve_aio(scheduler: JobScheduler, warmup: Warmup, layout: ResourceLayout, port: int,
+                    evals: MetricsHub | None = None) -> None:
+    """Run the asyncio gRPC server (streams are coroutines woken by hub events, no thread cap)."""
+    servicer = AsyncServicer(scheduler, evals, warmup=warmup, layout=layout)
+    server = aio.server()
+    pbg.add_TrainingServicer_to_server(servicer, server)
+    server.add_insecure_port(f'0.0.0.0:{port}')
+    await server.start()
+
+    print(f"✅ Server listening on port {port} (asyncio)")
+    print("📡 Awaiting client connection...\n")
+    warmup.start(servicer.attach)
+
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=2)
+
+
+def main() -> None:
+    """Entry point for training with gRPC metric streaming server."""
+
+    parser = ArgumentParser(description='MNIST training server with gRPC metric streaming')
+    parser.add_argument('--port', type=int, default=50051)
+    parser.add_argument('--aio', action='store_true', help='serve with grpc.aio instead of a thread pool')
+    parser.add_argument('--workers', type=int, default=1, help='data-parallel training processes (DDP over gloo)')
+    parser.add_argument('--max-jobs', type=int, default=1,
+                        help='training jobs run at once, each in its own process when > 1 (the rest wait in a queue)')
+    parser.add_argument('--isolated', action='store_true',
+                        help='train in a child process, streaming metrics back through shared memory')
+    parser.add_argument('--checkpoint-every', type=int, default=1, help='checkpoint every N epochs')
+    parser.add_argument('--checkpoint-keep', type=int, default=3, help='checkpoints retained on disk')
+    parser.add_argument('--patience', type=int, default=0,
+                        help='end a run once its smoothed loss has gone N batches without improving (0 disables; '
+                             'StartReq can override)')
+    parser.add_argument('--model', choices=('mlp', 'cnn'), default='mlp', help='architecture (StartReq can override)')
+    parser.add_argument('--bf16', action='store_true', help='CPU bfloat16 autocast')
+    parser.add_argument('--compile', action='store_true', help='torch.compile the model (warmed up before training)')
+    parser.add_argument('--channels-last', action='store_true', help='NHWC memory format for the CNN')
+    parser.add_argument('--snapshot-every', type=int, default=500,
+                        help='publish weight snapshots for evaluation and Predict every N batches (0 disables both)')
+    parser.add_argument('--predict-max-batch', type=int, default=64, help='images per Predict micro-batch')
+    parser.add_argument('--predict-max-wait-ms', type=float, default=5.0,
+                        help='longest a Predict request waits for others to batch with')
+    parser.add_argument('--train-cores', help='CPUs for training compute, e.g. "0-13" (default: all but the serving cores)')
+    parser.add_argument('--serve-cores', help='CPUs for the gRPC server and serialization, e.g. "14-15" '
+                                              '(default: the top 1 in 8 CPUs, given 4 or more; otherwise shared)')
+    parser.add_argument('--intra-op-threads', type=int, default=0,
+                        help='torch intra-op threads, split between concurrent jobs (default: one per training core)')
+    parser.add_argument('--inter-op-threads', type=int, default=1, help='torch inter-op threads')
+    parser.add_argument('--grpc-workers', type=int, default=10, help='thread-pool server workers (one per open stream)')
+    parser.add_argument('--no-pin', action='store_true', help='size the thread pools but leave CPU affinity alone')
+    args = parser.parse_args()
+
+    # 0. Resource governor: the serving cores for this thread (and so the scheduler and gRPC server threads),
+    #    the training cores for the warm-up and training threads and processes
+    try:
+        layout = ResourceLayout.plan(args.train_cores, args.serve_cores, args.intra_op_threads, args.inter_op_threads,
+                                     grpc_workers=0 if args.aio else args.grpc_workers,
+                                     max_jobs=args.max_jobs, pin=not args.no_pin)
+    except ValueError as e:
+        parser.error(str(e))
+    if layout.pinned:
+        layout.serve_cores = pin_thread(layout.serve_cores)
+    print(f'🧮 {layout.describe()}')
+
+    # 1. Job scheduler; every job streams through a fan-out hub of its own, backed by a durable log
+    stats = Stats()
+    scheduler = JobScheduler(
+        make_hub=lambda job_id, run: MetricsHub(capacity=1024, subscriber_capacity=256, policy='drop_oldest',
+                                                log=MetricsLog(root=f'./data/logs/{job_id}/{run}'), stats=stats),
+        max_jobs=args.max_jobs,
+        stats=stats,
+    )
+    if restored := scheduler.restore('./data/logs'):
+        print(f'📼 Restored {len(restored)} finished jobs from ./data/logs')
+    scheduler.start()
+
+    # 2-4. Evaluation results get a hub of their own; data, model and the runner factory are built by the warm-up
+    evals = MetricsHub(capacity=256) if args.snapshot_every > 0 else None
+    warmup = Warmup(WARMUP_STAGES, lambda warmup: build_stack(warmup, args, scheduler, evals, layout))
+
+    # 5. Start gRPC server that streams metrics right away, until interrupted
+    print("🚀 Starting gRPC Training Server...")
+    if args.aio:
+        try:
+            asyncio.run(serve_aio(scheduler, warmup, layout, args.port, evals))
+        except KeyboardInterrupt:
+            pass
+    else:
+        serve(scheduler, warmup, layout, args.port, evals)
+
+
 if __name__ == '__main__':
     main()
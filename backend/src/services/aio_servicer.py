@@ -0,0 +1,177 @@
+import asyncio
+from time import perf_counter
+from typing import AsyncIterator, Callable
+import grpc
+
+from src.generated import metrics_pb2 as pb
+from src.services.encoding import WireFormat
+from src.services.filters import MetricFilter
+from src.services.hub import MetricsHub, SlowConsumerError
+from src.services.images import ImageStore
+from src.services.resources import ResourceLayout
+from src.services.scheduler import JobScheduler
+from src.services.servicer import (Classifier, Framer, Servicer, decode_images, missing_job, replaced_run,
+                                  to_predict_res)
+from src.services.warmup import Warmup
+
+
+class AsyncServicer(Servicer):
+    """asyncio (grpc.aio) flavour of the Servicer: streams are woken by hub events instead of polling threads."""
+
+    loop: asyncio.AbstractEventLoop
+    wakeup: asyncio.Event               # Set (and replaced) on every publish; waiters grab it before polling
+
+    def __init__(self, scheduler: JobScheduler, evals: MetricsHub | None = None,
+                 predictor: Classifier | None = None, images: ImageStore | None = None,
+                 warmup: Warmup | None = None, layout: ResourceLayout | None = None) -> None:
+        super().__init__(scheduler, evals, predictor, images, warmup, layout)
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+
+        # Trainers (and the evaluator) publish from their own threads; hop onto the loop to wake subscribers
+        scheduler.add_listener(self.notify_threadsafe)
+        if evals:
+            evals.add_listener(self.notify_threadsafe)
+
+    def notify_threadsafe(self) -> None:
+        """Hub listener: schedule a wakeup from any thread."""
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.notify)
+
+    def notify(self) -> None:
+        """Wake every subscriber waiting on the current event (runs on the loop)."""
+        self.wakeup.set()
+        self.wakeup = asyncio.Event()
+
+    # The unary handlers below share the thread-pool servicer's code, and run it off the loop: Start opens
+    # the job's log, allocates shared memory and may spawn a process; the others take scheduler and hub locks
+    async def Status(self, req: pb.StatusReq, ctx: grpc.aio.ServicerContext) -> pb.StatusRes:
+        return await asyncio.to_thread(super().Status, req, ctx)   # type: ignore[arg-type]
+
+    async def Start(self, req: pb.StartReq, ctx: grpc.aio.ServicerContext) -> pb.StartRes:
+        return await asyncio.to_thread(super().Start, req, ctx)   # type: ignore[arg-type]
+
+    async def ListJobs(self, req: pb.ListJobsReq, ctx: grpc.aio.ServicerContext) -> pb.ListJobsRes:
+        return await asyncio.to_thread(super().ListJobs, req, ctx)   # type: ignore[arg-type]
+
+    async def QueryHardExamples(self, req: pb.HardExamplesReq, ctx: grpc.aio.ServicerContext) -> pb.HardExamplesRes:
+        """Top-k hardest train samples of a job by last loss, with optional filters."""
+        res = await asyncio.to_thread(self.hard_examples, req)  # Waits out a concurrent SampleIndex.close
+        if isinstance(res, tuple):
+            await ctx.abort(*res)
+        return res                                              # type: ignore[return-value]
+
+    async def SubscribeEval(self, req: pb.SubscribeEvalReq, ctx: grpc.aio.ServicerContext) -> AsyncIterator[pb.EvalMetric]:  # type: ignore[override]
+        """Stream held-out evaluation results as the evaluator produces them."""
+        if self.evals is None:
+            await ctx.abort(grpc.StatusCode.FAILED_PRECONDITION, 'Evaluation is disabled on this server')
+        sub = self.evals.subscribe(from_seq=req.from_seq if req.HasField('from_seq') else None)   # type: ignore[union-attr]
+        try:
+            while True:
+                wakeup = self.wakeup
+                result = sub.get(timeout=0)
+                if result is not None:
+                    yield pb.EvalMetric(**result)
+                    continue
+                if sub.closed or self.evals.closed:                 # type: ignore[union-attr]
+                    break
+                await wakeup.wait()
+        finally:
+            sub.close()
+
+    async def Predict(self, req: pb.PredictReq, ctx: grpc.aio.ServicerContext) -> pb.PredictRes:
+        """Classify images with the latest weight snapshot, batched together with concurrent requests."""
+        if (error := self.predict_error(req)) is not None:
+            await ctx.abort(*error)
+        return to_predict_res(await asyncio.wrap_future(self.predictor.submit(decode_images(req))))   # type: ignore[union-attr]
+
+    async def PredictStream(self, reqs: AsyncIterator[pb.PredictReq], ctx: grpc.aio.ServicerContext) -> AsyncIterator[pb.PredictRes]:  # type: ignore[override]
+        """Answer a stream of Predict requests in order."""
+        async for req in reqs:
+            if (error := self.predict_error(req)) is not None:
+                await ctx.abort(*error)
+            yield to_predict_res(await asyncio.wrap_future(self.predictor.submit(decode_images(req))))  # type: ignore[union-attr]
+
+    async def GetImages(self, req: pb.ImagesReq, ctx: grpc.aio.ServicerContext) -> pb.ImagesRes:
+        """Many thumbnails in one response (raw tiles or a sprite), cached by request."""
+        res = await asyncio.to_thread(self.load_images, req)     # Page faults and PNG encoding stay off the loop
+        if isinstance(res, tuple):
+            await ctx.abort(*res)
+        return res                                              # type: ignore[return-value]
+
+    async def GetStats(self, req: pb.StatsReq, ctx: grpc.aio.ServicerContext) -> pb.StatsRes:
+        return await asyncio.to_thread(super().GetStats, req, ctx)   # type: ignore[arg-type]
+
+    async def Profile(self, req: pb.ProfileReq, ctx: grpc.aio.ServicerContext) -> pb.ProfileRes:
+        return await asyncio.to_thread(super().Profile, req, ctx)   # type: ignore[arg-type]
+
+    async def Subscribe(self, req: pb.SubscribeReq, ctx: grpc.aio.ServicerContext) -> AsyncIterator[pb.TrainingMetric]:  # type: ignore[override]
+        """Stream metrics to subscribers as they arrive."""
+        async for msg in self.follow_async(req, ctx, poll=lambda: None):
+            if msg is not None:
+                yield msg
+
+    async def SubscribeBatched(self, req: pb.SubscribeBatchReq, ctx: grpc.aio.ServicerContext) -> AsyncIterator[pb.TrainingMetricBatch]:  # type: ignore[override]
+        """Stream metrics coalesced into frames, flushed by count, size or latency."""
+        framer = Framer(req)
+
+        def poll() -> float | None:
+            timeout = framer.timeout()
+            return None if timeout == float('inf') else timeout
+
+        async for msg in self.follow_async(req.subscribe, ctx, poll):
+            if msg is not None:
+                framer.add(msg)
+            if (frame := framer.flush()) is not None:
+                yield frame
+
+    async def follow_async(self, req: pb.SubscribeReq, ctx: grpc.aio.ServicerContext,
+                           poll: Callable[[], float | None]) -> AsyncIterator[pb.TrainingMetric | None]:
+        """Yield encoded metrics for one subscriber, or None each time `poll()` seconds pass idle."""
+        job = self.scheduler.get(req.job_id)
+        if job is None:
+            await ctx.abort(grpc.StatusCode.NOT_FOUND, missing_job(req.job_id))
+        if reason := replaced_run(job, req.run):
+            await ctx.abort(grpc.StatusCode.FAILED_PRECONDITION, reason)
+        from_seq = req.from_seq if req.HasField('from_seq') else None
+        sub = job.hub.subscribe(from_seq=from_seq)              # Private cursor into the job's ring
+        fmt = WireFormat.from_req(req)
+        filt = MetricFilter.from_req(req)
+        if req.compress:
+            ctx.set_compression(grpc.Compression.Gzip)
+        stats = self.stats
+        try:
+            print("Client connected to stream")
+
+            # Client disconnects cancel this task at the await below
+            while True:
+                wakeup = self.wakeup
+                metric = sub.get(timeout=0)                     # Never blocks the loop
+                if metric is not None:
+                    if filt.accepts(metric):
+                        start = perf_counter()
+                        msg = self.messages.get(job.id, job.run, metric, fmt, filt)
+                        sent = perf_counter()
+                        yield msg
+                        stats.record('stream.encode', sent - start)
+                        stats.record('stream.send', perf_counter() - sent)
+                        stats.count('stream.sent')
+                    continue
+                if sub.closed or job.hub.closed:
+                    break
+
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=poll())
+                except TimeoutError:
+                    yield None                                  # Idle tick so the caller can flush
+
+        except SlowConsumerError as e:
+            # Slow subscriber under the 'disconnect' policy; let it reconnect at the live tail
+            await ctx.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+
+        except Exception as e:
+            # Abort the RPC with INTERNAL error so the client knows something went wrong
+            await ctx.abort(grpc.StatusCode.INTERNAL, f"Streaming error: {e}")
+
+        finally:
+            sub.close()
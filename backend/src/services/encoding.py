@@ -0,0 +1,134 @@
+import struct
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, NamedTuple
+import numpy as np
+from numpy.typing import NDArray
+
+from src.generated import metrics_pb2 as pb
+from src.services.filters import MetricFilter
+
+SMALL_BATCH = 64                    # Up to this many values, struct packs a Python list faster than numpy converts it
+STRUCT_CODES = {'u1': 'B', '<u2': 'H', '<u4': 'I', '<f4': 'f'}
+
+
+def pack_array(values: Any, dtype: str) -> bytes:
+    """Little-endian bytes of a 1-D array or list (arrays already of `dtype` aren't copied before serializing)."""
+    if isinstance(values, np.ndarray):
+        return values.astype(dtype, copy=False).tobytes()
+    if len(values) <= SMALL_BATCH:
+        return struct.pack(f'<{len(values)}{STRUCT_CODES[dtype]}', *values)
+    return np.asarray(values, dtype=dtype).tobytes()
+
+
+def as_list(values: Any) -> list:
+    """Python values of a 1-D sequence (lists, as the trainer publishes them, are used as they are)."""
+    return values if isinstance(values, list) else np.asarray(values).tolist()
+
+
+def pack_ids(ids: Any) -> tuple[bytes, int]:
+    """Fixed-width ids: u16 while they all fit (every MNIST id does), else u32. Returns the bytes and the width."""
+    wide = len(ids) > 0 and (ids.max() if isinstance(ids, np.ndarray) else max(ids)) > 0xFFFF
+    return pack_array(ids, '<u4' if wide else '<u2'), 4 if wide else 2
+
+
+def unpack_ids(data: bytes, width: int = 2) -> NDArray[np.int64]:
+    """Inverse of pack_ids."""
+    return np.frombuffer(data, dtype='<u4' if width == 4 else '<u2').astype(np.int64)
+
+
+def pack_scores(scores: Any, encoding: int) -> bytes:
+    """Encode confidence scores at the requested precision."""
+    if encoding == pb.SCORES_FLOAT16:
+        return np.asarray(scores, dtype=np.float32).astype('<f2').tobytes()
+    if encoding == pb.SCORES_UINT8:
+        q = np.asarray(scores, dtype=np.float32) * 255      # Softmax probabilities, so already within [0, 255]
+        return np.rint(q, out=q).astype(np.uint8).tobytes()
+    return pack_array(scores, '<f4')
+
+
+def unpack_scores(data: bytes, encoding: int) -> NDArray[np.float32]:
+    """Inverse of pack_scores (lossy for the reduced-precision encodings)."""
+    if encoding == pb.SCORES_FLOAT16:
+        return np.frombuffer(data, dtype='<f2').astype(np.float32)
+    if encoding == pb.SCORES_UINT8:
+        return np.frombuffer(data, dtype=np.uint8).astype(np.float32) / 255
+    return np.frombuffer(data, dtype='<f4')
+
+
+def unpack_samples(packed: pb.PackedSamples) -> dict[str, NDArray]:
+    """Decode a PackedSamples message back into per-sample arrays (for clients and tools)."""
+    return {
+        'preds': np.frombuffer(packed.preds, dtype=np.uint8),
+        'truths': np.frombuffer(packed.truths, dtype=np.uint8),
+        'scores': unpack_scores(packed.scores, packed.score_encoding),
+        'image_ids': unpack_ids(packed.image_ids, packed.image_id_width),
+    }
+
+
+class WireFormat(NamedTuple):
+    """Encoding options a subscriber negotiated in its SubscribeReq."""
+
+    packed: bool
+    score_encoding: int
+
+    @classmethod
+    def from_req(cls, req: pb.SubscribeReq) -> 'WireFormat':
+        return cls(req.packed, req.score_encoding)
+
+
+def to_proto(metric: Any, fmt: WireFormat) -> pb.TrainingMetric:
+    """Build a TrainingMetric straight from the metric's arrays, without per-element Python loops."""
+    msg = pb.TrainingMetric(
+        epoch=int(metric['epoch']),
+        batch=int(metric['batch']),
+        batch_size=int(metric['batch_size']),
+        batch_loss=float(metric['batch_loss']),
+        seq=int(metric['seq']),
+        stop_reason=metric.get('stop_reason', ''),
+        batches_saved=int(metric.get('batches_saved', 0)),
+    )
+
+    if fmt.packed:
+        packed = msg.packed
+        packed.preds = pack_array(metric.get('preds', []), 'u1')
+        packed.truths = pack_array(metric.get('truths', []), 'u1')
+        packed.scores = pack_scores(metric.get('scores', []), fmt.score_encoding)
+        packed.score_encoding = fmt.score_encoding          # type: ignore[assignment]
+        packed.image_ids, packed.image_id_width = pack_ids(metric.get('image_ids', []))
+    else:
+        msg.preds.extend(as_list(metric.get('preds', [])))
+        msg.truths.extend(as_list(metric.get('truths', [])))
+        msg.scores.extend(as_list(metric.get('scores', [])))
+        msg.image_ids.extend(as_list(metric.get('image_ids', [])))
+
+    return msg
+
+
+class MessageCache:
+    """Small LRU of built messages keyed by (job, run, seq, wire format, filter), shared by all subscribers."""
+
+    size: int
+    entries: OrderedDict[tuple, pb.TrainingMetric]
+    lock: Lock
+
+    def __init__(self, size: int = 64) -> None:
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, job: str, run: str, metric: Any, fmt: WireFormat, filt: MetricFilter) -> pb.TrainingMetric:
+        """Return the filtered, encoded message, building it only for the first subscriber that asks."""
+        key = (job, run, metric['seq'], fmt, filt)             # Every run's hub numbers its metrics from 0
+        with self.lock:
+            msg = self.entries.get(key)
+            if msg is not None:
+                self.entries.move_to_end(key)
+                return msg
+
+        msg = to_proto(filt.apply(metric), fmt)
+        with self.lock:
+            self.entries[key] = msg
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return msg
@@ -0,0 +1,54 @@
+from typing import Any, NamedTuple
+import numpy as np
+
+from src.generated import metrics_pb2 as pb
+
+SAMPLE_FIELDS = ('preds', 'truths', 'scores', 'image_ids')     # Per-sample arrays a field mask can select
+INT32_MAX = 2**31 - 1
+
+
+class MetricFilter(NamedTuple):
+    """Server-side subscription filter, applied to metrics before they are encoded."""
+
+    fields: tuple[str, ...]         # Per-sample arrays to keep
+    every_nth: int                  # Keep metrics whose seq is a multiple of this (1 = all)
+    epochs: tuple[int, int]         # Inclusive epoch range
+    batches: tuple[int, int]        # Inclusive batch range
+    misclassified_only: bool        # Keep only samples where preds != truths
+
+    @classmethod
+    def from_req(cls, req: pb.SubscribeReq) -> 'MetricFilter':
+        """Build a filter from a SubscribeReq; unset options let everything through."""
+        def bound(name: str, default: int) -> int:
+            return getattr(req, name) if req.HasField(name) else default
+
+        return cls(
+            fields=tuple(f for f in SAMPLE_FIELDS if f in req.fields) if req.fields else SAMPLE_FIELDS,
+            every_nth=max(req.every_nth, 1),
+            epochs=(bound('min_epoch', 0), bound('max_epoch', INT32_MAX)),
+            batches=(bound('min_batch', 0), bound('max_batch', INT32_MAX)),
+            misclassified_only=req.misclassified_only,
+        )
+
+    def accepts(self, metric: Any) -> bool:
+        """Whether the metric should be sent at all (decimation and range checks)."""
+        return (
+            (metric['seq'] % self.every_nth == 0 or bool(metric.get('stop_reason')))    # Never decimate the final metric
+            and self.epochs[0] <= metric['epoch'] <= self.epochs[1]
+            and self.batches[0] <= metric['batch'] <= self.batches[1]
+        )
+
+    def apply(self, metric: Any) -> dict[str, Any]:
+        """Return a copy of the metric reduced to the selected fields and samples."""
+        out = {k: v for k, v in metric.items() if k not in SAMPLE_FIELDS}
+
+        # One vectorized mask shared by every kept array
+        mask = None
+        if self.misclassified_only:
+            mask = np.asarray(metric['preds']) != np.asarray(metric['truths'])
+
+        for field in self.fields:
+            values = np.asarray(metric.get(field, []))
+            out[field] = values[mask] if mask is not None and values.size == mask.size else values
+
+        return out
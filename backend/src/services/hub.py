@@ -0,0 +1,194 @@
+from threading import Condition, Lock
+from time import perf_counter
+from typing import Any, Callable, Literal
+
+from src.services.metrics_log import MetricsLog
+from src.services.stats import Stats
+
+SlowConsumerPolicy = Literal['drop_oldest', 'coalesce', 'disconnect']
+
+
+class SlowConsumerError(Exception):
+    """Raised when a subscriber falls too far behind under the 'disconnect' policy."""
+
+
+class Subscription:
+    """A subscriber's private cursor into the hub's shared ring buffer."""
+
+    hub: 'MetricsHub'
+    cursor: int                     # Sequence number of the next item to read
+    capacity: int                   # Max number of items this subscriber may lag behind
+    policy: SlowConsumerPolicy      # What to do when the lag exceeds capacity
+    dropped: int                    # Items skipped because the subscriber was too slow
+    replaying: bool                 # True while catching up from history (no lag bound)
+    closed: bool
+
+    def __init__(self, hub: 'MetricsHub', cursor: int, capacity: int, policy: SlowConsumerPolicy,
+                 replaying: bool = False) -> None:
+        self.hub = hub
+        self.cursor = cursor
+        self.capacity = capacity
+        self.policy = policy
+        self.dropped = 0
+        self.replaying = replaying
+        self.closed = False
+
+    def get(self, timeout: float | None = None) -> Any | None:
+        """Block until the next item is available, returning None on timeout or close."""
+        with self.hub.cond:
+            while self.cursor >= self.hub.head and not (self.closed or self.hub.closed):
+                if not self.hub.cond.wait(timeout):
+                    return None
+
+            if self.closed or self.cursor >= self.hub.head:
+                return None
+
+            lag = self.hub.head - self.cursor
+            if self.replaying and lag <= self.capacity and self.cursor >= self.hub.oldest():
+                self.replaying = False                  # Caught up with the live tail
+
+            if self.replaying and self.hub.log and self.cursor < self.hub.oldest():
+                if self.hub.closed:
+                    return None                         # Its log is closed: history ends here
+                seq = self.cursor                       # No longer in the ring: read it from disk
+                self.cursor += 1
+            else:
+                # Enforce the lag bound lazily, at read time, so publishing stays O(1)
+                if lag > (self.hub.head - self.hub.oldest() if self.replaying else self.capacity):
+                    self._catch_up(lag)
+
+                item = self.hub.ring[self.cursor % self.hub.capacity]
+                self.cursor += 1
+                return item
+
+        try:
+            return self.hub.log.read(seq)           # type: ignore[union-attr]
+        except ValueError:
+            return None                             # The hub closed (and its log with it) meanwhile
+
+    def _catch_up(self, lag: int) -> None:
+        """Apply the slow-consumer policy (caller must hold the hub lock)."""
+        if self.policy == 'disconnect':
+            self.closed = True
+            self.hub.subscribers.discard(self)
+            raise SlowConsumerError(f'Subscriber fell {lag} metrics behind (limit {self.capacity})')
+
+        keep = 1 if self.policy == 'coalesce' else self.capacity
+        self.dropped += lag - keep
+        self.hub.dropped += lag - keep
+        self.cursor = self.hub.head - keep
+
+    def close(self) -> None:
+        """Detach from the hub and wake any blocked reader."""
+        with self.hub.cond:
+            self.closed = True
+            self.hub.subscribers.discard(self)
+            self.hub.cond.notify_all()
+
+
+class MetricsHub:
+    """Fan-out broadcast hub: one shared ring buffer, one cursor per subscriber."""
+
+    capacity: int                           # Number of slots in the shared ring
+    subscriber_capacity: int                # Default per-subscriber lag bound
+    policy: SlowConsumerPolicy              # Default slow-consumer policy
+    ring: list[Any]                         # Shared ring buffer (overwritten in place)
+    head: int                               # Sequence number of the next item to publish
+    base: int                               # First sequence number published by this process
+    dropped: int                            # Total items skipped across all subscribers
+    subscribers: set[Subscription]
+    log: MetricsLog | None                  # Optional durable history backing replay
+    listeners: list[Callable[[], None]]     # Called (on the publisher's thread) after every put/close
+    closed: bool
+    cond: Condition                         # Guards the ring and cursors; held only briefly, never over disk I/O
+    publish: Lock                           # Serializes publishers, so log appends stay in seq order
+    stats: Stats                            # Server-side stage timings (publish, encode, send), may be shared
+
+    def __init__(self, capacity: int = 1024, subscriber_capacity: int = 256,
+                 policy: SlowConsumerPolicy = 'drop_oldest', log: MetricsLog | None = None,
+                 stats: Stats | None = None) -> None:
+        self.capacity = capacity
+        self.subscriber_capacity = min(subscriber_capacity, capacity)
+        self.policy = policy
+        self.ring = [None] * capacity
+        self.head = log.count if log else 0         # Sequence numbers continue across restarts
+        self.base = self.head
+        self.dropped = 0
+        self.log = log
+        self.listeners = []
+        self.subscribers = set()
+        self.closed = False
+        self.cond = Condition()
+        self.publish = Lock()
+        self.stats = stats or Stats()
+
+    def put(self, item: Any) -> None:
+        """Stamp the item with its sequence number and publish it to every subscriber."""
+        start = perf_counter()
+        with self.publish:
+            with self.cond:
+                seq = self.head
+                item['seq'] = seq
+                self.ring[seq % self.capacity] = item
+                self.head += 1
+                self.cond.notify_all()
+
+            # Written outside `cond`, so readers never wait on the disk. Holding `publish` means the
+            # next put can't evict this item from the ring before it is in the log for replay.
+            if self.log and not self.log.closed:
+                self.log.append(seq, item)
+
+        for listener in self.listeners:
+            listener()
+        self.stats.record('hub.put', perf_counter() - start)
+
+    def oldest(self) -> int:
+        """Oldest sequence number still held in the ring (caller must hold the lock)."""
+        return max(self.base, self.head - self.capacity)
+
+    def latest(self) -> Any | None:
+        """Most recently published item; read back from the log if it predates this process."""
+        with self.cond:
+            if self.head > self.base:
+                return self.ring[(self.head - 1) % self.capacity]
+            seq = self.head - 1
+        if not self.log or seq < 0:
+            return None
+        try:
+            return self.log.read(seq)                       # Outside `cond`: disk I/O
+        except ValueError:
+            return None                                     # The log was closed
+
+    def subscribe(self, capacity: int | None = None, policy: SlowConsumerPolicy | None = None,
+                  from_seq: int | None = None) -> Subscription:
+        """Attach a new subscriber at the live tail, or replaying history from `from_seq`."""
+        capacity = min(capacity or self.subscriber_capacity, self.capacity)
+        with self.cond:
+            # Without a log, history only reaches back as far as the ring does
+            oldest = 0 if self.log else self.oldest()
+            cursor = self.head if from_seq is None else min(max(from_seq, oldest), self.head)
+            sub = Subscription(self, cursor, capacity, policy or self.policy, replaying=cursor < self.head)
+            self.subscribers.add(sub)
+            return sub
+
+    def depth(self) -> tuple[int, int]:
+        """Items held in the ring, and the largest subscriber lag (unread items)."""
+        with self.cond:
+            lag = max((self.head - sub.cursor for sub in self.subscribers), default=0)
+            return self.head - self.oldest(), lag
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a wakeup callback for consumers that don't block on the condition (e.g. asyncio)."""
+        self.listeners.append(listener)
+
+    def close(self) -> None:
+        """Stop the hub, wake every blocked subscriber and release the log."""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+        for listener in self.listeners:
+            listener()
+        if self.log:
+            with self.publish:                      # After any append in flight
+                self.log.close()
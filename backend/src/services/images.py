@@ -0,0 +1,104 @@
+import math
+import struct
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from threading import Lock
+import numpy as np
+from numpy.typing import NDArray
+from PIL import Image
+
+from src.generated import metrics_pb2 as pb
+from src.services.stats import Stats
+
+IDX_FILES = {'train': 'train-images-idx3-ubyte', 'test': 't10k-images-idx3-ubyte'}
+IDX_UBYTE = 0x08                        # Element type code of every MNIST idx file
+TILE = 28
+MAX_IMAGES = 4096                       # Per request
+DEFAULT_COLUMNS = 32                    # Sprite width in tiles
+
+
+def open_idx(path: Path) -> NDArray[np.uint8]:
+    """Memory-map an unsigned-byte idx file (images: (N, rows, cols), labels: (N,)); pages load on demand."""
+    with open(path, 'rb') as f:
+        zero, dtype, ndim = struct.unpack('>HBB', f.read(4))
+        shape = struct.unpack(f'>{ndim}I', f.read(4 * ndim))
+    if zero != 0 or dtype != IDX_UBYTE:
+        raise ValueError(f'{path} is not an unsigned-byte idx file')
+    return np.memmap(path, dtype=np.uint8, mode='r', offset=4 + 4 * ndim, shape=shape)
+
+
+def sprite(tiles: NDArray[np.uint8], columns: int, compress_level: int = 1) -> bytes:
+    """Pack tiles row-major into one grayscale PNG, `columns` tiles wide (the last row padded with black)."""
+    n, h, w = tiles.shape
+    rows = math.ceil(n / columns)
+    grid = np.zeros((rows * columns, h, w), dtype=np.uint8)
+    grid[:n] = tiles
+    grid = grid.reshape(rows, columns, h, w).transpose(0, 2, 1, 3).reshape(rows * h, columns * w)
+    out = BytesIO()
+    Image.fromarray(grid, mode='L').save(out, format='PNG', compress_level=compress_level)   # Default favours speed
+    return out.getvalue()
+
+
+class ImageStore:
+    """Serves MNIST thumbnails straight from the raw idx files, with an LRU of encoded responses."""
+
+    root: Path                          # Directory holding MNIST/raw
+    images: dict[str, NDArray]          # Memory-mapped splits, opened on first use
+    max_bytes: int                      # Budget of the response cache
+    cache: OrderedDict[tuple, pb.ImagesRes]
+    cached_bytes: int
+    stats: Stats
+    lock: Lock
+
+    def __init__(self, root: str | Path = './data', max_bytes: int = 32 * 1024 * 1024, stats: Stats | None = None) -> None:
+        self.root = Path(root)
+        self.images = {}
+        self.max_bytes = max_bytes
+        self.cache = OrderedDict()
+        self.cached_bytes = 0
+        self.stats = stats or Stats()
+        self.lock = Lock()
+
+    def split(self, name: str) -> NDArray[np.uint8]:
+        images = self.images.get(name)
+        if images is None:
+            images = self.images[name] = open_idx(self.root / 'MNIST' / 'raw' / IDX_FILES[name])
+        return images
+
+    def get(self, image_ids: list[int], test: bool = False, fmt: int = pb.IMAGES_TILES,
+            columns: int = 0) -> pb.ImagesRes:
+        """Tiles (or one sprite) for the ids, in request order. Raises IndexError/ValueError on bad requests."""
+        if len(image_ids) > MAX_IMAGES:
+            raise ValueError(f'At most {MAX_IMAGES} images per request (got {len(image_ids)})')
+        if not 0 <= columns <= MAX_IMAGES:
+            raise ValueError(f'columns must be between 0 and {MAX_IMAGES} (got {columns})')
+        if not image_ids:                                           # PIL can't write an empty sprite
+            return pb.ImagesRes(format=fmt, count=0, columns=columns or DEFAULT_COLUMNS, tile_size=TILE)
+        columns = min(columns or DEFAULT_COLUMNS, len(image_ids))  # The sprite is never wider than its tiles
+        key = (tuple(image_ids), test, fmt, columns)
+        with self.lock:
+            res = self.cache.get(key)
+            if res is not None:
+                self.cache.move_to_end(key)
+                self.stats.count('images.cache_hits')
+                return res
+
+        with self.stats.time('images.encode'):
+            images = self.split('test' if test else 'train')
+            ids = np.asarray(image_ids, dtype=np.int64)
+            if ids.size and (ids.min() < 0 or ids.max() >= len(images)):
+                raise IndexError(f'Image ids must be in [0, {len(images)})')
+            tiles = images[ids]                                     # Gathers only the requested pages
+            data = sprite(tiles, columns) if fmt == pb.IMAGES_SPRITE_PNG else tiles.tobytes()
+            res = pb.ImagesRes(format=fmt, data=data, count=len(ids), columns=columns, tile_size=TILE)
+        self.stats.count('images.cache_misses')
+
+        with self.lock:
+            if key not in self.cache:
+                self.cache[key] = res
+                self.cached_bytes += len(data)
+            while self.cached_bytes > self.max_bytes and len(self.cache) > 1:
+                _, evicted = self.cache.popitem(last=False)
+                self.cached_bytes -= len(evicted.data)
+        return res
@@ -0,0 +1,173 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+from threading import Lock
+from typing import Any
+import numpy as np
+
+# Record layout (little-endian, 4-byte aligned):
+#   header  : seq i64 | epoch i32 | batch i32 | batch_size i32 | batch_loss f32 | n u32 | stop u32
+#   payload : scores f32[n] | image_ids i32[n] | preds u8[n] | truths u8[n]
+# `stop` is 0 except on a run's final metric: batches_saved << 2 | index of stop_reason in STOP_REASONS
+# (it took the place of 4 pad bytes, so logs written before it read as never stopped)
+HEADER = struct.Struct('<qiiifII')
+STOP_REASONS = ('', 'completed', 'tolerance', 'plateau')    # Trainer.stop reasons, by record code
+INDEX = struct.Struct('<Q')                 # One byte offset per record, indexed by seq
+
+
+def record_size(n: int) -> int:
+    """Size in bytes of a record holding n samples."""
+    return HEADER.size + 10 * n
+
+
+def encode_record(seq: int, metric: Any) -> bytes:
+    """Serialize one metric into the binary record layout."""
+    scores = np.asarray(metric.get('scores', []), dtype='<f4')
+    image_ids = np.asarray(metric.get('image_ids', []), dtype='<i4')
+    preds = np.asarray(metric['preds'], dtype=np.uint8)
+    truths = np.asarray(metric['truths'], dtype=np.uint8)
+    n = len(preds)
+    if len(scores) != n: scores = np.resize(scores, n)
+    if len(image_ids) != n: image_ids = np.resize(image_ids, n)
+
+    stop = STOP_REASONS.index(metric.get('stop_reason', '')) | int(metric.get('batches_saved', 0)) << 2
+    header = HEADER.pack(seq, int(metric['epoch']), int(metric['batch']),
+                         int(metric['batch_size']), float(metric['batch_loss']), n, stop)
+    return b''.join((header, scores.tobytes(), image_ids.tobytes(), preds.tobytes(), truths.tobytes()))
+
+
+def decode_record(buffer: Any, offset: int = 0) -> dict[str, Any]:
+    """Decode the record at `offset`; arrays are zero-copy views of `buffer`."""
+    seq, epoch, batch, batch_size, batch_loss, n, stop = HEADER.unpack_from(buffer, offset)
+    pos = offset + HEADER.size
+    return {
+        'seq': seq,
+        'epoch': epoch,
+        'batch': batch,
+        'batch_size': batch_size,
+        'batch_loss': batch_loss,
+        'preds': np.frombuffer(buffer, dtype=np.uint8, count=n, offset=pos + 8 * n),
+        'truths': np.frombuffer(buffer, dtype=np.uint8, count=n, offset=pos + 9 * n),
+        'scores': np.frombuffer(buffer, dtype='<f4', count=n, offset=pos),
+        'image_ids': np.frombuffer(buffer, dtype='<i4', count=n, offset=pos + 4 * n),
+        'stop_reason': STOP_REASONS[stop & 3],
+        'batches_saved': stop >> 2,
+    }
+
+
+class MetricsLog:
+    """Append-only binary log of training metrics with a memory-mapped offset index."""
+
+    data_path: Path                 # Concatenated records
+    index_path: Path                # Packed u64 offsets, one per seq
+    count: int                      # Number of records (== next seq)
+    created: list[Path]             # Directories this log made (deepest first), removed again by discard
+    closed: bool
+    lock: Lock
+
+    def __init__(self, root: str | Path, name: str = 'metrics') -> None:
+        root = Path(root)
+        self.created = [path for path in (root, *root.parents) if not path.exists()]
+        root.mkdir(parents=True, exist_ok=True)
+        self.data_path = root / f'{name}.log'
+        self.index_path = root / f'{name}.idx'
+        self.closed = False
+        self.lock = Lock()
+        self._data_map: mmap.mmap | None = None
+        self._index_map: mmap.mmap | None = None
+
+        self._recover()
+        self._data = open(self.data_path, 'ab')
+        self._index = open(self.index_path, 'ab')
+
+    def _recover(self) -> None:
+        """Drop any torn tail left by a crash so the index and data agree."""
+        self.data_path.touch()
+        self.index_path.touch()
+
+        index_size = self.index_path.stat().st_size
+        self.count = index_size // INDEX.size
+        end = 0
+        if self.count:
+            with open(self.index_path, 'rb') as f:
+                f.seek((self.count - 1) * INDEX.size)
+                (offset,) = INDEX.unpack(f.read(INDEX.size))
+            with open(self.data_path, 'rb') as f:
+                f.seek(offset)
+                header = f.read(HEADER.size)
+            end = offset + record_size(HEADER.unpack(header)[5]) if len(header) == HEADER.size else -1
+            if end < 0 or end > self.data_path.stat().st_size:
+                self.count -= 1                         # Indexed but never fully written
+                end = offset
+
+        os.truncate(self.index_path, self.count * INDEX.size)
+        if self.data_path.stat().st_size > end:
+            os.truncate(self.data_path, end)
+
+    def append(self, seq: int, metric: Any) -> None:
+        """Append one metric; seq must equal the current record count."""
+        record = encode_record(seq, metric)
+        with self.lock:
+            if seq != self.count:
+                raise ValueError(f'Out-of-order append: expected seq {self.count}, got {seq}')
+
+            # Data first, then index, so a crash never indexes a missing record
+            offset = self._data.tell()
+            self._data.write(record)
+            self._data.flush()
+            self._index.write(INDEX.pack(offset))
+            self._index.flush()
+            self.count += 1
+
+    def read(self, seq: int) -> dict[str, Any]:
+        """Decode a record into a metric dict; arrays are zero-copy views of the map."""
+        with self.lock:
+            if self.closed:
+                raise ValueError('The metrics log is closed')
+            if not 0 <= seq < self.count:
+                raise IndexError(f'seq {seq} not in log (0..{self.count - 1})')
+            index_map = self._index_map = self._remap(self._index_map, self.index_path, (seq + 1) * INDEX.size)
+            (offset,) = INDEX.unpack_from(index_map, seq * INDEX.size)
+            data_map = self._data_map = self._remap(self._data_map, self.data_path, offset + HEADER.size)
+            n = HEADER.unpack_from(data_map, offset)[5]
+            data_map = self._data_map = self._remap(data_map, self.data_path, offset + record_size(n))
+
+        return decode_record(data_map, offset)
+
+    @staticmethod
+    def _remap(current: mmap.mmap | None, path: Path, needed: int) -> mmap.mmap:
+        """Return a read-only map covering at least `needed` bytes, growing it if required."""
+        if current is not None and len(current) >= needed:
+            return current
+
+        # Old maps are left to the GC: readers may still hold array views into them
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """Close the append handles and the read maps (idempotent)."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._data.close()
+            self._index.close()
+            for current in (self._data_map, self._index_map):
+                try:
+                    if current is not None:
+                        current.close()
+                except BufferError:
+                    pass                                # A reader still holds views: the GC unmaps it after them
+            self._data_map = self._index_map = None
+
+    def discard(self) -> None:
+        """Close the log and delete its files, and the directories it made if that leaves them empty."""
+        self.close()
+        self.data_path.unlink(missing_ok=True)
+        self.index_path.unlink(missing_ok=True)
+        for path in self.created:
+            try:
+                path.rmdir()
+            except OSError:
+                break                                   # Not empty (e.g. other runs' logs)
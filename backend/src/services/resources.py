@@ -0,0 +1,78 @@
+import os
+from dataclasses import dataclass
+
+
+def parse_cpus(spec: str) -> tuple[int, ...]:
+    """CPU ids of a Linux-style list, e.g. '0-5,8' -> (0, 1, 2, 3, 4, 5, 8)."""
+    cpus: set[int] = set()
+    for part in filter(None, (p.strip() for p in spec.split(','))):
+        first, _, last = part.partition('-')
+        try:
+            cpus.update(range(int(first), int(last or first) + 1))
+        except ValueError:
+            raise ValueError(f'Invalid CPU list {spec!r} (expected e.g. "0-5,8")') from None
+    return tuple(sorted(cpus))
+
+
+def available_cpus() -> tuple[int, ...]:
+    """CPUs this process may run on (every CPU where affinity isn't supported)."""
+    if hasattr(os, 'sched_getaffinity'):
+        return tuple(sorted(os.sched_getaffinity(0)))
+    return tuple(range(os.cpu_count() or 1))
+
+
+def pin_thread(cpus: tuple[int, ...]) -> tuple[int, ...]:
+    """Restrict the calling thread (and the threads and processes it starts) to `cpus`; returns the effective set."""
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, cpus)                   # 0 = the calling thread on Linux
+        except OSError as e:
+            print(f'⚠️  Could not pin to CPUs {cpus}: {e}')
+    return available_cpus()
+
+
+@dataclass
+class ResourceLayout:
+    """How the server divides its CPUs: training compute on one core set, serving and serialization on another.
+
+    Threads inherit their creator's affinity, so pinning the main thread covers the gRPC server, and
+    pinning the warm-up and training threads covers torch's pools, the data prefetcher and the
+    evaluator; spawned training processes pin themselves (see apply_budget).
+    """
+
+    train_cores: tuple[int, ...]        # Empty when pinning is off
+    serve_cores: tuple[int, ...]
+    intra_op_threads: int               # torch intra-op pool of the server process
+    inter_op_threads: int
+    job_threads: int                    # Intra-op pool of each training job (cores split between concurrent jobs)
+    grpc_workers: int                   # Thread-pool server workers (0 with --aio)
+    pinned: bool
+
+    @classmethod
+    def plan(cls, train: str | None = None, serve: str | None = None, intra_op_threads: int = 0,
+             inter_op_threads: int = 1, grpc_workers: int = 10, max_jobs: int = 1, pin: bool = True) -> 'ResourceLayout':
+        """Split the available CPUs; unset core lists are derived (serving gets 1 in 8 cores, from the top, given 4+)."""
+        cpus = available_cpus()
+        train_cores = parse_cpus(train) if train else ()
+        serve_cores = parse_cpus(serve) if serve else ()
+        if not train_cores and not serve_cores:
+            reserved = (len(cpus) // 8 or 1) if len(cpus) >= 4 else 0
+            train_cores, serve_cores = cpus[:len(cpus) - reserved], cpus[len(cpus) - reserved:] or cpus
+        elif not train_cores:
+            train_cores = tuple(c for c in cpus if c not in serve_cores) or cpus
+        elif not serve_cores:
+            serve_cores = tuple(c for c in cpus if c not in train_cores) or cpus
+        for cores in (train_cores, serve_cores):
+            if unknown := set(cores) - set(cpus):
+                raise ValueError(f'CPUs {sorted(unknown)} are not available (this process may use {list(cpus)})')
+
+        intra_op_threads = intra_op_threads or len(train_cores)
+        pin = pin and hasattr(os, 'sched_setaffinity')
+        return cls(train_cores if pin else (), serve_cores if pin else (), intra_op_threads, max(inter_op_threads, 1),
+                   max(intra_op_threads // max(max_jobs, 1), 1), grpc_workers, pin)
+
+    def describe(self) -> str:
+        if not self.pinned:
+            return f'unpinned, {self.intra_op_threads} intra-op / {self.inter_op_threads} inter-op threads'
+        return (f'training on CPUs {list(self.train_cores)} ({self.intra_op_threads} intra-op, '
+                f'{self.inter_op_threads} inter-op, {self.job_threads} per job), serving on CPUs {list(self.serve_cores)}')
@@ -0,0 +1,121 @@
+from multiprocessing import shared_memory
+from threading import Lock
+import numpy as np
+from numpy.typing import NDArray
+
+TRAIN_SAMPLES = 60000               # MNIST train images, indexed by image id
+
+# Columns, one array each, back to back in one shared-memory block (widest first, so every column is aligned)
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ('loss', '<f4'),                # Cross-entropy at the last visit
+    ('correct', '<i4'),             # Visits classified correctly
+    ('seen', '<i4'),                # Visits (0 = not trained on yet)
+    ('epoch', '<i4'),               # Epoch of the last visit (-1 = never)
+    ('pred', 'u1'),                 # Prediction at the last visit
+    ('truth', 'u1'),
+)
+
+
+class SampleIndex:
+    """Per-sample training statistics of every train image, in preallocated columnar arrays in shared memory.
+
+    The trainer scatters each whole batch in with a few vectorized fancy-index writes, whether it
+    runs in the server, in a training process or as a data-parallel rank (each rank writes its own
+    shard). The server queries the same pages, so no per-sample data has to be streamed. Readers
+    may see a batch half-applied; every element is always a value some visit wrote.
+    """
+
+    shm: shared_memory.SharedMemory
+    owner: bool                     # Creator unlinks the segment on close
+    size: int
+    lock: Lock                      # Queries vs close (the trainer's writes are over by then)
+    closed: bool
+    loss: NDArray[np.float32]
+    correct: NDArray[np.int32]
+    seen: NDArray[np.int32]
+    epoch: NDArray[np.int32]
+    pred: NDArray[np.uint8]
+    truth: NDArray[np.uint8]
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool, size: int) -> None:
+        self.shm = shm
+        self.owner = owner
+        self.size = size
+        self.lock = Lock()
+        self.closed = False
+        offset = 0
+        for name, dtype in COLUMNS:
+            column = np.ndarray(size, dtype=dtype, buffer=shm.buf, offset=offset)
+            setattr(self, name, column)
+            offset += column.nbytes
+
+    @classmethod
+    def create(cls, size: int = TRAIN_SAMPLES) -> 'SampleIndex':
+        """Allocate an empty index (server side)."""
+        nbytes = size * sum(np.dtype(dtype).itemsize for _, dtype in COLUMNS)
+        index = cls(shared_memory.SharedMemory(create=True, size=nbytes), owner=True, size=size)
+        index.epoch.fill(-1)                                # The rest of a new block is already zeroed
+        return index
+
+    @classmethod
+    def attach(cls, name: str, size: int = TRAIN_SAMPLES) -> 'SampleIndex':
+        """Map an existing index by name (training side); the creator owns its lifetime."""
+        return cls(shared_memory.SharedMemory(name=name, track=False), owner=False, size=size)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def update(self, ids: NDArray, loss: NDArray, preds: NDArray, truths: NDArray, epoch: int) -> None:
+        """Scatter one batch in (ids are unique within a batch, so the in-place adds don't collide)."""
+        self.loss[ids] = loss
+        self.pred[ids] = preds
+        self.truth[ids] = truths
+        self.correct[ids] += preds == truths
+        self.seen[ids] += 1
+        self.epoch[ids] = epoch
+
+    def hardest(self, k: int, label: int | None = None, pred: int | None = None, misclassified_only: bool = False,
+                min_epoch: int | None = None, max_correct: int | None = None) -> tuple[dict[str, NDArray], int, int] | None:
+        """Rows of the (at most) k seen samples with the highest last loss among those passing the filters,
+        hardest first, as copied columns (plus 'id'), how many passed and how many have been seen;
+        None once the index is closed."""
+        with self.lock:
+            if self.closed:
+                return None
+            ids, matched = self.select(k, label, pred, misclassified_only, min_epoch, max_correct)
+            rows = {name: getattr(self, name)[ids] for name, _ in COLUMNS}
+            indexed = int(np.count_nonzero(self.seen))
+        return {'id': ids, **rows}, matched, indexed
+
+    def select(self, k: int, label: int | None, pred: int | None, misclassified_only: bool,
+               min_epoch: int | None, max_correct: int | None) -> tuple[NDArray[np.int64], int]:
+        mask = self.seen > 0
+        if label is not None:
+            mask &= self.truth == label
+        if pred is not None:
+            mask &= self.pred == pred
+        if misclassified_only:
+            mask &= self.pred != self.truth
+        if min_epoch is not None:
+            mask &= self.epoch >= min_epoch
+        if max_correct is not None:
+            mask &= self.correct <= max_correct
+
+        ids = np.flatnonzero(mask)
+        matched = len(ids)
+        if matched > k:
+            ids = ids[np.argpartition(-self.loss[ids], k - 1)[:k]]
+        return ids[np.argsort(-self.loss[ids], kind='stable')], matched
+
+    def close(self) -> None:
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            # Views into the buffer must go before the mapping can be closed
+            for name, _ in COLUMNS:
+                setattr(self, name, None)
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,321 @@
+import heapq
+import re
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import time
+from typing import Any, Callable, Literal, NamedTuple, Protocol
+from uuid import uuid4
+
+from src.services.hub import MetricsHub
+from src.services.sample_index import SampleIndex
+from src.services.stats import Stats
+
+JobState = Literal['queued', 'training', 'finished', 'failed']
+JOB_ID = re.compile(r'[A-Za-z0-9][A-Za-z0-9._-]{0,63}')     # Also used as a directory name (logs, checkpoints)
+
+
+class Runner(Protocol):
+    """Owns one training run (thread or isolated process); the scheduler starts one per job."""
+
+    def start(self, num_epochs: int, resume: bool = False, overrides: dict[str, Any] | None = None) -> None: ...
+    def state(self) -> str: ...
+    def modes(self) -> Any | None: ...
+    def stats(self) -> dict[str, Any] | None: ...           # Latest training Stats snapshot
+    def profile(self, steps: int) -> None: ...              # Request a profiler capture of the next N steps
+    def stopped(self) -> Any | None: ...                    # StopInfo (why training ended), once it has
+    def samples(self) -> SampleIndex | None: ...            # Per-sample statistics, once started
+    def close(self) -> None: ...                            # Release the run's resources once it is over
+
+
+class LoggedStop(NamedTuple):
+    """Why a run ended, as recorded in its final metric (mirrors training's StopInfo without importing torch)."""
+
+    reason: str
+    epoch: int
+    batch: int
+    batches_saved: int
+
+
+class Restored:
+    """Runner of a job restored from its log at startup: finished, with only its metrics left to replay."""
+
+    def __init__(self, hub: MetricsHub) -> None:
+        self.hub = hub
+
+    def start(self, num_epochs: int, resume: bool = False, overrides: dict[str, Any] | None = None) -> None:
+        raise RuntimeError('A restored job has nothing left to run; submit its id again instead')
+
+    def state(self) -> str:
+        return 'finished'
+
+    def modes(self) -> None: ...
+    def stats(self) -> None: ...
+    def profile(self, steps: int) -> None: ...
+    def samples(self) -> None: ...
+    def close(self) -> None: ...
+
+    def stopped(self) -> LoggedStop | None:
+        latest = self.hub.latest()
+        if not latest or not latest['stop_reason']:
+            return None                                     # Ended before recording why (e.g. the server died)
+        return LoggedStop(latest['stop_reason'], latest['epoch'], latest['batch'], latest['batches_saved'])
+
+
+class Job:
+    """One submitted training run: its config overrides, its own metrics hub and, once built, its runner."""
+
+    id: str
+    run: str                            # This submission of the id (a timestamp); names its log directory
+    num_epochs: int
+    resume: bool
+    overrides: dict[str, Any]           # TrainConfig fields set by the StartReq
+    priority: int                       # Higher runs first; FIFO among equals
+    hub: MetricsHub                     # Created on submit, so clients can subscribe while the job is queued
+    runner: Runner                      # Built (and validated) on submit, started when the job is dispatched
+    submitted: float                    # Wall-clock times
+    started: float | None               # Set on dispatch, when the job takes a slot
+    launched: bool                      # runner.start() has returned
+    error: str | None                   # Why the runner failed to start
+
+    def __init__(self, job_id: str, run: str, num_epochs: int, resume: bool, overrides: dict[str, Any], priority: int,
+                 hub: MetricsHub) -> None:
+        self.id = job_id
+        self.run = run
+        self.num_epochs = num_epochs
+        self.resume = resume
+        self.overrides = overrides
+        self.priority = priority
+        self.hub = hub
+        self.submitted = time()
+        self.started = None
+        self.launched = False
+        self.error = None
+
+    def state(self) -> JobState:
+        if self.error is not None:
+            return 'failed'
+        if self.started is None:
+            return 'queued'
+        if not self.launched:
+            return 'training'                               # Starting up, already holding its slot
+        return self.runner.state()                          # type: ignore[return-value]
+
+
+class JobScheduler:
+    """Queues training jobs and runs up to `max_jobs` of them at once, highest priority first.
+
+    Every job gets its own metrics hub (and so its own stream, and a log per run); runners come from
+    `make_runner`, which is installed once the training stack has warmed up. A dispatcher
+    thread starts queued jobs whenever a running one finishes.
+    """
+
+    make_hub: Callable[[str, str], MetricsHub]      # (job id, run) -> hub
+    make_runner: Callable[[Job], Runner] | None
+    max_jobs: int                       # Jobs training at the same time
+    retain: int                         # Finished jobs kept (with their hubs) for Status and replay
+    stats: Stats                        # Server-side stats, shared by every job's hub
+    jobs: dict[str, Job]                # In submission order
+    queue: list[tuple[int, int, str]]   # Heap of (-priority, submission order, job id)
+    listeners: list[Callable[[], None]] # Added to every job's hub (see MetricsHub.add_listener)
+    order: count
+    lock: Lock
+    stop: Event
+    thread: Thread
+
+    def __init__(self, make_hub: Callable[[str, str], MetricsHub], make_runner: Callable[[Job], Runner] | None = None,
+                 max_jobs: int = 1, retain: int = 100, stats: Stats | None = None) -> None:
+        self.make_hub = make_hub
+        self.make_runner = make_runner
+        self.max_jobs = max_jobs
+        self.retain = retain
+        self.stats = stats or Stats()
+        self.jobs = {}
+        self.queue = []
+        self.listeners = []
+        self.order = count()
+        self.lock = Lock()
+        self.stop = Event()
+        self.thread = Thread(target=self.run, name='scheduler', daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def close(self) -> None:
+        self.stop.set()
+
+    def submit(self, num_epochs: int, resume: bool = False, overrides: dict[str, Any] | None = None,
+               priority: int = 0, job_id: str | None = None) -> Job:
+        """Queue a job (raising ValueError for a bad id or config) and start it right away if a slot is free.
+
+        Reusing the id of a finished or failed job replaces it (with resume=True, the new run continues
+        from the old one's checkpoints); an id that is still queued or training is rejected.
+        """
+        if self.make_runner is None:
+            raise RuntimeError('The training stack is not ready yet')
+        job_id = job_id or uuid4().hex[:8]
+        if not JOB_ID.fullmatch(job_id):
+            raise ValueError(f'Invalid job id {job_id!r} (letters, digits, ".", "_" and "-", at most 64)')
+        with self.lock:
+            self.replaced(job_id)
+
+        run = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        job = Job(job_id, run, num_epochs, resume, overrides or {}, priority, self.make_hub(job_id, run))
+        try:
+            job.runner = self.make_runner(job)              # Validates the overrides
+        except Exception:
+            self.abandon(job)
+            raise
+        for listener in self.listeners:
+            job.hub.add_listener(listener)
+
+        with self.lock:
+            try:
+                old = self.replaced(job_id)
+            except ValueError:
+                self.abandon(job)
+                raise
+            self.jobs.pop(job_id, None)                     # Re-inserted last: jobs stay in submission order
+            self.jobs[job_id] = job
+            heapq.heappush(self.queue, (-priority, next(self.order), job_id))
+        if old is not None:
+            self.retire(old)
+        self.dispatch()
+        return job
+
+    def restore(self, root: str | Path) -> list[Job]:
+        """Register the latest logged run of each job under `root` (<root>/<job id>/<run>/) as finished.
+
+        Called at startup, so runs from before a restart can still be replayed (up to `retain` of them,
+        newest first). Restored jobs only have their metrics: resubmit the id (with resume) to train on.
+        """
+        latest: dict[str, Path] = {}
+        for path in Path(root).glob('*/*'):
+            job_id = path.parent.name
+            if path.is_dir() and JOB_ID.fullmatch(job_id) and (job_id not in latest or path.name > latest[job_id].name):
+                latest[job_id] = path
+        runs = sorted(latest.values(), key=lambda path: path.name)              # Runs are timestamps
+        restored = []
+        for path in runs[max(len(runs) - self.retain, 0):]:
+            job_id, run = path.parent.name, path.name
+            job = Job(job_id, run, 0, False, {}, 0, self.make_hub(job_id, run))
+            job.runner = Restored(job.hub)
+            job.submitted = job.started = path.stat().st_mtime
+            job.launched = True
+            for listener in self.listeners:
+                job.hub.add_listener(listener)
+            with self.lock:
+                if job_id in self.jobs:
+                    job.hub.close()                         # Submitted meanwhile: the new run wins
+                    continue
+                self.jobs[job_id] = job
+            restored.append(job)
+        return restored
+
+    def abandon(self, job: Job) -> None:
+        """Release a job that was never accepted, deleting the log its hub created."""
+        job.hub.close()
+        if job.hub.log:
+            job.hub.log.discard()
+
+    def replaced(self, job_id: str) -> Job | None:
+        """The finished or failed job a new submission with this id takes over from (call with the lock held)."""
+        job = self.jobs.get(job_id)
+        if job is not None and job.state() not in ('finished', 'failed'):
+            raise ValueError(f'Job {job_id!r} already exists ({job.state()})')
+        return job
+
+    def get(self, job_id: str | None = None) -> Job | None:
+        """The job with this id, or the most recently submitted one."""
+        with self.lock:
+            if job_id:
+                return self.jobs.get(job_id)
+            return next(reversed(self.jobs.values()), None)
+
+    def all_jobs(self) -> list[Job]:
+        with self.lock:
+            return list(self.jobs.values())
+
+    def position(self, job: Job) -> int:
+        """Jobs ahead of this one in the queue (0 = next to start, -1 = not queued)."""
+        with self.lock:
+            ranked = [job_id for *_, job_id in sorted(self.queue)]
+        return ranked.index(job.id) if job.id in ranked else -1
+
+    def counts(self) -> tuple[int, int]:
+        """(queued, training) job counts."""
+        with self.lock:
+            states = [job.state() for job in self.jobs.values()]
+        return states.count('queued'), states.count('training')
+
+    def followed(self) -> str | None:
+        """Id of the most recently started job still training: the one evaluation and Predict follow."""
+        with self.lock:
+            running = [job for job in self.jobs.values() if job.started is not None and job.state() == 'training']
+        return max(running, key=lambda job: job.started or 0).id if running else None
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Register a wakeup callback on every job's hub, present and future."""
+        with self.lock:
+            self.listeners.append(listener)
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            job.hub.add_listener(listener)
+
+    def run(self) -> None:
+        while not self.stop.wait(timeout=0.5):              # Runners don't signal completion: poll for free slots
+            try:
+                self.dispatch()
+                self.prune()
+            except Exception as e:
+                print(f'❌ Scheduling failed: {e}')
+
+    def dispatch(self) -> None:
+        """Start queued jobs while fewer than `max_jobs` are training."""
+        with self.lock:
+            running = sum(job.state() == 'training' for job in self.jobs.values())
+            ready = []
+            while self.queue and running + len(ready) < self.max_jobs:
+                job = self.jobs[heapq.heappop(self.queue)[2]]
+                job.started = time()                        # Counts as training from here on
+                ready.append(job)
+
+        for job in ready:
+            try:
+                job.runner.start(job.num_epochs, resume=job.resume)
+                job.launched = True
+                print(f'🏁 Job {job.id} started ({job.num_epochs} epochs, {job.overrides or "server defaults"})')
+            except Exception as e:
+                job.error = str(e)
+                print(f'❌ Job {job.id} failed to start: {e}')
+
+    def prune(self) -> None:
+        """Forget the oldest finished jobs beyond `retain`."""
+        with self.lock:
+            done = [job for job in self.jobs.values() if job.state() in ('finished', 'failed')]
+            pruned = done[:max(len(done) - self.retain, 0)]
+            for job in pruned:
+                del self.jobs[job.id]
+        for job in pruned:
+            self.retire(job)
+
+    def retire(self, job: Job) -> None:
+        """Release a job that is no longer retained: end its streams and free its runner's resources."""
+        job.hub.close()
+        if job.launched:
+            job.runner.close()
+
+
+class Followed:
+    """Sink adapter that stamps a job's items with its id and forwards them only while the scheduler follows it."""
+
+    def __init__(self, sink: Any, scheduler: JobScheduler, job_id: str) -> None:
+        self.sink = sink
+        self.scheduler = scheduler
+        self.job_id = job_id
+
+    def put(self, item: Any) -> None:
+        if self.scheduler.followed() == self.job_id:
+            item['job'] = self.job_id
+            self.sink.put(item)
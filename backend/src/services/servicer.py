@@ -1,74 +1,414 @@
-from queue import Queue, Empty
-from typing import Iterator, Callable
+from concurrent.futures import Future
+from time import monotonic, perf_counter
+from typing import Any, Iterator, Callable, Protocol
 import grpc
+import numpy as np
+from numpy.typing import NDArray
 
 from src.generated import metrics_pb2 as pb
 from src.generated import metrics_pb2_grpc as pbg
+from src.services.encoding import MessageCache, WireFormat
+from src.services.filters import MetricFilter
+from src.services.hub import MetricsHub, SlowConsumerError
+from src.services.images import ImageStore
+from src.services.resources import ResourceLayout
+from src.services.scheduler import Job, JobScheduler, Runner
+from src.services.stats import Stats, bucket_upper, percentile
+from src.services.warmup import Warmup
 
 
+class Framer:
+    """Accumulates encoded metrics into a TrainingMetricBatch under a count/bytes/latency flush policy."""
+
+    max_count: int
+    max_bytes: int
+    max_latency: float                  # Seconds
+    frame: pb.TrainingMetricBatch
+    size: int                           # Encoded size of the buffered metrics
+    deadline: float                     # Flush time of the oldest buffered metric
+
+    def __init__(self, req: pb.SubscribeBatchReq) -> None:
+        self.max_count = req.max_count or 32
+        self.max_bytes = req.max_bytes or 64 * 1024
+        self.max_latency = (req.max_latency_ms if req.HasField('max_latency_ms') else 100) / 1000
+        self.reset()
+
+    def reset(self) -> None:
+        self.frame = pb.TrainingMetricBatch()
+        self.size = 0
+        self.deadline = float('inf')
+
+    def timeout(self) -> float:
+        """Seconds until the buffered frame must be flushed (inf when empty)."""
+        return max(self.deadline - monotonic(), 0)
+
+    def add(self, msg: pb.TrainingMetric) -> None:
+        self.frame.metrics.append(msg)
+        self.size += msg.ByteSize()
+        if len(self.frame.metrics) == 1:
+            self.deadline = monotonic() + self.max_latency
+
+    def flush(self) -> pb.TrainingMetricBatch | None:
+        """Return the frame if any limit is hit (whichever comes first), else None."""
+        count = len(self.frame.metrics)
+        if not count or (count < self.max_count and self.size < self.max_bytes and monotonic() < self.deadline):
+            return None
+
+        frame = self.frame
+        self.reset()
+        return frame
+
+
+class Classifier(Protocol):
+    """Serves the Predict RPCs from the latest weight snapshot (see src.training.predictor.Predictor)."""
+
+    def ready(self) -> bool: ...                            # A snapshot has been published
+    def submit(self, images: NDArray) -> Future: ...        # Resolves to Predictions for (n, 28, 28) uint8 images
+
+
+RUN_OVERRIDES = ('model', 'bf16', 'compile', 'channels_last', 'lr', 'batch_size', 'patience')   # StartReq fields that override the server config
+
+
+def to_stats_res(snapshots: list[dict[str, Any]]) -> pb.StatsRes:
+    """Merge Stats snapshots (server, trainer) into one response, with percentiles per histogram."""
+    res = pb.StatsRes()
+    for snapshot in snapshots:
+        for name, h in snapshot['histograms'].items():
+            nonzero = [(bucket_upper(i), n) for i, n in enumerate(h['counts']) if n]
+            res.histograms.append(pb.Histogram(
+                name=name, count=h['count'], sum=h['sum'], min=h['min'], max=h['max'],
+                p50=percentile(h['counts'], 0.5), p90=percentile(h['counts'], 0.9), p99=percentile(h['counts'], 0.99),
+                bounds=[bound for bound, _ in nonzero], counts=[n for _, n in nonzero],
+            ))
+        res.counters.update(snapshot['counters'])
+        res.gauges.update(snapshot['gauges'])
+        res.labels.update(snapshot['labels'])
+    return res
+
+
+def decode_images(req: pb.PredictReq) -> NDArray:
+    """(n, 28, 28) uint8 view of the request's pixels (length checked by predict_error)."""
+    return np.frombuffer(req.images, dtype=np.uint8).reshape(-1, 28, 28)
+
+
+def to_predict_res(predictions: Any) -> pb.PredictRes:
+    return pb.PredictRes(
+        predictions=[pb.Prediction(label=int(label), score=float(probs[label]), probs=probs.tolist())
+                     for label, probs in zip(predictions.labels, predictions.probs)],
+        version=predictions.version, epoch=predictions.epoch, batch=predictions.batch, job_id=predictions.job_id,
+    )
+
+
+def missing_job(job_id: str) -> str:
+    return f'No job {job_id!r} on this server' if job_id else 'No training job has been submitted yet'
+
+
+def replaced_run(job: Job, run: str) -> str | None:
+    """Why a subscription asking for `run` can't be served, if the job has been resubmitted since."""
+    if run and run != job.run:
+        return f'Run {run} of job {job.id} was replaced by run {job.run}; its seqs no longer apply'
+    return None
+
+
+def to_layout(layout: ResourceLayout) -> pb.ResourceLayout:
+    return pb.ResourceLayout(train_cores=layout.train_cores, serve_cores=layout.serve_cores,
+                             intra_op_threads=layout.intra_op_threads, inter_op_threads=layout.inter_op_threads,
+                             job_threads=layout.job_threads, grpc_workers=layout.grpc_workers, pinned=layout.pinned)
+
+
+def to_job_info(job: Job) -> pb.JobInfo:
+    latest = job.hub.latest()
+    modes = job.runner.modes() if job.launched else None
+    stop = job.runner.stopped() if job.launched else None
+    return pb.JobInfo(job_id=job.id, run=job.run, status=job.state(), epoch=latest['epoch'] if latest else 0,
+                      num_epochs=job.num_epochs, priority=job.priority,
+                      overrides={name: str(value) for name, value in job.overrides.items()},
+                      modes=pb.TrainModes(**modes._asdict()) if modes else None,
+                      stop_reason=stop.reason if stop else '', batches_saved=stop.batches_saved if stop else 0)
+
 class Servicer(pbg.TrainingServicer):
     """Implements the metrics gRPC service with streaming support."""
     
-    queue: Queue
-    on_start: Callable[[int], None]
-    is_started: bool
-    epoch: int
+    scheduler: JobScheduler         # Training jobs, each with its own metrics hub
+    warmup: Warmup | None           # Background startup (None when the stack was built up front)
+    messages: MessageCache          # Each (job run, metric, wire format) is encoded once for all subscribers
+    evals: MetricsHub | None        # Held-out evaluation results (None when evaluation is disabled)
+    predictor: Classifier | None    # Micro-batched inference on weight snapshots (None when disabled)
+    images: ImageStore              # Thumbnails for GetImages
+    stats: Stats                    # Server-side stage timings, shared with the scheduler's hubs
+    layout: ResourceLayout | None   # CPU split between training and serving, reported by Status
 
-    def __init__(self, queue: Queue, on_start: Callable[[int], None]) -> None:
-        self.queue = queue
-        self.on_start = on_start
-        self.is_started = False
-        self.epoch = 0
+    def __init__(self, scheduler: JobScheduler, evals: MetricsHub | None = None,
+                 predictor: Classifier | None = None, images: ImageStore | None = None,
+                 warmup: Warmup | None = None, layout: ResourceLayout | None = None) -> None:
+        self.scheduler = scheduler
+        self.warmup = warmup
+        self.layout = layout
+        self.messages = MessageCache()
+        self.evals = evals
+        self.predictor = predictor
+        self.stats = scheduler.stats
+        self.images = images or ImageStore(stats=scheduler.stats)
+
+    def attach(self, stack: tuple[Callable[[Job], Runner], Classifier | None]) -> None:
+        """Warm-up callback: take over the runner factory and predictor once they are built."""
+        self.scheduler.make_runner, self.predictor = stack
+
+    def warming(self) -> bool:
+        return self.warmup is not None and not self.warmup.ready()
 
     def Status(self, req: pb.StatusReq, ctx: grpc.ServicerContext) -> pb.StatusRes:
-        """Check server status (handshake/health check)."""
-        if self.is_started:
-            return pb.StatusRes(status='training', message='Training in progress', epoch=self.epoch)
+        """Check server (or job) status (handshake/health check)."""
+        res = self.status(req)
+        if self.layout:
+            res.resources.CopyFrom(to_layout(self.layout))
+        return res
+
+    def status(self, req: pb.StatusReq) -> pb.StatusRes:
+        if self.warming():
+            status = 'failed' if self.warmup.failed() else 'warming'            # type: ignore[union-attr]
+            return pb.StatusRes(status=status, message=self.warmup.describe(),  # type: ignore[union-attr]
+                                progress=self.warmup.progress())                # type: ignore[union-attr]
+        queued, running = self.scheduler.counts()
+        job = self.scheduler.get(req.job_id)
+        if job is None:
+            if req.job_id:
+                return pb.StatusRes(status='not_found', message=f'No job {req.job_id!r} on this server',
+                                    progress=1.0, job_id=req.job_id, queued=queued, running=running)
+            return pb.StatusRes(status='ready', message='Server ready to start training', epoch=0, progress=1.0)
+
+        state = job.state()
+        latest = job.hub.latest()
+        epoch = latest['epoch'] if latest else 0
+        modes = job.runner.modes() if job.launched else None
+        stop = job.runner.stopped() if job.launched else None
+        res = pb.StatusRes(status=state, epoch=epoch, progress=1.0, job_id=job.id, queued=queued, running=running,
+                           modes=pb.TrainModes(**modes._asdict()) if modes else None,
+                           stop_reason=stop.reason if stop else '', batches_saved=stop.batches_saved if stop else 0)
+        if state == 'queued':
+            res.message = f'Queued behind {self.scheduler.position(job)} other jobs'
+        elif state == 'training':
+            res.message = 'Training in progress'
+        elif state == 'finished' and stop and stop.reason != 'completed':
+            res.message = (f'Training converged ({stop.reason}) at epoch {stop.epoch} batch {stop.batch}; '
+                           f'{stop.batches_saved} batches saved')
+        elif state == 'finished':
+            res.message = 'Training finished'
         else:
-            return pb.StatusRes(status='ready', message='Server ready to start training', epoch=0)
+            res.message = f'Training failed to start: {job.error}' if job.error else 'Training stopped with an error'
+        return res
 
     def Start(self, req: pb.StartReq, ctx: grpc.ServicerContext) -> pb.StartRes:
-        """Start training with epochs and confirmation (stateless)."""
+        """Submit a training job; it starts right away if a slot is free, else it is queued."""
   
-        # Check if already training
-        if self.is_started:
-            return pb.StartRes(status='already_running', message='Training is already in progress')
+        # The training stack is still being built in the background
+        if self.warming():
+            if self.warmup.failed():                                            # type: ignore[union-attr]
+                return pb.StartRes(status='failed', message=self.warmup.describe())     # type: ignore[union-attr]
+            return pb.StartRes(status='warming',
+                               message=f'{self.warmup.describe()}; retry once Status reports ready')  # type: ignore[union-attr]
 
         # Require confirmation
         if not req.confirmed:
             return pb.StartRes(status='not_confirmed', message='Set confirmed=true to start training')
 
-        # Start training
+        # Queue the job, with any per-run config overrides
         num_epochs = req.num_epochs or 3
-        self.is_started = True
-        self.epoch = 0
-        self.on_start(num_epochs)
-        return pb.StartRes(status='started', message=f'Training started for {num_epochs} epochs')
+        overrides = {name: getattr(req, name) for name in RUN_OVERRIDES if req.HasField(name)}
+        try:
+            job = self.scheduler.submit(num_epochs, resume=req.resume, overrides=overrides, priority=req.priority,
+                                        job_id=req.job_id if req.HasField('job_id') else None)
+        except ValueError as e:
+            return pb.StartRes(status='invalid', message=str(e))
+        if job.started is None:
+            position = self.scheduler.position(job)
+            return pb.StartRes(status='queued', job_id=job.id, run=job.run, position=position,
+                               message=f'Job {job.id} queued behind {position} other jobs')
+        if req.resume:
+            return pb.StartRes(status='started', job_id=job.id, run=job.run,
+                               message=f'Job {job.id} resumed from its latest checkpoint, up to {num_epochs} epochs')
+        return pb.StartRes(status='started', job_id=job.id, run=job.run,
+                           message=f'Job {job.id} started for {num_epochs} epochs')
+
+    def ListJobs(self, req: pb.ListJobsReq, ctx: grpc.ServicerContext) -> pb.ListJobsRes:
+        """Every job the server retains, in submission order."""
+        return pb.ListJobsRes(jobs=[to_job_info(job) for job in self.scheduler.all_jobs()])
+
+    def QueryHardExamples(self, req: pb.HardExamplesReq, ctx: grpc.ServicerContext) -> pb.HardExamplesRes:
+        """Top-k hardest train samples of a job by last loss, with optional filters."""
+        res = self.hard_examples(req)
+        if isinstance(res, tuple):
+            ctx.abort(*res)
+        return res
+
+    def hard_examples(self, req: pb.HardExamplesReq) -> pb.HardExamplesRes | tuple[grpc.StatusCode, str]:
+        """The response, or the status to abort with."""
+        job = self.scheduler.get(req.job_id)
+        if job is None:
+            return grpc.StatusCode.NOT_FOUND, missing_job(req.job_id)
+        index = job.runner.samples() if job.launched else None
+        if index is None:
+            return grpc.StatusCode.FAILED_PRECONDITION, f'Job {job.id} has not started training yet'
+        k = req.k or 20
+        if not 0 < k <= 1000:
+            return grpc.StatusCode.INVALID_ARGUMENT, f'k must be between 1 and 1000 (got {k})'
+
+        def optional(name: str) -> int | None:
+            return getattr(req, name) if req.HasField(name) else None
+
+        with self.stats.time('query.hard_examples'):
+            found = index.hardest(k, label=optional('label'), pred=optional('pred'),
+                                  misclassified_only=req.misclassified_only,
+                                  min_epoch=optional('min_epoch'), max_correct=optional('max_correct'))
+            if found is None:                                   # The job was pruned while we looked it up
+                return grpc.StatusCode.NOT_FOUND, f'Job {job.id} is no longer retained'
+            rows, matched, indexed = found
+            return pb.HardExamplesRes(image_ids=rows['id'].tolist(), losses=rows['loss'].tolist(),
+                                      preds=rows['pred'].tolist(), truths=rows['truth'].tolist(),
+                                      correct=rows['correct'].tolist(), seen=rows['seen'].tolist(),
+                                      epochs=rows['epoch'].tolist(), matched=matched, indexed=indexed)
+
+    def SubscribeEval(self, req: pb.SubscribeEvalReq, ctx: grpc.ServicerContext) -> Iterator[pb.EvalMetric]:
+        """Stream held-out evaluation results as the evaluator produces them."""
+        if self.evals is None:
+            ctx.abort(grpc.StatusCode.FAILED_PRECONDITION, 'Evaluation is disabled on this server')
+        sub = self.evals.subscribe(from_seq=req.from_seq if req.HasField('from_seq') else None)   # type: ignore[union-attr]
+        try:
+            while ctx.is_active():
+                result = sub.get(timeout=1.0)
+                if result is not None:
+                    yield pb.EvalMetric(**result)
+        finally:
+            sub.close()
+
+    def GetImages(self, req: pb.ImagesReq, ctx: grpc.ServicerContext) -> pb.ImagesRes:
+        """Many thumbnails in one response (raw tiles or a sprite), cached by request."""
+        res = self.load_images(req)
+        if isinstance(res, tuple):
+            ctx.abort(*res)
+        return res
+
+    def load_images(self, req: pb.ImagesReq) -> pb.ImagesRes | tuple[grpc.StatusCode, str]:
+        """The response, or the status to abort with."""
+        try:
+            return self.images.get(list(req.image_ids), test=req.test, fmt=req.format, columns=req.columns)
+        except (IndexError, ValueError) as e:
+            return grpc.StatusCode.INVALID_ARGUMENT, str(e)
+        except FileNotFoundError as e:
+            return grpc.StatusCode.UNAVAILABLE, f'MNIST files not available yet: {e}'
+
+    def predict_error(self, req: pb.PredictReq) -> tuple[grpc.StatusCode, str] | None:
+        """Why a Predict request can't be served, if it can't."""
+        if self.warming():
+            return grpc.StatusCode.UNAVAILABLE, 'Server is warming up: predictions are served once training has started'
+        if self.predictor is None:
+            return grpc.StatusCode.FAILED_PRECONDITION, 'Prediction is disabled on this server'
+        if not self.predictor.ready():
+            return grpc.StatusCode.UNAVAILABLE, 'No model weights yet: predictions are served once training has started'
+        if not req.images or len(req.images) % (28 * 28):
+            return grpc.StatusCode.INVALID_ARGUMENT, 'images must hold one or more 28x28 uint8 images (784 bytes each)'
+        return None
+
+    def Predict(self, req: pb.PredictReq, ctx: grpc.ServicerContext) -> pb.PredictRes:
+        """Classify images with the latest weight snapshot, batched together with concurrent requests."""
+        if (error := self.predict_error(req)) is not None:
+            ctx.abort(*error)
+        return to_predict_res(self.predictor.submit(decode_images(req)).result())     # type: ignore[union-attr]
+
+    def PredictStream(self, reqs: Iterator[pb.PredictReq], ctx: grpc.ServicerContext) -> Iterator[pb.PredictRes]:
+        """Answer a stream of Predict requests in order."""
+        for req in reqs:
+            if (error := self.predict_error(req)) is not None:
+                ctx.abort(*error)
+            yield to_predict_res(self.predictor.submit(decode_images(req)).result())  # type: ignore[union-attr]
+
+    def GetStats(self, req: pb.StatsReq, ctx: grpc.ServicerContext) -> pb.StatsRes:
+        """Stage latency histograms, counters and gauges of the server and of one job's training run."""
+        server = self.stats.snapshot()
+        jobs = self.scheduler.all_jobs()
+        depths = [job.hub.depth() for job in jobs]
+        queued, running = self.scheduler.counts()
+        server['gauges'].update({
+            'hub.subscribers': sum(len(job.hub.subscribers) for job in jobs),
+            'hub.ring_depth': max((depth for depth, _ in depths), default=0),
+            'hub.max_lag': max((lag for _, lag in depths), default=0),
+            'jobs.queued': queued,
+            'jobs.running': running,
+        })
+        server['counters'].update({'hub.published': sum(job.hub.head - job.hub.base for job in jobs),
+                                   'hub.dropped': sum(job.hub.dropped for job in jobs)})
+        job = self.scheduler.get(req.job_id)
+        training = job.runner.stats() if job and job.launched else None
+        return to_stats_res([server] + ([training] if training else []))
+
+    def Profile(self, req: pb.ProfileReq, ctx: grpc.ServicerContext) -> pb.ProfileRes:
+        """Capture a torch.profiler trace of a job's next N training steps (see labels['last_profile'] in GetStats)."""
+        job = self.scheduler.get(req.job_id)
+        if job is None or job.state() != 'training':
+            return pb.ProfileRes(status='not_training', message='Profiling needs a training job in progress')
+        steps = req.steps or 20
+        job.runner.profile(steps)
+        return pb.ProfileRes(status='requested', message=f'Profiling the next {steps} training steps of job {job.id}')
 
     def Subscribe(self, req: pb.SubscribeReq, ctx: grpc.ServicerContext) -> Iterator[pb.TrainingMetric]:
         """Stream metrics to subscribers as they arrive."""
+        for msg in self.follow(req, ctx, poll=lambda: 1.0):
+            if msg is not None:
+                yield msg
+
+    def SubscribeBatched(self, req: pb.SubscribeBatchReq, ctx: grpc.ServicerContext) -> Iterator[pb.TrainingMetricBatch]:
+        """Stream metrics coalesced into frames, flushed by count, size or latency."""
+        framer = Framer(req)
+        for msg in self.follow(req.subscribe, ctx, poll=lambda: min(framer.timeout(), 1.0)):
+            if msg is not None:
+                framer.add(msg)
+            if (frame := framer.flush()) is not None:
+                yield frame
+
+    def follow(self, req: pb.SubscribeReq, ctx: grpc.ServicerContext,
+               poll: Callable[[], float]) -> Iterator[pb.TrainingMetric | None]:
+        """Yield encoded metrics for one subscriber, or None each time `poll()` seconds pass idle."""
+        job = self.scheduler.get(req.job_id)
+        if job is None:
+            ctx.abort(grpc.StatusCode.NOT_FOUND, missing_job(req.job_id))
+        if reason := replaced_run(job, req.run):
+            ctx.abort(grpc.StatusCode.FAILED_PRECONDITION, reason)
+        from_seq = req.from_seq if req.HasField('from_seq') else None
+        sub = job.hub.subscribe(from_seq=from_seq)              # Private cursor into the job's ring
+        fmt = WireFormat.from_req(req)
+        filt = MetricFilter.from_req(req)
+        if req.compress:
+            ctx.set_compression(grpc.Compression.Gzip)
+        stats = self.stats
         try:
             print("Client connected to stream")
             
             # Check if client disconnected
             while ctx.is_active():
-                try: 
-                    metric = self.queue.get(timeout=1.0)        # Block until a metric is available
-                except Empty: 
-                    continue                                    # No metric yet, loop again
-
-                # Convert dict to protobuf message
-                yield pb.TrainingMetric(
-                    epoch=int(metric['epoch']),
-                    batch=int(metric['batch']),
-                    batch_size=int(metric['batch_size']),
-                    batch_loss=float(metric['batch_loss']),
-                    preds=[int(x) for x in metric['preds']],
-                    truths=[int(x) for x in metric['truths']],
-                    scores=[float(x) for x in metric.get('scores', [])],
-                    image_ids=[int(x) for x in metric.get('image_ids', [])],
-                )
+                metric = sub.get(timeout=poll())                # Block until a metric is available
+                if metric is None:
+                    if sub.closed or job.hub.closed:
+                        break                                   # The job was retired: end the stream
+                    yield None                                  # No metric yet, let the caller flush or loop
+                    continue
+
+                # Filter, then convert dict to protobuf message in the negotiated wire format
+                if filt.accepts(metric):
+                    start = perf_counter()
+                    msg = self.messages.get(job.id, job.run, metric, fmt, filt)
+                    sent = perf_counter()
+                    yield msg                                   # Resumes once gRPC has taken the message
+                    stats.record('stream.encode', sent - start)
+                    stats.record('stream.send', perf_counter() - sent)
+                    stats.count('stream.sent')
+
+        except SlowConsumerError as e:
+            # Slow subscriber under the 'disconnect' policy; let it reconnect at the live tail
+            ctx.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
 
         except Exception as e:
             # Abort the RPC with INTERNAL error so the client knows something went wrong
             ctx.abort(grpc.StatusCode.INTERNAL, f"Streaming error: {e}")
+
+        finally:
+            sub.close()
@@ -0,0 +1,100 @@
+import struct
+from multiprocessing import shared_memory
+from typing import Any
+import numpy as np
+
+from src.services.metrics_log import decode_record, encode_record
+
+# Layout: 64-byte ring header, then `slots` fixed-size slots of [stamp u64 | length u32 | pad | record]
+RING_HEADER = struct.Struct('<QII')         # published (next seq to write), slot count, slot size
+SLOT_HEADER = struct.Struct('<QI4x')        # stamp (seq + 1 once complete, 0 while writing), record length
+RING_HEADER_SIZE = 64
+WRITING = 0
+
+
+class ShmRing:
+    """Single-producer, multi-consumer ring of metric records in shared memory, with no locks.
+
+    The producer stamps a slot as WRITING, copies the record in, stamps it with seq + 1 and finally
+    bumps the published counter. Readers validate the stamp before and after decoding (a seqlock),
+    so a slot overwritten mid-read is detected and skipped rather than returned torn.
+    """
+
+    shm: shared_memory.SharedMemory
+    slots: int
+    slot_size: int
+    published: int                  # Producer-side copy of the published counter
+    owner: bool                     # Creator unlinks the segment on close
+    event: Any                      # Optional multiprocessing.Event set after every put (reader wakeup)
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool, event: Any = None) -> None:
+        self.shm = shm
+        self.owner = owner
+        self.event = event
+        self.published, self.slots, self.slot_size = RING_HEADER.unpack_from(shm.buf, 0)
+
+    @classmethod
+    def create(cls, slots: int, slot_size: int, event: Any = None) -> 'ShmRing':
+        """Allocate a new ring (server side)."""
+        slot_size = (slot_size + SLOT_HEADER.size + 7) // 8 * 8
+        shm = shared_memory.SharedMemory(create=True, size=RING_HEADER_SIZE + slots * slot_size)
+        RING_HEADER.pack_into(shm.buf, 0, 0, slots, slot_size)
+        return cls(shm, owner=True, event=event)
+
+    @classmethod
+    def attach(cls, name: str, event: Any = None) -> 'ShmRing':
+        """Map an existing ring by name (training side); the creator owns its lifetime."""
+        return cls(shared_memory.SharedMemory(name=name, track=False), owner=False, event=event)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def slot(self, seq: int) -> int:
+        return RING_HEADER_SIZE + (seq % self.slots) * self.slot_size
+
+    def put(self, metric: Any) -> None:
+        """Publish a metric (producer only); never blocks, overwrites the oldest slot."""
+        seq = self.published
+        record = encode_record(seq, metric)
+        if len(record) > self.slot_size - SLOT_HEADER.size:
+            raise ValueError(f'Metric record of {len(record)} bytes does not fit a {self.slot_size}-byte slot')
+
+        buf = self.shm.buf
+        offset = self.slot(seq)
+        SLOT_HEADER.pack_into(buf, offset, WRITING, 0)
+        start = offset + SLOT_HEADER.size
+        buf[start:start + len(record)] = record
+        SLOT_HEADER.pack_into(buf, offset, seq + 1, len(record))
+
+        self.published = seq + 1
+        struct.pack_into('<Q', buf, 0, self.published)
+        if self.event is not None:
+            self.event.set()
+
+    def head(self) -> int:
+        """Next sequence number the producer will write (consumer side)."""
+        return struct.unpack_from('<Q', self.shm.buf, 0)[0]
+
+    def read(self, seq: int) -> dict[str, Any] | None:
+        """Decode record `seq` in place, or None if it was overwritten (or is mid-write)."""
+        buf = self.shm.buf
+        offset = self.slot(seq)
+        if SLOT_HEADER.unpack_from(buf, offset)[0] != seq + 1:
+            return None
+
+        # Header fields are read straight from the mapping; arrays are copied exactly once,
+        # into memory the hub can keep after this slot is reused
+        record = decode_record(buf, offset + SLOT_HEADER.size)
+        for key, value in record.items():
+            if isinstance(value, np.ndarray):
+                record[key] = value.copy()
+
+        if SLOT_HEADER.unpack_from(buf, offset)[0] != seq + 1:
+            return None                                 # Overwritten while we were reading
+        return record
+
+    def close(self) -> None:
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,149 @@
+import math
+import multiprocessing as mp
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any
+
+# Log-spaced latency buckets: 4 per power of two from 1µs, the last one open-ended (~1h and up)
+BUCKET_MIN = 1e-6
+BUCKETS_PER_OCTAVE = 4
+NUM_BUCKETS = 130
+
+
+def bucket_upper(i: int) -> float:
+    """Upper bound (seconds) of bucket i."""
+    return BUCKET_MIN * 2 ** (i / BUCKETS_PER_OCTAVE)
+
+
+def percentile(counts: list[int], q: float) -> float:
+    """Approximate q-quantile (0..1) from bucket counts: the upper bound of the bucket holding it."""
+    total = sum(counts)
+    if not total:
+        return 0.0
+    rank, seen = q * total, 0
+    for i, n in enumerate(counts):
+        seen += n
+        if seen >= rank and n:
+            return bucket_upper(i)
+    return bucket_upper(len(counts) - 1)
+
+
+class Histogram:
+    """Log-bucketed latency histogram. Recording is O(1) and lock-free (concurrent writers may rarely lose a count)."""
+
+    counts: list[int]
+    count: int
+    total: float                        # Sum of recorded seconds
+    min: float
+    max: float
+
+    def __init__(self) -> None:
+        self.counts = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        i = 0 if seconds <= BUCKET_MIN else min(int(math.log2(seconds / BUCKET_MIN) * BUCKETS_PER_OCTAVE) + 1, NUM_BUCKETS - 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min: self.min = seconds
+        if seconds > self.max: self.max = seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        return {'count': self.count, 'sum': self.total, 'min': self.min if self.count else 0.0,
+                'max': self.max, 'counts': list(self.counts)}
+
+
+class Timer:
+    """Context manager recording the elapsed time of its block into a histogram."""
+
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram: Histogram) -> None:
+        self.histogram = histogram
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.histogram.record(perf_counter() - self.start)
+
+
+class Stats:
+    """Per-process registry of stage timings (histograms), counters, gauges and labels."""
+
+    histograms: dict[str, Histogram]
+    counters: dict[str, int]
+    gauges: dict[str, float]            # Last observed value (e.g. queue depth)
+    labels: dict[str, str]              # Free-form facts (e.g. path of the last profiler trace)
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+        self.labels = {}
+
+    def histogram(self, name: str) -> Histogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def record(self, name: str, seconds: float) -> None:
+        self.histogram(name).record(seconds)
+
+    def time(self, name: str) -> Timer:
+        """`with stats.time('stage'):` records the block's duration."""
+        return Timer(self.histogram(name))
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Plain-data copy, safe to pickle across processes."""
+        return {
+            'histograms': {name: h.snapshot() for name, h in list(self.histograms.items())},
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'labels': dict(self.labels),
+        }
+
+
+def report_periodically(stats: Stats, sink: Any, interval: float = 1.0) -> Event:
+    """Put {'stats': snapshot} into `sink` every `interval` seconds (from a daemon thread) until the event is set."""
+    stop = Event()
+
+    def report() -> None:
+        while not stop.wait(interval):
+            sink.put({'stats': stats.snapshot()})
+
+    Thread(target=report, name='stats-reporter', daemon=True).start()
+    return stop
+
+
+class ProfileTrigger:
+    """Cross-process request for a torch.profiler capture of the next N training steps."""
+
+    steps: Any                          # Shared int (RawValue): pending request, 0 when none
+
+    def __init__(self, ctx: Any = mp) -> None:
+        self.steps = ctx.RawValue('i', 0)
+
+    def request(self, steps: int) -> None:
+        self.steps.value = steps
+
+    def take(self) -> int:
+        """Consume a pending request (training side); cheap enough to poll every batch."""
+        steps = self.steps.value
+        if steps:
+            self.steps.value = 0
+        return steps
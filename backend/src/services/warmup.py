@@ -0,0 +1,69 @@
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Callable
+
+
+class Warmup:
+    """Builds the training stack on a background thread, so the server can answer RPCs while it loads.
+
+    `build` receives the Warmup and calls `stage()` as it moves on (importing torch, loading data,
+    building the model...); Status reports the current stage until `on_ready` has the result.
+    """
+
+    stages: tuple[str, ...]             # Stage names `build` goes through, in order
+    build: Callable[['Warmup'], Any]
+    current: str
+    completed: int                      # Stages finished so far
+    error: str | None
+    started: float                      # perf_counter() when the thread started
+    finished: Event                     # Set once build returned (or raised)
+    thread: Thread
+
+    def __init__(self, stages: tuple[str, ...], build: Callable[['Warmup'], Any]) -> None:
+        self.stages = stages
+        self.build = build
+        self.current = 'Waiting to start'
+        self.completed = 0
+        self.error = None
+        self.started = perf_counter()
+        self.finished = Event()
+        self.thread = Thread(name='warmup', daemon=True)
+
+    def start(self, on_ready: Callable[[Any], None]) -> None:
+        """Run `build` in the background and hand its result to `on_ready` (before ready() turns true)."""
+        self.started = perf_counter()
+        self.thread = Thread(target=self.run, args=(on_ready,), name='warmup', daemon=True)
+        self.thread.start()
+
+    def run(self, on_ready: Callable[[Any], None]) -> None:
+        try:
+            on_ready(self.build(self))
+            self.completed = len(self.stages)
+            print(f'🔥 Warm-up done in {perf_counter() - self.started:.1f}s')
+        except Exception as e:
+            self.error = f'{self.current}: {e}'
+            print(f'❌ Warm-up failed at {self.error}')
+        finally:
+            self.finished.set()
+
+    def stage(self, name: str) -> None:
+        """Called by `build` when it moves on to the named stage."""
+        self.completed = self.stages.index(name)
+        self.current = name
+        print(f'⏳ {name}...')
+
+    def ready(self) -> bool:
+        return self.finished.is_set() and self.error is None
+
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def progress(self) -> float:
+        """Fraction of stages finished (1.0 once ready)."""
+        return self.completed / len(self.stages) if self.stages else float(self.ready())
+
+    def describe(self) -> str:
+        if self.error is not None:
+            return f'Warm-up failed at {self.error}'
+        return (f'Warming up: {self.current} ({self.completed + 1}/{len(self.stages)}, '
+                f'{perf_counter() - self.started:.1f}s elapsed)')
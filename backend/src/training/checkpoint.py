@@ -0,0 +1,101 @@
+import copy
+import os
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+from typing import Any
+import torch
+from torch import nn
+from torch.optim import Optimizer
+
+from src.training.convergence import StopInfo
+
+
+def unwrap(model: nn.Module) -> nn.Module:
+    """The underlying module of torch.compile and DDP wrappers, so checkpoints load in any training mode."""
+    for attr in ('_orig_mod', 'module'):          # compile wraps DDP, which wraps the model
+        model = getattr(model, attr, model)
+    return model
+
+
+class Checkpointer:
+    """Periodic training checkpoints: snapshot state in memory, write to disk on a background thread."""
+
+    root: Path
+    every: int                          # Checkpoint every N epochs (the final epoch is always saved)
+    keep: int                           # Number of checkpoints retained on disk
+    queue: Queue                        # Pending (epoch, snapshot) writes; None stops the writer
+    writer: Thread
+
+    def __init__(self, root: str | Path, every: int = 1, keep: int = 3) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.every = max(every, 1)
+        self.keep = max(keep, 1)
+        self.queue = Queue()
+        self.writer = Thread(target=self.write_loop, name='checkpoint-writer', daemon=True)
+        self.writer.start()
+
+    def due(self, epoch: int) -> bool:
+        return (epoch + 1) % self.every == 0
+
+    def save(self, model: nn.Module, optimizer: Optimizer, epoch: int, prev_loss: float, converged: bool,
+             stop: StopInfo | None = None) -> None:
+        """Snapshot model/optimizer state (cheap, on the training thread) and queue it for writing."""
+        snapshot = {
+            'model': {k: v.detach().clone() for k, v in unwrap(model).state_dict().items()},
+            'optimizer': copy.deepcopy(optimizer.state_dict()),
+            'epoch': epoch,
+            'prev_loss': prev_loss,
+            'converged': converged,
+            'stop': stop._asdict() if stop else None,   # StopInfo, as plain types for weights_only loading
+        }
+        self.queue.put((epoch, snapshot))
+
+    def write_loop(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            epoch, snapshot = item
+            try:
+                self.write(epoch, snapshot)
+            except Exception as e:
+                print(f'❌ Checkpoint for epoch {epoch} failed: {e}')
+            finally:
+                self.queue.task_done()
+
+    def write(self, epoch: int, snapshot: dict[str, Any]) -> None:
+        """Write atomically (temp file, fsync, rename) so a crash never leaves a torn checkpoint."""
+        path = self.root / f'ckpt-{epoch:05d}.pt'
+        tmp = path.with_suffix('.pt.tmp')
+        with open(tmp, 'wb') as f:
+            torch.save(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+        for old in self.checkpoints()[:-self.keep]:
+            old.unlink(missing_ok=True)
+
+    def wait(self) -> None:
+        """Block until every queued checkpoint is on disk."""
+        self.queue.join()
+
+    def close(self) -> None:
+        """Write what is queued, then stop the writer thread (the run is over)."""
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+    def checkpoints(self) -> list[Path]:
+        """Completed checkpoints, oldest first."""
+        return sorted(self.root.glob('ckpt-*.pt'))
+
+    def load_latest(self) -> dict[str, Any] | None:
+        """Load the newest checkpoint, or None if there is none."""
+        checkpoints = self.checkpoints()
+        if not checkpoints:
+            return None
+        return torch.load(checkpoints[-1], map_location='cpu', weights_only=True)
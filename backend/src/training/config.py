@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+import os
+import torch
+from torch.nn import CrossEntropyLoss
+from torch.optim import SGD
+
+from src.training.checkpoint import Checkpointer
+from src.training.convergence import ConvergenceMonitor
+from src.training.data_module import DataModule
+from src.services.resources import pin_thread
+from src.services.sample_index import SampleIndex
+from src.services.stats import ProfileTrigger
+from src.training.model import MODELS
+from src.training.trainer import MetricSink, Trainer
+
+
+@dataclass
+class TrainConfig:
+    """Everything needed to (re)build the training stack, including in another process."""
+
+    root: str = './data'
+    batch_size: int = 16
+    lr: float = 0.01
+    tolerance: float = 0.005            # Minimum epoch loss change required to continue training
+    patience: int = 0                   # Batches the smoothed loss may go without improving (0 disables)
+    ema_alpha: float = 0.005            # Loss smoothing: weight of the newest batch
+    min_delta: float = 0.01             # Relative improvement of the smoothed loss that resets patience
+    update_interval: int = 160          # Emit metrics every N batches
+    tensor_resident: bool = True        # Batch from in-memory tensors instead of PIL/ToTensor
+    prefetch: int = 4                   # Background batch queue depth (0 disables)
+    num_workers: int = 0                # DataLoader worker processes (PIL path only)
+    lazy_metrics: bool = True           # Host conversion only on emitted batches
+    seed: int = 0
+    model: str = 'mlp'                  # Architecture, a key of MODELS
+    bf16: bool = False                  # CPU bfloat16 autocast
+    compile: bool = False               # torch.compile (warmed up before the first metric)
+    channels_last: bool = False         # NHWC memory format for the CNN
+    checkpoint_dir: str | None = './data/checkpoints'   # None disables checkpointing
+    checkpoint_every: int = 1           # Checkpoint every N epochs
+    checkpoint_keep: int = 3            # Checkpoints retained on disk
+    profile_dir: str = './data/profiles'                # Where remotely triggered profiler traces go
+    snapshot_every: int = 500           # Weight snapshot (for evaluation) every N batches
+    cores: tuple[int, ...] = ()         # CPUs training is pinned to, split between data-parallel ranks (empty = unpinned)
+    threads: int = 0                    # torch intra-op threads, split between ranks (0 = torch default)
+    interop_threads: int = 0            # torch inter-op threads (0 = torch default)
+
+    def __post_init__(self) -> None:
+        if self.model not in MODELS:
+            raise ValueError(f'Unknown model {self.model!r} (expected one of {", ".join(MODELS)})')
+        if self.lr <= 0:
+            raise ValueError(f'lr must be positive (got {self.lr})')
+        if self.batch_size <= 0:
+            raise ValueError(f'batch_size must be positive (got {self.batch_size})')
+        if self.patience < 0:
+            raise ValueError(f'patience must not be negative (got {self.patience})')
+        if not 0 < self.ema_alpha <= 1:
+            raise ValueError(f'ema_alpha must be in (0, 1] (got {self.ema_alpha})')
+
+
+def apply_budget(config: TrainConfig, rank: int = 0, world_size: int = 1) -> None:
+    """Pin the calling thread to this rank's share of the training cores and size torch's thread pools.
+
+    Runs before anything spawns threads, so the data prefetcher and torch's pools inherit the pinning.
+    """
+    share = len(config.cores) // world_size
+    cores = config.cores[rank * share:(rank + 1) * share] or config.cores
+    pin_thread(cores)
+    if config.threads:
+        torch.set_num_threads(max(1, config.threads // world_size))
+    elif world_size > 1:                            # One core's worth of threads per core in this rank's share
+        torch.set_num_threads(len(cores) if config.cores else max(1, (os.cpu_count() or 1) // world_size))
+    if config.interop_threads and torch.get_num_interop_threads() != config.interop_threads:
+        try:
+            torch.set_num_interop_threads(config.interop_threads)
+        except RuntimeError:                        # Fixed once the process has used the pool (thread runners)
+            pass
+
+
+def build_trainer(config: TrainConfig, metrics: MetricSink | None = None,
+                  rank: int = 0, world_size: int = 1, trainer_cls: type[Trainer] = Trainer,
+                  profile_trigger: ProfileTrigger | None = None, snapshots: MetricSink | None = None,
+                  samples: SampleIndex | None = None) -> Trainer:
+    """Load data and build model, optimizer and trainer for one process (or one data-parallel rank)."""
+
+    # Stay within this run's CPU budget (and this rank's share of it)
+    apply_budget(config, rank, world_size)
+
+    # Set seed for reproducibility (identical initial weights on every rank)
+    torch.manual_seed(config.seed)
+
+    # 1. Load data (this rank's shard)
+    data = DataModule(
+        root=config.root,
+        batch_size=config.batch_size,
+        download=True,
+        tensor_resident=config.tensor_resident,
+        prefetch=config.prefetch,
+        num_workers=config.num_workers,
+        rank=rank,
+        world_size=world_size,
+        seed=config.seed,
+    )
+    train_loader, _ = data.get_loaders()
+
+    # 2. Build model + optimizer + loss
+    model = MODELS[config.model]()
+    criterion = CrossEntropyLoss()
+    optimizer = SGD(model.parameters(), lr=config.lr)
+
+    # 3. Checkpoints are read by every rank on resume, but only written by rank 0
+    checkpointer = None
+    if config.checkpoint_dir:
+        checkpointer = Checkpointer(config.checkpoint_dir, every=config.checkpoint_every, keep=config.checkpoint_keep)
+
+    # 4. Create trainer (producer of metrics), compiled and warmed up so its modes are final
+    trainer = trainer_cls(
+        model=model,
+        criterion=criterion,
+        optimizer=optimizer,
+        dataloader=train_loader,
+        tolerance=config.tolerance,
+        update_interval=config.update_interval,
+        metrics=metrics,
+        lazy_metrics=config.lazy_metrics,
+        checkpointer=checkpointer,
+        bf16=config.bf16,
+        compile=config.compile,
+        channels_last=config.channels_last,
+        profile_trigger=profile_trigger,
+        profile_dir=config.profile_dir,
+        snapshots=snapshots,
+        snapshot_every=config.snapshot_every,
+        convergence=ConvergenceMonitor(config.ema_alpha, config.patience, config.min_delta) if config.patience else None,
+        samples=samples,
+    )
+    trainer.warm_up()
+    return trainer
@@ -0,0 +1,64 @@
+from typing import Literal, NamedTuple
+import torch
+from torch import Tensor
+
+StopReason = Literal['completed', 'tolerance', 'plateau']     # Also coded in metric records (see metrics_log)
+
+
+class StopInfo(NamedTuple):
+    """Why and where training ended, and how many batches of the requested run it skipped."""
+
+    reason: StopReason
+    epoch: int
+    batch: int
+    batches_saved: int                  # Optimizer steps (per process) left unrun
+
+
+class ConvergenceMonitor:
+    """Exponential moving average of the batch loss with patience, so a plateau can end training mid-epoch.
+
+    The average is updated on-tensor every batch (no host sync); it is read, and compared with
+    the best value so far, only every `check_every` batches. Training has plateaued once the
+    smoothed loss hasn't improved on its best by `min_delta` (relative) for `patience` batches.
+    """
+
+    alpha: float                        # EMA weight of the newest batch loss
+    patience: int                       # Batches without improvement before stopping (0 disables)
+    min_delta: float                    # Relative improvement that resets the patience counter
+    check_every: int                    # Batches between reads of the smoothed loss
+    ema: Tensor                         # Smoothed loss, float64 scalar
+    steps: int                          # Batches seen
+    best: float                         # Lowest smoothed loss at a check
+    stale: int                          # Batches since `best` last improved
+
+    def __init__(self, alpha: float = 0.02, patience: int = 1000, min_delta: float = 0.01,
+                 check_every: int = 50) -> None:
+        self.alpha = alpha
+        self.patience = patience
+        self.min_delta = min_delta
+        self.check_every = max(1, min(check_every, patience or check_every))
+        self.ema = torch.zeros((), dtype=torch.float64)
+        self.steps = 0
+        self.best = float('inf')
+        self.stale = 0
+
+    def update(self, loss: Tensor | float) -> None:
+        """Fold one batch loss into the average (seeded with the first one, so there is no start-up bias)."""
+        if self.steps == 0:
+            self.ema.fill_(loss)
+        else:
+            self.ema.mul_(1 - self.alpha).add_(loss, alpha=self.alpha)
+        self.steps += 1
+
+    def due(self) -> bool:
+        """Whether this batch is a check point (the same batches on every data-parallel rank)."""
+        return self.patience > 0 and self.steps % self.check_every == 0
+
+    def check(self, smoothed: float) -> bool:
+        """Record the smoothed loss read at a check point; True once it has plateaued."""
+        if smoothed < self.best * (1 - self.min_delta):
+            self.best, self.stale = smoothed, 0
+        else:
+            self.stale += self.check_every
+        # The average needs ~1/alpha batches to reflect the current loss rather than the first few
+        return self.steps >= 1 / self.alpha and self.stale >= self.patience
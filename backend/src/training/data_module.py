@@ -1,8 +1,15 @@
 import sys
 import os
+from queue import Queue, Full
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+import torch
+from torch import Tensor
 from torchvision import datasets, transforms
-from torch.utils.data import DataLoader, Dataset
-from typing import Any
+from torch.utils.data import DataLoader, Dataset, DistributedSampler
+
+from src.training.dataset_cache import load_mnist
 
 
 class IndexedDataset(Dataset):
@@ -19,6 +26,135 @@ class IndexedDataset(Dataset):
         return idx, image, label
 
 
+class TensorLoader:
+    """Tensor-resident loader: keeps all images as one uint8 tensor and gathers whole batches at once."""
+
+    images: Tensor      # (N, 28, 28) uint8, decoded once
+    targets: Tensor     # (N,) int64
+    batch_size: int
+    shuffle: bool
+    rank: int           # This process's shard when training data-parallel
+    world_size: int     # Number of shards (1 = whole dataset)
+    seed: int           # Shared shuffle seed, so every rank agrees on the epoch's permutation
+    epoch: int
+
+    def __init__(self, images: Tensor, targets: Tensor, batch_size: int, shuffle: bool = False,
+                 rank: int = 0, world_size: int = 1, seed: int = 0):
+        self.images = images
+        self.targets = targets
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.rank = rank
+        self.world_size = world_size
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+
+    def num_samples(self) -> int:
+        """Samples served per epoch by this shard (equal across ranks so collectives line up)."""
+        return len(self.images) // self.world_size
+
+    def __len__(self) -> int:
+        return (self.num_samples() + self.batch_size - 1) // self.batch_size
+
+    def __iter__(self) -> Iterator[tuple[Tensor, Tensor, Tensor]]:
+        n = len(self.images)
+        if self.world_size > 1:
+            # Same permutation on every rank, then a strided, equal-length shard of it
+            generator = torch.Generator().manual_seed(self.seed + self.epoch)
+            order = torch.randperm(n, generator=generator) if self.shuffle else torch.arange(n)
+            order = order[self.rank:self.num_samples() * self.world_size:self.world_size]
+        else:
+            order = torch.randperm(n) if self.shuffle else torch.arange(n)
+
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start:start + self.batch_size]
+            inputs = self.images[indices].unsqueeze(1).float().div_(255)   # Same layout/scale as ToTensor: (B, 1, 28, 28)
+            yield indices, inputs, self.targets[indices]
+
+
+class PrefetchLoader:
+    """Overlaps batch preparation with training via a bounded queue filled by a producer thread."""
+
+    loader: Iterable
+    depth: int              # Max number of ready batches held in the queue (>= 2)
+    wait_time: float        # Seconds the consumer spent blocked on data during the current epoch
+    total_wait_time: float  # Same, accumulated over all epochs
+    queue: Queue | None     # Ready batches of the current epoch (its size is the live prefetch depth)
+
+    def __init__(self, loader: Iterable, depth: int = 2):
+        self.loader = loader
+        self.depth = max(depth, 2)
+        self.wait_time = 0.0
+        self.total_wait_time = 0.0
+        self.queue = None
+
+    def __len__(self) -> int:
+        return len(self.loader)     # type: ignore
+
+    def set_epoch(self, epoch: int) -> None:
+        set_epoch(self.loader, epoch)
+
+    def __iter__(self) -> Iterator[Any]:
+        queue: Queue = Queue(maxsize=self.depth)
+        self.queue = queue
+        stop = Event()
+        done = object()
+
+        def produce() -> None:
+            """Fill the queue until the epoch ends or the consumer goes away."""
+            try:
+                for batch in self.loader:
+                    while not stop.is_set():
+                        try:
+                            queue.put(batch, timeout=0.1)
+                            break
+                        except Full:
+                            continue                    # Consumer is busy computing, retry
+                    if stop.is_set():
+                        return
+                queue.put(done)
+            except BaseException as e:
+                queue.put(e)                            # Re-raised on the training thread
+
+        producer = Thread(target=produce, name='prefetch', daemon=True)
+        producer.start()
+        self.wait_time = 0.0
+
+        try:
+            while True:
+                start = perf_counter()
+                item = queue.get()
+                waited = perf_counter() - start
+                self.wait_time += waited
+                self.total_wait_time += waited
+
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Unblock and retire the producer if the epoch was cut short
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            producer.join()
+
+
+Loader = DataLoader | TensorLoader | PrefetchLoader
+
+
+def set_epoch(loader: Any, epoch: int) -> None:
+    """Tell a (possibly sharded) loader which epoch is starting, so shuffling stays in sync across ranks."""
+    if hasattr(loader, 'set_epoch'):
+        loader.set_epoch(epoch)
+    elif isinstance(loader, DataLoader) and isinstance(loader.sampler, DistributedSampler):
+        loader.sampler.set_epoch(epoch)
+
+
 def get_data_path():
     if getattr(sys, 'frozen', False):
         return os.path.join(getattr(sys, '_MEIPASS', '.'), 'data')
@@ -31,30 +167,65 @@ class DataModule:
     root: str
     batch_size: int
     download: bool
+    tensor_resident: bool   # Serve batches from in-memory tensors instead of per-sample PIL/ToTensor
+    prefetch: int           # Depth of the background batch queue (0 disables prefetching)
+    num_workers: int        # DataLoader worker processes decoding samples (PIL path only)
+    rank: int               # Train shard served to this process (data-parallel training)
+    world_size: int         # Number of train shards
+    seed: int               # Shuffle seed shared by all shards
     
-    def __init__(self, root: str | None = None, batch_size = 64, download = True):
+    def __init__(self, root: str | None = None, batch_size = 64, download = True, tensor_resident = False,
+                 prefetch = 0, num_workers = 0, rank = 0, world_size = 1, seed = 0):
         self.root = root or get_data_path()
         self.batch_size = batch_size
         self.download = download
+        self.tensor_resident = tensor_resident
+        self.prefetch = prefetch
+        self.num_workers = num_workers
+        self.rank = rank
+        self.world_size = world_size
+        self.seed = seed
         
         # Standard MNIST normalization
         self.transform = transforms.Compose([transforms.ToTensor()])
     
-    def get_loaders(self) -> tuple[DataLoader, DataLoader]:
+    def get_loaders(self) -> tuple[Loader, Loader]:
         """Return train and test dataloaders."""
 
-        train_dataset = datasets.MNIST(
-            self.root, train=True, download=self.download, transform=self.transform
-        )
-        test_dataset = datasets.MNIST(
-            self.root, train=False, download=self.download, transform=self.transform
-        )
+        train_loader: Loader
+        test_loader: Loader
+
+        # Batch straight from the decoded uint8 tensors (memory-mapped from the array cache),
+        # skipping torchvision's dataset setup, PIL and the default collate
+        if self.tensor_resident:
+            splits = load_mnist(self.root, download=self.download)
+            train_loader = TensorLoader(*splits['train'], self.batch_size, shuffle=True,
+                                        rank=self.rank, world_size=self.world_size, seed=self.seed)
+            test_loader = TensorLoader(*splits['test'], self.batch_size, shuffle=False)
+
+        else:
+            train_dataset = datasets.MNIST(
+                self.root, train=True, download=self.download, transform=self.transform
+            )
+            test_dataset = datasets.MNIST(
+                self.root, train=False, download=self.download, transform=self.transform
+            )
+
+            # Wrap datasets to return indices along with data
+            indexed_train = IndexedDataset(train_dataset)
+            indexed_test = IndexedDataset(test_dataset)
 
-        # Wrap datasets to return indices along with data
-        indexed_train = IndexedDataset(train_dataset)
-        indexed_test = IndexedDataset(test_dataset)
+            workers = dict(num_workers=self.num_workers, persistent_workers=self.num_workers > 0)
+            if self.world_size > 1:
+                sampler = DistributedSampler(indexed_train, self.world_size, self.rank, shuffle=True,
+                                             seed=self.seed, drop_last=True)
+                train_loader = DataLoader(indexed_train, batch_size=self.batch_size, sampler=sampler, **workers)
+            else:
+                train_loader = DataLoader(indexed_train, batch_size=self.batch_size, shuffle=True, **workers)
+            test_loader = DataLoader(indexed_test, batch_size=self.batch_size, shuffle=False)
 
-        train_loader = DataLoader(indexed_train, batch_size=self.batch_size, shuffle=True)
-        test_loader = DataLoader(indexed_test, batch_size=self.batch_size, shuffle=False)
+        # Prepare upcoming batches in the background while the trainer computes
+        if self.prefetch:
+            train_loader = PrefetchLoader(train_loader, depth=self.prefetch)
 
         return train_loader, test_loader
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from time import perf_counter
+import numpy as np
+import torch
+from torch import Tensor
+from torchvision import datasets
+
+from src.services.images import open_idx
+
+CACHE_VERSION = 1                       # Bump when the cached layout changes
+RAW_FILES = {
+    'train-images': 'train-images-idx3-ubyte',
+    'train-labels': 'train-labels-idx1-ubyte',
+    'test-images': 't10k-images-idx3-ubyte',
+    'test-labels': 't10k-labels-idx1-ubyte',
+}
+
+Split = tuple[Tensor, Tensor]           # (N, 28, 28) uint8 images, (N,) int64 labels
+
+
+def cache_dir(root: str | Path) -> Path:
+    return Path(root) / 'MNIST' / 'cache' / f'v{CACHE_VERSION}'
+
+
+def sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(path: Path) -> dict[str, int]:
+    stat = path.stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def build_cache(root: str | Path) -> None:
+    """Decode the raw idx files into .npy arrays plus meta.json (raw checksums), published atomically."""
+    raw_dir = Path(root) / 'MNIST' / 'raw'
+    target = cache_dir(root)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix='.build-', dir=target.parent))
+    try:
+        sources = {}
+        for name, file in RAW_FILES.items():
+            raw = raw_dir / file
+            array = np.asarray(open_idx(raw))
+            np.save(tmp / f'{name}.npy', array.astype(np.int64) if name.endswith('labels') else array)
+            sources[file] = {**fingerprint(raw), 'sha256': sha256(raw)}
+        (tmp / 'meta.json').write_text(json.dumps({'version': CACHE_VERSION, 'sources': sources}, indent=2))
+
+        shutil.rmtree(target, ignore_errors=True)           # Stale cache (raw files changed)
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            pass                                            # Another process published the same cache first
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def is_fresh(root: str | Path) -> bool:
+    """True if the cache matches the raw files: same size and mtime, or else the same sha256 (then re-stamped)."""
+    meta_path = cache_dir(root) / 'meta.json'
+    if not meta_path.exists():
+        return False
+    meta = json.loads(meta_path.read_text())
+    if meta.get('version') != CACHE_VERSION:
+        return False
+
+    raw_dir = Path(root) / 'MNIST' / 'raw'
+    restamp = False
+    for file, source in meta['sources'].items():
+        raw = raw_dir / file
+        if not raw.exists():
+            continue                                        # Cache shipped without the raw files
+        if fingerprint(raw) == {'size': source['size'], 'mtime_ns': source['mtime_ns']}:
+            continue
+        if sha256(raw) != source['sha256']:
+            return False
+        source.update(fingerprint(raw))                     # Touched but identical
+        restamp = True
+
+    if restamp:
+        meta_path.write_text(json.dumps(meta, indent=2))
+    return True
+
+
+def load_split(root: str | Path, split: str) -> Split:
+    """Zero-copy tensors over the cached arrays.
+
+    The files are mapped copy-on-write: every process reading the same cache shares its physical pages,
+    and nothing is ever written back.
+    """
+    directory = cache_dir(root)
+    images = np.load(directory / f'{split}-images.npy', mmap_mode='c')
+    labels = np.load(directory / f'{split}-labels.npy', mmap_mode='c')
+    return torch.from_numpy(images), torch.from_numpy(labels)
+
+
+def load_mnist(root: str | Path, download: bool = True) -> dict[str, Split]:
+    """Train and test splits from the preprocessed cache, (re)building it from the raw idx files when needed."""
+    start = perf_counter()
+    if not is_fresh(root):
+        print('📦 Building MNIST array cache...')
+        datasets.MNIST(str(root), train=True, download=download)     # Fetch and extract the raw files if missing
+        datasets.MNIST(str(root), train=False, download=download)
+        build_cache(root)
+
+    splits = {split: load_split(root, split) for split in ('train', 'test')}
+    print(f'⚡ MNIST loaded from {cache_dir(root)} in {(perf_counter() - start) * 1000:.1f} ms')
+    return splits
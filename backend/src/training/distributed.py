@@ -0,0 +1,155 @@
+import os
+import sys
+import socket
+from typing import Any
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from torch import Tensor
+from torch.nn.parallel import DistributedDataParallel
+
+from src.services.sample_index import SampleIndex
+from src.services.stats import ProfileTrigger, report_periodically
+from src.training.config import TrainConfig, build_trainer
+from src.training.convergence import StopInfo
+from src.training.snapshots import Tagged
+from src.training.trainer import MetricSink, Trainer, TrainModes
+
+
+class DistributedTrainer(Trainer):
+    """Trainer for one DDP rank: gradients are all-reduced by DDP, losses by this class, metrics come from rank 0."""
+
+    rank: int
+    world_size: int
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.rank = dist.get_rank()
+        self.world_size = dist.get_world_size()
+        self.model = DistributedDataParallel(self.model)   # Same parameters, so the optimizer is unaffected
+        self.lazy_metrics = True                            # Loss reduction happens on the lazy path
+
+    def reduce_loss(self, loss: Tensor) -> Tensor:
+        """Average a loss over all ranks, so stop decisions agree (every rank reduces at the same batches)."""
+        loss = loss.clone()
+        dist.all_reduce(loss, op=dist.ReduceOp.SUM)
+        return loss / self.world_size
+
+    def emit(self, metric: Any) -> None:
+        if self.rank == 0:
+            super().emit(metric)
+
+    def save_checkpoint(self, epoch: int, prev_loss: float) -> None:
+        if self.rank == 0:                                  # Replicas are identical; every rank resumes from it
+            super().save_checkpoint(epoch, prev_loss)
+
+
+def run_worker(rank: int, world_size: int, port: int, config: TrainConfig,
+               num_epochs: int, resume: bool, metrics: MetricSink, profile_trigger: ProfileTrigger | None = None,
+               snapshots: bool = False, samples: str | None = None) -> None:
+    """Entry point of one data-parallel worker process (rank 0 also profiles and publishes weight snapshots)."""
+    if rank != 0:
+        sys.stdout = open(os.devnull, 'w')                 # Only rank 0 reports progress
+
+    # build_trainer splits the cores and threads between workers instead of every rank spawning a full intra-op pool
+    dist.init_process_group('gloo', init_method=f'tcp://127.0.0.1:{port}', rank=rank, world_size=world_size)
+    index = SampleIndex.attach(samples) if samples else None      # Every rank indexes its own shard
+    try:
+        trainer = build_trainer(config, metrics=metrics, rank=rank, world_size=world_size, trainer_cls=DistributedTrainer,
+                                profile_trigger=profile_trigger if rank == 0 else None,
+                                snapshots=Tagged(metrics, 'snapshot') if snapshots and rank == 0 else None,
+                                samples=index)
+        if rank == 0:
+            metrics.put({'modes': trainer.modes})
+            stop = report_periodically(trainer.stats, metrics)
+        trainer.train(num_epochs, resume=resume)
+        if rank == 0:
+            stop.set()
+            metrics.put({'stats': trainer.stats.snapshot()})
+            metrics.put({'done': True, 'converged': trainer.converged, 'stop': trainer.stop})
+    finally:
+        dist.destroy_process_group()
+        if index:
+            index.close()
+
+
+def free_port() -> int:
+    """Pick an unused localhost port for the rendezvous."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class DataParallelRunner:
+    """Trains with N DDP worker processes (gloo) and republishes rank 0's metrics into a local sink."""
+
+    config: TrainConfig
+    world_size: int
+    metrics: MetricSink                 # Usually the server's MetricsHub
+    reports: MetricSink | None          # Optional sink for rank 0's TrainModes and stats reports
+    profile_trigger: ProfileTrigger | None
+    snapshots: MetricSink | None        # Receives rank 0's weight snapshots
+    samples: str | None                 # Shared-memory name of the SampleIndex the ranks scatter into
+    converged: bool
+    stop: StopInfo | None               # Rank 0's stop reason, once training has ended
+    modes: TrainModes | None
+    latest_stats: dict[str, Any] | None # Rank 0's most recent Stats snapshot
+
+    def __init__(self, config: TrainConfig, world_size: int, metrics: MetricSink,
+                 reports: MetricSink | None = None, profile_trigger: ProfileTrigger | None = None,
+                 snapshots: MetricSink | None = None, samples: str | None = None) -> None:
+        self.config = config
+        self.world_size = world_size
+        self.metrics = metrics
+        self.reports = reports
+        self.profile_trigger = profile_trigger
+        self.snapshots = snapshots
+        self.samples = samples
+        self.converged = False
+        self.stop = None
+        self.modes = None
+        self.latest_stats = None
+
+    def train(self, num_epochs: int, resume: bool = False) -> None:
+        """Run training to completion (blocking), like Trainer.train."""
+        ctx = mp.get_context('spawn')
+        queue = ctx.Queue()
+        port = free_port()
+
+        workers = [
+            ctx.Process(target=run_worker, name=f'ddp-rank-{rank}', daemon=True,
+                        args=(rank, self.world_size, port, self.config, num_epochs, resume, queue, self.profile_trigger,
+                              self.snapshots is not None, self.samples))
+            for rank in range(self.world_size)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # Pump rank 0's metrics into the hub until it reports completion or the workers die
+        while True:
+            try:
+                item = queue.get(timeout=1.0)
+            except Exception:
+                if any(w.exitcode not in (None, 0) for w in workers):
+                    print('❌ Data-parallel worker failed; stopping training')
+                    break
+                continue
+
+            if item.get('done'):
+                self.converged = item['converged']
+                self.stop = item['stop']
+                break
+            if 'snapshot' in item:
+                self.snapshots.put(item['snapshot'])        # type: ignore[union-attr]
+                continue
+            if 'modes' in item or 'stats' in item:
+                self.modes = item.get('modes', self.modes)
+                self.latest_stats = item.get('stats', self.latest_stats)
+                if self.reports:
+                    self.reports.put(item)
+                continue
+            self.metrics.put(item)
+
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
@@ -0,0 +1,104 @@
+from threading import Event, Thread
+from time import perf_counter
+from typing import NotRequired, TypedDict
+import torch
+from torch import nn
+import torch.nn.functional as F
+
+from src.training.data_module import DataModule, Loader
+from src.training.snapshots import WeightSnapshot, WeightSnapshots, key, restore
+from src.training.trainer import MetricSink
+
+
+class EvalMetric(TypedDict):
+    """Held-out (test set) results for one weight snapshot."""
+
+    epoch: int
+    batch: int
+    version: int
+    loss: float
+    accuracy: float
+    class_accuracy: list[float]
+    samples: int
+    duration_ms: float
+    job_id: str
+    seq: NotRequired[int]     # Assigned by the hub on publish
+
+
+class Evaluator:
+    """Evaluates the newest weight snapshot on the 10k test set in a background thread.
+
+    Training only ever publishes a snapshot (see WeightSnapshots); snapshots that arrive while an
+    evaluation is running are coalesced, so evaluation falls behind rather than holding training up.
+    """
+
+    snapshots: WeightSnapshots
+    results: MetricSink                 # Usually a MetricsHub dedicated to eval results
+    root: str
+    batch_size: int
+    loader: Loader | None               # Test loader, built on the evaluator thread
+    models: dict[str, nn.Module]        # One eval copy per architecture, reloaded for every snapshot
+    stop: Event
+    thread: Thread
+
+    def __init__(self, snapshots: WeightSnapshots, results: MetricSink, root: str = './data',
+                 batch_size: int = 1000) -> None:
+        self.snapshots = snapshots
+        self.results = results
+        self.root = root
+        self.batch_size = batch_size
+        self.loader = None
+        self.models = {}
+        self.stop = Event()
+        self.thread = Thread(target=self.run, name='evaluator', daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def close(self) -> None:
+        self.stop.set()
+
+    def run(self) -> None:
+        last = None
+        while not self.stop.is_set():
+            snapshot = self.snapshots.wait(last, timeout=1.0)
+            if snapshot is None:
+                continue
+            last = key(snapshot)
+            try:
+                self.results.put(self.evaluate(snapshot))
+            except Exception as e:
+                print(f'❌ Evaluation failed: {e}')
+
+    def evaluate(self, snapshot: WeightSnapshot) -> EvalMetric:
+        """Loss, accuracy and per-class accuracy of one snapshot on the whole test set."""
+        start = perf_counter()
+        if self.loader is None:
+            _, self.loader = DataModule(root=self.root, batch_size=self.batch_size, tensor_resident=True).get_loaders()
+        model = restore(snapshot, self.models)
+
+        loss = torch.zeros((), dtype=torch.float64)
+        correct = torch.zeros(10, dtype=torch.int64)
+        total = torch.zeros(10, dtype=torch.int64)
+        with torch.inference_mode():
+            for _, inputs, targets in self.loader:
+                outputs = model(inputs).view(-1, 10)
+                loss += F.cross_entropy(outputs, targets, reduction='sum')
+                correct += torch.bincount(targets[outputs.argmax(dim=-1) == targets], minlength=10)
+                total += torch.bincount(targets, minlength=10)
+
+        samples = int(total.sum())
+        result: EvalMetric = {
+            'epoch': snapshot['epoch'],
+            'batch': snapshot['batch'],
+            'version': snapshot['version'],
+            'loss': loss.item() / samples,
+            'accuracy': int(correct.sum()) / samples,
+            'class_accuracy': (correct / total.clamp(min=1)).tolist(),
+            'samples': samples,
+            'duration_ms': (perf_counter() - start) * 1000,
+            'job_id': snapshot.get('job', ''),
+        }
+        print(f'🧪 Eval [Epoch {result["epoch"]} | Batch {result["batch"]}] '
+              f'Accuracy: {result["accuracy"]:.2%} | Loss: {result["loss"]:.4f}')
+        return result
@@ -4,7 +4,7 @@ import torch.nn as nn
 
 # Regular NN Verson
 
-class Model(nn.Module):
+class MLP(nn.Module):
     """Neural network pipeline from https://www.youtube.com/watch?v=gBw0u_5u0qU."""
     
     fc1: nn.Linear     # fully connected: 784 → 100
@@ -27,46 +27,47 @@ class Model(nn.Module):
         return x.squeeze()                 # remove dims of size 1
 
 
-# # CNN Version
+# CNN Version
 
-# import torch.nn as nn
-# from torch import Tensor
-
-# class Model(nn.Module):
-#     """
-#     Simple CNN for 28x28 grayscale images.
-#     Feature extractor: Conv -> ReLU -> Conv -> ReLU -> MaxPool (twice)
-#     Classifier: Linear -> ReLU -> Linear (logits for 10 classes)
-#     """
+class CNN(nn.Module):
+    """
+    Simple CNN for 28x28 grayscale images.
+    Feature extractor: Conv -> ReLU -> Conv -> ReLU -> MaxPool (twice)
+    Classifier: Linear -> ReLU -> Linear (logits for 10 classes)
+    """
     
-#     features: nn.Sequential
-#     classifier: nn.Sequential
+    features: nn.Sequential
+    classifier: nn.Sequential
     
-#     def __init__(self, num_classes: int = 10) -> None:
-#         super().__init__()
-#         self.features = nn.Sequential(
-#             nn.Conv2d(in_channels=1, out_channels=32, kernel_size=3, padding=1),    # 1x28x28 -> 32x28x28
-#             nn.ReLU(inplace=True),                                                  # Saves memory
-#             nn.Conv2d(32, 64, kernel_size=3, padding=1),                            # 32x28x28 -> 64x28x28
-#             nn.ReLU(inplace=True),
-#             nn.MaxPool2d(2),                                                        # 64x28x28 -> 64x14x14
+    def __init__(self, num_classes: int = 10) -> None:
+        super().__init__()
+        self.features = nn.Sequential(
+            nn.Conv2d(in_channels=1, out_channels=32, kernel_size=3, padding=1),    # 1x28x28 -> 32x28x28
+            nn.ReLU(inplace=True),                                                  # Saves memory
+            nn.Conv2d(32, 64, kernel_size=3, padding=1),                            # 32x28x28 -> 64x28x28
+            nn.ReLU(inplace=True),
+            nn.MaxPool2d(2),                                                        # 64x28x28 -> 64x14x14
+
+            nn.Conv2d(64, 128, kernel_size=3, padding=1),                           # 64x14x14 -> 128x14x14
+            nn.ReLU(inplace=True),
+            nn.MaxPool2d(2),                                                        # 128x14x14 -> 128x7x7
+        )
+        # 128 channels * 7 * 7 = 6272 features after the second pool
+        self.classifier = nn.Sequential(
+            nn.Flatten(),                  # -> (N, 6272)
+            nn.Linear(128 * 7 * 7, 256),
+            nn.ReLU(inplace=True),
+            nn.Linear(256, num_classes),   # logits
+        )
+
+    def forward(self, x: Tensor) -> Tensor:
+        # Expect x of shape (N, 1, 28, 28) with dtype float
+        x = self.features(x)
+        x = self.classifier(x)
 
-#             nn.Conv2d(64, 128, kernel_size=3, padding=1),                           # 64x14x14 -> 128x14x14
-#             nn.ReLU(inplace=True),
-#             nn.MaxPool2d(2),                                                        # 128x14x14 -> 128x7x7
-#         )
-#         # 128 channels * 7 * 7 = 6272 features after the second pool
-#         self.classifier = nn.Sequential(
-#             nn.Flatten(),                  # -> (N, 6272)
-#             nn.Linear(128 * 7 * 7, 256),
-#             nn.ReLU(inplace=True),
-#             nn.Linear(256, num_classes),   # logits
-#         )
+        # Do NOT squeeze; keep batch dim even for N=1
+        return x
 
-#     def forward(self, x: Tensor) -> Tensor:
-#         # Expect x of shape (N, 1, 28, 28) with dtype float
-#         x = self.features(x)
-#         x = self.classifier(x)
 
-#         # Do NOT squeeze; keep batch dim even for N=1
-#         return x  #
+Model = MLP                                 # Default architecture
+MODELS: dict[str, type[nn.Module]] = {'mlp': MLP, 'cnn': CNN}
@@ -0,0 +1,139 @@
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Event, Thread
+from time import perf_counter
+from typing import NamedTuple
+import numpy as np
+from numpy.typing import NDArray
+import torch
+from torch import nn
+import torch.nn.functional as F
+
+from src.services.stats import Stats
+from src.training.snapshots import WeightSnapshots, key, restore
+
+
+class ModelUnavailableError(Exception):
+    """Raised for predictions requested before training published its first weight snapshot."""
+
+
+class Predictions(NamedTuple):
+    """Results for one request, and which snapshot produced them."""
+
+    labels: NDArray                     # (n,) predicted digit
+    probs: NDArray                      # (n, 10) softmax probabilities
+    version: int
+    epoch: int
+    batch: int
+    job_id: str
+
+
+class Request(NamedTuple):
+    images: NDArray                     # (n, 28, 28) uint8
+    future: Future
+    arrived: float                      # perf_counter() when submitted
+
+
+class Predictor:
+    """Serves predictions from the latest weight snapshot, coalescing concurrent requests into micro-batches.
+
+    A single batcher thread owns the inference model: it takes the first waiting request, keeps
+    collecting more until `max_batch` images or `max_wait` seconds, runs one forward pass and
+    splits the results back. Snapshots are read from WeightSnapshots, so nothing is shared with
+    the trainer's live model.
+    """
+
+    snapshots: WeightSnapshots
+    max_batch: int                      # Images per forward pass (a single larger request is never split)
+    max_wait: float                     # Seconds the first request of a batch may wait for company
+    stats: Stats
+    queue: Queue[Request]
+    models: dict[str, nn.Module]        # Private eval copy per architecture, reloaded on new snapshots
+    loaded: tuple[int, int] | None      # (run, version) currently loaded
+    stop: Event
+    thread: Thread
+
+    def __init__(self, snapshots: WeightSnapshots, max_batch: int = 64, max_wait: float = 0.005,
+                 stats: Stats | None = None) -> None:
+        self.snapshots = snapshots
+        self.max_batch = max(max_batch, 1)
+        self.max_wait = max_wait
+        self.stats = stats or Stats()
+        self.queue = Queue()
+        self.models = {}
+        self.loaded = None
+        self.stop = Event()
+        self.thread = Thread(target=self.run, name='predictor', daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def close(self) -> None:
+        self.stop.set()
+
+    def ready(self) -> bool:
+        return self.snapshots.get() is not None
+
+    def submit(self, images: NDArray) -> 'Future[Predictions]':
+        """Queue (n, 28, 28) uint8 images for prediction; the future resolves once their batch has run."""
+        future: Future = Future()
+        self.queue.put(Request(images, future, perf_counter()))
+        return future
+
+    def run(self) -> None:
+        while not self.stop.is_set():
+            try:
+                first = self.queue.get(timeout=1.0)
+            except Empty:
+                continue
+            batch = self.collect(first)
+            try:
+                self.serve(batch)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+
+    def collect(self, first: Request) -> list[Request]:
+        """Requests for one forward pass: the first one plus whatever arrives before the deadline or the size cap."""
+        batch, size = [first], len(first.images)
+        deadline = first.arrived + self.max_wait
+        while size < self.max_batch:
+            try:
+                request = self.queue.get(timeout=max(deadline - perf_counter(), 0))
+            except Empty:
+                break
+            batch.append(request)
+            size += len(request.images)
+        return batch
+
+    def serve(self, batch: list[Request]) -> None:
+        snapshot = self.snapshots.get()
+        if snapshot is None:
+            raise ModelUnavailableError('No weights yet: predictions are served once training has started')
+        model = self.models.get(snapshot['model'])
+        if key(snapshot) != self.loaded or model is None:
+            model = restore(snapshot, self.models)
+            self.loaded = key(snapshot)
+
+        start = perf_counter()
+        images = np.concatenate([request.images for request in batch])
+        with torch.inference_mode():
+            inputs = torch.from_numpy(images).unsqueeze(1).float().div_(255)     # Same scale as training
+            probs = F.softmax(model(inputs).view(-1, 10), dim=-1).numpy()
+        labels = probs.argmax(axis=-1)
+        done = perf_counter()
+
+        offset = 0
+        for request in batch:
+            n = len(request.images)
+            request.future.set_result(Predictions(labels[offset:offset + n], probs[offset:offset + n],
+                                                  snapshot['version'], snapshot['epoch'], snapshot['batch'],
+                                                  snapshot.get('job', '')))
+            offset += n
+            self.stats.record('predict.latency', done - request.arrived)
+
+        self.stats.record('predict.forward', done - start)
+        self.stats.count('predict.batches')
+        self.stats.count('predict.requests', len(batch))
+        self.stats.count('predict.images', len(images))
+        self.stats.gauge('predict.batch_size', len(images))
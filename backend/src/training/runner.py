@@ -0,0 +1,247 @@
+import multiprocessing as mp
+from dataclasses import replace
+from threading import Thread
+from queue import Empty
+from typing import Any, Literal
+
+from src.services.hub import MetricsHub
+from src.services.metrics_log import record_size
+from src.services.sample_index import SampleIndex
+from src.services.shm_ring import ShmRing
+from src.services.stats import ProfileTrigger, report_periodically
+from src.training.config import TrainConfig, build_trainer
+from src.training.convergence import StopInfo
+from src.training.distributed import DataParallelRunner
+from src.training.snapshots import Tagged
+from src.training.trainer import MetricSink, Trainer, TrainModes
+
+RunState = Literal['ready', 'training', 'finished', 'failed']
+
+
+class ThreadRunner:
+    """Runs training in a background thread of the server process."""
+
+    config: TrainConfig
+    hub: MetricsHub
+    world_size: int
+    trainer: Trainer | DataParallelRunner | None
+    thread: Thread | None
+    failed: bool
+    profile_trigger: ProfileTrigger     # Shared with the data-parallel workers, if any
+    snapshots: MetricSink | None        # Where weight snapshots are published (None disables them)
+    index: SampleIndex | None           # Per-sample statistics, allocated on start
+
+    def __init__(self, config: TrainConfig, hub: MetricsHub, world_size: int = 1,
+                 snapshots: MetricSink | None = None) -> None:
+        self.config = config
+        self.hub = hub
+        self.world_size = world_size
+        self.snapshots = snapshots
+        self.index = None
+        self.trainer = None
+        self.thread = None
+        self.failed = False
+        self.profile_trigger = ProfileTrigger(mp.get_context('spawn'))
+
+    def start(self, num_epochs: int, resume: bool = False, overrides: dict[str, Any] | None = None) -> None:
+        config = replace(self.config, **(overrides or {}))
+        self.index = SampleIndex.create()
+        self.thread = Thread(target=self.run, args=(config, num_epochs, resume), daemon=True)
+        self.thread.start()
+
+    def run(self, config: TrainConfig, num_epochs: int, resume: bool) -> None:
+        try:
+            if self.world_size > 1:
+                self.trainer = DataParallelRunner(config, world_size=self.world_size, metrics=self.hub,
+                                                  profile_trigger=self.profile_trigger, snapshots=self.snapshots,
+                                                  samples=self.index.name)          # type: ignore[union-attr]
+            else:
+                self.trainer = build_trainer(config, metrics=self.hub, profile_trigger=self.profile_trigger,
+                                             snapshots=self.snapshots, samples=self.index)
+            self.trainer.train(num_epochs, resume=resume)
+        except Exception as e:
+            self.failed = True
+            print(f'❌ Training failed: {e}')
+            raise
+
+    def state(self) -> RunState:
+        if self.thread is None:
+            return 'ready'
+        if self.thread.is_alive():
+            return 'training'
+        return 'failed' if self.failed else 'finished'
+
+    def modes(self) -> TrainModes | None:
+        return self.trainer.modes if self.trainer else None
+
+    def stats(self) -> dict[str, Any] | None:
+        if isinstance(self.trainer, DataParallelRunner):
+            return self.trainer.latest_stats
+        return self.trainer.stats.snapshot() if self.trainer else None
+
+    def stopped(self) -> StopInfo | None:
+        return self.trainer.stop if self.trainer else None
+
+    def samples(self) -> SampleIndex | None:
+        return self.index
+
+    def profile(self, steps: int) -> None:
+        self.profile_trigger.request(steps)
+
+    def close(self) -> None:
+        if self.index and self.state() != 'training':
+            self.index.close()
+            self.index = None
+
+
+def run_isolated(config: TrainConfig, num_epochs: int, resume: bool, world_size: int,
+                 ring_name: str, event: Any, reports: Any, profile_trigger: ProfileTrigger, snapshots: bool,
+                 samples: str) -> None:
+    """Entry point of the training process: publish metrics into the shared-memory ring, the rest as reports."""
+    ring = ShmRing.attach(ring_name, event)
+    snapshot_sink = Tagged(reports, 'snapshot') if snapshots else None
+    index = None
+    try:
+        if world_size > 1:
+            runner = DataParallelRunner(config, world_size=world_size, metrics=ring, reports=reports,
+                                        profile_trigger=profile_trigger, snapshots=snapshot_sink, samples=samples)
+            runner.train(num_epochs, resume=resume)
+            reports.put({'stop': runner.stop})
+        else:
+            index = SampleIndex.attach(samples)
+            trainer = build_trainer(config, metrics=ring, profile_trigger=profile_trigger, snapshots=snapshot_sink,
+                                    samples=index)
+            reports.put({'modes': trainer.modes})
+            stop = report_periodically(trainer.stats, reports)
+            try:
+                trainer.train(num_epochs, resume=resume)
+            finally:
+                stop.set()
+                reports.put({'stats': trainer.stats.snapshot(), 'stop': trainer.stop})
+    finally:
+        ring.close()
+        if index:
+            index.close()
+
+
+class ProcessRunner:
+    """Runs training in a child process so it never competes with the server for the GIL.
+
+    Metrics cross the process boundary through a lock-free shared-memory ring; a pump thread
+    in the server drains it into the hub whenever the child signals the wakeup event.
+    """
+
+    config: TrainConfig
+    hub: MetricsHub
+    world_size: int
+    slots: int
+    process: Any | None                 # multiprocessing (spawn) Process
+    pumper: Thread | None               # Drains the ring into the hub; outlives the process by one final pass
+    reports: Any | None                 # Queue the child posts {'modes'|'stats'|'stop'|'snapshot': ...} reports to
+    latest: dict[str, Any]              # Most recent modes, stats and stop reports
+    profile_trigger: ProfileTrigger | None
+    snapshots: MetricSink | None        # Receives the child's weight snapshots (None disables them)
+    index: SampleIndex | None           # Per-sample statistics the child scatters into, allocated on start
+    dropped: int                        # Records overwritten before the pump reached them
+
+    def __init__(self, config: TrainConfig, hub: MetricsHub, world_size: int = 1, slots: int = 256,
+                 snapshots: MetricSink | None = None) -> None:
+        self.config = config
+        self.hub = hub
+        self.world_size = world_size
+        self.slots = slots
+        self.snapshots = snapshots
+        self.process = None
+        self.pumper = None
+        self.reports = None
+        self.latest = {}
+        self.profile_trigger = None
+        self.index = None
+        self.dropped = 0
+
+    def start(self, num_epochs: int, resume: bool = False, overrides: dict[str, Any] | None = None) -> None:
+        config = replace(self.config, **(overrides or {}))
+        ctx = mp.get_context('spawn')
+        event = ctx.Event()
+        self.reports = ctx.Queue()
+        self.latest = {}
+        self.profile_trigger = ProfileTrigger(ctx)
+        ring = ShmRing.create(self.slots, record_size(config.batch_size), event)
+        self.index = SampleIndex.create()
+
+        # Not a daemon: data-parallel mode spawns workers of its own
+        self.process = ctx.Process(target=run_isolated, name='trainer',
+                                   args=(config, num_epochs, resume, self.world_size, ring.name, event, self.reports,
+                                         self.profile_trigger, self.snapshots is not None, self.index.name))
+        self.process.start()
+        self.pumper = Thread(target=self.pump, args=(ring, event), daemon=True)
+        self.pumper.start()
+
+    def pump(self, ring: ShmRing, event: Any) -> None:
+        """Drain the ring into the hub, and the reports queue, until the training process exits."""
+        cursor = 0
+        try:
+            while True:
+                alive = self.process.is_alive()
+                event.wait(timeout=0.5)
+                event.clear()                               # Anything published after this re-sets it
+
+                head = ring.head()
+                if head - cursor > ring.slots:              # Lapped: skip what was overwritten
+                    self.dropped += head - ring.slots - cursor
+                    cursor = head - ring.slots
+                for seq in range(cursor, head):
+                    metric = ring.read(seq)
+                    if metric is None:
+                        self.dropped += 1
+                    else:
+                        self.hub.put(metric)
+                cursor = head
+                self.drain_reports()                        # The child can't exit with reports still queued
+
+                if not alive:                               # Final drain done after the exit was seen
+                    break
+        finally:
+            ring.close()
+
+    def state(self) -> RunState:
+        if self.process is None:
+            return 'ready'
+        if self.process.is_alive() or self.pumper.is_alive():     # Not finished until every metric is published
+            return 'training'
+        return 'finished' if self.process.exitcode == 0 else 'failed'
+
+    def drain_reports(self) -> None:
+        try:
+            while True:
+                report = self.reports.get_nowait()
+                if 'snapshot' in report:
+                    self.snapshots.put(report['snapshot'])      # type: ignore[union-attr]
+                else:
+                    self.latest.update(report)
+        except Empty:
+            pass
+
+    def modes(self) -> TrainModes | None:
+        return self.latest.get('modes')
+
+    def stats(self) -> dict[str, Any] | None:
+        stats = self.latest.get('stats')
+        if stats is None:
+            return None
+        return {**stats, 'counters': {**stats['counters'], 'ring.dropped': self.dropped}}
+
+    def stopped(self) -> StopInfo | None:
+        return self.latest.get('stop')
+
+    def samples(self) -> SampleIndex | None:
+        return self.index
+
+    def profile(self, steps: int) -> None:
+        if self.profile_trigger is not None:
+            self.profile_trigger.request(steps)
+
+    def close(self) -> None:
+        if self.index and self.state() != 'training':
+            self.index.close()
+            self.index = None
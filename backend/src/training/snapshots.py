@@ -0,0 +1,78 @@
+from threading import Condition
+from typing import Any, NotRequired, TypedDict
+from numpy.typing import NDArray
+import torch
+from torch import nn
+
+from src.training.model import MODELS
+
+
+class WeightSnapshot(TypedDict):
+    """A copy of the model's weights taken between two training steps."""
+
+    version: int                        # Increases with every snapshot of a run
+    model: str                          # Architecture, a key of MODELS
+    epoch: int
+    batch: int
+    state: dict[str, NDArray]           # state_dict as numpy arrays, so it pickles by value across processes
+    run: NotRequired[int]               # Set by WeightSnapshots on publish
+    job: NotRequired[str]               # Job that trained these weights (set by the scheduler's sink)
+
+
+class WeightSnapshots:
+    """Latest-wins holder of the trainer's weight snapshots.
+
+    Publishing replaces the previous snapshot and never waits for readers, so consumers (evaluation,
+    inference) that fall behind simply skip versions instead of slowing training down.
+    """
+
+    latest: WeightSnapshot | None
+    runs: int                           # Training runs seen so far (versions restart with every run)
+    cond: Condition
+
+    def __init__(self) -> None:
+        self.latest = None
+        self.runs = 0
+        self.cond = Condition()
+
+    def put(self, snapshot: WeightSnapshot) -> None:
+        with self.cond:
+            if snapshot['version'] == 0:
+                self.runs += 1
+            snapshot['run'] = self.runs
+            self.latest = snapshot
+            self.cond.notify_all()
+
+    def get(self) -> WeightSnapshot | None:
+        with self.cond:
+            return self.latest
+
+    def wait(self, after: tuple[int, int] | None, timeout: float | None = None) -> WeightSnapshot | None:
+        """Block until a snapshot newer than `after` (run, version) is published, returning None on timeout."""
+        with self.cond:
+            self.cond.wait_for(lambda: self.latest is not None and key(self.latest) != after, timeout)
+            return self.latest if self.latest is not None and key(self.latest) != after else None
+
+
+def key(snapshot: WeightSnapshot) -> tuple[int, int]:
+    return snapshot.get('run', 0), snapshot['version']
+
+
+def restore(snapshot: WeightSnapshot, models: dict[str, nn.Module]) -> nn.Module:
+    """Load a snapshot into the reader's private eval-mode model of that architecture (built on first use)."""
+    model = models.get(snapshot['model'])
+    if model is None:
+        model = models[snapshot['model']] = MODELS[snapshot['model']]().eval()
+    model.load_state_dict({name: torch.from_numpy(array) for name, array in snapshot['state'].items()})
+    return model
+
+
+class Tagged:
+    """Sink adapter that wraps every item as {tag: item}, to share one queue between kinds of reports."""
+
+    def __init__(self, sink: Any, tag: str) -> None:
+        self.sink = sink
+        self.tag = tag
+
+    def put(self, item: Any) -> None:
+        self.sink.put({self.tag: item})
@@ -1,9 +1,19 @@
-from queue import Queue
-from typing import TypedDict
+from pathlib import Path
+from time import perf_counter, strftime
+from typing import Any, NamedTuple, NotRequired, Protocol, TypedDict
+from numpy.typing import NDArray
+import torch
 from torch import nn, Tensor
 import torch.nn.functional as F
 from torch.optim import Optimizer
-from torch.utils.data import DataLoader
+
+from src.services.hub import MetricsHub
+from src.services.sample_index import SampleIndex
+from src.services.stats import ProfileTrigger, Stats
+from src.training.checkpoint import Checkpointer, unwrap
+from src.training.convergence import ConvergenceMonitor, StopInfo, StopReason
+from src.training.data_module import Loader, set_epoch
+
 
 class TrainingMetric(TypedDict):
     """Training metrics for a single batch."""
@@ -12,10 +22,28 @@ class TrainingMetric(TypedDict):
     batch: int
     batch_size: int
     batch_loss: float
-    preds: list[int]
-    truths: list[int]
-    scores: list[float]
-    image_ids: list[int]
+    preds: list[int] | NDArray
+    truths: list[int] | NDArray
+    scores: list[float] | NDArray
+    image_ids: list[int] | NDArray
+    seq: NotRequired[int]     # Assigned by the hub on publish
+    stop_reason: NotRequired[str]           # Set on the run's final metric: 'completed', 'tolerance' or 'plateau'
+    batches_saved: NotRequired[int]         # Set with stop_reason: batches of the requested run left unrun
+
+
+class TrainModes(NamedTuple):
+    """Acceleration modes actually in effect (requested modes can fall back, e.g. if compilation fails)."""
+
+    model: str
+    bf16: bool
+    compiled: bool
+    channels_last: bool
+
+
+class MetricSink(Protocol):
+    """Anything metrics can be published to: a MetricsHub, or a multiprocessing queue to one."""
+
+    def put(self, item: Any) -> None: ...
 
 
 class Trainer:
@@ -24,62 +52,252 @@ class Trainer:
     model: nn.Module
     criterion: nn.Module
     optimizer: Optimizer
-    dataloader: DataLoader
-    tolerance: float                        # Minimum loss change required to continue training
+    dataloader: Loader
+    tolerance: float                        # Minimum epoch loss change required to continue training
+    convergence: ConvergenceMonitor | None  # Per-batch smoothed-loss plateau detection (None disables)
     converged: bool                         # True if training stopped due to convergence
-    metrics: Queue[TrainingMetric | None]   # Queue of batch metrics for async consumption
+    stop: StopInfo | None                   # Why and where training ended, once it has
+    num_epochs: int                         # Epochs requested of train()
+    prev_loss: float                        # Mean loss of the last full epoch (tolerance reference)
+    metrics: MetricSink                     # Broadcast hub (or queue to one) of batch metrics for async consumption
     update_interval: int                    # Record metrics every N batches
+    lazy_metrics: bool                      # Keep the hot loop on tensors; convert only emitted batches
+    checkpointer: Checkpointer | None       # Periodic background checkpoints (None disables)
+    bf16: bool                              # CPU bfloat16 autocast for forward + loss
+    compile: bool                           # torch.compile the model during warm_up
+    compiled: bool                          # True once a compiled model survived warm-up
+    channels_last: bool                     # NHWC memory format (only applied to conv models)
+    stats: Stats                            # Per-stage timings and counters of the hot loop
+    profile_trigger: ProfileTrigger | None  # Remote request for a torch.profiler capture
+    profile_dir: Path
+    profiler: Any | None                    # Active torch.profiler.profile, if capturing
+    profile_steps: int                      # Steps left in the active capture
+    snapshots: MetricSink | None            # Receives weight snapshots for evaluation/inference (None disables)
+    snapshot_every: int                     # Publish a snapshot every N batches (and after every epoch)
+    snapshot_version: int
+    samples: SampleIndex | None             # Per-sample loss/prediction index of every train image (None disables)
   
     def __init__(self, model: nn.Module, criterion: nn.Module, 
-                 optimizer: Optimizer, dataloader: DataLoader, 
-                 tolerance: float = 0.001, update_interval: int = 1) -> None:
+                 optimizer: Optimizer, dataloader: Loader, 
+                 tolerance: float = 0.001, update_interval: int = 1,
+                 metrics: MetricSink | None = None, lazy_metrics: bool = False,
+                 checkpointer: Checkpointer | None = None, bf16: bool = False,
+                 compile: bool = False, channels_last: bool = False,
+                 profile_trigger: ProfileTrigger | None = None, profile_dir: str | Path = './data/profiles',
+                 snapshots: MetricSink | None = None, snapshot_every: int = 500,
+                 convergence: ConvergenceMonitor | None = None, samples: SampleIndex | None = None) -> None:
 
         self.model = model
         self.criterion = criterion
         self.optimizer = optimizer
         self.dataloader = dataloader
         self.tolerance = tolerance
+        self.convergence = convergence
         self.converged = False
-        self.metrics = Queue()
+        self.stop = None
+        self.num_epochs = 1
+        self.prev_loss = float('inf')
+        self.metrics = metrics or MetricsHub()
         self.update_interval = update_interval
+        self.lazy_metrics = lazy_metrics
+        self.checkpointer = checkpointer
+        self.bf16 = bf16
+        self.compile = compile
+        self.compiled = False
+        self.stats = Stats()
+        self.profile_trigger = profile_trigger
+        self.profile_dir = Path(profile_dir)
+        self.profiler = None
+        self.profile_steps = 0
+        self.snapshots = snapshots
+        self.snapshot_every = max(snapshot_every, 1)
+        self.snapshot_version = 0
+        self.samples = samples
 
-    def train_batch(self, indices: Tensor, inputs: Tensor, targets: Tensor) -> tuple[float, list[int], list[int], list[float], list[int]]:
-        """Train on a single batch and return loss, predictions, ground truths, confidence scores, and image indices."""
+        # NHWC only pays off for convolutions; the MLP flattens its input anyway
+        self.channels_last = channels_last and any(isinstance(m, nn.Conv2d) for m in model.modules())
+        if self.channels_last:
+            self.model = model.to(memory_format=torch.channels_last)
+
+    @property
+    def modes(self) -> TrainModes:
+        return TrainModes(type(unwrap(self.model)).__name__.lower(), self.bf16, self.compiled, self.channels_last)
 
-        # Standard training step
+    def warm_up(self) -> None:
+        """Compile the model and run one untimed forward/backward pass, so the first emitted metric doesn't pay for it.
+
+        Parameters are left untouched (no optimizer step). Any failure falls back to eager fp32.
+        """
+        if not (self.compile or self.bf16):
+            return
+
+        _, inputs, targets = next(iter(self.dataloader))
+        eager = self.model
+        if self.compile:
+            self.model = torch.compile(eager)
+        try:
+            self.forward_backward(inputs, targets)
+            self.compiled = self.compile
+        except Exception as e:
+            print(f'⚠️  Warm-up failed, falling back to eager fp32: {e}')
+            self.model, self.bf16 = eager, False
         self.optimizer.zero_grad(set_to_none=True)
-        outputs = self.model(inputs)
-        loss = self.criterion(outputs, targets)
+        self.stats.reset()                                  # Compilation time is not a forward pass
+        print(f'🔥 Warm-up done: {self.modes}')
+
+    def forward_backward(self, inputs: Tensor, targets: Tensor) -> tuple[Tensor, Tensor]:
+        """Compute loss and gradients under the active modes; logits come back as fp32."""
+        if self.channels_last:
+            inputs = inputs.contiguous(memory_format=torch.channels_last)
+        start = perf_counter()
+        with torch.autocast('cpu', dtype=torch.bfloat16, enabled=self.bf16):
+            outputs = self.model(inputs)
+            loss = self.criterion(outputs, targets)         # Autocast keeps the loss in fp32
+        forward = perf_counter()
         loss.backward()
-        self.optimizer.step()
+        self.stats.record('train.forward', forward - start)
+        self.stats.record('train.backward', perf_counter() - forward)
+        return loss.detach(), outputs.detach().float()
+
+    def train_step(self, inputs: Tensor, targets: Tensor) -> tuple[Tensor, Tensor]:
+        """Run one optimization step and return the detached loss and logits, without any host sync."""
+        self.optimizer.zero_grad(set_to_none=True)
+        loss, outputs = self.forward_backward(inputs, targets)
+        with self.stats.time('train.step'):
+            self.optimizer.step()
+        self.stats.count('train.batches')
+        self.stats.count('train.samples', inputs.shape[0])
+        return loss, outputs
+
+    def profile_tick(self) -> None:
+        """Start a requested torch.profiler capture, or finish the active one (called once per batch)."""
+        if self.profiler is None:
+            steps = self.profile_trigger.take() if self.profile_trigger else 0
+            if steps:
+                self.profiler = torch.profiler.profile(activities=[torch.profiler.ProfilerActivity.CPU])
+                self.profiler.start()
+                self.profile_steps = steps
+                print(f'🔬 Profiling the next {steps} steps')
+            return
+
+        self.profile_steps -= 1
+        if self.profile_steps <= 0:
+            self.profiler.stop()
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            path = self.profile_dir / f'trace-{strftime("%Y%m%d-%H%M%S")}.json'
+            self.profiler.export_chrome_trace(str(path))
+            self.profiler = None
+            self.stats.labels['last_profile'] = str(path.resolve())
+            print(f'🔬 Profile saved to {path}')
+
+    def begin_batch(self, data_wait: float) -> None:
+        """Per-batch bookkeeping before the step: time blocked on the loader, prefetch depth, profiler window."""
+        self.stats.record('train.data_wait', data_wait)
+        queue = getattr(self.dataloader, 'queue', None)
+        if queue is not None:
+            self.stats.gauge('data.prefetch_depth', queue.qsize())
+        self.profile_tick()
+
+    def snapshot_tick(self, epoch: int, batch: int, num_batches: int, stopping: bool = False) -> None:
+        """Publish a weight snapshot every `snapshot_every` batches, on the final batch of the epoch and on a stop."""
+        if self.snapshots and ((batch + 1) % self.snapshot_every == 0 or batch == num_batches - 1 or stopping):
+            self.publish_snapshot(epoch, batch)
+
+    def publish_snapshot(self, epoch: int, batch: int) -> None:
+        """Copy the weights out of the live model (a few ms at most) and hand them to the snapshot sink."""
+        with self.stats.time('train.snapshot'):
+            state = {name: tensor.detach().numpy().copy() for name, tensor in unwrap(self.model).state_dict().items()}
+            self.snapshots.put({'version': self.snapshot_version, 'model': self.modes.model,   # type: ignore[union-attr]
+                                'epoch': epoch, 'batch': batch, 'state': state})
+        self.snapshot_version += 1
 
-        # Extract predictions and targets
-        preds = outputs.argmax(dim=-1).tolist()
-        truths = targets.tolist()
-        image_ids = indices.tolist()
+    @staticmethod
+    def predict(outputs: Tensor) -> tuple[Tensor, Tensor]:
+        """Vectorized predictions and confidence scores (softmax probability of the predicted class)."""
+        probs = F.softmax(outputs.view(-1, outputs.shape[-1]), dim=-1)
+        scores, preds = probs.max(dim=-1)
+        return preds, scores
 
-        # Get confidence scores (softmax probabilities for predicted class)
-        probs = F.softmax(outputs, dim=-1)
-        scores = [probs[i, pred].item() for i, pred in enumerate(preds)]
+    def index_samples(self, epoch: int, indices: Tensor, outputs: Tensor, targets: Tensor) -> None:
+        """Scatter every sample of the batch (loss, prediction, correctness) into the sample index."""
+        if self.samples is None:
+            return
+        with self.stats.time('train.index'):
+            losses = F.cross_entropy(outputs, targets, reduction='none')
+            self.samples.update(indices.numpy(), losses.numpy(), outputs.argmax(dim=-1).numpy(), targets.numpy(), epoch)
 
-        return loss.item(), preds, truths, scores, image_ids
+    def train_batch(self, indices: Tensor, inputs: Tensor, targets: Tensor,
+                    epoch: int = 0) -> tuple[float, list[int], list[int], list[float], list[int]]:
+        """Train on a single batch and return loss, predictions, ground truths, confidence scores, and image indices."""
+        loss, outputs = self.train_step(inputs, targets)
+        self.index_samples(epoch, indices, outputs, targets)
+        with self.stats.time('train.metrics'):
+            preds, scores = self.predict(outputs)
+            return loss.item(), preds.tolist(), targets.tolist(), scores.tolist(), indices.tolist()
+
+    def reduce_loss(self, loss: Tensor) -> Tensor:
+        """Hook to aggregate a loss across workers (identity on a single process)."""
+        return loss
+
+    def stop_check(self, epoch: int, batch: int, num_batches: int, loss: Tensor | float,
+                   running_loss: Tensor | float) -> bool:
+        """Decide after each batch whether training ends here, recording why in `stop`.
+
+        The smoothed loss is checked for a plateau every few batches, mid-epoch included; the
+        epoch-mean tolerance check and completion are decided on the final batch of an epoch,
+        before it is emitted, so the run's last metric can carry the stop reason.
+        """
+        reason: StopReason | None = None
+        if self.convergence:
+            self.convergence.update(loss)
+            if self.convergence.due() and self.convergence.check(self.reduce_loss(self.convergence.ema).item()):
+                reason = 'plateau'
+        if reason is None and batch == num_batches - 1:
+            epoch_loss = self.reduce_loss(torch.as_tensor(running_loss, dtype=torch.float64)).item() / num_batches
+            if abs(self.prev_loss - epoch_loss) < self.tolerance:
+                reason = 'tolerance'
+            elif epoch >= self.num_epochs - 1:
+                reason = 'completed'
+            self.prev_loss = epoch_loss
+        if reason is None:
+            return False
+
+        self.converged = reason != 'completed'
+        saved = max(num_batches - batch - 1 + (self.num_epochs - epoch - 1) * num_batches, 0)
+        self.stop = StopInfo(reason, epoch, batch, saved)
+        print(f'🛑 Stopped at epoch {epoch} batch {batch} ({reason}); {saved} batches saved')
+        return True
+
+    def emit(self, metric: TrainingMetric) -> None:
+        """Publish one batch metric."""
+        with self.stats.time('train.emit'):
+            self.metrics.put(metric)
+        self.stats.count('train.emitted')
 
     def train_epoch(self, epoch: int) -> float:
         """Train for one epoch and return average loss."""
+        set_epoch(self.dataloader, epoch)
+        if self.lazy_metrics:
+            return self.train_epoch_lazy(epoch)
+
         self.model.train()
         running_loss = 0.0
 
         num_batches = len(self.dataloader)  # guard for last-batch check
+        fetch = perf_counter()
         for batch, (indices, inputs, targets) in enumerate(self.dataloader):
-            batch_loss, preds, truths, scores, image_ids = self.train_batch(indices, inputs, targets)
+            self.begin_batch(perf_counter() - fetch)
+            batch_loss, preds, truths, scores, image_ids = self.train_batch(indices, inputs, targets, epoch)
             running_loss += batch_loss
+            stopping = self.stop_check(epoch, batch, num_batches, batch_loss, running_loss)
+            self.snapshot_tick(epoch, batch, num_batches, stopping)
 
             # Record at interval boundaries, and always for the final batch
             is_update_boundary = batch % self.update_interval == 0
             is_last_batch = batch == num_batches - 1
 
-            if is_update_boundary or is_last_batch:
-                self.metrics.put({
+            if is_update_boundary or is_last_batch or stopping:
+                metric: TrainingMetric = {
                     'epoch': epoch,
                     'batch': batch,
                     'batch_size': int(inputs.shape[0]),
@@ -88,24 +306,100 @@ class Trainer:
                     'truths': truths,
                     'scores': scores,
                     'image_ids': image_ids,
-                })
+                }
+                if stopping:
+                    metric['stop_reason'], metric['batches_saved'] = self.stop.reason, self.stop.batches_saved  # type: ignore[union-attr]
+                self.emit(metric)
                 
             if batch % 16 == 0:
                 print(f'[Epoch {epoch} | Batch {batch}/{num_batches-1}] | Loss: {batch_loss:.4f}')
+            if stopping:
+                break
+            fetch = perf_counter()
 
-        return running_loss / len(self.dataloader)
+        self.report_data_wait(epoch)
+        return running_loss / (batch + 1)
 
-    def train(self, num_epochs: int) -> None:
-        """Train for multiple epochs, stopping early if loss converges."""
-        prev_loss = float('inf')
+    def train_epoch_lazy(self, epoch: int) -> float:
+        """Train for one epoch touching host memory only on emitted batches, and return average loss."""
+        self.model.train()
+        running_loss = torch.zeros((), dtype=torch.float64)    # Accumulated on-tensor; read once per epoch
 
-        for epoch in range(num_epochs):
-            epoch_loss = self.train_epoch(epoch)
-            delta_loss = prev_loss - epoch_loss
+        num_batches = len(self.dataloader)
+        fetch = perf_counter()
+        for batch, (indices, inputs, targets) in enumerate(self.dataloader):
+            self.begin_batch(perf_counter() - fetch)
+            loss, outputs = self.train_step(inputs, targets)
+            self.index_samples(epoch, indices, outputs, targets)
+            running_loss += loss
+            stopping = self.stop_check(epoch, batch, num_batches, loss, running_loss)
+            self.snapshot_tick(epoch, batch, num_batches, stopping)
 
-            # Stop if loss change is smaller than tolerance
-            if abs(delta_loss) < self.tolerance: 
-                self.converged = True
+            # Only materialize metrics at interval boundaries, on the final batch and on a stop
+            if batch % self.update_interval == 0 or batch == num_batches - 1 or stopping:
+                metrics_start = perf_counter()
+                preds, scores = self.predict(outputs)
+                batch_loss = self.reduce_loss(loss).item()
+                metric: TrainingMetric = {
+                    'epoch': epoch,
+                    'batch': batch,
+                    'batch_size': int(inputs.shape[0]),
+                    'batch_loss': batch_loss,
+                    'preds': preds.numpy(),             # Zero-copy views of fresh CPU tensors
+                    'truths': targets.numpy(),
+                    'scores': scores.numpy(),
+                    'image_ids': indices.numpy(),
+                }
+                if stopping:
+                    metric['stop_reason'], metric['batches_saved'] = self.stop.reason, self.stop.batches_saved  # type: ignore[union-attr]
+                self.stats.record('train.metrics', perf_counter() - metrics_start)
+                self.emit(metric)
+                print(f'[Epoch {epoch} | Batch {batch}/{num_batches-1}] | Loss: {batch_loss:.4f}')
+            if stopping:
                 break
+            fetch = perf_counter()
+
+        self.report_data_wait(epoch)
+        return running_loss.item() / (batch + 1)
+
+    def report_data_wait(self, epoch: int) -> None:
+        """Report time spent blocked on the data pipeline (prefetching loaders only)."""
+        wait_time = getattr(self.dataloader, 'wait_time', None)
+        if wait_time is not None:
+            print(f'[Epoch {epoch}] Data wait: {wait_time:.3f}s')
+
+    def save_checkpoint(self, epoch: int, prev_loss: float) -> None:
+        """Hook to snapshot training state after an epoch (written in the background)."""
+        if self.checkpointer:
+            self.checkpointer.save(self.model, self.optimizer, epoch, prev_loss, self.converged, self.stop)
+
+    def resume(self) -> tuple[int, float]:
+        """Restore the latest checkpoint, returning the first epoch to run and the convergence reference loss."""
+        state = self.checkpointer.load_latest() if self.checkpointer else None
+        if state is None:
+            print('⚠️  No checkpoint found; starting from scratch')
+            return 0, float('inf')
+
+        unwrap(self.model).load_state_dict(state['model'])
+        self.optimizer.load_state_dict(state['optimizer'])
+        self.converged = state['converged']
+        self.stop = StopInfo(**state['stop']) if state.get('stop') else None
+        print(f'♻️  Resumed from epoch {state["epoch"]} checkpoint')
+        return state['epoch'] + 1, state['prev_loss']
 
-            prev_loss = epoch_loss
+    def train(self, num_epochs: int, resume: bool = False) -> None:
+        """Train for multiple epochs, stopping early (mid-epoch included) once the loss converges."""
+        self.num_epochs = num_epochs
+        try:
+            start_epoch, self.prev_loss = self.resume() if resume else (0, float('inf'))
+            if self.converged:
+                return
+            for epoch in range(start_epoch, num_epochs):
+                self.train_epoch(epoch)                 # Ends early once stop_check decides to stop
+                if self.stop or (self.checkpointer and self.checkpointer.due(epoch)):
+                    self.save_checkpoint(epoch, self.prev_loss)
+                if self.stop:
+                    break
+        finally:
+            if self.checkpointer:
+                self.checkpointer.close()           # Don't let the process exit with a write in flight
@@ -0,0 +1,25 @@
+from typing import Callable
+import numpy as np
+import pytest
+
+
+def make_metric(i: int = 0, n: int = 8, as_lists: bool = False) -> dict:
+    """Batch i's training metric with n samples; the same i always gives the same values."""
+    rng = np.random.default_rng(i)
+    values = {
+        'seq': i,
+        'epoch': i // 100,
+        'batch': i,
+        'batch_size': n,
+        'batch_loss': 1.0 / (i + 1),
+        'preds': rng.integers(0, 10, n),
+        'truths': rng.integers(0, 10, n),
+        'scores': rng.random(n, dtype=np.float32),
+        'image_ids': rng.permutation(60_000)[:n],
+    }
+    return {k: v.tolist() if as_lists and isinstance(v, np.ndarray) else v for k, v in values.items()}
+
+
+@pytest.fixture
+def metric() -> Callable[..., dict]:
+    return make_metric
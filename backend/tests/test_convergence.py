@@ -0,0 +1,44 @@
+import torch
+import pytest
+
+from src.training.convergence import ConvergenceMonitor
+
+
+def stopped_at(monitor: ConvergenceMonitor, losses) -> int | None:
+    """Drive the monitor the way Trainer does; the batch at which it reports a plateau."""
+    for batch, loss in enumerate(losses):
+        monitor.update(torch.tensor(loss))
+        if monitor.due() and monitor.check(monitor.ema.item()):
+            return batch
+    return None
+
+
+def test_average_is_seeded_with_the_first_loss():
+    monitor = ConvergenceMonitor(alpha=0.5)
+    monitor.update(4.0)
+    assert monitor.ema.item() == 4.0
+    monitor.update(torch.tensor(2.0))
+    assert monitor.ema.item() == pytest.approx(3.0)
+
+
+def test_stops_once_a_plateau_outlasts_patience():
+    monitor = ConvergenceMonitor(alpha=0.1, patience=100, check_every=10)
+    falling = [1.0 / (i + 1) for i in range(50)]
+    batch = stopped_at(monitor, falling + [falling[-1]] * 1000)
+    assert batch is not None and 50 + 100 <= batch < 50 + 200
+
+
+def test_keeps_going_while_the_loss_improves():
+    monitor = ConvergenceMonitor(alpha=0.1, patience=100, check_every=10)
+    assert stopped_at(monitor, [0.99 ** i for i in range(2000)]) is None
+
+
+def test_waits_for_the_average_to_warm_up():
+    """A flat loss from the start only counts as a plateau once ~1/alpha batches are in the average."""
+    monitor = ConvergenceMonitor(alpha=0.01, patience=10, check_every=10)
+    assert stopped_at(monitor, [1.0] * 1000) == 99
+
+
+def test_zero_patience_disables_it():
+    monitor = ConvergenceMonitor(patience=0, check_every=10)
+    assert stopped_at(monitor, [1.0] * 5000) is None
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from src.generated import metrics_pb2 as pb
+from src.services.encoding import WireFormat, pack_array, pack_ids, to_proto, unpack_ids, unpack_samples
+
+
+@pytest.mark.parametrize('ids, width', [([], 2), ([0, 59999, 65535], 2), ([65536, 3], 4), ([2**32 - 1, 0], 4)])
+def test_ids_round_trip(ids, width):
+    for values in (ids, np.asarray(ids, dtype=np.int64)):
+        data, got_width = pack_ids(values)
+        assert got_width == width and len(data) == width * len(ids)
+        assert unpack_ids(data, got_width).tolist() == ids
+
+
+@pytest.mark.parametrize('n', [3, 200])                    # Either side of the struct/numpy switch
+def test_lists_and_arrays_pack_alike(n):
+    values = np.arange(n) * 300
+    assert pack_array(values.tolist(), '<u4') == pack_array(values, '<u4') == values.astype('<u4').tobytes()
+
+
+@pytest.mark.parametrize('n', [0, 16, 256])
+@pytest.mark.parametrize('as_lists', [False, True])
+@pytest.mark.parametrize('encoding, atol', [(pb.SCORES_FLOAT32, 0), (pb.SCORES_FLOAT16, 1e-3), (pb.SCORES_UINT8, 1 / 255)])
+def test_packed_round_trip(metric, n, as_lists, encoding, atol):
+    m = metric(n=n, as_lists=as_lists)
+    msg = pb.TrainingMetric.FromString(to_proto(m, WireFormat(True, encoding)).SerializeToString())
+    samples = unpack_samples(msg.packed)
+    for key in ('preds', 'truths', 'image_ids'):
+        assert samples[key].tolist() == list(m[key])
+    np.testing.assert_allclose(samples['scores'], m['scores'], atol=atol)
+
+
+def test_packed_is_smaller_than_repeated(metric):
+    m = metric(n=256)
+    packed = to_proto(m, WireFormat(True, pb.SCORES_FLOAT32)).ByteSize()
+    assert packed < to_proto(m, WireFormat(False, pb.SCORES_FLOAT32)).ByteSize()
+
+
+def test_repeated_matches_for_lists_and_arrays(metric):
+    fmt = WireFormat(False, pb.SCORES_FLOAT32)
+    assert to_proto(metric(n=16), fmt) == to_proto(metric(n=16, as_lists=True), fmt)
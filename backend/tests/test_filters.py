@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.generated import metrics_pb2 as pb
+from src.services.filters import SAMPLE_FIELDS, MetricFilter
+
+
+def test_an_empty_request_lets_everything_through(metric):
+    filt = MetricFilter.from_req(pb.SubscribeReq())
+    assert filt.fields == SAMPLE_FIELDS and filt.every_nth == 1 and not filt.misclassified_only
+    m = metric(5)
+    assert filt.accepts(m)
+    out = filt.apply(m)
+    for field in SAMPLE_FIELDS:
+        np.testing.assert_array_equal(out[field], m[field])
+
+
+def test_decimation_keeps_every_nth_and_the_final_metric(metric):
+    filt = MetricFilter.from_req(pb.SubscribeReq(every_nth=3))
+    assert [seq for seq in range(7) if filt.accepts(metric(seq))] == [0, 3, 6]
+    assert filt.accepts({**metric(4), 'stop_reason': 'plateau'})
+
+
+def test_epoch_and_batch_ranges_are_inclusive(metric):
+    filt = MetricFilter.from_req(pb.SubscribeReq(min_epoch=1, max_epoch=1, min_batch=120, max_batch=150))
+    assert filt.accepts({**metric(0), 'epoch': 1, 'batch': 120})
+    assert filt.accepts({**metric(0), 'epoch': 1, 'batch': 150})
+    assert not filt.accepts({**metric(0), 'epoch': 1, 'batch': 151})
+    assert not filt.accepts({**metric(0), 'epoch': 2, 'batch': 130})
+
+
+def test_an_explicit_zero_bound_is_honoured(metric):
+    """Explicit zeros are set fields, not defaults: max_epoch=0 keeps epoch 0 only."""
+    filt = MetricFilter.from_req(pb.SubscribeReq(max_epoch=0))
+    assert filt.accepts({**metric(0), 'epoch': 0}) and not filt.accepts({**metric(0), 'epoch': 1})
+
+
+def test_field_mask_and_misclassified_only(metric):
+    filt = MetricFilter.from_req(pb.SubscribeReq(fields=['image_ids', 'preds', 'bogus'], misclassified_only=True))
+    assert filt.fields == ('preds', 'image_ids')            # Unknown names are ignored, order is canonical
+    m = {**metric(0, n=4), 'preds': np.array([1, 2, 3, 4]), 'truths': np.array([1, 0, 3, 0])}
+    out = filt.apply(m)
+    assert out['preds'].tolist() == [2, 4]
+    assert out['image_ids'].tolist() == m['image_ids'][[1, 3]].tolist()
+    assert 'truths' not in out and 'scores' not in out
+    assert (out['seq'], out['batch_loss']) == (m['seq'], m['batch_loss'])
@@ -0,0 +1,57 @@
+import pytest
+
+from src.generated import metrics_pb2 as pb
+from src.services import servicer
+from src.services.servicer import Framer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(servicer, 'monotonic', lambda: now[0])
+    return now
+
+
+def message(seq: int) -> pb.TrainingMetric:
+    return pb.TrainingMetric(seq=seq, epoch=1, batch=seq, batch_loss=0.5, preds=list(range(10)))
+
+
+def test_defaults(clock):
+    framer = Framer(pb.SubscribeBatchReq())
+    assert (framer.max_count, framer.max_bytes, framer.max_latency) == (32, 64 * 1024, 0.1)
+    assert framer.flush() is None and framer.timeout() == float('inf')
+
+
+def test_flushes_at_max_count(clock):
+    framer = Framer(pb.SubscribeBatchReq(max_count=3))
+    for seq in range(3):
+        assert framer.flush() is None
+        framer.add(message(seq))
+    frame = framer.flush()
+    assert [m.seq for m in frame.metrics] == [0, 1, 2]
+    assert framer.flush() is None and framer.size == 0      # Reset for the next frame
+
+
+def test_flushes_at_max_bytes(clock):
+    size = message(0).ByteSize()
+    framer = Framer(pb.SubscribeBatchReq(max_bytes=2 * size))
+    framer.add(message(0))
+    assert framer.flush() is None
+    framer.add(message(1))
+    assert len(framer.flush().metrics) == 2
+
+
+def test_flushes_once_the_oldest_metric_is_due(clock):
+    framer = Framer(pb.SubscribeBatchReq(max_latency_ms=50))
+    framer.add(message(0))
+    clock[0] += 0.03
+    framer.add(message(1))                                  # Doesn't push the deadline back
+    assert framer.flush() is None and framer.timeout() == pytest.approx(0.02)
+    clock[0] += 0.02
+    assert framer.timeout() == 0 and len(framer.flush().metrics) == 2
+
+
+def test_zero_latency_flushes_every_metric(clock):
+    framer = Framer(pb.SubscribeBatchReq(max_latency_ms=0))
+    framer.add(message(0))
+    assert len(framer.flush().metrics) == 1
@@ -0,0 +1,104 @@
+import pytest
+
+from src.services.hub import MetricsHub, SlowConsumerError
+from src.services.metrics_log import MetricsLog
+
+
+def publish(hub: MetricsHub, metric, count: int) -> None:
+    for i in range(count):
+        hub.put(metric(i))
+
+
+def drain(sub) -> list[int]:
+    seqs = []
+    while (item := sub.get(timeout=0)) is not None:
+        seqs.append(item['seq'])
+    return seqs
+
+
+def test_every_subscriber_sees_every_item(metric):
+    hub = MetricsHub(capacity=8)
+    first, second = hub.subscribe(), hub.subscribe()
+    publish(hub, metric, 3)
+    assert drain(first) == drain(second) == [0, 1, 2]
+    assert hub.latest()['seq'] == 2
+
+
+def test_drop_oldest_keeps_the_newest_capacity_items(metric):
+    hub = MetricsHub(capacity=16, subscriber_capacity=4, policy='drop_oldest')
+    sub = hub.subscribe()
+    publish(hub, metric, 10)
+    assert hub.depth() == (10, 10)                          # Lag is only enforced when the subscriber reads
+    assert drain(sub) == [6, 7, 8, 9]
+    assert sub.dropped == hub.dropped == 6
+
+
+def test_coalesce_skips_to_the_latest_item(metric):
+    hub = MetricsHub(capacity=16, subscriber_capacity=4, policy='coalesce')
+    sub = hub.subscribe()
+    publish(hub, metric, 10)
+    assert drain(sub) == [9] and sub.dropped == 9
+
+
+def test_disconnect_drops_the_slow_subscriber(metric):
+    hub = MetricsHub(capacity=16, subscriber_capacity=4, policy='disconnect')
+    slow, fast = hub.subscribe(), hub.subscribe(capacity=16)
+    publish(hub, metric, 5)
+    with pytest.raises(SlowConsumerError):
+        slow.get(timeout=0)
+    assert slow.closed and slow not in hub.subscribers
+    assert drain(fast) == [0, 1, 2, 3, 4]
+
+
+def test_lag_within_capacity_drops_nothing(metric):
+    hub = MetricsHub(capacity=16, subscriber_capacity=4)
+    sub = hub.subscribe()
+    publish(hub, metric, 4)
+    assert hub.depth() == (4, 4)
+    assert sub.get(timeout=0)['seq'] == 0
+    assert hub.depth() == (4, 3)
+    assert drain(sub) == [1, 2, 3] and sub.dropped == 0 and hub.depth() == (4, 0)
+
+
+def test_history_without_a_log_ends_at_the_ring(metric):
+    hub = MetricsHub(capacity=4, subscriber_capacity=4)
+    publish(hub, metric, 10)
+    assert drain(hub.subscribe(from_seq=0)) == [6, 7, 8, 9]
+
+
+def test_replay_hands_off_from_the_log_to_the_live_ring(tmp_path, metric):
+    hub = MetricsHub(capacity=4, subscriber_capacity=2, log=MetricsLog(tmp_path))
+    publish(hub, metric, 10)
+    sub = hub.subscribe(from_seq=0)
+    assert [sub.get(timeout=0)['seq'] for _ in range(7)] == list(range(7))   # 0-5 from disk, 6 from the ring
+    assert sub.replaying                                    # Still 3 behind, more than its capacity of 2
+
+    hub.put(metric(10))
+    assert drain(sub) == [7, 8, 9, 10] and sub.dropped == 0 and not sub.replaying
+    hub.put(metric(11))
+    assert drain(sub) == [11]
+    hub.close()
+
+
+def test_replay_of_a_reopened_log(tmp_path, metric):
+    """A hub over an existing log (e.g. a job restored after a restart) serves its history from disk."""
+    hub = MetricsHub(log=MetricsLog(tmp_path))
+    publish(hub, metric, 3)
+    hub.close()
+
+    hub = MetricsHub(capacity=4, log=MetricsLog(tmp_path))
+    assert (hub.base, hub.head) == (3, 3) and hub.latest()['seq'] == 2
+    sub = hub.subscribe(from_seq=0)
+    assert drain(sub) == [0, 1, 2]
+    hub.put(metric(3))
+    assert drain(sub) == [3]
+    hub.close()
+
+
+def test_close_ends_every_subscription(metric):
+    hub = MetricsHub()
+    sub = hub.subscribe()
+    hub.put(metric(0))
+    hub.close()
+    assert sub.get(timeout=0)['seq'] == 0                   # Items already published are still delivered
+    assert sub.get(timeout=1) is None
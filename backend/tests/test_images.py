@@ -0,0 +1,47 @@
+import struct
+from io import BytesIO
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.generated import metrics_pb2 as pb
+from src.services.images import IDX_FILES, IDX_UBYTE, MAX_IMAGES, TILE, ImageStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    raw = tmp_path / 'MNIST' / 'raw'
+    raw.mkdir(parents=True)
+    tiles = np.arange(5 * TILE * TILE, dtype=np.uint32).astype(np.uint8).reshape(5, TILE, TILE)
+    with open(raw / IDX_FILES['train'], 'wb') as f:
+        f.write(struct.pack('>HBB3I', 0, IDX_UBYTE, 3, *tiles.shape) + tiles.tobytes())
+    return ImageStore(tmp_path)
+
+
+def test_tiles_in_request_order(store):
+    res = store.get([3, 0])
+    tiles = np.frombuffer(res.data, dtype=np.uint8).reshape(2, TILE, TILE)
+    assert res.count == 2
+    np.testing.assert_array_equal(tiles[0], store.split('train')[3])
+
+
+def test_sprite_is_no_wider_than_its_tiles(store):
+    res = store.get([1, 2], fmt=pb.IMAGES_SPRITE_PNG, columns=MAX_IMAGES)
+    assert res.columns == 2
+    assert Image.open(BytesIO(res.data)).size == (2 * TILE, TILE)
+
+
+@pytest.mark.parametrize('columns', [-1, MAX_IMAGES + 1])
+def test_rejects_out_of_range_columns(store, columns):
+    with pytest.raises(ValueError):
+        store.get([0], fmt=pb.IMAGES_SPRITE_PNG, columns=columns)
+
+
+def test_empty_request(store):
+    res = store.get([], fmt=pb.IMAGES_SPRITE_PNG)
+    assert res.count == 0 and not res.data
+
+
+def test_rejects_unknown_ids(store):
+    with pytest.raises(IndexError):
+        store.get([5])
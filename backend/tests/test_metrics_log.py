@@ -0,0 +1,106 @@
+import os
+import numpy as np
+import pytest
+
+from src.services.hub import MetricsHub
+from src.services.metrics_log import INDEX, MetricsLog, record_size
+
+
+@pytest.fixture
+def fill(metric):
+    def fill(root, count: int) -> MetricsLog:
+        log = MetricsLog(root)
+        for seq in range(count):
+            log.append(seq, metric(seq))
+        return log
+    return fill
+
+
+def test_round_trip(tmp_path, fill, metric):
+    log = fill(tmp_path, 3)
+    for seq in range(3):
+        got, want = log.read(seq), metric(seq)
+        assert (got['seq'], got['epoch'], got['batch']) == (seq, want['epoch'], want['batch'])
+        assert got['batch_loss'] == pytest.approx(want['batch_loss'])
+        for key in ('preds', 'truths', 'scores', 'image_ids'):
+            np.testing.assert_array_equal(got[key], want[key])
+        assert got['stop_reason'] == '' and got['batches_saved'] == 0
+    log.close()
+
+
+def test_stop_reason_round_trip(tmp_path, metric):
+    log = MetricsLog(tmp_path)
+    log.append(0, {**metric(0), 'stop_reason': 'plateau', 'batches_saved': 1234})
+    got = log.read(0)
+    assert (got['stop_reason'], got['batches_saved']) == ('plateau', 1234)
+    log.close()
+
+
+def test_rejects_out_of_order_and_missing_seqs(tmp_path, fill, metric):
+    log = fill(tmp_path, 2)
+    with pytest.raises(ValueError):
+        log.append(5, metric(5))
+    with pytest.raises(IndexError):
+        log.read(2)
+    log.close()
+
+
+def test_reopen_continues(tmp_path, fill, metric):
+    fill(tmp_path, 3).close()
+    log = MetricsLog(tmp_path)
+    assert log.count == 3
+    log.append(3, metric(3))
+    assert log.read(3)['batch'] == 3 and log.read(0)['batch'] == 0
+    log.close()
+
+
+def test_recovers_from_torn_record(tmp_path, fill, metric):
+    """A crash after indexing a record whose data never fully reached the disk drops just that record."""
+    fill(tmp_path, 3).close()
+    data = tmp_path / 'metrics.log'
+    os.truncate(data, data.stat().st_size - 5)
+
+    log = MetricsLog(tmp_path)
+    assert log.count == 2
+    assert data.stat().st_size == 2 * record_size(8)
+    assert (tmp_path / 'metrics.idx').stat().st_size == 2 * INDEX.size
+    log.append(2, metric(7))
+    assert log.read(2)['batch'] == 7
+    log.close()
+
+
+def test_recovers_from_unindexed_data(tmp_path, fill):
+    """Data written without its index entry (crash between the two writes) is discarded."""
+    fill(tmp_path, 3).close()
+    index = tmp_path / 'metrics.idx'
+    os.truncate(index, index.stat().st_size - INDEX.size)
+
+    log = MetricsLog(tmp_path)
+    assert log.count == 2
+    assert (tmp_path / 'metrics.log').stat().st_size == 2 * record_size(8)
+    log.close()
+
+
+def test_recovers_from_partial_index_entry(tmp_path, fill, metric):
+    fill(tmp_path, 3).close()
+    index = tmp_path / 'metrics.idx'
+    os.truncate(index, index.stat().st_size - 3)
+
+    log = MetricsLog(tmp_path)
+    assert log.count == 2
+    assert index.stat().st_size == 2 * INDEX.size
+    np.testing.assert_array_equal(log.read(1)['image_ids'], metric(1)['image_ids'])
+    log.close()
+
+
+def test_closing_the_hub_closes_its_log(tmp_path, metric):
+    log = MetricsLog(tmp_path)
+    hub = MetricsHub(log=log)
+    hub.put(metric(0))
+    view = log.read(0)['preds']                             # Keeps the data map exported
+    hub.close()
+    assert log.closed and log._data.closed and log._index.closed
+    with pytest.raises(ValueError):
+        log.read(0)
+    assert view.tolist() == metric(0)['preds'].tolist()
+    log.close()                                             # Idempotent
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from src.services.sample_index import SampleIndex
+
+
+@pytest.fixture
+def index():
+    index = SampleIndex.create(size=10)
+    index.update(ids=np.array([0, 1, 2, 3]), loss=np.array([0.1, 2.0, 0.5, 3.0]),
+                 preds=np.array([1, 2, 3, 3]), truths=np.array([1, 5, 3, 7]), epoch=0)
+    index.update(ids=np.array([1, 4]), loss=np.array([0.3, 1.0]),
+                 preds=np.array([5, 0]), truths=np.array([5, 9]), epoch=1)       # Sample 1 is right on its 2nd visit
+    yield index
+    index.close()
+
+
+def test_hardest_first_among_seen_samples(index):
+    rows, matched, indexed = index.hardest(3)
+    assert rows['id'].tolist() == [3, 4, 2]
+    assert rows['loss'].tolist() == pytest.approx([3.0, 1.0, 0.5])
+    assert (matched, indexed) == (5, 5)
+
+
+def test_visits_accumulate(index):
+    rows, _, _ = index.hardest(10, label=5)
+    assert rows['id'].tolist() == [1]
+    assert (rows['seen'][0], rows['correct'][0], rows['epoch'][0]) == (2, 1, 1)
+
+
+@pytest.mark.parametrize('filters, ids', [
+    ({'misclassified_only': True}, [3, 4]),
+    ({'pred': 3}, [3, 2]),
+    ({'min_epoch': 1}, [4, 1]),
+    ({'max_correct': 0}, [3, 4]),
+    ({'label': 7, 'misclassified_only': True}, [3]),
+    ({'label': 8}, []),
+])
+def test_filters(index, filters, ids):
+    rows, matched, indexed = index.hardest(10, **filters)
+    assert rows['id'].tolist() == ids and matched == len(ids) and indexed == 5
+
+
+def test_rows_are_copies(index):
+    rows, _, _ = index.hardest(1)
+    index.update(np.array([3]), np.array([9.0]), np.array([0]), np.array([0]), 2)
+    assert rows['loss'][0] == pytest.approx(3.0)
+
+
+def test_closed_index_returns_none():
+    index = SampleIndex.create(size=4)
+    index.close()
+    assert index.hardest(1) is None
@@ -0,0 +1,157 @@
+from typing import Any
+import pytest
+
+from src.services.hub import MetricsHub
+from src.services.metrics_log import MetricsLog
+from src.services.scheduler import Job, JobScheduler
+
+
+class FakeRunner:
+    """Runner whose state the test drives."""
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+        self.run_state = 'ready'
+        self.started_with: tuple[int, bool] | None = None
+        self.closed = False
+
+    def start(self, num_epochs: int, resume: bool = False, overrides: dict[str, Any] | None = None) -> None:
+        self.started_with = (num_epochs, resume)
+        self.run_state = 'training'
+
+    def state(self) -> str:
+        return self.run_state
+
+    def finish(self) -> None:
+        self.run_state = 'finished'
+
+    def modes(self) -> None: ...
+    def stats(self) -> None: ...
+    def profile(self, steps: int) -> None: ...
+    def stopped(self) -> None: ...
+    def samples(self) -> None: ...
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(make_hub=lambda job_id, run: MetricsHub(), make_runner=FakeRunner, max_jobs=1)
+    yield scheduler
+    scheduler.close()
+
+
+def test_requires_a_runner_factory():
+    with pytest.raises(RuntimeError):
+        JobScheduler(make_hub=lambda job_id, run: MetricsHub()).submit(1)
+
+
+@pytest.mark.parametrize('job_id', ['-x', 'a/b', '../a', 'x' * 65])
+def test_rejects_invalid_ids(scheduler, job_id):
+    with pytest.raises(ValueError):
+        scheduler.submit(1, job_id=job_id)
+
+
+def test_queues_beyond_max_jobs_by_priority(scheduler):
+    first = scheduler.submit(1, job_id='a')
+    low = scheduler.submit(1, job_id='b')
+    high = scheduler.submit(1, job_id='c', priority=5)
+    assert [job.state() for job in (first, low, high)] == ['training', 'queued', 'queued']
+    assert scheduler.position(high) == 0 and scheduler.position(low) == 1
+
+    first.runner.finish()
+    scheduler.dispatch()
+    assert (high.state(), low.state()) == ('training', 'queued')
+    assert scheduler.followed() == 'c'
+
+
+def test_rejects_an_id_that_is_still_active(scheduler):
+    scheduler.submit(1, job_id='a')
+    scheduler.submit(1, job_id='b')
+    for job_id in ('a', 'b'):                               # Training, queued
+        with pytest.raises(ValueError, match='already exists'):
+            scheduler.submit(1, job_id=job_id)
+
+
+def test_resubmitting_a_finished_job_replaces_it(scheduler):
+    old = scheduler.submit(1, job_id='a')
+    other = scheduler.submit(1, job_id='b')
+    old.runner.finish()
+    scheduler.dispatch()
+    other.runner.finish()
+
+    new = scheduler.submit(3, resume=True, job_id='a')
+    assert new is not old and new.run != old.run
+    assert scheduler.get('a') is new and [job.id for job in scheduler.all_jobs()] == ['b', 'a']
+    assert new.runner.started_with == (3, True)
+    assert old.hub.closed and old.runner.closed
+    assert not new.hub.closed
+
+
+def test_resubmitting_a_failed_job_replaces_it(scheduler):
+    old = scheduler.submit(1, job_id='a')
+    old.error = 'boom'
+    new = scheduler.submit(1, job_id='a')
+    assert scheduler.get('a') is new and old.hub.closed
+
+
+def test_prune_keeps_the_newest_finished_jobs(scheduler):
+    scheduler.retain = 1
+    jobs = []
+    for job_id in 'abc':
+        jobs.append(scheduler.submit(1, job_id=job_id))
+        jobs[-1].runner.finish()
+    scheduler.prune()
+    assert [job.id for job in scheduler.all_jobs()] == ['c']
+    assert all(job.hub.closed and job.runner.closed for job in jobs[:2])
+    assert not jobs[2].hub.closed
+
+
+def test_get_defaults_to_the_latest_job(scheduler):
+    assert scheduler.get() is None
+    scheduler.submit(1, job_id='a')
+    latest = scheduler.submit(1)
+    assert scheduler.get() is latest and scheduler.get('missing') is None
+
+
+def test_a_rejected_job_leaves_no_log_behind(tmp_path):
+    hubs = []
+
+    def make_hub(job_id: str, run: str) -> MetricsHub:
+        hubs.append(MetricsHub(log=MetricsLog(root=tmp_path / 'logs' / job_id / run)))
+        return hubs[-1]
+
+    def reject(job: Job) -> FakeRunner:
+        raise ValueError(f'Bad overrides: {job.overrides}')
+
+    with pytest.raises(ValueError, match='Bad overrides'):
+        JobScheduler(make_hub=make_hub, make_runner=reject).submit(1, overrides={'model': 'xx'}, job_id='a')
+    assert hubs[0].closed and hubs[0].log.closed
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_restores_the_latest_run_of_each_logged_job(tmp_path, metric):
+    def make_hub(job_id: str, run: str) -> MetricsHub:
+        return MetricsHub(log=MetricsLog(root=tmp_path / job_id / run))
+
+    for job_id, run, stop_reason in [('a', '20260101-000000-000000', ''), ('a', '20260102-000000-000000', 'plateau'),
+                                     ('b', '20260101-120000-000000', '')]:
+        hub = make_hub(job_id, run)
+        for i in range(3):
+            hub.put({**metric(i), 'stop_reason': stop_reason if i == 2 else ''})
+        hub.close()
+    (tmp_path / 'bad id!' / 'run').mkdir(parents=True)
+
+    scheduler = JobScheduler(make_hub=make_hub, make_runner=FakeRunner)
+    restored = scheduler.restore(tmp_path)
+    assert [(job.id, job.run) for job in restored] == [('b', '20260101-120000-000000'), ('a', '20260102-000000-000000')]
+    job = scheduler.get('a')
+    assert job.state() == 'finished' and job.hub.latest()['batch'] == 2
+    assert job.runner.stopped().reason == 'plateau' and scheduler.get('b').runner.stopped() is None
+
+    sub = job.hub.subscribe(from_seq=0)
+    assert [sub.get(timeout=0)['seq'] for _ in range(3)] == [0, 1, 2]
+
+    new = scheduler.submit(1, resume=True, job_id='a')
+    assert new.runner.started_with == (1, True) and job.hub.closed
@@ -0,0 +1,73 @@
+from threading import Event
+import numpy as np
+import pytest
+
+from src.services import shm_ring
+from src.services.metrics_log import decode_record, record_size
+from src.services.shm_ring import SLOT_HEADER, WRITING, ShmRing
+
+
+@pytest.fixture
+def ring():
+    ring = ShmRing.create(slots=4, slot_size=record_size(8), event=Event())
+    yield ring
+    ring.close()
+
+
+def test_put_and_read(ring, metric):
+    reader = ShmRing.attach(ring.name)
+    try:
+        for i in range(3):
+            ring.put(metric(i))
+        assert reader.head() == 3 and ring.event.is_set()
+        for i in range(3):
+            got = reader.read(i)
+            assert got['seq'] == i and got['batch'] == i
+            np.testing.assert_array_equal(got['image_ids'], metric(i)['image_ids'])
+    finally:
+        reader.close()
+
+
+def test_read_copies_out_of_the_slot(ring, metric):
+    ring.put(metric(1))
+    got = ring.read(0)
+    for i in range(2, 6):                                   # Laps the ring, reusing slot 0
+        ring.put(metric(i))
+    assert got['batch'] == 1 and got['preds'].tolist() == metric(1)['preds'].tolist()
+
+
+def test_overwritten_slot_reads_as_none(ring, metric):
+    for i in range(6):
+        ring.put(metric(i))
+    assert ring.read(0) is None and ring.read(1) is None    # Lapped by seqs 4 and 5
+    assert ring.read(5)['batch'] == 5
+
+
+def test_slot_being_written_reads_as_none(ring, metric):
+    ring.put(metric(0))
+    SLOT_HEADER.pack_into(ring.shm.buf, ring.slot(0), WRITING, 0)
+    assert ring.read(0) is None
+
+
+def test_slot_overwritten_mid_read_reads_as_none(ring, metric, monkeypatch):
+    ring.put(metric(0))
+
+    def decode_then_lap(buffer, offset):
+        record = decode_record(buffer, offset)
+        for i in range(1, 5):                               # The producer laps the ring while we decode
+            ring.put(metric(i))
+        return record
+
+    monkeypatch.setattr(shm_ring, 'decode_record', decode_then_lap)
+    assert ring.read(0) is None
+
+
+def test_unpublished_seq_reads_as_none(ring, metric):
+    ring.put(metric(0))
+    assert ring.read(1) is None
+
+
+def test_rejects_records_larger_than_a_slot(ring, metric):
+    with pytest.raises(ValueError):
+        ring.put(metric(0, n=64))
+    assert ring.head() == 0
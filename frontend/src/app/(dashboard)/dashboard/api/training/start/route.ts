@@ -2,7 +2,7 @@ import { NextRequest, NextResponse } from 'next/server'
 import { promisify } from 'util'
 import * as grpc from '@grpc/grpc-js'
 import type { ServiceError } from '@grpc/grpc-js'
-import { TrainingClient, type StartReq, type StartRes } from '@/generated/metrics'
+import { TrainingClient, StartReq, type StartRes } from '@/generated/metrics'
 
 export const dynamic = 'force-dynamic'
 
@@ -19,7 +19,7 @@ export async function POST(request: NextRequest) {
     const startAsync = promisify<StartReq, StartRes>(client.start.bind(client))
 
     // Call Start RPC
-    const response = await startAsync({ numEpochs, confirmed: true })
+    const response = await startAsync(StartReq.create({ numEpochs, confirmed: true }))
 
     // Close client after call completes
     client.close()
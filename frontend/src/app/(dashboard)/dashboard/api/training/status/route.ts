@@ -2,7 +2,7 @@ import { NextResponse } from 'next/server'
 import { promisify } from 'util'
 import * as grpc from '@grpc/grpc-js'
 import type { ServiceError } from '@grpc/grpc-js'
-import { TrainingClient, type StatusReq, type StatusRes } from '@/generated/metrics'
+import { TrainingClient, StatusReq, type StatusRes } from '@/generated/metrics'
 
 export const dynamic = 'force-dynamic'
 
@@ -16,7 +16,7 @@ export async function GET() {
     const statusAsync = promisify<StatusReq, StatusRes>(client.status.bind(client))
 
     // Call Status RPC
-    const response = await statusAsync({})
+    const response = await statusAsync(StatusReq.create())
 
     // Close client after call completes
     client.close()
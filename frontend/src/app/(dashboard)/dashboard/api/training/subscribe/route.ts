@@ -1,7 +1,7 @@
 import { NextRequest } from 'next/server'
 import * as grpc from '@grpc/grpc-js'
 import type { ServiceError } from '@grpc/grpc-js'
-import { TrainingClient, type TrainingMetric } from '@/generated/metrics'
+import { SubscribeReq, TrainingClient, type TrainingMetric } from '@/generated/metrics'
 
 export const dynamic = 'force-dynamic'
 
@@ -32,7 +32,7 @@ export async function GET(request: NextRequest) {
       }
 
       // Subscribe to metrics stream
-      const call = client.subscribe({})
+      const call = client.subscribe(SubscribeReq.create())
 
       call.on('data', (metric: TrainingMetric) => {
         if (isClosed) return
@@ -10,9 +10,11 @@ import {
   type CallOptions,
   type ChannelCredentials,
   Client,
+  type ClientDuplexStream,
   type ClientOptions,
   type ClientReadableStream,
   type ClientUnaryCall,
+  type handleBidiStreamingCall,
   type handleServerStreamingCall,
   type handleUnaryCall,
   makeGenericClientConstructor,
@@ -23,6 +25,97 @@ import {
 
 export const protobufPackage = "services";
 
+export enum ScoreEncoding {
+  /** SCORES_FLOAT32 - 4 bytes per score */
+  SCORES_FLOAT32 = 0,
+  /** SCORES_FLOAT16 - 2 bytes per score, little-endian IEEE half */
+  SCORES_FLOAT16 = 1,
+  /** SCORES_UINT8 - 1 byte per score, quantized as round(score * 255) */
+  SCORES_UINT8 = 2,
+  UNRECOGNIZED = -1,
+}
+
+export function scoreEncodingFromJSON(object: any): ScoreEncoding {
+  switch (object) {
+    case 0:
+    case "SCORES_FLOAT32":
+      return ScoreEncoding.SCORES_FLOAT32;
+    case 1:
+    case "SCORES_FLOAT16":
+      return ScoreEncoding.SCORES_FLOAT16;
+    case 2:
+    case "SCORES_UINT8":
+      return ScoreEncoding.SCORES_UINT8;
+    case -1:
+    case "UNRECOGNIZED":
+    default:
+      return ScoreEncoding.UNRECOGNIZED;
+  }
+}
+
+export function scoreEncodingToJSON(object: ScoreEncoding): string {
+  switch (object) {
+    case ScoreEncoding.SCORES_FLOAT32:
+      return "SCORES_FLOAT32";
+    case ScoreEncoding.SCORES_FLOAT16:
+      return "SCORES_FLOAT16";
+    case ScoreEncoding.SCORES_UINT8:
+      return "SCORES_UINT8";
+    case ScoreEncoding.UNRECOGNIZED:
+    default:
+      return "UNRECOGNIZED";
+  }
+}
+
+export enum ImageFormat {
+  /** IMAGES_TILES - Raw 28x28 uint8 tiles, concatenated in request order */
+  IMAGES_TILES = 0,
+  /** IMAGES_SPRITE_PNG - One grayscale PNG, tiles laid out row-major `columns` wide */
+  IMAGES_SPRITE_PNG = 1,
+  UNRECOGNIZED = -1,
+}
+
+export function imageFormatFromJSON(object: any): ImageFormat {
+  switch (object) {
+    case 0:
+    case "IMAGES_TILES":
+      return ImageFormat.IMAGES_TILES;
+    case 1:
+    case "IMAGES_SPRITE_PNG":
+      return ImageFormat.IMAGES_SPRITE_PNG;
+    case -1:
+    case "UNRECOGNIZED":
+    default:
+      return ImageFormat.UNRECOGNIZED;
+  }
+}
+
+export function imageFormatToJSON(object: ImageFormat): string {
+  switch (object) {
+    case ImageFormat.IMAGES_TILES:
+      return "IMAGES_TILES";
+    case ImageFormat.IMAGES_SPRITE_PNG:
+      return "IMAGES_SPRITE_PNG";
+    case ImageFormat.UNRECOGNIZED:
+    default:
+      return "UNRECOGNIZED";
+  }
+}
+
+export interface PackedSamples {
+  /** One uint8 per sample */
+  preds: Buffer;
+  /** One uint8 per sample */
+  truths: Buffer;
+  /** Encoded as described by score_encoding */
+  scores: Buffer;
+  scoreEncoding: ScoreEncoding;
+  /** Little-endian unsigned ids, image_id_width bytes each */
+  imageIds: Buffer;
+  /** 2 (u16) while every id fits, else 4 (u32) */
+  imageIdWidth: number;
+}
+
 export interface TrainingMetric {
   epoch: number;
   batch: number;
@@ -32,25 +125,141 @@ export interface TrainingMetric {
   truths: number[];
   /** Confidence scores for predictions */
   scores: number[];
-  /** MNIST test image indices (0-9999) */
+  /** MNIST train image indices (0-59999), see GetImages */
   imageIds: number[];
+  /** Position in the run's append-only metrics log */
+  seq: number;
+  /** Set instead of fields 5-8 when the subscriber asked for packed encoding */
+  packed: PackedSamples | undefined;
+  /** Only on the run's final metric: "completed", "tolerance" (epoch loss) or "plateau" (smoothed loss) */
+  stopReason: string;
+  /** With stop_reason: batches of the requested epochs left unrun */
+  batchesSaved: number;
 }
 
-/** Empty for now, can add filters later */
 export interface SubscribeReq {
+  /** Replay history from this seq, then follow live (unset = live only) */
+  fromSeq?: number | undefined;
+  /** Send per-sample data as PackedSamples byte blobs */
+  packed: boolean;
+  /** Score precision when packed */
+  scoreEncoding: ScoreEncoding;
+  /** Gzip-compress stream messages */
+  compress: boolean;
+  /** Server-side filters, applied before encoding */
+  fields: string[];
+  /** Only send metrics whose seq is a multiple of N (0 = all) */
+  everyNth: number;
+  /** Inclusive epoch range */
+  minEpoch?: number | undefined;
+  maxEpoch?: number | undefined;
+  /** Inclusive batch range (within each epoch) */
+  minBatch?: number | undefined;
+  maxBatch?: number | undefined;
+  /** Only send samples where preds != truths */
+  misclassifiedOnly: boolean;
+  /** Job to follow (empty = the most recently submitted one) */
+  jobId: string;
+  /** Run from_seq counts in (see StartRes.run); FAILED_PRECONDITION once replaced */
+  run: string;
+}
+
+export interface SubscribeBatchReq {
+  /** Replay and encoding options, as for Subscribe */
+  subscribe: SubscribeReq | undefined;
+  /** Flush after this many metrics (0 = 32) */
+  maxCount: number;
+  /** Flush once the frame reaches this encoded size (0 = 64 KiB) */
+  maxBytes: number;
+  /** Flush when the oldest buffered metric is this old (unset = 100) */
+  maxLatencyMs?: number | undefined;
+}
+
+export interface TrainingMetricBatch {
+  metrics: TrainingMetric[];
+}
+
+export interface SubscribeEvalReq {
+  /** Replay retained results from this seq, then follow live (unset = live only) */
+  fromSeq?: number | undefined;
+}
+
+export interface EvalMetric {
+  /** Position in the server's eval result stream */
+  seq: number;
+  /** Training position of the evaluated weight snapshot */
+  epoch: number;
+  batch: number;
+  /** Snapshot version within the run */
+  version: number;
+  /** Mean cross-entropy over the test set */
+  loss: number;
+  accuracy: number;
+  /** Accuracy per digit 0-9 */
+  classAccuracy: number[];
+  /** Test images evaluated (10000) */
+  samples: number;
+  /** Time the evaluation took */
+  durationMs: number;
+  /** Job the snapshot came from */
+  jobId: string;
 }
 
-/** Empty - just checking server status */
 export interface StatusReq {
+  /** Job to report on (empty = the most recently submitted one) */
+  jobId: string;
+}
+
+export interface TrainModes {
+  /** "mlp" or "cnn" */
+  model: string;
+  /** CPU bfloat16 autocast */
+  bf16: boolean;
+  /** torch.compile'd graph (false if compilation fell back to eager) */
+  compiled: boolean;
+  /** NHWC memory format (conv models only) */
+  channelsLast: boolean;
 }
 
 export interface StatusRes {
-  /** "ready", "training", "idle" */
+  /** "warming", "ready" (no jobs yet), or the job's: "queued", "training", "finished", "failed"; "not_found" */
   status: string;
-  /** Additional info */
+  /** Additional info (the current stage while warming) */
   message: string;
   /** If training, which epoch (0 if not training) */
   epoch: number;
+  /** Modes actually in effect, once training has warmed up */
+  modes: TrainModes | undefined;
+  /** Startup stages completed, 0-1 (1 once the server is ready) */
+  progress: number;
+  /** Job reported on */
+  jobId: string;
+  /** Jobs waiting on the server */
+  queued: number;
+  /** Jobs training on the server */
+  running: number;
+  /** Once training has ended: "completed", "tolerance" or "plateau" */
+  stopReason: string;
+  /** Batches of the requested epochs an early stop skipped */
+  batchesSaved: number;
+  /** How the server's CPUs are split between training and serving */
+  resources: ResourceLayout | undefined;
+}
+
+export interface ResourceLayout {
+  /** CPUs training threads, torch's pools and training processes are pinned to */
+  trainCores: number[];
+  /** CPUs the gRPC server (and metric serialization) runs on */
+  serveCores: number[];
+  /** torch intra-op pool of the server process */
+  intraOpThreads: number;
+  interOpThreads: number;
+  /** Intra-op threads of each training job (split between concurrent jobs) */
+  jobThreads: number;
+  /** Thread-pool server workers (0 when serving with asyncio) */
+  grpcWorkers: number;
+  /** False when affinity pinning is off or unsupported (core lists empty) */
+  pinned: boolean;
 }
 
 export interface StartReq {
@@ -58,17 +267,377 @@ export interface StartReq {
   numEpochs: number;
   /** Must be true to actually start */
   confirmed: boolean;
+  /** Continue from the latest checkpoint (epoch, weights, optimizer, convergence state) */
+  resume: boolean;
+  /** Per-run overrides of the server's training config (unset = server default) */
+  model?: string | undefined;
+  bf16?: boolean | undefined;
+  compile?: boolean | undefined;
+  channelsLast?: boolean | undefined;
+  lr?: number | undefined;
+  batchSize?: number | undefined;
+  /** Batches the smoothed loss may go without improving (0 = epoch tolerance only; unset = --patience, default 0) */
+  patience?: number | undefined;
+  /** Scheduling */
+  priority: number;
+  /** Name the job (e.g. to resume its checkpoints later); unset = generated */
+  jobId?: string | undefined;
 }
 
 export interface StartRes {
-  /** "started", "already_running", "not_confirmed" */
+  /** "started", "queued", "not_confirmed", "invalid", "warming" (retry later), "failed" (warm-up failed) */
+  status: string;
+  /** Additional info */
+  message: string;
+  /** Key for Status, Subscribe, GetStats and Profile */
+  jobId: string;
+  /** Jobs ahead of it in the queue (when queued) */
+  position: number;
+  /** This submission of job_id; seqs count from 0 in every run */
+  run: string;
+}
+
+/** Empty - every job the server retains, in submission order */
+export interface ListJobsReq {
+}
+
+export interface JobInfo {
+  jobId: string;
+  /** "queued", "training", "finished", "failed" */
+  status: string;
+  /** Epoch of the latest metric */
+  epoch: number;
+  numEpochs: number;
+  priority: number;
+  /** Config set by its StartReq (e.g. lr, batch_size, model) */
+  overrides: { [key: string]: string };
+  /** Modes in effect, once training has warmed up */
+  modes: TrainModes | undefined;
+  /** Once training has ended: "completed", "tolerance" or "plateau" */
+  stopReason: string;
+  batchesSaved: number;
+  /** Current submission of job_id (see StartRes.run) */
+  run: string;
+}
+
+export interface JobInfo_OverridesEntry {
+  key: string;
+  value: string;
+}
+
+export interface ListJobsRes {
+  jobs: JobInfo[];
+}
+
+export interface PredictReq {
+  /** One or more 28x28 grayscale images: 784 uint8 pixels each (0-255, MNIST layout), concatenated */
+  images: Buffer;
+}
+
+export interface Prediction {
+  /** Predicted digit */
+  label: number;
+  /** Probability of the predicted digit */
+  score: number;
+  /** Probability of each digit 0-9 */
+  probs: number[];
+}
+
+export interface PredictRes {
+  /** One per image, in request order */
+  predictions: Prediction[];
+  /** Weight snapshot that produced them */
+  version: number;
+  /** Training position of that snapshot */
+  epoch: number;
+  batch: number;
+  /** Job the snapshot came from */
+  jobId: string;
+}
+
+export interface ImagesReq {
+  /** Dataset indices (as in TrainingMetric.image_ids), at most 4096 */
+  imageIds: number[];
+  /** Test split instead of train */
+  test: boolean;
+  format: ImageFormat;
+  /** Sprite width in tiles, 0-4096 (0 = 32); capped at the number of images */
+  columns: number;
+}
+
+export interface ImagesRes {
+  format: ImageFormat;
+  /** Tiles or PNG, as described by format */
+  data: Buffer;
+  /** Number of images */
+  count: number;
+  /** Sprite width in tiles: image i sits at column i % columns, row i / columns */
+  columns: number;
+  /** Tile edge in pixels (28) */
+  tileSize: number;
+}
+
+export interface StatsReq {
+  /** Job whose training stats to include (empty = the most recently submitted one) */
+  jobId: string;
+}
+
+export interface Histogram {
+  /** Stage, e.g. "train.forward", "stream.encode" */
+  name: string;
+  count: number;
+  /** Seconds */
+  sum: number;
+  min: number;
+  max: number;
+  /** Approximate (bucket upper bound), seconds */
+  p50: number;
+  p90: number;
+  p99: number;
+  /** Upper bound (seconds) of each non-empty bucket */
+  bounds: number[];
+  /** Samples in the matching bucket */
+  counts: number[];
+}
+
+export interface StatsRes {
+  histograms: Histogram[];
+  /** e.g. train.batches, stream.sent, hub.dropped */
+  counters: { [key: string]: number };
+  /** e.g. hub.subscribers, hub.ring_depth, data.prefetch_depth */
+  gauges: { [key: string]: number };
+  /** e.g. last_profile (path of the last profiler trace) */
+  labels: { [key: string]: string };
+}
+
+export interface StatsRes_CountersEntry {
+  key: string;
+  value: number;
+}
+
+export interface StatsRes_GaugesEntry {
+  key: string;
+  value: number;
+}
+
+export interface StatsRes_LabelsEntry {
+  key: string;
+  value: string;
+}
+
+export interface ProfileReq {
+  /** Training steps to capture (0 = 20) */
+  steps: number;
+  /** Job to profile (empty = the most recently submitted one) */
+  jobId: string;
+}
+
+export interface ProfileRes {
+  /** "requested", "not_training" */
   status: string;
   /** Additional info */
   message: string;
 }
 
+export interface HardExamplesReq {
+  /** Job to query (empty = most recently submitted) */
+  jobId: string;
+  /** Samples to return, hardest first (default 20, at most 1000) */
+  k: number;
+  /** Only this true digit */
+  label?: number | undefined;
+  /** Only samples last predicted as this digit */
+  pred?: number | undefined;
+  /** Only samples whose last prediction was wrong */
+  misclassifiedOnly: boolean;
+  /** Only samples visited in this epoch or later */
+  minEpoch?: number | undefined;
+  /** Only samples classified correctly at most this many times */
+  maxCorrect?: number | undefined;
+}
+
+export interface HardExamplesRes {
+  /** One entry per sample, ordered by last loss, highest first */
+  imageIds: number[];
+  /** Cross-entropy at the last visit */
+  losses: number[];
+  /** Prediction at the last visit */
+  preds: number[];
+  truths: number[];
+  /** Visits classified correctly */
+  correct: number[];
+  /** Visits so far */
+  seen: number[];
+  /** Epoch of the last visit */
+  epochs: number[];
+  /** Samples passing the filters */
+  matched: number;
+  /** Samples trained on at least once */
+  indexed: number;
+}
+
+function createBasePackedSamples(): PackedSamples {
+  return {
+    preds: Buffer.alloc(0),
+    truths: Buffer.alloc(0),
+    scores: Buffer.alloc(0),
+    scoreEncoding: 0,
+    imageIds: Buffer.alloc(0),
+    imageIdWidth: 0,
+  };
+}
+
+export const PackedSamples: MessageFns<PackedSamples> = {
+  encode(message: PackedSamples, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.preds.length !== 0) {
+      writer.uint32(10).bytes(message.preds);
+    }
+    if (message.truths.length !== 0) {
+      writer.uint32(18).bytes(message.truths);
+    }
+    if (message.scores.length !== 0) {
+      writer.uint32(26).bytes(message.scores);
+    }
+    if (message.scoreEncoding !== 0) {
+      writer.uint32(32).int32(message.scoreEncoding);
+    }
+    if (message.imageIds.length !== 0) {
+      writer.uint32(42).bytes(message.imageIds);
+    }
+    if (message.imageIdWidth !== 0) {
+      writer.uint32(48).uint32(message.imageIdWidth);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): PackedSamples {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBasePackedSamples();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.preds = Buffer.from(reader.bytes());
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.truths = Buffer.from(reader.bytes());
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.scores = Buffer.from(reader.bytes());
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.scoreEncoding = reader.int32() as any;
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.imageIds = Buffer.from(reader.bytes());
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.imageIdWidth = reader.uint32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): PackedSamples {
+    return {
+      preds: isSet(object.preds) ? Buffer.from(bytesFromBase64(object.preds)) : Buffer.alloc(0),
+      truths: isSet(object.truths) ? Buffer.from(bytesFromBase64(object.truths)) : Buffer.alloc(0),
+      scores: isSet(object.scores) ? Buffer.from(bytesFromBase64(object.scores)) : Buffer.alloc(0),
+      scoreEncoding: isSet(object.scoreEncoding) ? scoreEncodingFromJSON(object.scoreEncoding) : 0,
+      imageIds: isSet(object.imageIds) ? Buffer.from(bytesFromBase64(object.imageIds)) : Buffer.alloc(0),
+      imageIdWidth: isSet(object.imageIdWidth) ? globalThis.Number(object.imageIdWidth) : 0,
+    };
+  },
+
+  toJSON(message: PackedSamples): unknown {
+    const obj: any = {};
+    if (message.preds.length !== 0) {
+      obj.preds = base64FromBytes(message.preds);
+    }
+    if (message.truths.length !== 0) {
+      obj.truths = base64FromBytes(message.truths);
+    }
+    if (message.scores.length !== 0) {
+      obj.scores = base64FromBytes(message.scores);
+    }
+    if (message.scoreEncoding !== 0) {
+      obj.scoreEncoding = scoreEncodingToJSON(message.scoreEncoding);
+    }
+    if (message.imageIds.length !== 0) {
+      obj.imageIds = base64FromBytes(message.imageIds);
+    }
+    if (message.imageIdWidth !== 0) {
+      obj.imageIdWidth = Math.round(message.imageIdWidth);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<PackedSamples>, I>>(base?: I): PackedSamples {
+    return PackedSamples.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<PackedSamples>, I>>(object: I): PackedSamples {
+    const message = createBasePackedSamples();
+    message.preds = object.preds ?? Buffer.alloc(0);
+    message.truths = object.truths ?? Buffer.alloc(0);
+    message.scores = object.scores ?? Buffer.alloc(0);
+    message.scoreEncoding = object.scoreEncoding ?? 0;
+    message.imageIds = object.imageIds ?? Buffer.alloc(0);
+    message.imageIdWidth = object.imageIdWidth ?? 0;
+    return message;
+  },
+};
+
 function createBaseTrainingMetric(): TrainingMetric {
-  return { epoch: 0, batch: 0, batchSize: 0, batchLoss: 0, preds: [], truths: [], scores: [], imageIds: [] };
+  return {
+    epoch: 0,
+    batch: 0,
+    batchSize: 0,
+    batchLoss: 0,
+    preds: [],
+    truths: [],
+    scores: [],
+    imageIds: [],
+    seq: 0,
+    packed: undefined,
+    stopReason: "",
+    batchesSaved: 0,
+  };
 }
 
 export const TrainingMetric: MessageFns<TrainingMetric> = {
@@ -105,6 +674,18 @@ export const TrainingMetric: MessageFns<TrainingMetric> = {
       writer.int32(v);
     }
     writer.join();
+    if (message.seq !== 0) {
+      writer.uint32(72).int64(message.seq);
+    }
+    if (message.packed !== undefined) {
+      PackedSamples.encode(message.packed, writer.uint32(82).fork()).join();
+    }
+    if (message.stopReason !== "") {
+      writer.uint32(90).string(message.stopReason);
+    }
+    if (message.batchesSaved !== 0) {
+      writer.uint32(96).int64(message.batchesSaved);
+    }
     return writer;
   },
 
@@ -219,6 +800,38 @@ export const TrainingMetric: MessageFns<TrainingMetric> = {
 
           break;
         }
+        case 9: {
+          if (tag !== 72) {
+            break;
+          }
+
+          message.seq = longToNumber(reader.int64());
+          continue;
+        }
+        case 10: {
+          if (tag !== 82) {
+            break;
+          }
+
+          message.packed = PackedSamples.decode(reader, reader.uint32());
+          continue;
+        }
+        case 11: {
+          if (tag !== 90) {
+            break;
+          }
+
+          message.stopReason = reader.string();
+          continue;
+        }
+        case 12: {
+          if (tag !== 96) {
+            break;
+          }
+
+          message.batchesSaved = longToNumber(reader.int64());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -238,6 +851,10 @@ export const TrainingMetric: MessageFns<TrainingMetric> = {
       truths: globalThis.Array.isArray(object?.truths) ? object.truths.map((e: any) => globalThis.Number(e)) : [],
       scores: globalThis.Array.isArray(object?.scores) ? object.scores.map((e: any) => globalThis.Number(e)) : [],
       imageIds: globalThis.Array.isArray(object?.imageIds) ? object.imageIds.map((e: any) => globalThis.Number(e)) : [],
+      seq: isSet(object.seq) ? globalThis.Number(object.seq) : 0,
+      packed: isSet(object.packed) ? PackedSamples.fromJSON(object.packed) : undefined,
+      stopReason: isSet(object.stopReason) ? globalThis.String(object.stopReason) : "",
+      batchesSaved: isSet(object.batchesSaved) ? globalThis.Number(object.batchesSaved) : 0,
     };
   },
 
@@ -267,6 +884,18 @@ export const TrainingMetric: MessageFns<TrainingMetric> = {
     if (message.imageIds?.length) {
       obj.imageIds = message.imageIds.map((e) => Math.round(e));
     }
+    if (message.seq !== 0) {
+      obj.seq = Math.round(message.seq);
+    }
+    if (message.packed !== undefined) {
+      obj.packed = PackedSamples.toJSON(message.packed);
+    }
+    if (message.stopReason !== "") {
+      obj.stopReason = message.stopReason;
+    }
+    if (message.batchesSaved !== 0) {
+      obj.batchesSaved = Math.round(message.batchesSaved);
+    }
     return obj;
   },
 
@@ -283,16 +912,75 @@ export const TrainingMetric: MessageFns<TrainingMetric> = {
     message.truths = object.truths?.map((e) => e) || [];
     message.scores = object.scores?.map((e) => e) || [];
     message.imageIds = object.imageIds?.map((e) => e) || [];
+    message.seq = object.seq ?? 0;
+    message.packed = (object.packed !== undefined && object.packed !== null)
+      ? PackedSamples.fromPartial(object.packed)
+      : undefined;
+    message.stopReason = object.stopReason ?? "";
+    message.batchesSaved = object.batchesSaved ?? 0;
     return message;
   },
 };
 
 function createBaseSubscribeReq(): SubscribeReq {
-  return {};
+  return {
+    fromSeq: undefined,
+    packed: false,
+    scoreEncoding: 0,
+    compress: false,
+    fields: [],
+    everyNth: 0,
+    minEpoch: undefined,
+    maxEpoch: undefined,
+    minBatch: undefined,
+    maxBatch: undefined,
+    misclassifiedOnly: false,
+    jobId: "",
+    run: "",
+  };
 }
 
 export const SubscribeReq: MessageFns<SubscribeReq> = {
-  encode(_: SubscribeReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+  encode(message: SubscribeReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.fromSeq !== undefined) {
+      writer.uint32(8).int64(message.fromSeq);
+    }
+    if (message.packed !== false) {
+      writer.uint32(16).bool(message.packed);
+    }
+    if (message.scoreEncoding !== 0) {
+      writer.uint32(24).int32(message.scoreEncoding);
+    }
+    if (message.compress !== false) {
+      writer.uint32(32).bool(message.compress);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
+    if (message.everyNth !== 0) {
+      writer.uint32(48).int32(message.everyNth);
+    }
+    if (message.minEpoch !== undefined) {
+      writer.uint32(56).int32(message.minEpoch);
+    }
+    if (message.maxEpoch !== undefined) {
+      writer.uint32(64).int32(message.maxEpoch);
+    }
+    if (message.minBatch !== undefined) {
+      writer.uint32(72).int32(message.minBatch);
+    }
+    if (message.maxBatch !== undefined) {
+      writer.uint32(80).int32(message.maxBatch);
+    }
+    if (message.misclassifiedOnly !== false) {
+      writer.uint32(88).bool(message.misclassifiedOnly);
+    }
+    if (message.jobId !== "") {
+      writer.uint32(98).string(message.jobId);
+    }
+    if (message.run !== "") {
+      writer.uint32(106).string(message.run);
+    }
     return writer;
   },
 
@@ -303,49 +991,110 @@ export const SubscribeReq: MessageFns<SubscribeReq> = {
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
-      }
-      if ((tag & 7) === 4 || tag === 0) {
-        break;
-      }
-      reader.skip(tag & 7);
-    }
-    return message;
-  },
-
-  fromJSON(_: any): SubscribeReq {
-    return {};
-  },
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
 
-  toJSON(_: SubscribeReq): unknown {
-    const obj: any = {};
-    return obj;
-  },
+          message.fromSeq = longToNumber(reader.int64());
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
 
-  create<I extends Exact<DeepPartial<SubscribeReq>, I>>(base?: I): SubscribeReq {
-    return SubscribeReq.fromPartial(base ?? ({} as any));
-  },
-  fromPartial<I extends Exact<DeepPartial<SubscribeReq>, I>>(_: I): SubscribeReq {
-    const message = createBaseSubscribeReq();
-    return message;
-  },
-};
+          message.packed = reader.bool();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
 
-function createBaseStatusReq(): StatusReq {
-  return {};
-}
+          message.scoreEncoding = reader.int32() as any;
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
 
-export const StatusReq: MessageFns<StatusReq> = {
-  encode(_: StatusReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    return writer;
-  },
+          message.compress = reader.bool();
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
 
-  decode(input: BinaryReader | Uint8Array, length?: number): StatusReq {
-    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
-    const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseStatusReq();
-    while (reader.pos < end) {
-      const tag = reader.uint32();
-      switch (tag >>> 3) {
+          message.fields.push(reader.string());
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.everyNth = reader.int32();
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.minEpoch = reader.int32();
+          continue;
+        }
+        case 8: {
+          if (tag !== 64) {
+            break;
+          }
+
+          message.maxEpoch = reader.int32();
+          continue;
+        }
+        case 9: {
+          if (tag !== 72) {
+            break;
+          }
+
+          message.minBatch = reader.int32();
+          continue;
+        }
+        case 10: {
+          if (tag !== 80) {
+            break;
+          }
+
+          message.maxBatch = reader.int32();
+          continue;
+        }
+        case 11: {
+          if (tag !== 88) {
+            break;
+          }
+
+          message.misclassifiedOnly = reader.bool();
+          continue;
+        }
+        case 12: {
+          if (tag !== 98) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+        case 13: {
+          if (tag !== 106) {
+            break;
+          }
+
+          message.run = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -355,46 +1104,115 @@ export const StatusReq: MessageFns<StatusReq> = {
     return message;
   },
 
-  fromJSON(_: any): StatusReq {
-    return {};
+  fromJSON(object: any): SubscribeReq {
+    return {
+      fromSeq: isSet(object.fromSeq) ? globalThis.Number(object.fromSeq) : undefined,
+      packed: isSet(object.packed) ? globalThis.Boolean(object.packed) : false,
+      scoreEncoding: isSet(object.scoreEncoding) ? scoreEncodingFromJSON(object.scoreEncoding) : 0,
+      compress: isSet(object.compress) ? globalThis.Boolean(object.compress) : false,
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
+      everyNth: isSet(object.everyNth) ? globalThis.Number(object.everyNth) : 0,
+      minEpoch: isSet(object.minEpoch) ? globalThis.Number(object.minEpoch) : undefined,
+      maxEpoch: isSet(object.maxEpoch) ? globalThis.Number(object.maxEpoch) : undefined,
+      minBatch: isSet(object.minBatch) ? globalThis.Number(object.minBatch) : undefined,
+      maxBatch: isSet(object.maxBatch) ? globalThis.Number(object.maxBatch) : undefined,
+      misclassifiedOnly: isSet(object.misclassifiedOnly) ? globalThis.Boolean(object.misclassifiedOnly) : false,
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+      run: isSet(object.run) ? globalThis.String(object.run) : "",
+    };
   },
 
-  toJSON(_: StatusReq): unknown {
+  toJSON(message: SubscribeReq): unknown {
     const obj: any = {};
+    if (message.fromSeq !== undefined) {
+      obj.fromSeq = Math.round(message.fromSeq);
+    }
+    if (message.packed !== false) {
+      obj.packed = message.packed;
+    }
+    if (message.scoreEncoding !== 0) {
+      obj.scoreEncoding = scoreEncodingToJSON(message.scoreEncoding);
+    }
+    if (message.compress !== false) {
+      obj.compress = message.compress;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
+    if (message.everyNth !== 0) {
+      obj.everyNth = Math.round(message.everyNth);
+    }
+    if (message.minEpoch !== undefined) {
+      obj.minEpoch = Math.round(message.minEpoch);
+    }
+    if (message.maxEpoch !== undefined) {
+      obj.maxEpoch = Math.round(message.maxEpoch);
+    }
+    if (message.minBatch !== undefined) {
+      obj.minBatch = Math.round(message.minBatch);
+    }
+    if (message.maxBatch !== undefined) {
+      obj.maxBatch = Math.round(message.maxBatch);
+    }
+    if (message.misclassifiedOnly !== false) {
+      obj.misclassifiedOnly = message.misclassifiedOnly;
+    }
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    if (message.run !== "") {
+      obj.run = message.run;
+    }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<StatusReq>, I>>(base?: I): StatusReq {
-    return StatusReq.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<SubscribeReq>, I>>(base?: I): SubscribeReq {
+    return SubscribeReq.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<StatusReq>, I>>(_: I): StatusReq {
-    const message = createBaseStatusReq();
+  fromPartial<I extends Exact<DeepPartial<SubscribeReq>, I>>(object: I): SubscribeReq {
+    const message = createBaseSubscribeReq();
+    message.fromSeq = object.fromSeq ?? undefined;
+    message.packed = object.packed ?? false;
+    message.scoreEncoding = object.scoreEncoding ?? 0;
+    message.compress = object.compress ?? false;
+    message.fields = object.fields?.map((e) => e) || [];
+    message.everyNth = object.everyNth ?? 0;
+    message.minEpoch = object.minEpoch ?? undefined;
+    message.maxEpoch = object.maxEpoch ?? undefined;
+    message.minBatch = object.minBatch ?? undefined;
+    message.maxBatch = object.maxBatch ?? undefined;
+    message.misclassifiedOnly = object.misclassifiedOnly ?? false;
+    message.jobId = object.jobId ?? "";
+    message.run = object.run ?? "";
     return message;
   },
 };
 
-function createBaseStatusRes(): StatusRes {
-  return { status: "", message: "", epoch: 0 };
+function createBaseSubscribeBatchReq(): SubscribeBatchReq {
+  return { subscribe: undefined, maxCount: 0, maxBytes: 0, maxLatencyMs: undefined };
 }
 
-export const StatusRes: MessageFns<StatusRes> = {
-  encode(message: StatusRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.status !== "") {
-      writer.uint32(10).string(message.status);
+export const SubscribeBatchReq: MessageFns<SubscribeBatchReq> = {
+  encode(message: SubscribeBatchReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.subscribe !== undefined) {
+      SubscribeReq.encode(message.subscribe, writer.uint32(10).fork()).join();
     }
-    if (message.message !== "") {
-      writer.uint32(18).string(message.message);
+    if (message.maxCount !== 0) {
+      writer.uint32(16).int32(message.maxCount);
     }
-    if (message.epoch !== 0) {
-      writer.uint32(24).int32(message.epoch);
+    if (message.maxBytes !== 0) {
+      writer.uint32(24).int32(message.maxBytes);
+    }
+    if (message.maxLatencyMs !== undefined) {
+      writer.uint32(32).int32(message.maxLatencyMs);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): StatusRes {
+  decode(input: BinaryReader | Uint8Array, length?: number): SubscribeBatchReq {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseStatusRes();
+    const message = createBaseSubscribeBatchReq();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -403,15 +1221,15 @@ export const StatusRes: MessageFns<StatusRes> = {
             break;
           }
 
-          message.status = reader.string();
+          message.subscribe = SubscribeReq.decode(reader, reader.uint32());
           continue;
         }
         case 2: {
-          if (tag !== 18) {
+          if (tag !== 16) {
             break;
           }
 
-          message.message = reader.string();
+          message.maxCount = reader.int32();
           continue;
         }
         case 3: {
@@ -419,7 +1237,15 @@ export const StatusRes: MessageFns<StatusRes> = {
             break;
           }
 
-          message.epoch = reader.int32();
+          message.maxBytes = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.maxLatencyMs = reader.int32();
           continue;
         }
       }
@@ -431,76 +1257,72 @@ export const StatusRes: MessageFns<StatusRes> = {
     return message;
   },
 
-  fromJSON(object: any): StatusRes {
+  fromJSON(object: any): SubscribeBatchReq {
     return {
-      status: isSet(object.status) ? globalThis.String(object.status) : "",
-      message: isSet(object.message) ? globalThis.String(object.message) : "",
-      epoch: isSet(object.epoch) ? globalThis.Number(object.epoch) : 0,
+      subscribe: isSet(object.subscribe) ? SubscribeReq.fromJSON(object.subscribe) : undefined,
+      maxCount: isSet(object.maxCount) ? globalThis.Number(object.maxCount) : 0,
+      maxBytes: isSet(object.maxBytes) ? globalThis.Number(object.maxBytes) : 0,
+      maxLatencyMs: isSet(object.maxLatencyMs) ? globalThis.Number(object.maxLatencyMs) : undefined,
     };
   },
 
-  toJSON(message: StatusRes): unknown {
+  toJSON(message: SubscribeBatchReq): unknown {
     const obj: any = {};
-    if (message.status !== "") {
-      obj.status = message.status;
+    if (message.subscribe !== undefined) {
+      obj.subscribe = SubscribeReq.toJSON(message.subscribe);
     }
-    if (message.message !== "") {
-      obj.message = message.message;
+    if (message.maxCount !== 0) {
+      obj.maxCount = Math.round(message.maxCount);
     }
-    if (message.epoch !== 0) {
-      obj.epoch = Math.round(message.epoch);
+    if (message.maxBytes !== 0) {
+      obj.maxBytes = Math.round(message.maxBytes);
+    }
+    if (message.maxLatencyMs !== undefined) {
+      obj.maxLatencyMs = Math.round(message.maxLatencyMs);
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<StatusRes>, I>>(base?: I): StatusRes {
-    return StatusRes.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<SubscribeBatchReq>, I>>(base?: I): SubscribeBatchReq {
+    return SubscribeBatchReq.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<StatusRes>, I>>(object: I): StatusRes {
-    const message = createBaseStatusRes();
-    message.status = object.status ?? "";
-    message.message = object.message ?? "";
-    message.epoch = object.epoch ?? 0;
+  fromPartial<I extends Exact<DeepPartial<SubscribeBatchReq>, I>>(object: I): SubscribeBatchReq {
+    const message = createBaseSubscribeBatchReq();
+    message.subscribe = (object.subscribe !== undefined && object.subscribe !== null)
+      ? SubscribeReq.fromPartial(object.subscribe)
+      : undefined;
+    message.maxCount = object.maxCount ?? 0;
+    message.maxBytes = object.maxBytes ?? 0;
+    message.maxLatencyMs = object.maxLatencyMs ?? undefined;
     return message;
   },
 };
 
-function createBaseStartReq(): StartReq {
-  return { numEpochs: 0, confirmed: false };
+function createBaseTrainingMetricBatch(): TrainingMetricBatch {
+  return { metrics: [] };
 }
 
-export const StartReq: MessageFns<StartReq> = {
-  encode(message: StartReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.numEpochs !== 0) {
-      writer.uint32(8).int32(message.numEpochs);
-    }
-    if (message.confirmed !== false) {
-      writer.uint32(16).bool(message.confirmed);
+export const TrainingMetricBatch: MessageFns<TrainingMetricBatch> = {
+  encode(message: TrainingMetricBatch, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.metrics) {
+      TrainingMetric.encode(v!, writer.uint32(10).fork()).join();
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): StartReq {
+  decode(input: BinaryReader | Uint8Array, length?: number): TrainingMetricBatch {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseStartReq();
+    const message = createBaseTrainingMetricBatch();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
         case 1: {
-          if (tag !== 8) {
-            break;
-          }
-
-          message.numEpochs = reader.int32();
-          continue;
-        }
-        case 2: {
-          if (tag !== 16) {
+          if (tag !== 10) {
             break;
           }
 
-          message.confirmed = reader.bool();
+          message.metrics.push(TrainingMetric.decode(reader, reader.uint32()));
           continue;
         }
       }
@@ -512,71 +1334,57 @@ export const StartReq: MessageFns<StartReq> = {
     return message;
   },
 
-  fromJSON(object: any): StartReq {
+  fromJSON(object: any): TrainingMetricBatch {
     return {
-      numEpochs: isSet(object.numEpochs) ? globalThis.Number(object.numEpochs) : 0,
-      confirmed: isSet(object.confirmed) ? globalThis.Boolean(object.confirmed) : false,
+      metrics: globalThis.Array.isArray(object?.metrics)
+        ? object.metrics.map((e: any) => TrainingMetric.fromJSON(e))
+        : [],
     };
   },
 
-  toJSON(message: StartReq): unknown {
+  toJSON(message: TrainingMetricBatch): unknown {
     const obj: any = {};
-    if (message.numEpochs !== 0) {
-      obj.numEpochs = Math.round(message.numEpochs);
-    }
-    if (message.confirmed !== false) {
-      obj.confirmed = message.confirmed;
+    if (message.metrics?.length) {
+      obj.metrics = message.metrics.map((e) => TrainingMetric.toJSON(e));
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<StartReq>, I>>(base?: I): StartReq {
-    return StartReq.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<TrainingMetricBatch>, I>>(base?: I): TrainingMetricBatch {
+    return TrainingMetricBatch.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<StartReq>, I>>(object: I): StartReq {
-    const message = createBaseStartReq();
-    message.numEpochs = object.numEpochs ?? 0;
-    message.confirmed = object.confirmed ?? false;
+  fromPartial<I extends Exact<DeepPartial<TrainingMetricBatch>, I>>(object: I): TrainingMetricBatch {
+    const message = createBaseTrainingMetricBatch();
+    message.metrics = object.metrics?.map((e) => TrainingMetric.fromPartial(e)) || [];
     return message;
   },
 };
 
-function createBaseStartRes(): StartRes {
-  return { status: "", message: "" };
+function createBaseSubscribeEvalReq(): SubscribeEvalReq {
+  return { fromSeq: undefined };
 }
 
-export const StartRes: MessageFns<StartRes> = {
-  encode(message: StartRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.status !== "") {
-      writer.uint32(10).string(message.status);
-    }
-    if (message.message !== "") {
-      writer.uint32(18).string(message.message);
+export const SubscribeEvalReq: MessageFns<SubscribeEvalReq> = {
+  encode(message: SubscribeEvalReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.fromSeq !== undefined) {
+      writer.uint32(8).int64(message.fromSeq);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): StartRes {
+  decode(input: BinaryReader | Uint8Array, length?: number): SubscribeEvalReq {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     const end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseStartRes();
+    const message = createBaseSubscribeEvalReq();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
         case 1: {
-          if (tag !== 10) {
-            break;
-          }
-
-          message.status = reader.string();
-          continue;
-        }
-        case 2: {
-          if (tag !== 18) {
+          if (tag !== 8) {
             break;
           }
 
-          message.message = reader.string();
+          message.fromSeq = longToNumber(reader.int64());
           continue;
         }
       }
@@ -588,80 +1396,3625 @@ export const StartRes: MessageFns<StartRes> = {
     return message;
   },
 
-  fromJSON(object: any): StartRes {
+  fromJSON(object: any): SubscribeEvalReq {
     return {
-      status: isSet(object.status) ? globalThis.String(object.status) : "",
-      message: isSet(object.message) ? globalThis.String(object.message) : "",
+      fromSeq: isSet(object.fromSeq) ? globalThis.Number(object.fromSeq) : undefined,
     };
   },
 
-  toJSON(message: StartRes): unknown {
+  toJSON(message: SubscribeEvalReq): unknown {
     const obj: any = {};
-    if (message.status !== "") {
-      obj.status = message.status;
-    }
-    if (message.message !== "") {
-      obj.message = message.message;
+    if (message.fromSeq !== undefined) {
+      obj.fromSeq = Math.round(message.fromSeq);
     }
     return obj;
   },
 
-  create<I extends Exact<DeepPartial<StartRes>, I>>(base?: I): StartRes {
-    return StartRes.fromPartial(base ?? ({} as any));
+  create<I extends Exact<DeepPartial<SubscribeEvalReq>, I>>(base?: I): SubscribeEvalReq {
+    return SubscribeEvalReq.fromPartial(base ?? ({} as any));
   },
-  fromPartial<I extends Exact<DeepPartial<StartRes>, I>>(object: I): StartRes {
-    const message = createBaseStartRes();
-    message.status = object.status ?? "";
-    message.message = object.message ?? "";
+  fromPartial<I extends Exact<DeepPartial<SubscribeEvalReq>, I>>(object: I): SubscribeEvalReq {
+    const message = createBaseSubscribeEvalReq();
+    message.fromSeq = object.fromSeq ?? undefined;
     return message;
   },
 };
 
-export type TrainingService = typeof TrainingService;
-export const TrainingService = {
-  /** Check server status (handshake) */
-  status: {
-    path: "/services.Training/Status",
-    requestStream: false,
-    responseStream: false,
-    requestSerialize: (value: StatusReq): Buffer => Buffer.from(StatusReq.encode(value).finish()),
-    requestDeserialize: (value: Buffer): StatusReq => StatusReq.decode(value),
-    responseSerialize: (value: StatusRes): Buffer => Buffer.from(StatusRes.encode(value).finish()),
-    responseDeserialize: (value: Buffer): StatusRes => StatusRes.decode(value),
-  },
-  /** Start training with epochs and confirmation (stateless) */
-  start: {
-    path: "/services.Training/Start",
-    requestStream: false,
-    responseStream: false,
-    requestSerialize: (value: StartReq): Buffer => Buffer.from(StartReq.encode(value).finish()),
-    requestDeserialize: (value: Buffer): StartReq => StartReq.decode(value),
-    responseSerialize: (value: StartRes): Buffer => Buffer.from(StartRes.encode(value).finish()),
-    responseDeserialize: (value: Buffer): StartRes => StartRes.decode(value),
-  },
-  /** Client subscribes to stream of metrics from server */
-  subscribe: {
-    path: "/services.Training/Subscribe",
-    requestStream: false,
-    responseStream: true,
-    requestSerialize: (value: SubscribeReq): Buffer => Buffer.from(SubscribeReq.encode(value).finish()),
-    requestDeserialize: (value: Buffer): SubscribeReq => SubscribeReq.decode(value),
-    responseSerialize: (value: TrainingMetric): Buffer => Buffer.from(TrainingMetric.encode(value).finish()),
-    responseDeserialize: (value: Buffer): TrainingMetric => TrainingMetric.decode(value),
+function createBaseEvalMetric(): EvalMetric {
+  return {
+    seq: 0,
+    epoch: 0,
+    batch: 0,
+    version: 0,
+    loss: 0,
+    accuracy: 0,
+    classAccuracy: [],
+    samples: 0,
+    durationMs: 0,
+    jobId: "",
+  };
+}
+
+export const EvalMetric: MessageFns<EvalMetric> = {
+  encode(message: EvalMetric, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.seq !== 0) {
+      writer.uint32(8).int64(message.seq);
+    }
+    if (message.epoch !== 0) {
+      writer.uint32(16).int32(message.epoch);
+    }
+    if (message.batch !== 0) {
+      writer.uint32(24).int32(message.batch);
+    }
+    if (message.version !== 0) {
+      writer.uint32(32).int64(message.version);
+    }
+    if (message.loss !== 0) {
+      writer.uint32(45).float(message.loss);
+    }
+    if (message.accuracy !== 0) {
+      writer.uint32(53).float(message.accuracy);
+    }
+    writer.uint32(58).fork();
+    for (const v of message.classAccuracy) {
+      writer.float(v);
+    }
+    writer.join();
+    if (message.samples !== 0) {
+      writer.uint32(64).int32(message.samples);
+    }
+    if (message.durationMs !== 0) {
+      writer.uint32(77).float(message.durationMs);
+    }
+    if (message.jobId !== "") {
+      writer.uint32(82).string(message.jobId);
+    }
+    return writer;
   },
-} as const;
 
-export interface TrainingServer extends UntypedServiceImplementation {
-  /** Check server status (handshake) */
-  status: handleUnaryCall<StatusReq, StatusRes>;
-  /** Start training with epochs and confirmation (stateless) */
-  start: handleUnaryCall<StartReq, StartRes>;
-  /** Client subscribes to stream of metrics from server */
-  subscribe: handleServerStreamingCall<SubscribeReq, TrainingMetric>;
-}
+  decode(input: BinaryReader | Uint8Array, length?: number): EvalMetric {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseEvalMetric();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
 
-export interface TrainingClient extends Client {
-  /** Check server status (handshake) */
+          message.seq = longToNumber(reader.int64());
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.epoch = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.batch = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.version = longToNumber(reader.int64());
+          continue;
+        }
+        case 5: {
+          if (tag !== 45) {
+            break;
+          }
+
+          message.loss = reader.float();
+          continue;
+        }
+        case 6: {
+          if (tag !== 53) {
+            break;
+          }
+
+          message.accuracy = reader.float();
+          continue;
+        }
+        case 7: {
+          if (tag === 61) {
+            message.classAccuracy.push(reader.float());
+
+            continue;
+          }
+
+          if (tag === 58) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.classAccuracy.push(reader.float());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 8: {
+          if (tag !== 64) {
+            break;
+          }
+
+          message.samples = reader.int32();
+          continue;
+        }
+        case 9: {
+          if (tag !== 77) {
+            break;
+          }
+
+          message.durationMs = reader.float();
+          continue;
+        }
+        case 10: {
+          if (tag !== 82) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): EvalMetric {
+    return {
+      seq: isSet(object.seq) ? globalThis.Number(object.seq) : 0,
+      epoch: isSet(object.epoch) ? globalThis.Number(object.epoch) : 0,
+      batch: isSet(object.batch) ? globalThis.Number(object.batch) : 0,
+      version: isSet(object.version) ? globalThis.Number(object.version) : 0,
+      loss: isSet(object.loss) ? globalThis.Number(object.loss) : 0,
+      accuracy: isSet(object.accuracy) ? globalThis.Number(object.accuracy) : 0,
+      classAccuracy: globalThis.Array.isArray(object?.classAccuracy)
+        ? object.classAccuracy.map((e: any) => globalThis.Number(e))
+        : [],
+      samples: isSet(object.samples) ? globalThis.Number(object.samples) : 0,
+      durationMs: isSet(object.durationMs) ? globalThis.Number(object.durationMs) : 0,
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+    };
+  },
+
+  toJSON(message: EvalMetric): unknown {
+    const obj: any = {};
+    if (message.seq !== 0) {
+      obj.seq = Math.round(message.seq);
+    }
+    if (message.epoch !== 0) {
+      obj.epoch = Math.round(message.epoch);
+    }
+    if (message.batch !== 0) {
+      obj.batch = Math.round(message.batch);
+    }
+    if (message.version !== 0) {
+      obj.version = Math.round(message.version);
+    }
+    if (message.loss !== 0) {
+      obj.loss = message.loss;
+    }
+    if (message.accuracy !== 0) {
+      obj.accuracy = message.accuracy;
+    }
+    if (message.classAccuracy?.length) {
+      obj.classAccuracy = message.classAccuracy;
+    }
+    if (message.samples !== 0) {
+      obj.samples = Math.round(message.samples);
+    }
+    if (message.durationMs !== 0) {
+      obj.durationMs = message.durationMs;
+    }
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<EvalMetric>, I>>(base?: I): EvalMetric {
+    return EvalMetric.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<EvalMetric>, I>>(object: I): EvalMetric {
+    const message = createBaseEvalMetric();
+    message.seq = object.seq ?? 0;
+    message.epoch = object.epoch ?? 0;
+    message.batch = object.batch ?? 0;
+    message.version = object.version ?? 0;
+    message.loss = object.loss ?? 0;
+    message.accuracy = object.accuracy ?? 0;
+    message.classAccuracy = object.classAccuracy?.map((e) => e) || [];
+    message.samples = object.samples ?? 0;
+    message.durationMs = object.durationMs ?? 0;
+    message.jobId = object.jobId ?? "";
+    return message;
+  },
+};
+
+function createBaseStatusReq(): StatusReq {
+  return { jobId: "" };
+}
+
+export const StatusReq: MessageFns<StatusReq> = {
+  encode(message: StatusReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.jobId !== "") {
+      writer.uint32(10).string(message.jobId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatusReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatusReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatusReq {
+    return {
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+    };
+  },
+
+  toJSON(message: StatusReq): unknown {
+    const obj: any = {};
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatusReq>, I>>(base?: I): StatusReq {
+    return StatusReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatusReq>, I>>(object: I): StatusReq {
+    const message = createBaseStatusReq();
+    message.jobId = object.jobId ?? "";
+    return message;
+  },
+};
+
+function createBaseTrainModes(): TrainModes {
+  return { model: "", bf16: false, compiled: false, channelsLast: false };
+}
+
+export const TrainModes: MessageFns<TrainModes> = {
+  encode(message: TrainModes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.model !== "") {
+      writer.uint32(10).string(message.model);
+    }
+    if (message.bf16 !== false) {
+      writer.uint32(16).bool(message.bf16);
+    }
+    if (message.compiled !== false) {
+      writer.uint32(24).bool(message.compiled);
+    }
+    if (message.channelsLast !== false) {
+      writer.uint32(32).bool(message.channelsLast);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): TrainModes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseTrainModes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.model = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.bf16 = reader.bool();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.compiled = reader.bool();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.channelsLast = reader.bool();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): TrainModes {
+    return {
+      model: isSet(object.model) ? globalThis.String(object.model) : "",
+      bf16: isSet(object.bf16) ? globalThis.Boolean(object.bf16) : false,
+      compiled: isSet(object.compiled) ? globalThis.Boolean(object.compiled) : false,
+      channelsLast: isSet(object.channelsLast) ? globalThis.Boolean(object.channelsLast) : false,
+    };
+  },
+
+  toJSON(message: TrainModes): unknown {
+    const obj: any = {};
+    if (message.model !== "") {
+      obj.model = message.model;
+    }
+    if (message.bf16 !== false) {
+      obj.bf16 = message.bf16;
+    }
+    if (message.compiled !== false) {
+      obj.compiled = message.compiled;
+    }
+    if (message.channelsLast !== false) {
+      obj.channelsLast = message.channelsLast;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<TrainModes>, I>>(base?: I): TrainModes {
+    return TrainModes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<TrainModes>, I>>(object: I): TrainModes {
+    const message = createBaseTrainModes();
+    message.model = object.model ?? "";
+    message.bf16 = object.bf16 ?? false;
+    message.compiled = object.compiled ?? false;
+    message.channelsLast = object.channelsLast ?? false;
+    return message;
+  },
+};
+
+function createBaseStatusRes(): StatusRes {
+  return {
+    status: "",
+    message: "",
+    epoch: 0,
+    modes: undefined,
+    progress: 0,
+    jobId: "",
+    queued: 0,
+    running: 0,
+    stopReason: "",
+    batchesSaved: 0,
+    resources: undefined,
+  };
+}
+
+export const StatusRes: MessageFns<StatusRes> = {
+  encode(message: StatusRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.status !== "") {
+      writer.uint32(10).string(message.status);
+    }
+    if (message.message !== "") {
+      writer.uint32(18).string(message.message);
+    }
+    if (message.epoch !== 0) {
+      writer.uint32(24).int32(message.epoch);
+    }
+    if (message.modes !== undefined) {
+      TrainModes.encode(message.modes, writer.uint32(34).fork()).join();
+    }
+    if (message.progress !== 0) {
+      writer.uint32(45).float(message.progress);
+    }
+    if (message.jobId !== "") {
+      writer.uint32(50).string(message.jobId);
+    }
+    if (message.queued !== 0) {
+      writer.uint32(56).int32(message.queued);
+    }
+    if (message.running !== 0) {
+      writer.uint32(64).int32(message.running);
+    }
+    if (message.stopReason !== "") {
+      writer.uint32(74).string(message.stopReason);
+    }
+    if (message.batchesSaved !== 0) {
+      writer.uint32(80).int64(message.batchesSaved);
+    }
+    if (message.resources !== undefined) {
+      ResourceLayout.encode(message.resources, writer.uint32(90).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatusRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatusRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.status = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.message = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.epoch = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.modes = TrainModes.decode(reader, reader.uint32());
+          continue;
+        }
+        case 5: {
+          if (tag !== 45) {
+            break;
+          }
+
+          message.progress = reader.float();
+          continue;
+        }
+        case 6: {
+          if (tag !== 50) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.queued = reader.int32();
+          continue;
+        }
+        case 8: {
+          if (tag !== 64) {
+            break;
+          }
+
+          message.running = reader.int32();
+          continue;
+        }
+        case 9: {
+          if (tag !== 74) {
+            break;
+          }
+
+          message.stopReason = reader.string();
+          continue;
+        }
+        case 10: {
+          if (tag !== 80) {
+            break;
+          }
+
+          message.batchesSaved = longToNumber(reader.int64());
+          continue;
+        }
+        case 11: {
+          if (tag !== 90) {
+            break;
+          }
+
+          message.resources = ResourceLayout.decode(reader, reader.uint32());
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatusRes {
+    return {
+      status: isSet(object.status) ? globalThis.String(object.status) : "",
+      message: isSet(object.message) ? globalThis.String(object.message) : "",
+      epoch: isSet(object.epoch) ? globalThis.Number(object.epoch) : 0,
+      modes: isSet(object.modes) ? TrainModes.fromJSON(object.modes) : undefined,
+      progress: isSet(object.progress) ? globalThis.Number(object.progress) : 0,
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+      queued: isSet(object.queued) ? globalThis.Number(object.queued) : 0,
+      running: isSet(object.running) ? globalThis.Number(object.running) : 0,
+      stopReason: isSet(object.stopReason) ? globalThis.String(object.stopReason) : "",
+      batchesSaved: isSet(object.batchesSaved) ? globalThis.Number(object.batchesSaved) : 0,
+      resources: isSet(object.resources) ? ResourceLayout.fromJSON(object.resources) : undefined,
+    };
+  },
+
+  toJSON(message: StatusRes): unknown {
+    const obj: any = {};
+    if (message.status !== "") {
+      obj.status = message.status;
+    }
+    if (message.message !== "") {
+      obj.message = message.message;
+    }
+    if (message.epoch !== 0) {
+      obj.epoch = Math.round(message.epoch);
+    }
+    if (message.modes !== undefined) {
+      obj.modes = TrainModes.toJSON(message.modes);
+    }
+    if (message.progress !== 0) {
+      obj.progress = message.progress;
+    }
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    if (message.queued !== 0) {
+      obj.queued = Math.round(message.queued);
+    }
+    if (message.running !== 0) {
+      obj.running = Math.round(message.running);
+    }
+    if (message.stopReason !== "") {
+      obj.stopReason = message.stopReason;
+    }
+    if (message.batchesSaved !== 0) {
+      obj.batchesSaved = Math.round(message.batchesSaved);
+    }
+    if (message.resources !== undefined) {
+      obj.resources = ResourceLayout.toJSON(message.resources);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatusRes>, I>>(base?: I): StatusRes {
+    return StatusRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatusRes>, I>>(object: I): StatusRes {
+    const message = createBaseStatusRes();
+    message.status = object.status ?? "";
+    message.message = object.message ?? "";
+    message.epoch = object.epoch ?? 0;
+    message.modes = (object.modes !== undefined && object.modes !== null)
+      ? TrainModes.fromPartial(object.modes)
+      : undefined;
+    message.progress = object.progress ?? 0;
+    message.jobId = object.jobId ?? "";
+    message.queued = object.queued ?? 0;
+    message.running = object.running ?? 0;
+    message.stopReason = object.stopReason ?? "";
+    message.batchesSaved = object.batchesSaved ?? 0;
+    message.resources = (object.resources !== undefined && object.resources !== null)
+      ? ResourceLayout.fromPartial(object.resources)
+      : undefined;
+    return message;
+  },
+};
+
+function createBaseResourceLayout(): ResourceLayout {
+  return {
+    trainCores: [],
+    serveCores: [],
+    intraOpThreads: 0,
+    interOpThreads: 0,
+    jobThreads: 0,
+    grpcWorkers: 0,
+    pinned: false,
+  };
+}
+
+export const ResourceLayout: MessageFns<ResourceLayout> = {
+  encode(message: ResourceLayout, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    writer.uint32(10).fork();
+    for (const v of message.trainCores) {
+      writer.int32(v);
+    }
+    writer.join();
+    writer.uint32(18).fork();
+    for (const v of message.serveCores) {
+      writer.int32(v);
+    }
+    writer.join();
+    if (message.intraOpThreads !== 0) {
+      writer.uint32(24).int32(message.intraOpThreads);
+    }
+    if (message.interOpThreads !== 0) {
+      writer.uint32(32).int32(message.interOpThreads);
+    }
+    if (message.jobThreads !== 0) {
+      writer.uint32(40).int32(message.jobThreads);
+    }
+    if (message.grpcWorkers !== 0) {
+      writer.uint32(48).int32(message.grpcWorkers);
+    }
+    if (message.pinned !== false) {
+      writer.uint32(56).bool(message.pinned);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ResourceLayout {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseResourceLayout();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag === 8) {
+            message.trainCores.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 10) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.trainCores.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 2: {
+          if (tag === 16) {
+            message.serveCores.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 18) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.serveCores.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.intraOpThreads = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.interOpThreads = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.jobThreads = reader.int32();
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.grpcWorkers = reader.int32();
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.pinned = reader.bool();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ResourceLayout {
+    return {
+      trainCores: globalThis.Array.isArray(object?.trainCores)
+        ? object.trainCores.map((e: any) => globalThis.Number(e))
+        : [],
+      serveCores: globalThis.Array.isArray(object?.serveCores)
+        ? object.serveCores.map((e: any) => globalThis.Number(e))
+        : [],
+      intraOpThreads: isSet(object.intraOpThreads) ? globalThis.Number(object.intraOpThreads) : 0,
+      interOpThreads: isSet(object.interOpThreads) ? globalThis.Number(object.interOpThreads) : 0,
+      jobThreads: isSet(object.jobThreads) ? globalThis.Number(object.jobThreads) : 0,
+      grpcWorkers: isSet(object.grpcWorkers) ? globalThis.Number(object.grpcWorkers) : 0,
+      pinned: isSet(object.pinned) ? globalThis.Boolean(object.pinned) : false,
+    };
+  },
+
+  toJSON(message: ResourceLayout): unknown {
+    const obj: any = {};
+    if (message.trainCores?.length) {
+      obj.trainCores = message.trainCores.map((e) => Math.round(e));
+    }
+    if (message.serveCores?.length) {
+      obj.serveCores = message.serveCores.map((e) => Math.round(e));
+    }
+    if (message.intraOpThreads !== 0) {
+      obj.intraOpThreads = Math.round(message.intraOpThreads);
+    }
+    if (message.interOpThreads !== 0) {
+      obj.interOpThreads = Math.round(message.interOpThreads);
+    }
+    if (message.jobThreads !== 0) {
+      obj.jobThreads = Math.round(message.jobThreads);
+    }
+    if (message.grpcWorkers !== 0) {
+      obj.grpcWorkers = Math.round(message.grpcWorkers);
+    }
+    if (message.pinned !== false) {
+      obj.pinned = message.pinned;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ResourceLayout>, I>>(base?: I): ResourceLayout {
+    return ResourceLayout.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ResourceLayout>, I>>(object: I): ResourceLayout {
+    const message = createBaseResourceLayout();
+    message.trainCores = object.trainCores?.map((e) => e) || [];
+    message.serveCores = object.serveCores?.map((e) => e) || [];
+    message.intraOpThreads = object.intraOpThreads ?? 0;
+    message.interOpThreads = object.interOpThreads ?? 0;
+    message.jobThreads = object.jobThreads ?? 0;
+    message.grpcWorkers = object.grpcWorkers ?? 0;
+    message.pinned = object.pinned ?? false;
+    return message;
+  },
+};
+
+function createBaseStartReq(): StartReq {
+  return {
+    numEpochs: 0,
+    confirmed: false,
+    resume: false,
+    model: undefined,
+    bf16: undefined,
+    compile: undefined,
+    channelsLast: undefined,
+    lr: undefined,
+    batchSize: undefined,
+    patience: undefined,
+    priority: 0,
+    jobId: undefined,
+  };
+}
+
+export const StartReq: MessageFns<StartReq> = {
+  encode(message: StartReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.numEpochs !== 0) {
+      writer.uint32(8).int32(message.numEpochs);
+    }
+    if (message.confirmed !== false) {
+      writer.uint32(16).bool(message.confirmed);
+    }
+    if (message.resume !== false) {
+      writer.uint32(24).bool(message.resume);
+    }
+    if (message.model !== undefined) {
+      writer.uint32(34).string(message.model);
+    }
+    if (message.bf16 !== undefined) {
+      writer.uint32(40).bool(message.bf16);
+    }
+    if (message.compile !== undefined) {
+      writer.uint32(48).bool(message.compile);
+    }
+    if (message.channelsLast !== undefined) {
+      writer.uint32(56).bool(message.channelsLast);
+    }
+    if (message.lr !== undefined) {
+      writer.uint32(65).double(message.lr);
+    }
+    if (message.batchSize !== undefined) {
+      writer.uint32(72).int32(message.batchSize);
+    }
+    if (message.patience !== undefined) {
+      writer.uint32(96).int32(message.patience);
+    }
+    if (message.priority !== 0) {
+      writer.uint32(80).int32(message.priority);
+    }
+    if (message.jobId !== undefined) {
+      writer.uint32(90).string(message.jobId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StartReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStartReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.numEpochs = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.confirmed = reader.bool();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.resume = reader.bool();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.model = reader.string();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.bf16 = reader.bool();
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.compile = reader.bool();
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.channelsLast = reader.bool();
+          continue;
+        }
+        case 8: {
+          if (tag !== 65) {
+            break;
+          }
+
+          message.lr = reader.double();
+          continue;
+        }
+        case 9: {
+          if (tag !== 72) {
+            break;
+          }
+
+          message.batchSize = reader.int32();
+          continue;
+        }
+        case 12: {
+          if (tag !== 96) {
+            break;
+          }
+
+          message.patience = reader.int32();
+          continue;
+        }
+        case 10: {
+          if (tag !== 80) {
+            break;
+          }
+
+          message.priority = reader.int32();
+          continue;
+        }
+        case 11: {
+          if (tag !== 90) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StartReq {
+    return {
+      numEpochs: isSet(object.numEpochs) ? globalThis.Number(object.numEpochs) : 0,
+      confirmed: isSet(object.confirmed) ? globalThis.Boolean(object.confirmed) : false,
+      resume: isSet(object.resume) ? globalThis.Boolean(object.resume) : false,
+      model: isSet(object.model) ? globalThis.String(object.model) : undefined,
+      bf16: isSet(object.bf16) ? globalThis.Boolean(object.bf16) : undefined,
+      compile: isSet(object.compile) ? globalThis.Boolean(object.compile) : undefined,
+      channelsLast: isSet(object.channelsLast) ? globalThis.Boolean(object.channelsLast) : undefined,
+      lr: isSet(object.lr) ? globalThis.Number(object.lr) : undefined,
+      batchSize: isSet(object.batchSize) ? globalThis.Number(object.batchSize) : undefined,
+      patience: isSet(object.patience) ? globalThis.Number(object.patience) : undefined,
+      priority: isSet(object.priority) ? globalThis.Number(object.priority) : 0,
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : undefined,
+    };
+  },
+
+  toJSON(message: StartReq): unknown {
+    const obj: any = {};
+    if (message.numEpochs !== 0) {
+      obj.numEpochs = Math.round(message.numEpochs);
+    }
+    if (message.confirmed !== false) {
+      obj.confirmed = message.confirmed;
+    }
+    if (message.resume !== false) {
+      obj.resume = message.resume;
+    }
+    if (message.model !== undefined) {
+      obj.model = message.model;
+    }
+    if (message.bf16 !== undefined) {
+      obj.bf16 = message.bf16;
+    }
+    if (message.compile !== undefined) {
+      obj.compile = message.compile;
+    }
+    if (message.channelsLast !== undefined) {
+      obj.channelsLast = message.channelsLast;
+    }
+    if (message.lr !== undefined) {
+      obj.lr = message.lr;
+    }
+    if (message.batchSize !== undefined) {
+      obj.batchSize = Math.round(message.batchSize);
+    }
+    if (message.patience !== undefined) {
+      obj.patience = Math.round(message.patience);
+    }
+    if (message.priority !== 0) {
+      obj.priority = Math.round(message.priority);
+    }
+    if (message.jobId !== undefined) {
+      obj.jobId = message.jobId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StartReq>, I>>(base?: I): StartReq {
+    return StartReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StartReq>, I>>(object: I): StartReq {
+    const message = createBaseStartReq();
+    message.numEpochs = object.numEpochs ?? 0;
+    message.confirmed = object.confirmed ?? false;
+    message.resume = object.resume ?? false;
+    message.model = object.model ?? undefined;
+    message.bf16 = object.bf16 ?? undefined;
+    message.compile = object.compile ?? undefined;
+    message.channelsLast = object.channelsLast ?? undefined;
+    message.lr = object.lr ?? undefined;
+    message.batchSize = object.batchSize ?? undefined;
+    message.patience = object.patience ?? undefined;
+    message.priority = object.priority ?? 0;
+    message.jobId = object.jobId ?? undefined;
+    return message;
+  },
+};
+
+function createBaseStartRes(): StartRes {
+  return { status: "", message: "", jobId: "", position: 0, run: "" };
+}
+
+export const StartRes: MessageFns<StartRes> = {
+  encode(message: StartRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.status !== "") {
+      writer.uint32(10).string(message.status);
+    }
+    if (message.message !== "") {
+      writer.uint32(18).string(message.message);
+    }
+    if (message.jobId !== "") {
+      writer.uint32(26).string(message.jobId);
+    }
+    if (message.position !== 0) {
+      writer.uint32(32).int32(message.position);
+    }
+    if (message.run !== "") {
+      writer.uint32(42).string(message.run);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StartRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStartRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.status = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.message = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.position = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.run = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StartRes {
+    return {
+      status: isSet(object.status) ? globalThis.String(object.status) : "",
+      message: isSet(object.message) ? globalThis.String(object.message) : "",
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+      position: isSet(object.position) ? globalThis.Number(object.position) : 0,
+      run: isSet(object.run) ? globalThis.String(object.run) : "",
+    };
+  },
+
+  toJSON(message: StartRes): unknown {
+    const obj: any = {};
+    if (message.status !== "") {
+      obj.status = message.status;
+    }
+    if (message.message !== "") {
+      obj.message = message.message;
+    }
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    if (message.position !== 0) {
+      obj.position = Math.round(message.position);
+    }
+    if (message.run !== "") {
+      obj.run = message.run;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StartRes>, I>>(base?: I): StartRes {
+    return StartRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StartRes>, I>>(object: I): StartRes {
+    const message = createBaseStartRes();
+    message.status = object.status ?? "";
+    message.message = object.message ?? "";
+    message.jobId = object.jobId ?? "";
+    message.position = object.position ?? 0;
+    message.run = object.run ?? "";
+    return message;
+  },
+};
+
+function createBaseListJobsReq(): ListJobsReq {
+  return {};
+}
+
+export const ListJobsReq: MessageFns<ListJobsReq> = {
+  encode(_: ListJobsReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ListJobsReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListJobsReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(_: any): ListJobsReq {
+    return {};
+  },
+
+  toJSON(_: ListJobsReq): unknown {
+    const obj: any = {};
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListJobsReq>, I>>(base?: I): ListJobsReq {
+    return ListJobsReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListJobsReq>, I>>(_: I): ListJobsReq {
+    const message = createBaseListJobsReq();
+    return message;
+  },
+};
+
+function createBaseJobInfo(): JobInfo {
+  return {
+    jobId: "",
+    status: "",
+    epoch: 0,
+    numEpochs: 0,
+    priority: 0,
+    overrides: {},
+    modes: undefined,
+    stopReason: "",
+    batchesSaved: 0,
+    run: "",
+  };
+}
+
+export const JobInfo: MessageFns<JobInfo> = {
+  encode(message: JobInfo, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.jobId !== "") {
+      writer.uint32(10).string(message.jobId);
+    }
+    if (message.status !== "") {
+      writer.uint32(18).string(message.status);
+    }
+    if (message.epoch !== 0) {
+      writer.uint32(24).int32(message.epoch);
+    }
+    if (message.numEpochs !== 0) {
+      writer.uint32(32).int32(message.numEpochs);
+    }
+    if (message.priority !== 0) {
+      writer.uint32(40).int32(message.priority);
+    }
+    Object.entries(message.overrides).forEach(([key, value]) => {
+      JobInfo_OverridesEntry.encode({ key: key as any, value }, writer.uint32(50).fork()).join();
+    });
+    if (message.modes !== undefined) {
+      TrainModes.encode(message.modes, writer.uint32(58).fork()).join();
+    }
+    if (message.stopReason !== "") {
+      writer.uint32(66).string(message.stopReason);
+    }
+    if (message.batchesSaved !== 0) {
+      writer.uint32(72).int64(message.batchesSaved);
+    }
+    if (message.run !== "") {
+      writer.uint32(82).string(message.run);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): JobInfo {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseJobInfo();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.status = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.epoch = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.numEpochs = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.priority = reader.int32();
+          continue;
+        }
+        case 6: {
+          if (tag !== 50) {
+            break;
+          }
+
+          const entry6 = JobInfo_OverridesEntry.decode(reader, reader.uint32());
+          if (entry6.value !== undefined) {
+            message.overrides[entry6.key] = entry6.value;
+          }
+          continue;
+        }
+        case 7: {
+          if (tag !== 58) {
+            break;
+          }
+
+          message.modes = TrainModes.decode(reader, reader.uint32());
+          continue;
+        }
+        case 8: {
+          if (tag !== 66) {
+            break;
+          }
+
+          message.stopReason = reader.string();
+          continue;
+        }
+        case 9: {
+          if (tag !== 72) {
+            break;
+          }
+
+          message.batchesSaved = longToNumber(reader.int64());
+          continue;
+        }
+        case 10: {
+          if (tag !== 82) {
+            break;
+          }
+
+          message.run = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): JobInfo {
+    return {
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+      status: isSet(object.status) ? globalThis.String(object.status) : "",
+      epoch: isSet(object.epoch) ? globalThis.Number(object.epoch) : 0,
+      numEpochs: isSet(object.numEpochs) ? globalThis.Number(object.numEpochs) : 0,
+      priority: isSet(object.priority) ? globalThis.Number(object.priority) : 0,
+      overrides: isObject(object.overrides)
+        ? (globalThis.Object.entries(object.overrides) as [string, any][]).reduce(
+          (acc: { [key: string]: string }, [key, value]: [string, any]) => {
+            acc[key] = globalThis.String(value);
+            return acc;
+          },
+          {},
+        )
+        : {},
+      modes: isSet(object.modes) ? TrainModes.fromJSON(object.modes) : undefined,
+      stopReason: isSet(object.stopReason) ? globalThis.String(object.stopReason) : "",
+      batchesSaved: isSet(object.batchesSaved) ? globalThis.Number(object.batchesSaved) : 0,
+      run: isSet(object.run) ? globalThis.String(object.run) : "",
+    };
+  },
+
+  toJSON(message: JobInfo): unknown {
+    const obj: any = {};
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    if (message.status !== "") {
+      obj.status = message.status;
+    }
+    if (message.epoch !== 0) {
+      obj.epoch = Math.round(message.epoch);
+    }
+    if (message.numEpochs !== 0) {
+      obj.numEpochs = Math.round(message.numEpochs);
+    }
+    if (message.priority !== 0) {
+      obj.priority = Math.round(message.priority);
+    }
+    if (message.overrides) {
+      const entries = globalThis.Object.entries(message.overrides) as [string, string][];
+      if (entries.length > 0) {
+        obj.overrides = {};
+        entries.forEach(([k, v]) => {
+          obj.overrides[k] = v;
+        });
+      }
+    }
+    if (message.modes !== undefined) {
+      obj.modes = TrainModes.toJSON(message.modes);
+    }
+    if (message.stopReason !== "") {
+      obj.stopReason = message.stopReason;
+    }
+    if (message.batchesSaved !== 0) {
+      obj.batchesSaved = Math.round(message.batchesSaved);
+    }
+    if (message.run !== "") {
+      obj.run = message.run;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<JobInfo>, I>>(base?: I): JobInfo {
+    return JobInfo.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<JobInfo>, I>>(object: I): JobInfo {
+    const message = createBaseJobInfo();
+    message.jobId = object.jobId ?? "";
+    message.status = object.status ?? "";
+    message.epoch = object.epoch ?? 0;
+    message.numEpochs = object.numEpochs ?? 0;
+    message.priority = object.priority ?? 0;
+    message.overrides = (globalThis.Object.entries(object.overrides ?? {}) as [string, string][]).reduce(
+      (acc: { [key: string]: string }, [key, value]: [string, string]) => {
+        if (value !== undefined) {
+          acc[key] = globalThis.String(value);
+        }
+        return acc;
+      },
+      {},
+    );
+    message.modes = (object.modes !== undefined && object.modes !== null)
+      ? TrainModes.fromPartial(object.modes)
+      : undefined;
+    message.stopReason = object.stopReason ?? "";
+    message.batchesSaved = object.batchesSaved ?? 0;
+    message.run = object.run ?? "";
+    return message;
+  },
+};
+
+function createBaseJobInfo_OverridesEntry(): JobInfo_OverridesEntry {
+  return { key: "", value: "" };
+}
+
+export const JobInfo_OverridesEntry: MessageFns<JobInfo_OverridesEntry> = {
+  encode(message: JobInfo_OverridesEntry, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.key !== "") {
+      writer.uint32(10).string(message.key);
+    }
+    if (message.value !== "") {
+      writer.uint32(18).string(message.value);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): JobInfo_OverridesEntry {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseJobInfo_OverridesEntry();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.key = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.value = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): JobInfo_OverridesEntry {
+    return {
+      key: isSet(object.key) ? globalThis.String(object.key) : "",
+      value: isSet(object.value) ? globalThis.String(object.value) : "",
+    };
+  },
+
+  toJSON(message: JobInfo_OverridesEntry): unknown {
+    const obj: any = {};
+    if (message.key !== "") {
+      obj.key = message.key;
+    }
+    if (message.value !== "") {
+      obj.value = message.value;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<JobInfo_OverridesEntry>, I>>(base?: I): JobInfo_OverridesEntry {
+    return JobInfo_OverridesEntry.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<JobInfo_OverridesEntry>, I>>(object: I): JobInfo_OverridesEntry {
+    const message = createBaseJobInfo_OverridesEntry();
+    message.key = object.key ?? "";
+    message.value = object.value ?? "";
+    return message;
+  },
+};
+
+function createBaseListJobsRes(): ListJobsRes {
+  return { jobs: [] };
+}
+
+export const ListJobsRes: MessageFns<ListJobsRes> = {
+  encode(message: ListJobsRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.jobs) {
+      JobInfo.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ListJobsRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseListJobsRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.jobs.push(JobInfo.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ListJobsRes {
+    return {
+      jobs: globalThis.Array.isArray(object?.jobs) ? object.jobs.map((e: any) => JobInfo.fromJSON(e)) : [],
+    };
+  },
+
+  toJSON(message: ListJobsRes): unknown {
+    const obj: any = {};
+    if (message.jobs?.length) {
+      obj.jobs = message.jobs.map((e) => JobInfo.toJSON(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ListJobsRes>, I>>(base?: I): ListJobsRes {
+    return ListJobsRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ListJobsRes>, I>>(object: I): ListJobsRes {
+    const message = createBaseListJobsRes();
+    message.jobs = object.jobs?.map((e) => JobInfo.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBasePredictReq(): PredictReq {
+  return { images: Buffer.alloc(0) };
+}
+
+export const PredictReq: MessageFns<PredictReq> = {
+  encode(message: PredictReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.images.length !== 0) {
+      writer.uint32(10).bytes(message.images);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): PredictReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBasePredictReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.images = Buffer.from(reader.bytes());
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): PredictReq {
+    return {
+      images: isSet(object.images) ? Buffer.from(bytesFromBase64(object.images)) : Buffer.alloc(0),
+    };
+  },
+
+  toJSON(message: PredictReq): unknown {
+    const obj: any = {};
+    if (message.images.length !== 0) {
+      obj.images = base64FromBytes(message.images);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<PredictReq>, I>>(base?: I): PredictReq {
+    return PredictReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<PredictReq>, I>>(object: I): PredictReq {
+    const message = createBasePredictReq();
+    message.images = object.images ?? Buffer.alloc(0);
+    return message;
+  },
+};
+
+function createBasePrediction(): Prediction {
+  return { label: 0, score: 0, probs: [] };
+}
+
+export const Prediction: MessageFns<Prediction> = {
+  encode(message: Prediction, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.label !== 0) {
+      writer.uint32(8).int32(message.label);
+    }
+    if (message.score !== 0) {
+      writer.uint32(21).float(message.score);
+    }
+    writer.uint32(26).fork();
+    for (const v of message.probs) {
+      writer.float(v);
+    }
+    writer.join();
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): Prediction {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBasePrediction();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.label = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 21) {
+            break;
+          }
+
+          message.score = reader.float();
+          continue;
+        }
+        case 3: {
+          if (tag === 29) {
+            message.probs.push(reader.float());
+
+            continue;
+          }
+
+          if (tag === 26) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.probs.push(reader.float());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): Prediction {
+    return {
+      label: isSet(object.label) ? globalThis.Number(object.label) : 0,
+      score: isSet(object.score) ? globalThis.Number(object.score) : 0,
+      probs: globalThis.Array.isArray(object?.probs) ? object.probs.map((e: any) => globalThis.Number(e)) : [],
+    };
+  },
+
+  toJSON(message: Prediction): unknown {
+    const obj: any = {};
+    if (message.label !== 0) {
+      obj.label = Math.round(message.label);
+    }
+    if (message.score !== 0) {
+      obj.score = message.score;
+    }
+    if (message.probs?.length) {
+      obj.probs = message.probs;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<Prediction>, I>>(base?: I): Prediction {
+    return Prediction.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<Prediction>, I>>(object: I): Prediction {
+    const message = createBasePrediction();
+    message.label = object.label ?? 0;
+    message.score = object.score ?? 0;
+    message.probs = object.probs?.map((e) => e) || [];
+    return message;
+  },
+};
+
+function createBasePredictRes(): PredictRes {
+  return { predictions: [], version: 0, epoch: 0, batch: 0, jobId: "" };
+}
+
+export const PredictRes: MessageFns<PredictRes> = {
+  encode(message: PredictRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.predictions) {
+      Prediction.encode(v!, writer.uint32(10).fork()).join();
+    }
+    if (message.version !== 0) {
+      writer.uint32(16).int64(message.version);
+    }
+    if (message.epoch !== 0) {
+      writer.uint32(24).int32(message.epoch);
+    }
+    if (message.batch !== 0) {
+      writer.uint32(32).int32(message.batch);
+    }
+    if (message.jobId !== "") {
+      writer.uint32(42).string(message.jobId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): PredictRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBasePredictRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.predictions.push(Prediction.decode(reader, reader.uint32()));
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.version = longToNumber(reader.int64());
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.epoch = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.batch = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): PredictRes {
+    return {
+      predictions: globalThis.Array.isArray(object?.predictions)
+        ? object.predictions.map((e: any) => Prediction.fromJSON(e))
+        : [],
+      version: isSet(object.version) ? globalThis.Number(object.version) : 0,
+      epoch: isSet(object.epoch) ? globalThis.Number(object.epoch) : 0,
+      batch: isSet(object.batch) ? globalThis.Number(object.batch) : 0,
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+    };
+  },
+
+  toJSON(message: PredictRes): unknown {
+    const obj: any = {};
+    if (message.predictions?.length) {
+      obj.predictions = message.predictions.map((e) => Prediction.toJSON(e));
+    }
+    if (message.version !== 0) {
+      obj.version = Math.round(message.version);
+    }
+    if (message.epoch !== 0) {
+      obj.epoch = Math.round(message.epoch);
+    }
+    if (message.batch !== 0) {
+      obj.batch = Math.round(message.batch);
+    }
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<PredictRes>, I>>(base?: I): PredictRes {
+    return PredictRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<PredictRes>, I>>(object: I): PredictRes {
+    const message = createBasePredictRes();
+    message.predictions = object.predictions?.map((e) => Prediction.fromPartial(e)) || [];
+    message.version = object.version ?? 0;
+    message.epoch = object.epoch ?? 0;
+    message.batch = object.batch ?? 0;
+    message.jobId = object.jobId ?? "";
+    return message;
+  },
+};
+
+function createBaseImagesReq(): ImagesReq {
+  return { imageIds: [], test: false, format: 0, columns: 0 };
+}
+
+export const ImagesReq: MessageFns<ImagesReq> = {
+  encode(message: ImagesReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    writer.uint32(10).fork();
+    for (const v of message.imageIds) {
+      writer.int32(v);
+    }
+    writer.join();
+    if (message.test !== false) {
+      writer.uint32(16).bool(message.test);
+    }
+    if (message.format !== 0) {
+      writer.uint32(24).int32(message.format);
+    }
+    if (message.columns !== 0) {
+      writer.uint32(32).int32(message.columns);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ImagesReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseImagesReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag === 8) {
+            message.imageIds.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 10) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.imageIds.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.test = reader.bool();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.format = reader.int32() as any;
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.columns = reader.int32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ImagesReq {
+    return {
+      imageIds: globalThis.Array.isArray(object?.imageIds) ? object.imageIds.map((e: any) => globalThis.Number(e)) : [],
+      test: isSet(object.test) ? globalThis.Boolean(object.test) : false,
+      format: isSet(object.format) ? imageFormatFromJSON(object.format) : 0,
+      columns: isSet(object.columns) ? globalThis.Number(object.columns) : 0,
+    };
+  },
+
+  toJSON(message: ImagesReq): unknown {
+    const obj: any = {};
+    if (message.imageIds?.length) {
+      obj.imageIds = message.imageIds.map((e) => Math.round(e));
+    }
+    if (message.test !== false) {
+      obj.test = message.test;
+    }
+    if (message.format !== 0) {
+      obj.format = imageFormatToJSON(message.format);
+    }
+    if (message.columns !== 0) {
+      obj.columns = Math.round(message.columns);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ImagesReq>, I>>(base?: I): ImagesReq {
+    return ImagesReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ImagesReq>, I>>(object: I): ImagesReq {
+    const message = createBaseImagesReq();
+    message.imageIds = object.imageIds?.map((e) => e) || [];
+    message.test = object.test ?? false;
+    message.format = object.format ?? 0;
+    message.columns = object.columns ?? 0;
+    return message;
+  },
+};
+
+function createBaseImagesRes(): ImagesRes {
+  return { format: 0, data: Buffer.alloc(0), count: 0, columns: 0, tileSize: 0 };
+}
+
+export const ImagesRes: MessageFns<ImagesRes> = {
+  encode(message: ImagesRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.format !== 0) {
+      writer.uint32(8).int32(message.format);
+    }
+    if (message.data.length !== 0) {
+      writer.uint32(18).bytes(message.data);
+    }
+    if (message.count !== 0) {
+      writer.uint32(24).int32(message.count);
+    }
+    if (message.columns !== 0) {
+      writer.uint32(32).int32(message.columns);
+    }
+    if (message.tileSize !== 0) {
+      writer.uint32(40).int32(message.tileSize);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ImagesRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseImagesRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.format = reader.int32() as any;
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.data = Buffer.from(reader.bytes());
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.count = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.columns = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.tileSize = reader.int32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ImagesRes {
+    return {
+      format: isSet(object.format) ? imageFormatFromJSON(object.format) : 0,
+      data: isSet(object.data) ? Buffer.from(bytesFromBase64(object.data)) : Buffer.alloc(0),
+      count: isSet(object.count) ? globalThis.Number(object.count) : 0,
+      columns: isSet(object.columns) ? globalThis.Number(object.columns) : 0,
+      tileSize: isSet(object.tileSize) ? globalThis.Number(object.tileSize) : 0,
+    };
+  },
+
+  toJSON(message: ImagesRes): unknown {
+    const obj: any = {};
+    if (message.format !== 0) {
+      obj.format = imageFormatToJSON(message.format);
+    }
+    if (message.data.length !== 0) {
+      obj.data = base64FromBytes(message.data);
+    }
+    if (message.count !== 0) {
+      obj.count = Math.round(message.count);
+    }
+    if (message.columns !== 0) {
+      obj.columns = Math.round(message.columns);
+    }
+    if (message.tileSize !== 0) {
+      obj.tileSize = Math.round(message.tileSize);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ImagesRes>, I>>(base?: I): ImagesRes {
+    return ImagesRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ImagesRes>, I>>(object: I): ImagesRes {
+    const message = createBaseImagesRes();
+    message.format = object.format ?? 0;
+    message.data = object.data ?? Buffer.alloc(0);
+    message.count = object.count ?? 0;
+    message.columns = object.columns ?? 0;
+    message.tileSize = object.tileSize ?? 0;
+    return message;
+  },
+};
+
+function createBaseStatsReq(): StatsReq {
+  return { jobId: "" };
+}
+
+export const StatsReq: MessageFns<StatsReq> = {
+  encode(message: StatsReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.jobId !== "") {
+      writer.uint32(10).string(message.jobId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatsReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatsReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatsReq {
+    return {
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+    };
+  },
+
+  toJSON(message: StatsReq): unknown {
+    const obj: any = {};
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatsReq>, I>>(base?: I): StatsReq {
+    return StatsReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatsReq>, I>>(object: I): StatsReq {
+    const message = createBaseStatsReq();
+    message.jobId = object.jobId ?? "";
+    return message;
+  },
+};
+
+function createBaseHistogram(): Histogram {
+  return { name: "", count: 0, sum: 0, min: 0, max: 0, p50: 0, p90: 0, p99: 0, bounds: [], counts: [] };
+}
+
+export const Histogram: MessageFns<Histogram> = {
+  encode(message: Histogram, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.name !== "") {
+      writer.uint32(10).string(message.name);
+    }
+    if (message.count !== 0) {
+      writer.uint32(16).int64(message.count);
+    }
+    if (message.sum !== 0) {
+      writer.uint32(25).double(message.sum);
+    }
+    if (message.min !== 0) {
+      writer.uint32(33).double(message.min);
+    }
+    if (message.max !== 0) {
+      writer.uint32(41).double(message.max);
+    }
+    if (message.p50 !== 0) {
+      writer.uint32(49).double(message.p50);
+    }
+    if (message.p90 !== 0) {
+      writer.uint32(57).double(message.p90);
+    }
+    if (message.p99 !== 0) {
+      writer.uint32(65).double(message.p99);
+    }
+    writer.uint32(74).fork();
+    for (const v of message.bounds) {
+      writer.double(v);
+    }
+    writer.join();
+    writer.uint32(82).fork();
+    for (const v of message.counts) {
+      writer.int64(v);
+    }
+    writer.join();
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): Histogram {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseHistogram();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.name = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.count = longToNumber(reader.int64());
+          continue;
+        }
+        case 3: {
+          if (tag !== 25) {
+            break;
+          }
+
+          message.sum = reader.double();
+          continue;
+        }
+        case 4: {
+          if (tag !== 33) {
+            break;
+          }
+
+          message.min = reader.double();
+          continue;
+        }
+        case 5: {
+          if (tag !== 41) {
+            break;
+          }
+
+          message.max = reader.double();
+          continue;
+        }
+        case 6: {
+          if (tag !== 49) {
+            break;
+          }
+
+          message.p50 = reader.double();
+          continue;
+        }
+        case 7: {
+          if (tag !== 57) {
+            break;
+          }
+
+          message.p90 = reader.double();
+          continue;
+        }
+        case 8: {
+          if (tag !== 65) {
+            break;
+          }
+
+          message.p99 = reader.double();
+          continue;
+        }
+        case 9: {
+          if (tag === 73) {
+            message.bounds.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 74) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.bounds.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 10: {
+          if (tag === 80) {
+            message.counts.push(longToNumber(reader.int64()));
+
+            continue;
+          }
+
+          if (tag === 82) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.counts.push(longToNumber(reader.int64()));
+            }
+
+            continue;
+          }
+
+          break;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): Histogram {
+    return {
+      name: isSet(object.name) ? globalThis.String(object.name) : "",
+      count: isSet(object.count) ? globalThis.Number(object.count) : 0,
+      sum: isSet(object.sum) ? globalThis.Number(object.sum) : 0,
+      min: isSet(object.min) ? globalThis.Number(object.min) : 0,
+      max: isSet(object.max) ? globalThis.Number(object.max) : 0,
+      p50: isSet(object.p50) ? globalThis.Number(object.p50) : 0,
+      p90: isSet(object.p90) ? globalThis.Number(object.p90) : 0,
+      p99: isSet(object.p99) ? globalThis.Number(object.p99) : 0,
+      bounds: globalThis.Array.isArray(object?.bounds) ? object.bounds.map((e: any) => globalThis.Number(e)) : [],
+      counts: globalThis.Array.isArray(object?.counts) ? object.counts.map((e: any) => globalThis.Number(e)) : [],
+    };
+  },
+
+  toJSON(message: Histogram): unknown {
+    const obj: any = {};
+    if (message.name !== "") {
+      obj.name = message.name;
+    }
+    if (message.count !== 0) {
+      obj.count = Math.round(message.count);
+    }
+    if (message.sum !== 0) {
+      obj.sum = message.sum;
+    }
+    if (message.min !== 0) {
+      obj.min = message.min;
+    }
+    if (message.max !== 0) {
+      obj.max = message.max;
+    }
+    if (message.p50 !== 0) {
+      obj.p50 = message.p50;
+    }
+    if (message.p90 !== 0) {
+      obj.p90 = message.p90;
+    }
+    if (message.p99 !== 0) {
+      obj.p99 = message.p99;
+    }
+    if (message.bounds?.length) {
+      obj.bounds = message.bounds;
+    }
+    if (message.counts?.length) {
+      obj.counts = message.counts.map((e) => Math.round(e));
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<Histogram>, I>>(base?: I): Histogram {
+    return Histogram.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<Histogram>, I>>(object: I): Histogram {
+    const message = createBaseHistogram();
+    message.name = object.name ?? "";
+    message.count = object.count ?? 0;
+    message.sum = object.sum ?? 0;
+    message.min = object.min ?? 0;
+    message.max = object.max ?? 0;
+    message.p50 = object.p50 ?? 0;
+    message.p90 = object.p90 ?? 0;
+    message.p99 = object.p99 ?? 0;
+    message.bounds = object.bounds?.map((e) => e) || [];
+    message.counts = object.counts?.map((e) => e) || [];
+    return message;
+  },
+};
+
+function createBaseStatsRes(): StatsRes {
+  return { histograms: [], counters: {}, gauges: {}, labels: {} };
+}
+
+export const StatsRes: MessageFns<StatsRes> = {
+  encode(message: StatsRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.histograms) {
+      Histogram.encode(v!, writer.uint32(10).fork()).join();
+    }
+    Object.entries(message.counters).forEach(([key, value]) => {
+      StatsRes_CountersEntry.encode({ key: key as any, value }, writer.uint32(18).fork()).join();
+    });
+    Object.entries(message.gauges).forEach(([key, value]) => {
+      StatsRes_GaugesEntry.encode({ key: key as any, value }, writer.uint32(26).fork()).join();
+    });
+    Object.entries(message.labels).forEach(([key, value]) => {
+      StatsRes_LabelsEntry.encode({ key: key as any, value }, writer.uint32(34).fork()).join();
+    });
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatsRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatsRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.histograms.push(Histogram.decode(reader, reader.uint32()));
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          const entry2 = StatsRes_CountersEntry.decode(reader, reader.uint32());
+          if (entry2.value !== undefined) {
+            message.counters[entry2.key] = entry2.value;
+          }
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          const entry3 = StatsRes_GaugesEntry.decode(reader, reader.uint32());
+          if (entry3.value !== undefined) {
+            message.gauges[entry3.key] = entry3.value;
+          }
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          const entry4 = StatsRes_LabelsEntry.decode(reader, reader.uint32());
+          if (entry4.value !== undefined) {
+            message.labels[entry4.key] = entry4.value;
+          }
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatsRes {
+    return {
+      histograms: globalThis.Array.isArray(object?.histograms)
+        ? object.histograms.map((e: any) => Histogram.fromJSON(e))
+        : [],
+      counters: isObject(object.counters)
+        ? (globalThis.Object.entries(object.counters) as [string, any][]).reduce(
+          (acc: { [key: string]: number }, [key, value]: [string, any]) => {
+            acc[key] = globalThis.Number(value);
+            return acc;
+          },
+          {},
+        )
+        : {},
+      gauges: isObject(object.gauges)
+        ? (globalThis.Object.entries(object.gauges) as [string, any][]).reduce(
+          (acc: { [key: string]: number }, [key, value]: [string, any]) => {
+            acc[key] = globalThis.Number(value);
+            return acc;
+          },
+          {},
+        )
+        : {},
+      labels: isObject(object.labels)
+        ? (globalThis.Object.entries(object.labels) as [string, any][]).reduce(
+          (acc: { [key: string]: string }, [key, value]: [string, any]) => {
+            acc[key] = globalThis.String(value);
+            return acc;
+          },
+          {},
+        )
+        : {},
+    };
+  },
+
+  toJSON(message: StatsRes): unknown {
+    const obj: any = {};
+    if (message.histograms?.length) {
+      obj.histograms = message.histograms.map((e) => Histogram.toJSON(e));
+    }
+    if (message.counters) {
+      const entries = globalThis.Object.entries(message.counters) as [string, number][];
+      if (entries.length > 0) {
+        obj.counters = {};
+        entries.forEach(([k, v]) => {
+          obj.counters[k] = Math.round(v);
+        });
+      }
+    }
+    if (message.gauges) {
+      const entries = globalThis.Object.entries(message.gauges) as [string, number][];
+      if (entries.length > 0) {
+        obj.gauges = {};
+        entries.forEach(([k, v]) => {
+          obj.gauges[k] = v;
+        });
+      }
+    }
+    if (message.labels) {
+      const entries = globalThis.Object.entries(message.labels) as [string, string][];
+      if (entries.length > 0) {
+        obj.labels = {};
+        entries.forEach(([k, v]) => {
+          obj.labels[k] = v;
+        });
+      }
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatsRes>, I>>(base?: I): StatsRes {
+    return StatsRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatsRes>, I>>(object: I): StatsRes {
+    const message = createBaseStatsRes();
+    message.histograms = object.histograms?.map((e) => Histogram.fromPartial(e)) || [];
+    message.counters = (globalThis.Object.entries(object.counters ?? {}) as [string, number][]).reduce(
+      (acc: { [key: string]: number }, [key, value]: [string, number]) => {
+        if (value !== undefined) {
+          acc[key] = globalThis.Number(value);
+        }
+        return acc;
+      },
+      {},
+    );
+    message.gauges = (globalThis.Object.entries(object.gauges ?? {}) as [string, number][]).reduce(
+      (acc: { [key: string]: number }, [key, value]: [string, number]) => {
+        if (value !== undefined) {
+          acc[key] = globalThis.Number(value);
+        }
+        return acc;
+      },
+      {},
+    );
+    message.labels = (globalThis.Object.entries(object.labels ?? {}) as [string, string][]).reduce(
+      (acc: { [key: string]: string }, [key, value]: [string, string]) => {
+        if (value !== undefined) {
+          acc[key] = globalThis.String(value);
+        }
+        return acc;
+      },
+      {},
+    );
+    return message;
+  },
+};
+
+function createBaseStatsRes_CountersEntry(): StatsRes_CountersEntry {
+  return { key: "", value: 0 };
+}
+
+export const StatsRes_CountersEntry: MessageFns<StatsRes_CountersEntry> = {
+  encode(message: StatsRes_CountersEntry, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.key !== "") {
+      writer.uint32(10).string(message.key);
+    }
+    if (message.value !== 0) {
+      writer.uint32(16).int64(message.value);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatsRes_CountersEntry {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatsRes_CountersEntry();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.key = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.value = longToNumber(reader.int64());
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatsRes_CountersEntry {
+    return {
+      key: isSet(object.key) ? globalThis.String(object.key) : "",
+      value: isSet(object.value) ? globalThis.Number(object.value) : 0,
+    };
+  },
+
+  toJSON(message: StatsRes_CountersEntry): unknown {
+    const obj: any = {};
+    if (message.key !== "") {
+      obj.key = message.key;
+    }
+    if (message.value !== 0) {
+      obj.value = Math.round(message.value);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatsRes_CountersEntry>, I>>(base?: I): StatsRes_CountersEntry {
+    return StatsRes_CountersEntry.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatsRes_CountersEntry>, I>>(object: I): StatsRes_CountersEntry {
+    const message = createBaseStatsRes_CountersEntry();
+    message.key = object.key ?? "";
+    message.value = object.value ?? 0;
+    return message;
+  },
+};
+
+function createBaseStatsRes_GaugesEntry(): StatsRes_GaugesEntry {
+  return { key: "", value: 0 };
+}
+
+export const StatsRes_GaugesEntry: MessageFns<StatsRes_GaugesEntry> = {
+  encode(message: StatsRes_GaugesEntry, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.key !== "") {
+      writer.uint32(10).string(message.key);
+    }
+    if (message.value !== 0) {
+      writer.uint32(17).double(message.value);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatsRes_GaugesEntry {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatsRes_GaugesEntry();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.key = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 17) {
+            break;
+          }
+
+          message.value = reader.double();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatsRes_GaugesEntry {
+    return {
+      key: isSet(object.key) ? globalThis.String(object.key) : "",
+      value: isSet(object.value) ? globalThis.Number(object.value) : 0,
+    };
+  },
+
+  toJSON(message: StatsRes_GaugesEntry): unknown {
+    const obj: any = {};
+    if (message.key !== "") {
+      obj.key = message.key;
+    }
+    if (message.value !== 0) {
+      obj.value = message.value;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatsRes_GaugesEntry>, I>>(base?: I): StatsRes_GaugesEntry {
+    return StatsRes_GaugesEntry.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatsRes_GaugesEntry>, I>>(object: I): StatsRes_GaugesEntry {
+    const message = createBaseStatsRes_GaugesEntry();
+    message.key = object.key ?? "";
+    message.value = object.value ?? 0;
+    return message;
+  },
+};
+
+function createBaseStatsRes_LabelsEntry(): StatsRes_LabelsEntry {
+  return { key: "", value: "" };
+}
+
+export const StatsRes_LabelsEntry: MessageFns<StatsRes_LabelsEntry> = {
+  encode(message: StatsRes_LabelsEntry, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.key !== "") {
+      writer.uint32(10).string(message.key);
+    }
+    if (message.value !== "") {
+      writer.uint32(18).string(message.value);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): StatsRes_LabelsEntry {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseStatsRes_LabelsEntry();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.key = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.value = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): StatsRes_LabelsEntry {
+    return {
+      key: isSet(object.key) ? globalThis.String(object.key) : "",
+      value: isSet(object.value) ? globalThis.String(object.value) : "",
+    };
+  },
+
+  toJSON(message: StatsRes_LabelsEntry): unknown {
+    const obj: any = {};
+    if (message.key !== "") {
+      obj.key = message.key;
+    }
+    if (message.value !== "") {
+      obj.value = message.value;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<StatsRes_LabelsEntry>, I>>(base?: I): StatsRes_LabelsEntry {
+    return StatsRes_LabelsEntry.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<StatsRes_LabelsEntry>, I>>(object: I): StatsRes_LabelsEntry {
+    const message = createBaseStatsRes_LabelsEntry();
+    message.key = object.key ?? "";
+    message.value = object.value ?? "";
+    return message;
+  },
+};
+
+function createBaseProfileReq(): ProfileReq {
+  return { steps: 0, jobId: "" };
+}
+
+export const ProfileReq: MessageFns<ProfileReq> = {
+  encode(message: ProfileReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.steps !== 0) {
+      writer.uint32(8).int32(message.steps);
+    }
+    if (message.jobId !== "") {
+      writer.uint32(18).string(message.jobId);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ProfileReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseProfileReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.steps = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ProfileReq {
+    return {
+      steps: isSet(object.steps) ? globalThis.Number(object.steps) : 0,
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+    };
+  },
+
+  toJSON(message: ProfileReq): unknown {
+    const obj: any = {};
+    if (message.steps !== 0) {
+      obj.steps = Math.round(message.steps);
+    }
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ProfileReq>, I>>(base?: I): ProfileReq {
+    return ProfileReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ProfileReq>, I>>(object: I): ProfileReq {
+    const message = createBaseProfileReq();
+    message.steps = object.steps ?? 0;
+    message.jobId = object.jobId ?? "";
+    return message;
+  },
+};
+
+function createBaseProfileRes(): ProfileRes {
+  return { status: "", message: "" };
+}
+
+export const ProfileRes: MessageFns<ProfileRes> = {
+  encode(message: ProfileRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.status !== "") {
+      writer.uint32(10).string(message.status);
+    }
+    if (message.message !== "") {
+      writer.uint32(18).string(message.message);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ProfileRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseProfileRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.status = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.message = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ProfileRes {
+    return {
+      status: isSet(object.status) ? globalThis.String(object.status) : "",
+      message: isSet(object.message) ? globalThis.String(object.message) : "",
+    };
+  },
+
+  toJSON(message: ProfileRes): unknown {
+    const obj: any = {};
+    if (message.status !== "") {
+      obj.status = message.status;
+    }
+    if (message.message !== "") {
+      obj.message = message.message;
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<ProfileRes>, I>>(base?: I): ProfileRes {
+    return ProfileRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<ProfileRes>, I>>(object: I): ProfileRes {
+    const message = createBaseProfileRes();
+    message.status = object.status ?? "";
+    message.message = object.message ?? "";
+    return message;
+  },
+};
+
+function createBaseHardExamplesReq(): HardExamplesReq {
+  return {
+    jobId: "",
+    k: 0,
+    label: undefined,
+    pred: undefined,
+    misclassifiedOnly: false,
+    minEpoch: undefined,
+    maxCorrect: undefined,
+  };
+}
+
+export const HardExamplesReq: MessageFns<HardExamplesReq> = {
+  encode(message: HardExamplesReq, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.jobId !== "") {
+      writer.uint32(10).string(message.jobId);
+    }
+    if (message.k !== 0) {
+      writer.uint32(16).int32(message.k);
+    }
+    if (message.label !== undefined) {
+      writer.uint32(24).int32(message.label);
+    }
+    if (message.pred !== undefined) {
+      writer.uint32(32).int32(message.pred);
+    }
+    if (message.misclassifiedOnly !== false) {
+      writer.uint32(40).bool(message.misclassifiedOnly);
+    }
+    if (message.minEpoch !== undefined) {
+      writer.uint32(48).int32(message.minEpoch);
+    }
+    if (message.maxCorrect !== undefined) {
+      writer.uint32(56).int32(message.maxCorrect);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): HardExamplesReq {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseHardExamplesReq();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.jobId = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.k = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.label = reader.int32();
+          continue;
+        }
+        case 4: {
+          if (tag !== 32) {
+            break;
+          }
+
+          message.pred = reader.int32();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.misclassifiedOnly = reader.bool();
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.minEpoch = reader.int32();
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.maxCorrect = reader.int32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): HardExamplesReq {
+    return {
+      jobId: isSet(object.jobId) ? globalThis.String(object.jobId) : "",
+      k: isSet(object.k) ? globalThis.Number(object.k) : 0,
+      label: isSet(object.label) ? globalThis.Number(object.label) : undefined,
+      pred: isSet(object.pred) ? globalThis.Number(object.pred) : undefined,
+      misclassifiedOnly: isSet(object.misclassifiedOnly) ? globalThis.Boolean(object.misclassifiedOnly) : false,
+      minEpoch: isSet(object.minEpoch) ? globalThis.Number(object.minEpoch) : undefined,
+      maxCorrect: isSet(object.maxCorrect) ? globalThis.Number(object.maxCorrect) : undefined,
+    };
+  },
+
+  toJSON(message: HardExamplesReq): unknown {
+    const obj: any = {};
+    if (message.jobId !== "") {
+      obj.jobId = message.jobId;
+    }
+    if (message.k !== 0) {
+      obj.k = Math.round(message.k);
+    }
+    if (message.label !== undefined) {
+      obj.label = Math.round(message.label);
+    }
+    if (message.pred !== undefined) {
+      obj.pred = Math.round(message.pred);
+    }
+    if (message.misclassifiedOnly !== false) {
+      obj.misclassifiedOnly = message.misclassifiedOnly;
+    }
+    if (message.minEpoch !== undefined) {
+      obj.minEpoch = Math.round(message.minEpoch);
+    }
+    if (message.maxCorrect !== undefined) {
+      obj.maxCorrect = Math.round(message.maxCorrect);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<HardExamplesReq>, I>>(base?: I): HardExamplesReq {
+    return HardExamplesReq.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<HardExamplesReq>, I>>(object: I): HardExamplesReq {
+    const message = createBaseHardExamplesReq();
+    message.jobId = object.jobId ?? "";
+    message.k = object.k ?? 0;
+    message.label = object.label ?? undefined;
+    message.pred = object.pred ?? undefined;
+    message.misclassifiedOnly = object.misclassifiedOnly ?? false;
+    message.minEpoch = object.minEpoch ?? undefined;
+    message.maxCorrect = object.maxCorrect ?? undefined;
+    return message;
+  },
+};
+
+function createBaseHardExamplesRes(): HardExamplesRes {
+  return { imageIds: [], losses: [], preds: [], truths: [], correct: [], seen: [], epochs: [], matched: 0, indexed: 0 };
+}
+
+export const HardExamplesRes: MessageFns<HardExamplesRes> = {
+  encode(message: HardExamplesRes, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    writer.uint32(10).fork();
+    for (const v of message.imageIds) {
+      writer.int32(v);
+    }
+    writer.join();
+    writer.uint32(18).fork();
+    for (const v of message.losses) {
+      writer.float(v);
+    }
+    writer.join();
+    writer.uint32(26).fork();
+    for (const v of message.preds) {
+      writer.int32(v);
+    }
+    writer.join();
+    writer.uint32(34).fork();
+    for (const v of message.truths) {
+      writer.int32(v);
+    }
+    writer.join();
+    writer.uint32(42).fork();
+    for (const v of message.correct) {
+      writer.int32(v);
+    }
+    writer.join();
+    writer.uint32(50).fork();
+    for (const v of message.seen) {
+      writer.int32(v);
+    }
+    writer.join();
+    writer.uint32(58).fork();
+    for (const v of message.epochs) {
+      writer.int32(v);
+    }
+    writer.join();
+    if (message.matched !== 0) {
+      writer.uint32(64).int32(message.matched);
+    }
+    if (message.indexed !== 0) {
+      writer.uint32(72).int32(message.indexed);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): HardExamplesRes {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    const end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseHardExamplesRes();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag === 8) {
+            message.imageIds.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 10) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.imageIds.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 2: {
+          if (tag === 21) {
+            message.losses.push(reader.float());
+
+            continue;
+          }
+
+          if (tag === 18) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.losses.push(reader.float());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 3: {
+          if (tag === 24) {
+            message.preds.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 26) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.preds.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 4: {
+          if (tag === 32) {
+            message.truths.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 34) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.truths.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 5: {
+          if (tag === 40) {
+            message.correct.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 42) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.correct.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 6: {
+          if (tag === 48) {
+            message.seen.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 50) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.seen.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 7: {
+          if (tag === 56) {
+            message.epochs.push(reader.int32());
+
+            continue;
+          }
+
+          if (tag === 58) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.epochs.push(reader.int32());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+        case 8: {
+          if (tag !== 64) {
+            break;
+          }
+
+          message.matched = reader.int32();
+          continue;
+        }
+        case 9: {
+          if (tag !== 72) {
+            break;
+          }
+
+          message.indexed = reader.int32();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): HardExamplesRes {
+    return {
+      imageIds: globalThis.Array.isArray(object?.imageIds) ? object.imageIds.map((e: any) => globalThis.Number(e)) : [],
+      losses: globalThis.Array.isArray(object?.losses) ? object.losses.map((e: any) => globalThis.Number(e)) : [],
+      preds: globalThis.Array.isArray(object?.preds) ? object.preds.map((e: any) => globalThis.Number(e)) : [],
+      truths: globalThis.Array.isArray(object?.truths) ? object.truths.map((e: any) => globalThis.Number(e)) : [],
+      correct: globalThis.Array.isArray(object?.correct) ? object.correct.map((e: any) => globalThis.Number(e)) : [],
+      seen: globalThis.Array.isArray(object?.seen) ? object.seen.map((e: any) => globalThis.Number(e)) : [],
+      epochs: globalThis.Array.isArray(object?.epochs) ? object.epochs.map((e: any) => globalThis.Number(e)) : [],
+      matched: isSet(object.matched) ? globalThis.Number(object.matched) : 0,
+      indexed: isSet(object.indexed) ? globalThis.Number(object.indexed) : 0,
+    };
+  },
+
+  toJSON(message: HardExamplesRes): unknown {
+    const obj: any = {};
+    if (message.imageIds?.length) {
+      obj.imageIds = message.imageIds.map((e) => Math.round(e));
+    }
+    if (message.losses?.length) {
+      obj.losses = message.losses;
+    }
+    if (message.preds?.length) {
+      obj.preds = message.preds.map((e) => Math.round(e));
+    }
+    if (message.truths?.length) {
+      obj.truths = message.truths.map((e) => Math.round(e));
+    }
+    if (message.correct?.length) {
+      obj.correct = message.correct.map((e) => Math.round(e));
+    }
+    if (message.seen?.length) {
+      obj.seen = message.seen.map((e) => Math.round(e));
+    }
+    if (message.epochs?.length) {
+      obj.epochs = message.epochs.map((e) => Math.round(e));
+    }
+    if (message.matched !== 0) {
+      obj.matched = Math.round(message.matched);
+    }
+    if (message.indexed !== 0) {
+      obj.indexed = Math.round(message.indexed);
+    }
+    return obj;
+  },
+
+  create<I extends Exact<DeepPartial<HardExamplesRes>, I>>(base?: I): HardExamplesRes {
+    return HardExamplesRes.fromPartial(base ?? ({} as any));
+  },
+  fromPartial<I extends Exact<DeepPartial<HardExamplesRes>, I>>(object: I): HardExamplesRes {
+    const message = createBaseHardExamplesRes();
+    message.imageIds = object.imageIds?.map((e) => e) || [];
+    message.losses = object.losses?.map((e) => e) || [];
+    message.preds = object.preds?.map((e) => e) || [];
+    message.truths = object.truths?.map((e) => e) || [];
+    message.correct = object.correct?.map((e) => e) || [];
+    message.seen = object.seen?.map((e) => e) || [];
+    message.epochs = object.epochs?.map((e) => e) || [];
+    message.matched = object.matched ?? 0;
+    message.indexed = object.indexed ?? 0;
+    return message;
+  },
+};
+
+export type TrainingService = typeof TrainingService;
+export const TrainingService = {
+  /** Check server status (handshake) */
+  status: {
+    path: "/services.Training/Status",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: StatusReq): Buffer => Buffer.from(StatusReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): StatusReq => StatusReq.decode(value),
+    responseSerialize: (value: StatusRes): Buffer => Buffer.from(StatusRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): StatusRes => StatusRes.decode(value),
+  },
+  /** Submit a training job (run config, epochs, priority); it starts once a slot is free */
+  start: {
+    path: "/services.Training/Start",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: StartReq): Buffer => Buffer.from(StartReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): StartReq => StartReq.decode(value),
+    responseSerialize: (value: StartRes): Buffer => Buffer.from(StartRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): StartRes => StartRes.decode(value),
+  },
+  /** Every job on the server (queued, training, or retained after finishing) */
+  listJobs: {
+    path: "/services.Training/ListJobs",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: ListJobsReq): Buffer => Buffer.from(ListJobsReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): ListJobsReq => ListJobsReq.decode(value),
+    responseSerialize: (value: ListJobsRes): Buffer => Buffer.from(ListJobsRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): ListJobsRes => ListJobsRes.decode(value),
+  },
+  /** Client subscribes to stream of metrics from server */
+  subscribe: {
+    path: "/services.Training/Subscribe",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: SubscribeReq): Buffer => Buffer.from(SubscribeReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): SubscribeReq => SubscribeReq.decode(value),
+    responseSerialize: (value: TrainingMetric): Buffer => Buffer.from(TrainingMetric.encode(value).finish()),
+    responseDeserialize: (value: Buffer): TrainingMetric => TrainingMetric.decode(value),
+  },
+  /** Same stream, coalesced into frames under a client-chosen flush policy */
+  subscribeBatched: {
+    path: "/services.Training/SubscribeBatched",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: SubscribeBatchReq): Buffer => Buffer.from(SubscribeBatchReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): SubscribeBatchReq => SubscribeBatchReq.decode(value),
+    responseSerialize: (value: TrainingMetricBatch): Buffer => Buffer.from(TrainingMetricBatch.encode(value).finish()),
+    responseDeserialize: (value: Buffer): TrainingMetricBatch => TrainingMetricBatch.decode(value),
+  },
+  /** Held-out test set results, evaluated in the background on periodic weight snapshots */
+  subscribeEval: {
+    path: "/services.Training/SubscribeEval",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: SubscribeEvalReq): Buffer => Buffer.from(SubscribeEvalReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): SubscribeEvalReq => SubscribeEvalReq.decode(value),
+    responseSerialize: (value: EvalMetric): Buffer => Buffer.from(EvalMetric.encode(value).finish()),
+    responseDeserialize: (value: Buffer): EvalMetric => EvalMetric.decode(value),
+  },
+  /** Many thumbnails in one response, read from the memory-mapped idx image files */
+  getImages: {
+    path: "/services.Training/GetImages",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: ImagesReq): Buffer => Buffer.from(ImagesReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): ImagesReq => ImagesReq.decode(value),
+    responseSerialize: (value: ImagesRes): Buffer => Buffer.from(ImagesRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): ImagesRes => ImagesRes.decode(value),
+  },
+  /** Classify images with the latest weight snapshot of the model being trained */
+  predict: {
+    path: "/services.Training/Predict",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: PredictReq): Buffer => Buffer.from(PredictReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): PredictReq => PredictReq.decode(value),
+    responseSerialize: (value: PredictRes): Buffer => Buffer.from(PredictRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): PredictRes => PredictRes.decode(value),
+  },
+  /** Same, one response per request, for clients sending a steady stream of images */
+  predictStream: {
+    path: "/services.Training/PredictStream",
+    requestStream: true,
+    responseStream: true,
+    requestSerialize: (value: PredictReq): Buffer => Buffer.from(PredictReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): PredictReq => PredictReq.decode(value),
+    responseSerialize: (value: PredictRes): Buffer => Buffer.from(PredictRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): PredictRes => PredictRes.decode(value),
+  },
+  /** Per-stage latency histograms, counters and gauges of the trainer and the server */
+  getStats: {
+    path: "/services.Training/GetStats",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: StatsReq): Buffer => Buffer.from(StatsReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): StatsReq => StatsReq.decode(value),
+    responseSerialize: (value: StatsRes): Buffer => Buffer.from(StatsRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): StatsRes => StatsRes.decode(value),
+  },
+  /** Capture a torch.profiler trace of the next N training steps */
+  profile: {
+    path: "/services.Training/Profile",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: ProfileReq): Buffer => Buffer.from(ProfileReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): ProfileReq => ProfileReq.decode(value),
+    responseSerialize: (value: ProfileRes): Buffer => Buffer.from(ProfileRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): ProfileRes => ProfileRes.decode(value),
+  },
+  /** Top-k hardest train samples of a job by last loss, from its server-side per-sample index */
+  queryHardExamples: {
+    path: "/services.Training/QueryHardExamples",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: HardExamplesReq): Buffer => Buffer.from(HardExamplesReq.encode(value).finish()),
+    requestDeserialize: (value: Buffer): HardExamplesReq => HardExamplesReq.decode(value),
+    responseSerialize: (value: HardExamplesRes): Buffer => Buffer.from(HardExamplesRes.encode(value).finish()),
+    responseDeserialize: (value: Buffer): HardExamplesRes => HardExamplesRes.decode(value),
+  },
+} as const;
+
+export interface TrainingServer extends UntypedServiceImplementation {
+  /** Check server status (handshake) */
+  status: handleUnaryCall<StatusReq, StatusRes>;
+  /** Submit a training job (run config, epochs, priority); it starts once a slot is free */
+  start: handleUnaryCall<StartReq, StartRes>;
+  /** Every job on the server (queued, training, or retained after finishing) */
+  listJobs: handleUnaryCall<ListJobsReq, ListJobsRes>;
+  /** Client subscribes to stream of metrics from server */
+  subscribe: handleServerStreamingCall<SubscribeReq, TrainingMetric>;
+  /** Same stream, coalesced into frames under a client-chosen flush policy */
+  subscribeBatched: handleServerStreamingCall<SubscribeBatchReq, TrainingMetricBatch>;
+  /** Held-out test set results, evaluated in the background on periodic weight snapshots */
+  subscribeEval: handleServerStreamingCall<SubscribeEvalReq, EvalMetric>;
+  /** Many thumbnails in one response, read from the memory-mapped idx image files */
+  getImages: handleUnaryCall<ImagesReq, ImagesRes>;
+  /** Classify images with the latest weight snapshot of the model being trained */
+  predict: handleUnaryCall<PredictReq, PredictRes>;
+  /** Same, one response per request, for clients sending a steady stream of images */
+  predictStream: handleBidiStreamingCall<PredictReq, PredictRes>;
+  /** Per-stage latency histograms, counters and gauges of the trainer and the server */
+  getStats: handleUnaryCall<StatsReq, StatsRes>;
+  /** Capture a torch.profiler trace of the next N training steps */
+  profile: handleUnaryCall<ProfileReq, ProfileRes>;
+  /** Top-k hardest train samples of a job by last loss, from its server-side per-sample index */
+  queryHardExamples: handleUnaryCall<HardExamplesReq, HardExamplesRes>;
+}
+
+export interface TrainingClient extends Client {
+  /** Check server status (handshake) */
   status(request: StatusReq, callback: (error: ServiceError | null, response: StatusRes) => void): ClientUnaryCall;
   status(
     request: StatusReq,
@@ -674,7 +5027,7 @@ export interface TrainingClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: StatusRes) => void,
   ): ClientUnaryCall;
-  /** Start training with epochs and confirmation (stateless) */
+  /** Submit a training job (run config, epochs, priority); it starts once a slot is free */
   start(request: StartReq, callback: (error: ServiceError | null, response: StartRes) => void): ClientUnaryCall;
   start(
     request: StartReq,
@@ -687,6 +5040,22 @@ export interface TrainingClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: StartRes) => void,
   ): ClientUnaryCall;
+  /** Every job on the server (queued, training, or retained after finishing) */
+  listJobs(
+    request: ListJobsReq,
+    callback: (error: ServiceError | null, response: ListJobsRes) => void,
+  ): ClientUnaryCall;
+  listJobs(
+    request: ListJobsReq,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ListJobsRes) => void,
+  ): ClientUnaryCall;
+  listJobs(
+    request: ListJobsReq,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ListJobsRes) => void,
+  ): ClientUnaryCall;
   /** Client subscribes to stream of metrics from server */
   subscribe(request: SubscribeReq, options?: Partial<CallOptions>): ClientReadableStream<TrainingMetric>;
   subscribe(
@@ -694,6 +5063,95 @@ export interface TrainingClient extends Client {
     metadata?: Metadata,
     options?: Partial<CallOptions>,
   ): ClientReadableStream<TrainingMetric>;
+  /** Same stream, coalesced into frames under a client-chosen flush policy */
+  subscribeBatched(
+    request: SubscribeBatchReq,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<TrainingMetricBatch>;
+  subscribeBatched(
+    request: SubscribeBatchReq,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<TrainingMetricBatch>;
+  /** Held-out test set results, evaluated in the background on periodic weight snapshots */
+  subscribeEval(request: SubscribeEvalReq, options?: Partial<CallOptions>): ClientReadableStream<EvalMetric>;
+  subscribeEval(
+    request: SubscribeEvalReq,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EvalMetric>;
+  /** Many thumbnails in one response, read from the memory-mapped idx image files */
+  getImages(request: ImagesReq, callback: (error: ServiceError | null, response: ImagesRes) => void): ClientUnaryCall;
+  getImages(
+    request: ImagesReq,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ImagesRes) => void,
+  ): ClientUnaryCall;
+  getImages(
+    request: ImagesReq,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ImagesRes) => void,
+  ): ClientUnaryCall;
+  /** Classify images with the latest weight snapshot of the model being trained */
+  predict(request: PredictReq, callback: (error: ServiceError | null, response: PredictRes) => void): ClientUnaryCall;
+  predict(
+    request: PredictReq,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: PredictRes) => void,
+  ): ClientUnaryCall;
+  predict(
+    request: PredictReq,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: PredictRes) => void,
+  ): ClientUnaryCall;
+  /** Same, one response per request, for clients sending a steady stream of images */
+  predictStream(): ClientDuplexStream<PredictReq, PredictRes>;
+  predictStream(options: Partial<CallOptions>): ClientDuplexStream<PredictReq, PredictRes>;
+  predictStream(metadata: Metadata, options?: Partial<CallOptions>): ClientDuplexStream<PredictReq, PredictRes>;
+  /** Per-stage latency histograms, counters and gauges of the trainer and the server */
+  getStats(request: StatsReq, callback: (error: ServiceError | null, response: StatsRes) => void): ClientUnaryCall;
+  getStats(
+    request: StatsReq,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: StatsRes) => void,
+  ): ClientUnaryCall;
+  getStats(
+    request: StatsReq,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: StatsRes) => void,
+  ): ClientUnaryCall;
+  /** Capture a torch.profiler trace of the next N training steps */
+  profile(request: ProfileReq, callback: (error: ServiceError | null, response: ProfileRes) => void): ClientUnaryCall;
+  profile(
+    request: ProfileReq,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ProfileRes) => void,
+  ): ClientUnaryCall;
+  profile(
+    request: ProfileReq,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ProfileRes) => void,
+  ): ClientUnaryCall;
+  /** Top-k hardest train samples of a job by last loss, from its server-side per-sample index */
+  queryHardExamples(
+    request: HardExamplesReq,
+    callback: (error: ServiceError | null, response: HardExamplesRes) => void,
+  ): ClientUnaryCall;
+  queryHardExamples(
+    request: HardExamplesReq,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: HardExamplesRes) => void,
+  ): ClientUnaryCall;
+  queryHardExamples(
+    request: HardExamplesReq,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: HardExamplesRes) => void,
+  ): ClientUnaryCall;
 }
 
 export const TrainingClient = makeGenericClientConstructor(TrainingService, "services.Training") as unknown as {
@@ -702,6 +5160,14 @@ export const TrainingClient = makeGenericClientConstructor(TrainingService, "ser
   serviceName: string;
 };
 
+function bytesFromBase64(b64: string): Uint8Array {
+  return Uint8Array.from(globalThis.Buffer.from(b64, "base64"));
+}
+
+function base64FromBytes(arr: Uint8Array): string {
+  return globalThis.Buffer.from(arr).toString("base64");
+}
+
 type Builtin = Date | Function | Uint8Array | string | number | boolean | undefined;
 
 export type DeepPartial<T> = T extends Builtin ? T
@@ -714,6 +5180,21 @@ type KeysOfUnion<T> = T extends T ? keyof T : never;
 export type Exact<P, I extends P> = P extends Builtin ? P
   : P & { [K in keyof P]: Exact<P[K], I[K]> } & { [K in Exclude<keyof I, KeysOfUnion<P>>]: never };
 
+function longToNumber(int64: { toString(): string }): number {
+  const num = globalThis.Number(int64.toString());
+  if (num > globalThis.Number.MAX_SAFE_INTEGER) {
+    throw new globalThis.Error("Value is larger than Number.MAX_SAFE_INTEGER");
+  }
+  if (num < globalThis.Number.MIN_SAFE_INTEGER) {
+    throw new globalThis.Error("Value is smaller than Number.MIN_SAFE_INTEGER");
+  }
+  return num;
+}
+
+function isObject(value: any): boolean {
+  return typeof value === "object" && value !== null;
+}
+
 function isSet(value: any): boolean {
   return value !== null && value !== undefined;
 }